@@ -0,0 +1,47 @@
+"""add page cross document match
+
+Revision ID: a4c9e2f7b1d3
+Revises: e5a1c8f3b6d9
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e2f7b1d3'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c8f3b6d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'page_classifications',
+        sa.Column(
+            'cross_document_match',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment='Near-identical page in another document of the workflow',
+        ),
+    )
+    op.add_column(
+        'page_classifications',
+        sa.Column(
+            'minhash_signature',
+            sa.LargeBinary(),
+            nullable=True,
+            comment='MinHash signature of the page text for cross-document matching',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('page_classifications', 'minhash_signature')
+    op.drop_column('page_classifications', 'cross_document_match')
@@ -0,0 +1,46 @@
+"""add document_page_coordinates table
+
+Revision ID: a7c1e9d2b4f6
+Revises: d3775e797d90
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e9d2b4f6'
+down_revision: Union[str, Sequence[str], None] = 'd3775e797d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Columnar word coordinates, replacing the per-word JSON dicts stored in
+    # document_pages.additional_metadata['word_coordinates']. Existing rows
+    # keep their inline coordinates; the repository falls back to them.
+    op.create_table(
+        'document_page_coordinates',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('document_id', sa.UUID(), nullable=False),
+        sa.Column('page_number', sa.Integer(), nullable=False),
+        sa.Column('word_count', sa.Integer(), nullable=False),
+        sa.Column('boxes', sa.LargeBinary(), nullable=False,
+                  comment='float32 x0, y0, x1, y1 per word (PDF points, bottom-left origin)'),
+        sa.Column('text_offsets', sa.LargeBinary(), nullable=False,
+                  comment='int32 start offset of each word in text, plus the end offset'),
+        sa.Column('text', sa.Text(), nullable=False,
+                  comment='Concatenated word texts'),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=True),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('document_id', 'page_number', name='uq_page_coordinates_doc_page'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('document_page_coordinates')
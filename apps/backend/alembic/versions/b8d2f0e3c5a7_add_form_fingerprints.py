@@ -0,0 +1,58 @@
+"""add form_fingerprints table
+
+Revision ID: b8d2f0e3c5a7
+Revises: a7c1e9d2b4f6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f0e3c5a7'
+down_revision: Union[str, Sequence[str], None] = 'a7c1e9d2b4f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'form_fingerprints',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=False,
+                  comment='SHA-256 of form numbers, extractor, prompt and normalized text'),
+        sa.Column('form_number', sa.String(), nullable=False,
+                  comment="Form number(s), e.g. 'CG 00 01 04 13'"),
+        sa.Column('section_type', sa.String(), nullable=False,
+                  comment='Section type the form was extracted as'),
+        sa.Column('extractor_key', sa.String(), nullable=False,
+                  comment='Extractor that produced the output'),
+        sa.Column('extraction_output', postgresql.JSONB(astext_type=sa.Text()), nullable=False,
+                  comment='Parsed LLM output before page number injection'),
+        sa.Column('confidence', sa.Numeric(precision=5, scale=3), nullable=False,
+                  comment='Extraction confidence reported by the LLM'),
+        sa.Column('validated', sa.Boolean(), nullable=False,
+                  comment='Whether the output may be reused'),
+        sa.Column('source_document_id', sa.UUID(), nullable=True),
+        sa.Column('model_version', sa.String(), nullable=True,
+                  comment='LLM model version for provenance'),
+        sa.Column('hit_count', sa.Integer(), server_default='0', nullable=False,
+                  comment='Times the output was reused'),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('NOW()'), nullable=True),
+        sa.Column('last_used_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['source_document_id'], ['documents.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('fingerprint'),
+        comment='Reusable extraction output of standard ISO forms',
+    )
+    op.create_index('ix_form_fingerprints_form_number', 'form_fingerprints', ['form_number'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_form_fingerprints_form_number', table_name='form_fingerprints')
+    op.drop_table('form_fingerprints')
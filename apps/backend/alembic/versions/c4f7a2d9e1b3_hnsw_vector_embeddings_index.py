@@ -0,0 +1,58 @@
+"""replace ivfflat with hnsw index on vector_embeddings
+
+Revision ID: c4f7a2d9e1b3
+Revises: b8d2f0e3c5a7
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2d9e1b3'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f0e3c5a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The ivfflat index was trained on an empty table (meaningless centroids)
+    # and later dropped by autogenerate on some databases
+    op.execute("DROP INDEX IF EXISTS vector_embeddings_embedding_idx")
+
+    # Built concurrently so embedding writes are not blocked on large tables
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_vector_embeddings_embedding_hnsw',
+            'vector_embeddings',
+            ['embedding'],
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_vector_embeddings_workflow_document',
+            'vector_embeddings',
+            ['workflow_id', 'document_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vector_embeddings_workflow_document', table_name='vector_embeddings')
+    op.drop_index('ix_vector_embeddings_embedding_hnsw', table_name='vector_embeddings')
+    op.create_index(
+        'vector_embeddings_embedding_idx',
+        'vector_embeddings',
+        ['embedding'],
+        postgresql_using='ivfflat',
+        postgresql_with={'lists': 100},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
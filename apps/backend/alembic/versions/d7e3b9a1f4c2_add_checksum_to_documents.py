@@ -0,0 +1,40 @@
+"""add checksum to documents
+
+Revision ID: d7e3b9a1f4c2
+Revises: c4f7a2d9e1b3
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e3b9a1f4c2'
+down_revision: Union[str, Sequence[str], None] = 'c4f7a2d9e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'documents',
+        sa.Column('checksum', sa.String(length=64), nullable=True, comment='SHA-256 of the uploaded file content'),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_documents_user_checksum',
+            'documents',
+            ['user_id', 'checksum'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_documents_user_checksum', table_name='documents')
+    op.drop_column('documents', 'checksum')
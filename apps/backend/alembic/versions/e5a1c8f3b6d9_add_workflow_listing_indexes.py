@@ -0,0 +1,50 @@
+"""add workflow listing indexes
+
+Revision ID: e5a1c8f3b6d9
+Revises: d7e3b9a1f4c2
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c8f3b6d9'
+down_revision: Union[str, Sequence[str], None] = 'd7e3b9a1f4c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workflows_user_created_id',
+            'workflows',
+            ['user_id', 'created_at', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_workflow_documents_workflow_id',
+            'workflow_documents',
+            ['workflow_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_workflow_run_events_workflow_created',
+            'workflow_run_events',
+            ['workflow_id', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workflow_run_events_workflow_created', table_name='workflow_run_events')
+    op.drop_index('ix_workflow_documents_workflow_id', table_name='workflow_documents')
+    op.drop_index('ix_workflows_user_created_id', table_name='workflows')
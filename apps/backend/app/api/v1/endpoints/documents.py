@@ -7,6 +7,7 @@ from app.core.database import get_async_session as get_session
 from app.services.user_service import UserService
 from app.services.document_service import DocumentService
 from app.core.auth import get_current_user
+from app.core.exceptions import ValidationError
 from app.schemas.auth import CurrentUser
 from app.schemas.generated.documents import (
     ApiResponse,
@@ -128,14 +129,28 @@ async def get_document(
 async def delete_document(
     request: Request,
     document_id: UUID,
+    workflow_id: Optional[UUID] = Query(None),
     current_user: Annotated[CurrentUser, Depends(get_current_user)] = None,
     user_service: Annotated[UserService, Depends(get_user_service)] = None,
     document_service: Annotated[DocumentService, Depends(get_document_service)] = None,
 ) -> ApiResponse:
-    """Delete document and all related data."""
+    """Delete document and all related data.
+
+    With workflow_id the document is removed from that workflow and only
+    deleted once no other workflow uses it.
+    """
     user = await user_service.get_or_create_user_from_jwt(current_user)
     
-    success = await document_service.delete_document(document_id, user.id)
+    try:
+        success = await document_service.delete_document(document_id, user.id, workflow_id=workflow_id)
+    except ValidationError as e:
+        error_detail = create_error_detail(
+            title="Document In Use",
+            status=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            request=request
+        )
+        raise HTTPException(status_code=409, detail=error_detail.model_dump(mode='json'))
     if not success:
         error_detail = create_error_detail(
             title="Document Not Found",
@@ -3,6 +3,9 @@
 from fastapi import APIRouter, Request
 from app.core.config import settings
 from app.core.database import db_client
+from app.core.llm_rate_limiter import llm_rate_limiter_stats
+from app.core.llm_response_cache import llm_response_cache_stats
+from app.utils.latency_histogram import stage_latency_snapshot
 from app.utils.logging import get_logger
 from app.schemas.generated.health import HealthCheckResponse, ApiResponse
 from app.utils.responses import create_api_response
@@ -28,6 +31,12 @@ async def health_check(request: Request) -> ApiResponse:
         status="healthy" if db_health["status"] == "healthy" else "degraded",
         version=settings.app_version,
         service=settings.app_name,
+        database=db_health,
+        retrieval={"stage_latencies": stage_latency_snapshot()},
+        llm={
+            "response_cache": llm_response_cache_stats(),
+            "rate_limiters": llm_rate_limiter_stats(),
+        },
     )
     
     return create_api_response(
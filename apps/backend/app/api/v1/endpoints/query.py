@@ -1,14 +1,16 @@
-from typing import Annotated, List
+import json
+from typing import Annotated, AsyncIterator, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_session as get_session
+from app.core.database import async_session_maker, get_async_session as get_session
 from app.core.auth import get_current_user
 from app.schemas.auth import CurrentUser
 from app.schemas.generated.query import GraphRAGRequest, GraphRAGResponse
-from app.schemas.query import WorkflowMessage
+from app.schemas.query import QueryStreamEvent, WorkflowMessage
 from app.services.retrieval.graphrag_service import GraphRAGService
 from app.services.workflow_service import WorkflowService
 from app.services.user_service import UserService
@@ -44,32 +46,13 @@ async def get_workflow_query_repository(
     return WorkflowQueryRepository(db_session)
 
 
-@router.post(
-    "/{workflow_id}",
-    response_model=GraphRAGResponse,
-    summary="Execute GraphRAG query",
-    operation_id="execute_query",
-)
-async def execute_query(
+async def _validate_workflow_access(
     workflow_id: UUID,
-    request: GraphRAGRequest,
-    current_user: Annotated[CurrentUser, Depends(get_current_user)],
-    user_service: Annotated[UserService, Depends(get_user_service)],
-    workflow_service: Annotated[WorkflowService, Depends(get_workflow_service)],
-    graphrag_service: Annotated[GraphRAGService, Depends(get_graphrag_service)],
-    query_repo: Annotated[WorkflowQueryRepository, Depends(get_workflow_query_repository)],
-) -> GraphRAGResponse:
-    """
-    Execute a GraphRAG query within a specific workflow context.
-    
-    This endpoint:
-    1. Validates that the workflow exists and belongs to the user.
-    2. Persists the user's query.
-    3. Invokes the GraphRAG service to retrieve information and generate an answer.
-    4. Persists the model's response.
-    5. Returns the answer with citations and process metadata.
-    """
-    # 1. Validate user and workflow access
+    current_user: CurrentUser,
+    user_service: UserService,
+    workflow_service: WorkflowService,
+) -> None:
+    """Raise 404 unless the workflow exists and belongs to the user."""
     user = await user_service.get_or_create_user_from_jwt(current_user)
     
     wf = await workflow_service.get_workflow_details(workflow_id, user.id)
@@ -83,7 +66,13 @@ async def execute_query(
             detail="Workflow not found or access denied",
         )
 
-    # 2. Persist user query
+
+async def _persist_user_query(
+    workflow_id: UUID,
+    request: GraphRAGRequest,
+    query_repo: WorkflowQueryRepository,
+) -> None:
+    """Persist the user's query, populating document_ids from mentions."""
     # Auto-populate document_ids from mentioned_documents if not explicitly set
     if request.mentioned_documents and not request.document_ids:
         request.document_ids = [doc.id for doc in request.mentioned_documents]
@@ -106,6 +95,44 @@ async def execute_query(
             "Failed to persist user query",
             extra={"workflow_id": str(workflow_id), "error": str(e)},
         )
+
+
+def _format_sse(event: QueryStreamEvent) -> str:
+    """Format a QueryStreamEvent as a raw SSE message."""
+    return f"event: {event.event_type}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+
+@router.post(
+    "/{workflow_id}",
+    response_model=GraphRAGResponse,
+    summary="Execute GraphRAG query",
+    operation_id="execute_query",
+)
+async def execute_query(
+    workflow_id: UUID,
+    request: GraphRAGRequest,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
+    workflow_service: Annotated[WorkflowService, Depends(get_workflow_service)],
+    graphrag_service: Annotated[GraphRAGService, Depends(get_graphrag_service)],
+    query_repo: Annotated[WorkflowQueryRepository, Depends(get_workflow_query_repository)],
+) -> GraphRAGResponse:
+    """
+    Execute a GraphRAG query within a specific workflow context.
+    
+    This endpoint:
+    1. Validates that the workflow exists and belongs to the user.
+    2. Persists the user's query.
+    3. Invokes the GraphRAG service to retrieve information and generate an answer.
+    4. Persists the model's response.
+    5. Returns the answer with citations and process metadata.
+    """
+    # 1. Validate user and workflow access
+    await _validate_workflow_access(workflow_id, current_user, user_service, workflow_service)
+
+    # 2. Persist user query
+    await _persist_user_query(workflow_id, request, query_repo)
+
     # 3. Invoke GraphRAG service
     try:
         response = await graphrag_service.query(
@@ -138,6 +165,91 @@ async def execute_query(
         )
 
 
+@router.post(
+    "/{workflow_id}/stream",
+    summary="Execute GraphRAG query with a streamed answer",
+    operation_id="stream_query",
+)
+async def stream_query(
+    workflow_id: UUID,
+    request: GraphRAGRequest,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    user_service: Annotated[UserService, Depends(get_user_service)],
+    workflow_service: Annotated[WorkflowService, Depends(get_workflow_service)],
+    query_repo: Annotated[WorkflowQueryRepository, Depends(get_workflow_query_repository)],
+) -> StreamingResponse:
+    """
+    Execute a GraphRAG query, streaming the answer as server-sent events.
+
+    Emits ``context_ready`` once retrieval finishes, ``delta`` events with
+    answer text as the LLM generates it, and ``final`` with the complete
+    response, citations and metadata (the same payload as ``POST /{workflow_id}``).
+    An ``error`` event ends the stream if the query fails.
+    """
+    await _validate_workflow_access(workflow_id, current_user, user_service, workflow_service)
+    await _persist_user_query(workflow_id, request, query_repo)
+
+    async def event_stream() -> AsyncIterator[str]:
+        # Request-scoped dependencies are torn down before the body streams,
+        # so the stream runs on a session of its own
+        try:
+            async with async_session_maker() as session:
+                graphrag_service = GraphRAGService(session)
+                stream_query_repo = WorkflowQueryRepository(session)
+                async for event in graphrag_service.query_stream(
+                    workflow_id=workflow_id,
+                    request=request
+                ):
+                    if event.event_type == "final":
+                        await _persist_model_response(workflow_id, request, event.data, stream_query_repo)
+                    yield _format_sse(event)
+        except Exception:
+            LOGGER.error(
+                "Streamed GraphRAG query failed",
+                extra={"workflow_id": str(workflow_id), "query": request.query[:100]},
+                exc_info=True,
+            )
+            yield _format_sse(QueryStreamEvent(
+                event_type="error",
+                data={"detail": "Query execution failed"},
+            ))
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (Nginx)
+        },
+    )
+
+
+async def _persist_model_response(
+    workflow_id: UUID,
+    request: GraphRAGRequest,
+    response: dict,
+    query_repo: WorkflowQueryRepository,
+) -> None:
+    """Persist a streamed answer once it is complete."""
+    try:
+        await query_repo.create_query(
+            workflow_id=workflow_id,
+            role="model",
+            content=response["answer"],
+            additional_metadata={
+                "citations_count": len(response.get("sources") or []),
+                "latency_ms": response["metadata"]["latency_ms"],
+                "target_document_ids": [str(d) for d in request.document_ids] if request.document_ids else None
+            }
+        )
+    except Exception as e:
+        LOGGER.error(
+            "Failed to persist streamed model response",
+            extra={"workflow_id": str(workflow_id), "error": str(e)},
+        )
+
+
 @router.get(
     "/{workflow_id}/messages",
     response_model=List[WorkflowMessage],
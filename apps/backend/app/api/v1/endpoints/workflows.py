@@ -10,6 +10,7 @@ from app.core.database import get_async_session as get_session
 from app.services.workflow_service import WorkflowService
 from app.services.user_service import UserService
 from app.core.auth import get_current_user, get_current_user_from_query
+from app.core.exceptions import ValidationError
 from app.schemas.auth import CurrentUser
 from app.schemas.generated.workflows import (
     ApiResponse,
@@ -137,31 +138,46 @@ async def create_workflow(
 )
 async def list_workflows(
     request: Request,
-    limit: int = Query(50),
-    offset: int = Query(0),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     include_documents: bool = Query(True),
     include_stages: bool = Query(True),
     include_events: bool = Query(True),
-    events_limit: int = Query(5),
+    events_limit: int = Query(5, ge=0),
     current_user: Annotated[CurrentUser, Depends(get_current_user)] = None,
     user_service: Annotated[UserService, Depends(get_user_service)] = None,
     workflow_service: Annotated[WorkflowService, Depends(get_workflow_service)] = None,
 ) -> ApiResponse:
-    """List workflow executions for the current user."""
+    """List workflow executions for the current user.
+
+    Pass next_cursor from the previous page as cursor to page through
+    the list; offset is only applied without a cursor.
+    """
     user = await user_service.get_or_create_user_from_jwt(current_user)
     
-    workflows_data = await workflow_service.list_workflows(
-        user.id, 
-        limit=limit, 
-        offset=offset,
-        include_documents=include_documents,
-        include_stages=include_stages,
-        include_events=include_events,
-        events_limit=events_limit
-    )
+    try:
+        workflows_data = await workflow_service.list_workflows(
+            user.id, 
+            limit=limit, 
+            offset=offset,
+            include_documents=include_documents,
+            include_stages=include_stages,
+            include_events=include_events,
+            events_limit=events_limit,
+            cursor=cursor,
+        )
+    except ValidationError as e:
+        error_detail = create_error_detail(
+            title="Invalid Cursor",
+            status=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+            request=request
+        )
+        raise HTTPException(status_code=400, detail=error_detail.model_dump(mode='json'))
 
     if not workflows_data or not workflows_data.get("workflows"):
-        data = WorkflowListResponse(total=0, workflows=[])
+        data = WorkflowListResponse(total=(workflows_data or {}).get("total", 0), workflows=[])
         return create_api_response(
             data=data,
             message="No workflows found",
@@ -171,6 +187,7 @@ async def list_workflows(
     data = WorkflowListResponse(
         total=workflows_data["total"],
         workflows=workflows_data["workflows"],
+        next_cursor=workflows_data["next_cursor"],
     )
     
     return create_api_response(
@@ -1,8 +1,8 @@
 """Application configuration."""
 
 from pathlib import Path
-from typing import Optional
-from urllib.parse import parse_qs, urlencode
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -45,18 +45,88 @@ class DatabaseSettings(BaseSettings):
     pool_size: int = Field(default=10, validation_alias="DATABASE_POOL_SIZE")
     max_overflow: int = Field(default=20, validation_alias="DATABASE_MAX_OVERFLOW")
     echo: bool = Field(default=False, validation_alias="DATABASE_ECHO")
+
+    # Pooling: "queue" (direct Postgres), "pgbouncer" (transaction pooler in front),
+    # or "null" (no client-side pooling, one connection per session).
+    # Unset: "pgbouncer" when the URL points at a pooler, otherwise "queue".
+    pool_mode: Optional[str] = Field(default=None, validation_alias="DATABASE_POOL_MODE")
+    pool_timeout: int = Field(default=30, validation_alias="DATABASE_POOL_TIMEOUT")
+    pool_recycle: int = Field(default=1800, validation_alias="DATABASE_POOL_RECYCLE")
+    pool_pre_ping: bool = Field(default=True, validation_alias="DATABASE_POOL_PRE_PING")
+    # Unset: the URL's statement_cache_size parameter, else 100. Always 0 in pgbouncer mode.
+    statement_cache_size: Optional[int] = Field(default=None, validation_alias="DATABASE_STATEMENT_CACHE_SIZE")
+
+    # Temporal workers run fewer, longer-lived sessions than the API
+    process_role: str = Field(default="api", validation_alias="DATABASE_PROCESS_ROLE")
+    worker_pool_size: int = Field(default=5, validation_alias="DATABASE_WORKER_POOL_SIZE")
+    worker_max_overflow: int = Field(default=10, validation_alias="DATABASE_WORKER_MAX_OVERFLOW")
     
     use_local_db: bool = Field(default=True, validation_alias="USE_LOCAL_DB")
     
     @property
-    def connection_url(self) -> str:
-        """Get the connection URL with the correct asyncpg prefix."""
+    def raw_url(self) -> str:
+        """Get the configured connection URL as provided."""
         # Determine which URL to use based on the toggle
         if self.use_local_db:
-             raw_url = self.url
-        else:
-            # Prioritize production URLs if not using local DB
-            raw_url = self.postgres_url or self.postgres_url_non_pooling or self.url
+            return self.url
+        # Prioritize production URLs if not using local DB
+        return self.postgres_url or self.postgres_url_non_pooling or self.url
+
+    @property
+    def url_params(self) -> Dict[str, List[str]]:
+        """Get the query parameters of the configured connection URL."""
+        raw_url = self.raw_url or ""
+        if "?" not in raw_url:
+            return {}
+        return parse_qs(raw_url.split("?", 1)[1])
+
+    @property
+    def uses_pooler(self) -> bool:
+        """Whether the URL points at a transaction pooler (Supabase/PgBouncer).
+
+        Detected from the ``supa`` or ``pgbouncer`` URL parameters, a
+        ``pooler.`` host, or the conventional pooler port 6543.
+        """
+        params = self.url_params
+        if "supa" in params or params.get("pgbouncer") == ["true"]:
+            return True
+        try:
+            parts = urlsplit(self.raw_url or "")
+            host, port = parts.hostname or "", parts.port
+        except ValueError:
+            return False
+        return "pooler." in host or port == 6543
+
+    @property
+    def resolved_pool_mode(self) -> str:
+        """Get the pool mode, detecting a pooler when it is not configured."""
+        if self.pool_mode and self.pool_mode.strip():
+            return self.pool_mode.strip().lower()
+        return "pgbouncer" if self.uses_pooler else "queue"
+
+    @property
+    def resolved_statement_cache_size(self) -> int:
+        """Get the asyncpg prepared statement cache size for the pool mode.
+
+        A transaction pooler hands each transaction a different server
+        connection, so cached prepared statements are never safe there.
+        """
+        if self.resolved_pool_mode in ("pgbouncer", "null"):
+            return 0
+        if self.statement_cache_size is not None:
+            return self.statement_cache_size
+        url_value = self.url_params.get("statement_cache_size")
+        if url_value:
+            try:
+                return int(url_value[0])
+            except ValueError:
+                LOGGER.warning(f"Ignoring invalid statement_cache_size URL parameter '{url_value[0]}'")
+        return 100
+
+    @property
+    def connection_url(self) -> str:
+        """Get the connection URL with the correct asyncpg prefix."""
+        raw_url = self.raw_url
         
         if not raw_url:
             return ""
@@ -68,7 +138,7 @@ class DatabaseSettings(BaseSettings):
             # Use postgresql+asyncpg as the base scheme
             base_scheme = "postgresql+asyncpg"
             
-            # Parse query parameters to remove unsupported ones and add PgBouncer compat
+            # Parse query parameters to remove unsupported ones
             if "?" in rest:
                 path, query = rest.split("?", 1)
                 params = parse_qs(query)
@@ -77,18 +147,18 @@ class DatabaseSettings(BaseSettings):
                 if "sslmode" in params:
                     params["ssl"] = params.pop("sslmode")
                 
-                # Remove unsupported 'supa' parameter
-                if "supa" in params:
-                    params.pop("supa")
+                # Remove unsupported 'supa' and 'pgbouncer' parameters
+                params.pop("supa", None)
+                params.pop("pgbouncer", None)
+
+                # Passed to asyncpg as resolved_statement_cache_size in app.core.database
+                params.pop("statement_cache_size", None)
 
-                # Add PgBouncer compatibility parameter
-                params["statement_cache_size"] = ["0"]
-                    
                 # Reconstruct query string
                 new_query = urlencode(params, doseq=True)
-                return f"{base_scheme}://{path}?{new_query}"
+                return f"{base_scheme}://{path}?{new_query}" if new_query else f"{base_scheme}://{path}"
             else:
-                return f"{base_scheme}://{rest}?statement_cache_size=0"
+                return f"{base_scheme}://{rest}"
         
         return raw_url
 
@@ -115,6 +185,11 @@ class LLMSettings(BaseSettings):
     
     enable_fallback: bool = Field(default=False, validation_alias="ENABLE_LLM_FALLBACK")
 
+    # Process-wide limits per provider, shared by all LLM clients in a worker (0 = no limit)
+    max_concurrency: int = Field(default=8, validation_alias="LLM_MAX_CONCURRENCY")
+    requests_per_minute: int = Field(default=0, validation_alias="LLM_REQUESTS_PER_MINUTE")
+    tokens_per_minute: int = Field(default=0, validation_alias="LLM_TOKENS_PER_MINUTE")
+
     # Chunking
     chunk_max_tokens: int = Field(default=1500, validation_alias="CHUNK_MAX_TOKENS")
     chunk_min_tokens: int = Field(default=300, validation_alias="CHUNK_MIN_TOKENS")
@@ -148,6 +223,172 @@ class LLMSettings(BaseSettings):
         else:
             LOGGER.warning(f"Using unsupported LLM provider: {self.provider}")
 
+class OCRSettings(BaseSettings):
+    """Docling OCR execution settings."""
+    # Number of worker processes running Docling; 0 runs conversions in a thread
+    process_pool_workers: int = Field(default=2, validation_alias="OCR_PROCESS_POOL_WORKERS")
+    # Recycle a worker process after this many conversions to cap memory growth
+    max_tasks_per_worker: int = Field(default=20, validation_alias="OCR_MAX_TASKS_PER_WORKER")
+    # Documents with more pages than the threshold are OCR'd as parallel page-range shards
+    shard_threshold_pages: int = Field(default=120, validation_alias="OCR_SHARD_THRESHOLD_PAGES")
+    shard_size_pages: int = Field(default=50, validation_alias="OCR_SHARD_SIZE_PAGES")
+    # Word-coordinate extraction runs alongside Docling in its own small process pool
+    coordinate_workers: int = Field(default=2, validation_alias="OCR_COORDINATE_WORKERS")
+    coordinate_chunk_pages: int = Field(default=25, validation_alias="OCR_COORDINATE_CHUNK_PAGES")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
+class DocumentCacheSettings(BaseSettings):
+    """Local on-disk cache of source documents shared by processing stages."""
+    directory: str = Field(default="/tmp/insura_document_cache", validation_alias="DOCUMENT_CACHE_DIR")
+    max_bytes: int = Field(default=2 * 1024 ** 3, validation_alias="DOCUMENT_CACHE_MAX_BYTES")
+    # Leases older than this are treated as left behind by a crashed reader
+    lease_ttl_seconds: int = Field(default=3600, validation_alias="DOCUMENT_CACHE_LEASE_TTL_SECONDS")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
+class LLMCacheSettings(BaseSettings):
+    """Local on-disk cache of LLM responses keyed by the full request."""
+    enabled: bool = Field(default=False, validation_alias="LLM_CACHE_ENABLED")
+    directory: str = Field(default="/tmp/insura_llm_cache", validation_alias="LLM_CACHE_DIR")
+    ttl_seconds: int = Field(default=7 * 24 * 3600, validation_alias="LLM_CACHE_TTL_SECONDS")
+    max_bytes: int = Field(default=512 * 1024 ** 2, validation_alias="LLM_CACHE_MAX_BYTES")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
+class HTTPClientSettings(BaseSettings):
+    """Shared outbound HTTP client pools (LLM APIs, storage, JWKS)."""
+    max_connections: int = Field(default=100, validation_alias="HTTP_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(default=20, validation_alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    keepalive_expiry: float = Field(default=30.0, validation_alias="HTTP_KEEPALIVE_EXPIRY")
+    # Used when the h2 package is installed (httpx[http2])
+    http2: bool = Field(default=True, validation_alias="HTTP2_ENABLED")
+    # Upper bound on a server-requested Retry-After wait
+    max_retry_after_seconds: float = Field(default=60.0, validation_alias="HTTP_MAX_RETRY_AFTER_SECONDS")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
+class EmbeddingSettings(BaseSettings):
+    """Sentence-transformer embedding settings."""
+    # Must produce 384-dim vectors to match the vector_embeddings column
+    model_name: str = Field(default="all-MiniLM-L6-v2", validation_alias="EMBEDDING_MODEL_NAME")
+    # "torch" or "onnx"; ONNX (optionally a quantized int8 file) is cheaper on CPU
+    backend: str = Field(default="torch", validation_alias="EMBEDDING_BACKEND")
+    onnx_file_name: str = Field(default="", validation_alias="EMBEDDING_ONNX_FILE")
+    # Texts per model.encode batch
+    batch_size: int = Field(default=64, validation_alias="EMBEDDING_BATCH_SIZE")
+    # Concurrent embed() calls within this window share one forward pass
+    batch_window_ms: float = Field(default=5.0, validation_alias="EMBEDDING_BATCH_WINDOW_MS")
+    query_cache_size: int = Field(default=2048, validation_alias="EMBEDDING_QUERY_CACHE_SIZE")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+        # model_name would otherwise collide with pydantic's "model_" namespace
+        protected_namespaces=(),
+    )
+
+
+class VectorSearchSettings(BaseSettings):
+    """pgvector search planning settings."""
+    # HNSW candidate list size per query (pgvector hnsw.ef_search, max 1000)
+    hnsw_ef_search: int = Field(default=100, validation_alias="VECTOR_HNSW_EF_SEARCH")
+    # Keep scanning the HNSW graph until filtered queries find enough rows
+    # ("strict_order" or "relaxed_order"; empty to disable). Only applied when
+    # the installed pgvector is 0.8 or later, which added the setting.
+    hnsw_iterative_scan: str = Field(default="strict_order", validation_alias="VECTOR_HNSW_ITERATIVE_SCAN")
+    # Scopes with at most this many vectors are searched exactly instead of via HNSW
+    exact_scan_max_vectors: int = Field(default=5000, validation_alias="VECTOR_EXACT_SCAN_MAX_VECTORS")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+class GraphRAGSettings(BaseSettings):
+    """GraphRAG query pipeline settings."""
+    # Neo4j node mapping + traversal; past this the answer uses vector context only
+    graph_timeout_seconds: float = Field(default=5.0, validation_alias="GRAPHRAG_GRAPH_TIMEOUT_SECONDS")
+    # Answer generation; past this an apology is returned (streams that already
+    # produced text end early with the partial answer)
+    generation_timeout_seconds: float = Field(default=60.0, validation_alias="GRAPHRAG_GENERATION_TIMEOUT_SECONDS")
+    # Workflows whose document/section/entity inventory is kept in memory per process
+    workflow_context_cache_size: int = Field(default=256, validation_alias="GRAPHRAG_WORKFLOW_CONTEXT_CACHE_SIZE")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+class PageAnalysisSettings(BaseSettings):
+    """Rule-based page analysis settings."""
+    # Word n-gram size for near-duplicate page MinHashes
+    duplicate_shingle_size: int = Field(default=3, validation_alias="PAGE_DUPLICATE_SHINGLE_SIZE")
+    # Also match pages against other documents of the same workflow (repeated ISO forms)
+    cross_document_duplicates: bool = Field(default=False, validation_alias="PAGE_CROSS_DOCUMENT_DUPLICATES")
+    cross_document_threshold: float = Field(default=0.9, validation_alias="PAGE_CROSS_DOCUMENT_THRESHOLD")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
+class FormCacheSettings(BaseSettings):
+    """Reuse of extraction output for standard forms across documents."""
+    enabled: bool = Field(default=True, validation_alias="FORM_CACHE_ENABLED")
+    # Outputs below this LLM confidence are stored but never reused
+    min_confidence: float = Field(default=0.8, validation_alias="FORM_CACHE_MIN_CONFIDENCE")
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE) if ENV_FILE else None,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        env_prefix="",
+    )
+
+
 class TemporalSettings(BaseSettings):
     """Temporal connection and workflow settings."""
     host: str = Field(default="localhost", validation_alias="TEMPORAL_HOST")
@@ -202,6 +443,8 @@ class SupabaseSettings(BaseSettings):
     jwt_secret: str = Field(default="", validation_alias="SUPABASE_JWT_SECRET")
     service_role_key: str = Field(default="", validation_alias="SUPABASE_SERVICE_ROLE_KEY")
     jwks_cache_ttl: int = Field(default=3600, validation_alias="SUPABASE_JWKS_CACHE_TTL")  # 1 hour
+    # Files of one upload request streamed to storage at the same time
+    upload_concurrency: int = Field(default=4, validation_alias="STORAGE_UPLOAD_CONCURRENCY")
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE) if ENV_FILE else None,
@@ -243,6 +486,15 @@ class Settings(BaseSettings):
     # Nested Settings - Initialize with env file explicitly
     db: DatabaseSettings = Field(default_factory=lambda: DatabaseSettings())
     llm: LLMSettings = Field(default_factory=lambda: LLMSettings())
+    ocr: OCRSettings = Field(default_factory=lambda: OCRSettings())
+    document_cache: DocumentCacheSettings = Field(default_factory=lambda: DocumentCacheSettings())
+    llm_cache: LLMCacheSettings = Field(default_factory=lambda: LLMCacheSettings())
+    http: HTTPClientSettings = Field(default_factory=lambda: HTTPClientSettings())
+    embedding: EmbeddingSettings = Field(default_factory=lambda: EmbeddingSettings())
+    vector_search: VectorSearchSettings = Field(default_factory=lambda: VectorSearchSettings())
+    graphrag: GraphRAGSettings = Field(default_factory=lambda: GraphRAGSettings())
+    page_analysis: PageAnalysisSettings = Field(default_factory=lambda: PageAnalysisSettings())
+    form_cache: FormCacheSettings = Field(default_factory=lambda: FormCacheSettings())
     temporal: TemporalSettings = Field(default_factory=lambda: TemporalSettings())
     neo4j: Neo4jSettings = Field(default_factory=lambda: Neo4jSettings())
     supabase: SupabaseSettings = Field(default_factory=lambda: SupabaseSettings())
@@ -271,6 +523,10 @@ class Settings(BaseSettings):
     def database_echo(self) -> bool: 
         return self.db.echo
 
+    @property
+    def database_pool_mode(self) -> str:
+        return self.db.resolved_pool_mode
+
     @property
     def gemini_api_key(self) -> str: 
         return self.llm.gemini_api_key
@@ -378,7 +634,10 @@ settings = Settings()
 
 # Log initialization for debugging
 LOGGER.info(f"Settings initialized with environment: {settings.environment}")
-LOGGER.info(f"Database settings: local={settings.db.use_local_db}, pool={settings.db.pool_size}")
+LOGGER.info(
+    f"Database settings: local={settings.db.use_local_db}, pool_mode={settings.db.resolved_pool_mode}, "
+    f"role={settings.db.process_role}, pool={settings.db.pool_size}"
+)
 LOGGER.info(f"Neo4j settings: local={settings.neo4j.use_local_neo4j}, host={settings.neo4j.host}")
 
 if settings.llm_provider == "gemini":
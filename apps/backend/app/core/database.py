@@ -4,12 +4,18 @@ This module centralizes the async SQLAlchemy session dependency in the
 core layer so it can be reused across the application.
 """
 
+import time
+import weakref
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Optional
+from uuid import uuid4
+
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from app.core.config import settings
-from sqlalchemy import text
+from sqlalchemy import exc, text
 
 from app.utils.logging import get_logger
 
@@ -47,21 +53,169 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-from sqlalchemy.pool import NullPool
+class PoolWaitStats:
+    """Running statistics for time spent waiting on a pooled connection."""
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.database_echo,
-    future=True,
-    poolclass=NullPool,
-    # Quality of Life settings
-    connect_args={
-        "statement_cache_size": 0,
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+
+    def record(self, elapsed: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait += elapsed
+        self.max_wait = max(self.max_wait, elapsed)
+        if timed_out:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+        return {
+            "checkouts": self.checkouts,
+            "avg_wait_ms": round(avg_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "timeouts": self.timeouts,
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times.
+
+    The stats object is shared with pools created via ``recreate()`` so
+    metrics survive an invalidation of the whole pool.
+    """
+
+    def __init__(self, *args, wait_stats: Optional[PoolWaitStats] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = wait_stats or PoolWaitStats()
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return conn
+
+
+# Pool mode, process role and configured overflow limit per engine, reported
+# alongside pool metrics
+_ENGINE_LABELS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def build_engine(role: Optional[str] = None) -> AsyncEngine:
+    """Create the async engine for the current process.
+
+    ``DATABASE_POOL_MODE`` selects the pooling strategy:
+
+    - ``queue``: bounded client-side pool with asyncpg's prepared statement
+      cache enabled. Use when connecting to Postgres directly.
+    - ``pgbouncer``: same pool, with the statement cache disabled and unique
+      prepared statement names so statements never collide on a shared
+      server connection. Selected automatically when the URL points at a
+      transaction pooler.
+    - ``null``: no client-side pooling and no statement cache. Every session
+      opens a fresh connection.
+
+    Args:
+        role: ``api`` or ``worker``; defaults to ``DATABASE_PROCESS_ROLE``.
+            Workers get their own (smaller) pool sizing.
+
+    Returns:
+        AsyncEngine: Configured engine
+    """
+    db_settings = settings.db
+    role = role or db_settings.process_role
+    mode = db_settings.resolved_pool_mode
+
+    connect_args = {
         "command_timeout": 60,
         "timeout": 60,
-    },
-)
+    }
+    engine_kwargs = {
+        "echo": db_settings.echo,
+        "future": True,
+    }
+
+    labels = {}
+    if mode == "null":
+        connect_args["statement_cache_size"] = 0
+        engine_kwargs["poolclass"] = NullPool
+    else:
+        if mode not in ("queue", "pgbouncer"):
+            LOGGER.warning(f"Unknown DATABASE_POOL_MODE '{mode}', falling back to 'queue'")
+            mode = "queue"
+
+        connect_args["statement_cache_size"] = db_settings.resolved_statement_cache_size
+        if mode == "pgbouncer":
+            connect_args["prepared_statement_name_func"] = _unique_statement_name
+
+        if role == "worker":
+            pool_size, max_overflow = db_settings.worker_pool_size, db_settings.worker_max_overflow
+        else:
+            pool_size, max_overflow = db_settings.pool_size, db_settings.max_overflow
+        labels["max_overflow"] = max_overflow
+
+        engine_kwargs.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+            pool_recycle=db_settings.pool_recycle,
+            pool_pre_ping=db_settings.pool_pre_ping,
+        )
+
+    LOGGER.info(
+        "Creating database engine",
+        extra={"pool_mode": mode, "role": role},
+    )
+
+    new_engine = create_async_engine(
+        settings.database_url,
+        connect_args=connect_args,
+        **engine_kwargs,
+    )
+    _ENGINE_LABELS[new_engine.sync_engine] = {"mode": mode, "role": role, **labels}
+    return new_engine
+
+
+def get_pool_metrics(target: AsyncEngine) -> dict:
+    """Collect connection pool metrics for an engine.
+
+    Args:
+        target: Engine to inspect
+
+    Returns:
+        dict: Pool mode, sizing, checked-out/overflow counts and wait stats
+    """
+    pool = target.pool
+    metrics = dict(_ENGINE_LABELS.get(target.sync_engine, {"mode": "unknown", "role": "unknown"}))
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        metrics["wait"] = pool.wait_stats.snapshot()
+    return metrics
+
+
+# Create async engine
+engine = build_engine()
 
 # Create async session factory
 async_session_maker = async_sessionmaker(
@@ -202,7 +356,8 @@ class DatabaseClient:
                 "status": "healthy",
                 "connected": True,
                 "database": "postgresql",
-                "latency_test": "passed" if val == 1 else "failed"
+                "latency_test": "passed" if val == 1 else "failed",
+                "pool": get_pool_metrics(self.engine),
             }
             
         except Exception as e:
@@ -212,6 +367,7 @@ class DatabaseClient:
                 "status": "unhealthy",
                 "connected": False,
                 "error": str(e),
+                "pool": get_pool_metrics(self.engine),
             }
 
     @property
@@ -0,0 +1,112 @@
+"""Process-shared outbound HTTP clients.
+
+Creating an ``httpx.AsyncClient`` per request pays DNS, TCP and TLS setup
+on every call. Instead, one long-lived client per origin (scheme, host,
+port) keeps a pool of keep-alive connections, multiplexed over HTTP/2 when
+the ``h2`` package is available.
+
+Clients are bound to the event loop that created them; a new one is made
+if the origin is used from another loop. close_http_clients() must be
+called on shutdown (API lifespan and Temporal worker).
+"""
+
+import asyncio
+import importlib.util
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+if settings.http.http2 and not _HTTP2_AVAILABLE:
+    LOGGER.warning(
+        "HTTP2_ENABLED is set but the h2 package is not installed; "
+        "outbound clients will use HTTP/1.1. Install httpx[http2] to enable HTTP/2."
+    )
+
+_clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Get the shared client for the origin of a URL.
+
+    Args:
+        url: Any URL on the target origin
+
+    Returns:
+        Long-lived AsyncClient; callers must not close it
+    """
+    origin = _origin(url)
+    loop = asyncio.get_running_loop()
+
+    entry = _clients.get(origin)
+    if entry is not None and entry[1] is loop and not entry[0].is_closed:
+        return entry[0]
+
+    client = httpx.AsyncClient(
+        http2=settings.http.http2 and _HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=settings.http.max_connections,
+            max_keepalive_connections=settings.http.max_keepalive_connections,
+            keepalive_expiry=settings.http.keepalive_expiry,
+        ),
+        timeout=settings.http_timeout,
+    )
+    _clients[origin] = (client, loop)
+    LOGGER.debug(
+        f"Created shared HTTP client for {origin}",
+        extra={"origin": origin, "http2": settings.http.http2 and _HTTP2_AVAILABLE},
+    )
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients created on the running event loop."""
+    loop = asyncio.get_running_loop()
+    for origin, (client, client_loop) in list(_clients.items()):
+        if client_loop is not loop:
+            continue
+        del _clients[origin]
+        try:
+            await client.aclose()
+        except Exception as e:
+            LOGGER.warning(f"Error closing HTTP client for {origin}: {e}")
+    LOGGER.info("Closed shared HTTP clients")
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Seconds to wait, capped at HTTP_MAX_RETRY_AFTER_SECONDS, or None
+        if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    return min(max(seconds, 0.0), settings.http.max_retry_after_seconds)
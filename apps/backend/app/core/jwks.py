@@ -8,10 +8,11 @@ import asyncio
 import time
 from typing import List, Dict, Any, Optional
 
-import aiohttp
+import httpx
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -129,25 +130,24 @@ class JWKSService:
             RuntimeError: If fetch fails or response is invalid
         """
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(self.jwks_url) as response:
-                    if response.status != 200:
-                        raise RuntimeError(f"JWKS endpoint returned {response.status}: {await response.text()}")
+            response = await get_http_client(self.jwks_url).get(self.jwks_url, timeout=self.timeout)
+            if response.status_code != 200:
+                raise RuntimeError(f"JWKS endpoint returned {response.status_code}: {response.text}")
 
-                    data = await response.json()
+            data = response.json()
 
-                    LOGGER.info(f"JWKS response: {data}")
+            LOGGER.info(f"JWKS response: {data}")
 
-                    # Validate response structure
-                    jwks_response = JWKSResponse(**data)
+            # Validate response structure
+            jwks_response = JWKSResponse(**data)
 
-                    # Convert to dict keyed by kid
-                    keys = {key.kid: key for key in jwks_response.keys}
+            # Convert to dict keyed by kid
+            keys = {key.kid: key for key in jwks_response.keys}
 
-                    LOGGER.info(f"Successfully fetched {len(keys)} JWKS keys")
-                    return keys
+            LOGGER.info(f"Successfully fetched {len(keys)} JWKS keys")
+            return keys
 
-        except aiohttp.ClientError as e:
+        except httpx.HTTPError as e:
             LOGGER.error(f"Network error fetching JWKS: {e}")
             raise RuntimeError(f"Failed to fetch JWKS keys: {e}") from e
         except Exception as e:
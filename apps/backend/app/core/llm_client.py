@@ -1,10 +1,11 @@
 import asyncio
-from typing import Dict, Any, Optional, List, Union
+import json
+from typing import AsyncIterator, Dict, Any, Optional, List, Union
 
-import httpx
 from httpx import TimeoutException, HTTPStatusError
 
 from app.core.exceptions import APIClientError, APITimeoutError
+from app.core.http_client import get_http_client, retry_after_seconds
 from app.utils.logging import get_logger
 from google import genai
 from google.genai import types
@@ -16,7 +17,8 @@ class BaseLLMClient:
     """Base client for LLM API interactions.
     
     Handles common logic for HTTP requests, retries, timeout management,
-    and error logging.
+    and error logging. Requests share the process-wide pooled client of
+    the API's origin.
     """
 
     def __init__(
@@ -66,41 +68,115 @@ class BaseLLMClient:
             APITimeoutError: If the API call times out after retries
         """
         url = f"{self.base_url}{endpoint}" if endpoint else self.base_url
-        
-        default_headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        
-        if headers:
-            default_headers.update(headers)
+        default_headers = self._build_headers(headers)
             
         self.logger.debug(
             f"Calling LLM API: {url}",
             extra={"method": method, "timeout": self.timeout}
         )
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(self.max_retries):
-                try:
-                    if method.upper() == "GET":
-                        response = await client.get(url, headers=default_headers, params=payload)
-                    else:
-                        response = await client.post(url, headers=default_headers, json=payload)
-                        
-                    response.raise_for_status()
-                    return response.json()
+        client = get_http_client(url)
+        for attempt in range(self.max_retries):
+            try:
+                if method.upper() == "GET":
+                    response = await client.get(
+                        url, headers=default_headers, params=payload, timeout=self.timeout
+                    )
+                else:
+                    response = await client.post(
+                        url, headers=default_headers, json=payload, timeout=self.timeout
+                    )
                     
-                except HTTPStatusError as e:
-                    await self._handle_http_error(e, attempt, url)
+                response.raise_for_status()
+                return response.json()
+                
+            except HTTPStatusError as e:
+                await self._handle_http_error(e, attempt, url)
+                
+            except TimeoutException as e:
+                await self._handle_timeout_error(e, attempt, url)
+                
+            except Exception as e:
+                await self._handle_generic_error(e, attempt, url)
                     
-                except TimeoutException as e:
+        raise APIClientError(f"Failed to call API {url} after {self.max_retries} attempts")
+
+    async def stream_api(
+        self,
+        endpoint: str = "",
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST to a server-sent events API and yield the parsed events.
+
+        Failures before the first event are retried like call_api. Once
+        events have been yielded the request cannot be replayed, so a
+        failure mid-stream is raised immediately.
+
+        Args:
+            endpoint: API endpoint (appended to base_url)
+            payload: JSON payload
+            headers: Additional headers
+
+        Yields:
+            JSON payload of each ``data:`` event, until ``[DONE]``
+
+        Raises:
+            APIClientError: If the stream fails
+            APITimeoutError: If the API call times out after retries
+        """
+        url = f"{self.base_url}{endpoint}" if endpoint else self.base_url
+        default_headers = self._build_headers(headers)
+
+        self.logger.debug(
+            f"Streaming LLM API: {url}",
+            extra={"timeout": self.timeout}
+        )
+
+        client = get_http_client(url)
+        for attempt in range(self.max_retries):
+            received = False
+            try:
+                async with client.stream(
+                    "POST", url, headers=default_headers, json=payload, timeout=self.timeout
+                ) as response:
+                    if response.is_error:
+                        # Load the body so the error handler can log it
+                        await response.aread()
+                    response.raise_for_status()
+
+                    async for line in response.aiter_lines():
+                        # Skip event separators and keep-alive comments
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[len("data:"):].strip()
+                        if data == "[DONE]":
+                            return
+                        received = True
+                        yield json.loads(data)
+                return
+
+            except Exception as e:
+                if received:
+                    raise APIClientError(f"API stream {url} interrupted: {e}") from e
+                if isinstance(e, HTTPStatusError):
+                    await self._handle_http_error(e, attempt, url)
+                elif isinstance(e, TimeoutException):
                     await self._handle_timeout_error(e, attempt, url)
-                    
-                except Exception as e:
+                else:
                     await self._handle_generic_error(e, attempt, url)
-                    
-        raise APIClientError(f"Failed to call API {url} after {self.max_retries} attempts")
+
+        raise APIClientError(f"Failed to stream API {url} after {self.max_retries} attempts")
+
+    def _build_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Build request headers with authentication."""
+        default_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        if headers:
+            default_headers.update(headers)
+        return default_headers
 
     async def _handle_http_error(self, error: HTTPStatusError, attempt: int, url: str):
         """Handle HTTP status errors."""
@@ -126,7 +202,9 @@ class BaseLLMClient:
             raise APIClientError(f"API Client Error {status_code}: {error_body}") from error
             
         if attempt < self.max_retries - 1:
-            await self._wait_before_retry(attempt)
+            # Rate limits and overload responses say how long to back off
+            retry_after = retry_after_seconds(error.response) if status_code in (429, 503) else None
+            await self._wait_before_retry(attempt, retry_after)
         else:
             raise APIClientError(f"API HTTP Error {status_code} after retries") from error
 
@@ -154,9 +232,19 @@ class BaseLLMClient:
         else:
             raise APIClientError(f"API Error: {str(error)}") from error
 
-    async def _wait_before_retry(self, attempt: int):
-        """Exponential backoff wait."""
-        wait_time = self.retry_delay * (2 ** attempt)
+    async def _wait_before_retry(self, attempt: int, retry_after: Optional[float] = None):
+        """Wait before retrying.
+
+        Args:
+            attempt: Zero-based attempt number
+            retry_after: Server-requested delay (Retry-After); exponential
+                backoff is used when absent
+        """
+        if retry_after is not None:
+            self.logger.info(f"Honoring Retry-After of {retry_after:.1f}s")
+            wait_time = retry_after
+        else:
+            wait_time = self.retry_delay * (2 ** attempt)
         await asyncio.sleep(wait_time)
 
 
@@ -209,26 +297,7 @@ class GeminiClient:
         Raises:
             APIClientError: If generation fails
         """
-        # Default config
-        config = types.GenerateContentConfig(
-            temperature=0.0,  # Default to deterministic
-        )
-        
-        # Merge provided config
-        if generation_config:
-            # Map dict to GenerateContentConfig if needed, or pass as kwargs
-            # The SDK accepts a config object or kwargs. Let's use the object.
-            if "temperature" in generation_config:
-                config.temperature = generation_config["temperature"]
-            if "max_output_tokens" in generation_config:
-                config.max_output_tokens = generation_config["max_output_tokens"]
-            if "response_mime_type" in generation_config:
-                config.response_mime_type = generation_config["response_mime_type"]
-            if "response_schema" in generation_config:
-                config.response_schema = generation_config["response_schema"]
-
-        if system_instruction:
-            config.system_instruction = system_instruction
+        config = self._build_config(system_instruction, generation_config)
 
         for attempt in range(self.max_retries):
             try:
@@ -267,6 +336,86 @@ class GeminiClient:
         
         raise APIClientError("Gemini generation failed")
 
+    async def generate_content_stream(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream generated text from Gemini as it is produced.
+
+        Failures before the first chunk are retried; a failure after text
+        has been yielded is raised, since the stream cannot be resumed.
+
+        Args:
+            contents: Input content (string or list of parts)
+            system_instruction: Optional system instruction
+            generation_config: Optional generation config (temperature, etc.)
+
+        Yields:
+            Text deltas
+
+        Raises:
+            APIClientError: If generation fails
+        """
+        config = self._build_config(system_instruction, generation_config)
+
+        for attempt in range(self.max_retries):
+            emitted = False
+            try:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model,
+                    contents=contents,
+                    config=config
+                )
+                async for chunk in stream:
+                    if chunk.text:
+                        emitted = True
+                        yield chunk.text
+                return
+
+            except Exception as e:
+                if emitted:
+                    LOGGER.error(f"Gemini stream interrupted: {e}", exc_info=True)
+                    raise APIClientError(f"Gemini stream interrupted: {e}") from e
+                LOGGER.warning(
+                    f"Gemini streaming error (Attempt {attempt + 1}/{self.max_retries}): {e}"
+                )
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+                else:
+                    LOGGER.error(f"Gemini streaming failed after retries: {e}", exc_info=True)
+                    raise APIClientError(f"Gemini generation failed: {e}")
+
+    def _build_config(
+        self,
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+    ) -> types.GenerateContentConfig:
+        """Build the SDK request config from a generation config dict."""
+        # Default config
+        config = types.GenerateContentConfig(
+            temperature=0.0,  # Default to deterministic
+        )
+        
+        # Merge provided config
+        if generation_config:
+            # Map dict to GenerateContentConfig if needed, or pass as kwargs
+            # The SDK accepts a config object or kwargs. Let's use the object.
+            if "temperature" in generation_config:
+                config.temperature = generation_config["temperature"]
+            if "max_output_tokens" in generation_config:
+                config.max_output_tokens = generation_config["max_output_tokens"]
+            if "response_mime_type" in generation_config:
+                config.response_mime_type = generation_config["response_mime_type"]
+            if "response_schema" in generation_config:
+                config.response_schema = generation_config["response_schema"]
+
+        if system_instruction:
+            config.system_instruction = system_instruction
+
+        return config
+
 
 
 class OpenRouterClient:
@@ -328,6 +477,82 @@ class OpenRouterClient:
         Raises:
             APIClientError: If generation fails
         """
+        payload = self._build_payload(contents, system_instruction, generation_config)
+
+        try:
+            # Call OpenRouter API
+            response = await self.client.call_api(
+                endpoint="",  # Base URL already includes the endpoint
+                method="POST",
+                payload=payload
+            )
+            
+            # Extract text from response
+            if "choices" in response and len(response["choices"]) > 0:
+                message = response["choices"][0].get("message", {})
+                content = message.get("content", "")
+                
+                if not content:
+                    LOGGER.warning("Empty response from OpenRouter")
+                    return ""
+                
+                return content
+            else:
+                LOGGER.error(f"Unexpected OpenRouter response format: {response}")
+                raise APIClientError("Invalid response format from OpenRouter")
+                
+        except Exception as e:
+            LOGGER.error(f"OpenRouter generation failed: {e}", exc_info=True)
+            raise APIClientError(f"OpenRouter generation failed: {e}")
+
+    async def generate_content_stream(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream generated text from OpenRouter (server-sent events).
+
+        Args:
+            contents: Input content (string or list of parts)
+            system_instruction: Optional system instruction
+            generation_config: Optional generation config (temperature, etc.)
+
+        Yields:
+            Text deltas
+
+        Raises:
+            APIClientError: If generation fails
+        """
+        payload = self._build_payload(contents, system_instruction, generation_config)
+        payload["stream"] = True
+
+        try:
+            async for event in self.client.stream_api(payload=payload):
+                # Errors after the stream has started arrive as events
+                if "error" in event:
+                    raise APIClientError(f"OpenRouter stream error: {event['error']}")
+
+                choices = event.get("choices") or []
+                if not choices:
+                    continue
+                delta = (choices[0].get("delta") or {}).get("content")
+                if delta:
+                    yield delta
+
+        except APIClientError:
+            raise
+        except Exception as e:
+            LOGGER.error(f"OpenRouter streaming failed: {e}", exc_info=True)
+            raise APIClientError(f"OpenRouter generation failed: {e}")
+
+    def _build_payload(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the chat completions request payload."""
         # Build messages array for OpenRouter
         messages = []
         
@@ -383,29 +608,5 @@ class OpenRouterClient:
         else:
             # Default to deterministic
             payload["temperature"] = 0.0
-        
-        try:
-            # Call OpenRouter API
-            response = await self.client.call_api(
-                endpoint="",  # Base URL already includes the endpoint
-                method="POST",
-                payload=payload
-            )
-            
-            # Extract text from response
-            if "choices" in response and len(response["choices"]) > 0:
-                message = response["choices"][0].get("message", {})
-                content = message.get("content", "")
-                
-                if not content:
-                    LOGGER.warning("Empty response from OpenRouter")
-                    return ""
-                
-                return content
-            else:
-                LOGGER.error(f"Unexpected OpenRouter response format: {response}")
-                raise APIClientError("Invalid response format from OpenRouter")
-                
-        except Exception as e:
-            LOGGER.error(f"OpenRouter generation failed: {e}", exc_info=True)
-            raise APIClientError(f"OpenRouter generation failed: {e}")
+
+        return payload
@@ -0,0 +1,206 @@
+"""Process-wide LLM concurrency and rate limiting.
+
+Every UnifiedLLMClient in a worker process shares one limiter per provider,
+so concurrent extraction tasks cannot exceed the provider's request and
+token quotas however many clients or services issue calls.
+
+A limiter combines:
+- a semaphore capping in-flight requests
+- a token bucket on requests per minute
+- a token bucket on (estimated) prompt tokens per minute
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Rough characters-per-token ratio used to size requests before sending them
+CHARS_PER_TOKEN = 4
+
+
+def estimate_prompt_tokens(
+    contents: Union[str, List[Union[str, Dict[str, Any]]]],
+    system_instruction: Optional[str] = None,
+) -> int:
+    """Estimate the prompt tokens of an LLM request from its length."""
+    if isinstance(contents, str):
+        chars = len(contents)
+    else:
+        chars = sum(len(part) if isinstance(part, str) else len(str(part)) for part in contents)
+    if system_instruction:
+        chars += len(system_instruction)
+    return chars // CHARS_PER_TOKEN + 1
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at a per-minute rate.
+
+    The bucket holds at most one minute of budget. Requests larger than
+    that are clamped so they wait for a full bucket instead of forever.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        """Initialize a full bucket.
+
+        Args:
+            per_minute: Budget added per minute
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take budget from the bucket, waiting until enough is available.
+
+        Args:
+            amount: Budget to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+
+class LLMRateLimiter:
+    """Concurrency and rate limits for one LLM provider.
+
+    asyncio primitives are bound to the event loop they are first used on,
+    so they are recreated if the limiter is used from a new loop.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            provider: Provider name (for logging)
+            max_concurrency: Maximum in-flight requests
+            requests_per_minute: Request quota, 0 for no limit
+            tokens_per_minute: Prompt token quota, 0 for no limit
+        """
+        self.provider = provider
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._request_bucket: Optional[TokenBucket] = None
+        self._token_bucket: Optional[TokenBucket] = None
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._request_bucket = TokenBucket(self.requests_per_minute) if self.requests_per_minute > 0 else None
+        self._token_bucket = TokenBucket(self.tokens_per_minute) if self.tokens_per_minute > 0 else None
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of an LLM call.
+
+        Args:
+            estimated_tokens: Estimated prompt tokens of the request
+        """
+        self._bind_loop()
+        started = time.monotonic()
+
+        async with self._semaphore:
+            if self._request_bucket is not None:
+                await self._request_bucket.acquire(1)
+            if self._token_bucket is not None and estimated_tokens > 0:
+                await self._token_bucket.acquire(estimated_tokens)
+
+            waited = time.monotonic() - started
+            self.total_wait_seconds += waited
+            self.total_requests += 1
+            if waited > 1.0:
+                LOGGER.debug(
+                    f"LLM request waited {waited:.1f}s for {self.provider} rate limit",
+                    extra={"provider": self.provider, "in_flight": self.in_flight},
+                )
+
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "provider": self.provider,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "total_requests": self.total_requests,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+        }
+
+
+_limiters: Dict[str, LLMRateLimiter] = {}
+
+
+def get_llm_rate_limiter(provider: str) -> LLMRateLimiter:
+    """Get the process-wide limiter of a provider.
+
+    Args:
+        provider: Provider name (e.g. "gemini", "openrouter")
+
+    Returns:
+        LLMRateLimiter shared by all clients of the provider
+    """
+    provider = str(getattr(provider, "value", provider)).lower()
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limiter = LLMRateLimiter(
+            provider=provider,
+            max_concurrency=settings.llm.max_concurrency,
+            requests_per_minute=settings.llm.requests_per_minute,
+            tokens_per_minute=settings.llm.tokens_per_minute,
+        )
+        _limiters[provider] = limiter
+    return limiter
+
+
+def llm_rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the statistics of every provider limiter created in this process.
+
+    Returns:
+        Limiter stats keyed by provider name
+    """
+    return {provider: limiter.stats() for provider, limiter in _limiters.items()}
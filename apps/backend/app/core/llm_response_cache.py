@@ -0,0 +1,265 @@
+"""Content-addressed local cache of LLM responses.
+
+Temporal retries, re-runs of a workflow and repeated comparisons send the
+same prompts to the LLM again. Responses are stored on local disk under a
+hash of everything that determines them (provider, model, system
+instruction, contents and generation config), so an identical request is
+answered from disk instead of being billed again.
+
+Entries expire after a TTL. The cache is bounded by total size with
+least-recently-used eviction, tracked through file mtimes like the
+document cache.
+
+Layout under the cache root:
+    <key[:2]>/<key>.json    {"created_at": <unix time>, "response": <text>}
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+def llm_cache_key(
+    provider: str,
+    model: str,
+    contents: Union[str, List[Union[str, Dict[str, Any]]]],
+    system_instruction: Optional[str] = None,
+    generation_config: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Hash the inputs that determine an LLM response.
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        {
+            "provider": str(getattr(provider, "value", provider)),
+            "model": model,
+            "system_instruction": system_instruction,
+            "contents": contents,
+            "generation_config": generation_config or {},
+        },
+        sort_keys=True,
+        default=str,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """TTL- and size-bounded on-disk cache of LLM responses.
+
+    Attributes:
+        root: Cache root directory
+        ttl_seconds: Age after which entries are ignored and removed
+        max_bytes: Total entry size above which LRU entries are evicted
+    """
+
+    def __init__(self, root: str, ttl_seconds: int, max_bytes: int):
+        """Initialize the cache and create its directory.
+
+        Args:
+            root: Cache root directory
+            ttl_seconds: Entry time to live
+            max_bytes: Maximum total size of cached entries
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # Total entry size, scanned on the first write and then tracked
+        self._total_bytes: Optional[int] = None
+        # One in-flight LLM call per key in this process
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    @asynccontextmanager
+    async def single_flight(self, key: str) -> AsyncIterator[None]:
+        """Serialize identical requests, so concurrent duplicates call the LLM once.
+
+        The lock of a key is dropped once no request holds or waits for it.
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    def get(self, key: str) -> Optional[str]:
+        """Read a cached response.
+
+        Args:
+            key: Cache key from llm_cache_key
+
+        Returns:
+            Response text, or None on a miss or expired entry
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError):
+            # Corrupt or partially written entry
+            self.misses += 1
+            self._remove(path)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self.expired += 1
+            self.misses += 1
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return entry.get("response")
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response atomically and evict if over the size bound.
+
+        Args:
+            key: Cache key from llm_cache_key
+            response: Response text
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"created_at": time.time(), "response": response}, ensure_ascii=False)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as out:
+                out.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if self._total_bytes is None:
+            self._total_bytes = self._scan()[1]
+        else:
+            self._total_bytes += path.stat().st_size
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        if self._total_bytes is not None:
+            self._total_bytes -= size
+
+    def _scan(self):
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        return entries, total
+
+    def evict(self) -> int:
+        """Evict least-recently-used entries until the cache fits max_bytes.
+
+        Returns:
+            Number of entries evicted
+        """
+        entries, total = self._scan()
+
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+            evicted += 1
+
+        self._total_bytes = total
+        self.evictions += evicted
+        if evicted:
+            LOGGER.info(
+                f"Evicted {evicted} cached LLM responses",
+                extra={"evicted": evicted, "cache_bytes": total, "max_bytes": self.max_bytes},
+            )
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_llm_response_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get or create the process-wide LLM response cache.
+
+    Returns:
+        LLMResponseCache instance
+    """
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache(
+            root=settings.llm_cache.directory,
+            ttl_seconds=settings.llm_cache.ttl_seconds,
+            max_bytes=settings.llm_cache.max_bytes,
+        )
+    return _llm_response_cache
+
+
+def llm_response_cache_stats() -> Optional[Dict[str, Any]]:
+    """Get the process-wide cache counters without creating the cache.
+
+    Returns:
+        Cache stats, or None if no LLM call has used the cache yet
+    """
+    if _llm_response_cache is None:
+        return None
+    return _llm_response_cache.stats()
@@ -4,10 +4,14 @@ Provides a unified interface for interacting with different LLM providers
 (Gemini, OpenRouter, Ollama, Groq) with automatic provider selection based on configuration.
 """
 
+import asyncio
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from app.core.llm_client import GeminiClient, OpenRouterClient
+from app.core.config import settings
+from app.core.llm_rate_limiter import estimate_prompt_tokens, get_llm_rate_limiter
+from app.core.llm_response_cache import get_llm_response_cache, llm_cache_key
 from app.utils.logging import get_logger
 from app.core.exceptions import APIClientError
 
@@ -25,6 +29,11 @@ class UnifiedLLMClient:
     
     Provides a consistent interface regardless of the underlying provider,
     allowing seamless switching between Gemini, OpenRouter.
+
+    Calls go through the process-wide rate limiter of their provider, so
+    concurrent callers share one request and token budget per worker.
+    With LLM_CACHE_ENABLED, identical requests are answered from the local
+    response cache.
     """
 
     def __init__(
@@ -131,6 +140,7 @@ class UnifiedLLMClient:
         contents: Union[str, List[Union[str, Dict[str, Any]]]],
         system_instruction: Optional[str] = None,
         generation_config: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
     ) -> str:
         """Generate content using the configured LLM provider.
 
@@ -138,6 +148,8 @@ class UnifiedLLMClient:
             contents: Input content (string or list of parts)
             system_instruction: Optional system instruction
             generation_config: Optional generation config (temperature, etc.)
+            use_cache: Read and write the response cache (defaults to
+                LLM_CACHE_ENABLED); False bypasses it for this call
 
         Returns:
             Generated text response
@@ -145,13 +157,54 @@ class UnifiedLLMClient:
         Raises:
             APIClientError: If generation fails
         """
+        if not (settings.llm_cache.enabled if use_cache is None else use_cache):
+            response, _ = await self._generate_uncached(contents, system_instruction, generation_config)
+            return response
+
+        cache = get_llm_response_cache()
+        key = llm_cache_key(self.provider, self.model, contents, system_instruction, generation_config)
+
+        # Identical concurrent requests wait for the first one instead of
+        # each calling the LLM
+        async with cache.single_flight(key):
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                LOGGER.debug("LLM response cache hit", extra={"provider": self.provider.value, "model": self.model})
+                return cached
+
+            response, from_fallback = await self._generate_uncached(
+                contents, system_instruction, generation_config
+            )
+
+            # A fallback answer is not cached: the key names the primary model
+            if response and not from_fallback:
+                try:
+                    await asyncio.to_thread(cache.put, key, response)
+                except OSError as e:
+                    LOGGER.warning(f"Failed to cache LLM response: {e}")
+            return response
+
+    async def _generate_uncached(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+    ) -> Tuple[str, bool]:
+        """Call the provider (with fallback) under the provider rate limit.
+
+        Returns:
+            Tuple of (generated text, whether the Gemini fallback produced it)
+        """
+        estimated_tokens = estimate_prompt_tokens(contents, system_instruction)
         try:
             # Try primary client
-            return await self.client.generate_content(
-                contents=contents,
-                system_instruction=system_instruction,
-                generation_config=generation_config
-            )
+            async with get_llm_rate_limiter(self.provider).limit(estimated_tokens):
+                response = await self.client.generate_content(
+                    contents=contents,
+                    system_instruction=system_instruction,
+                    generation_config=generation_config
+                )
+            return response, False
         except Exception as e:
             # Try fallback if enabled
             if self.fallback_client:
@@ -159,11 +212,13 @@ class UnifiedLLMClient:
                     f"Primary provider ({self.provider}) failed, attempting Gemini fallback: {e}"
                 )
                 try:
-                    return await self.fallback_client.generate_content(
-                        contents=contents,
-                        system_instruction=system_instruction,
-                        generation_config=generation_config
-                    )
+                    async with get_llm_rate_limiter(LLMProvider.GEMINI).limit(estimated_tokens):
+                        response = await self.fallback_client.generate_content(
+                            contents=contents,
+                            system_instruction=system_instruction,
+                            generation_config=generation_config
+                        )
+                    return response, True
                 except Exception as fallback_error:
                     LOGGER.error(f"Fallback to Gemini also failed: {fallback_error}")
                     raise APIClientError(
@@ -174,6 +229,103 @@ class UnifiedLLMClient:
                 raise
 
 
+    async def generate_content_stream(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        use_cache: Optional[bool] = None,
+    ) -> AsyncIterator[str]:
+        """Stream generated text from the configured LLM provider.
+
+        Shares the response cache of generate_content: a cached response is
+        yielded as a single chunk, and a completed stream from the primary
+        provider is cached.
+
+        Args:
+            contents: Input content (string or list of parts)
+            system_instruction: Optional system instruction
+            generation_config: Optional generation config (temperature, etc.)
+            use_cache: Read and write the response cache (defaults to
+                LLM_CACHE_ENABLED); False bypasses it for this call
+
+        Yields:
+            Text deltas
+
+        Raises:
+            APIClientError: If generation fails
+        """
+        key = None
+        if settings.llm_cache.enabled if use_cache is None else use_cache:
+            cache = get_llm_response_cache()
+            key = llm_cache_key(self.provider, self.model, contents, system_instruction, generation_config)
+            cached = await asyncio.to_thread(cache.get, key)
+            if cached is not None:
+                LOGGER.debug("LLM response cache hit", extra={"provider": self.provider.value, "model": self.model})
+                yield cached
+                return
+
+        parts: List[str] = []
+        from_fallback = False
+        async for delta, from_fallback in self._stream_uncached(
+            contents, system_instruction, generation_config
+        ):
+            parts.append(delta)
+            yield delta
+
+        if key is not None and parts and not from_fallback:
+            try:
+                await asyncio.to_thread(get_llm_response_cache().put, key, "".join(parts))
+            except OSError as e:
+                LOGGER.warning(f"Failed to cache LLM response: {e}")
+
+    async def _stream_uncached(
+        self,
+        contents: Union[str, List[Union[str, Dict[str, Any]]]],
+        system_instruction: Optional[str],
+        generation_config: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """Stream from the provider under its rate limit.
+
+        The request slot is held until the stream ends. Gemini fallback is
+        only attempted if the primary provider failed before yielding text.
+
+        Yields:
+            Tuples of (text delta, whether the Gemini fallback produced it)
+        """
+        estimated_tokens = estimate_prompt_tokens(contents, system_instruction)
+        emitted = False
+        try:
+            async with get_llm_rate_limiter(self.provider).limit(estimated_tokens):
+                async for delta in self.client.generate_content_stream(
+                    contents=contents,
+                    system_instruction=system_instruction,
+                    generation_config=generation_config
+                ):
+                    emitted = True
+                    yield delta, False
+        except Exception as e:
+            if emitted or not self.fallback_client:
+                raise
+
+            LOGGER.warning(
+                f"Primary provider ({self.provider}) stream failed, attempting Gemini fallback: {e}"
+            )
+            try:
+                async with get_llm_rate_limiter(LLMProvider.GEMINI).limit(estimated_tokens):
+                    async for delta in self.fallback_client.generate_content_stream(
+                        contents=contents,
+                        system_instruction=system_instruction,
+                        generation_config=generation_config
+                    ):
+                        yield delta, True
+            except Exception as fallback_error:
+                LOGGER.error(f"Fallback to Gemini also failed: {fallback_error}")
+                raise APIClientError(
+                    f"Both primary ({self.provider}) and fallback (Gemini) failed"
+                ) from fallback_error
+
+
 def create_llm_client(
     provider: Union[str, LLMProvider],
     api_key: str = "",
@@ -9,7 +9,9 @@ from sqlalchemy import (
     JSON,
     Date,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     Numeric,
     String,
     Text,
@@ -26,6 +28,10 @@ from app.core.database import Base
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+# Width of vector_embeddings.embedding; EMBEDDING_MODEL_NAME must produce vectors
+# of this size (changing it needs a migration and a re-embed)
+EMBEDDING_DIMENSION = 384
+
 
 class User(Base):
     """User model for Supabase-authenticated users."""
@@ -65,6 +71,9 @@ class Document(Base):
     file_path: Mapped[str] = mapped_column(String, nullable=False)
     document_name: Mapped[str | None] = mapped_column(String, nullable=True)
     mime_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    checksum: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, comment="SHA-256 of the uploaded file content"
+    )
     page_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     status: Mapped[str] = mapped_column(
         String, nullable=False, default="uploaded"
@@ -103,6 +112,11 @@ class Document(Base):
         "Citation", back_populates="document", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Re-uploads of identical content are matched per user
+        Index("ix_documents_user_checksum", "user_id", "checksum"),
+    )
+
 
 class DocumentPage(Base):
     """Page-level metadata for PDFs/images."""
@@ -145,6 +159,46 @@ class DocumentPage(Base):
     document: Mapped["Document"] = relationship("Document", back_populates="pages")
 
 
+class DocumentPageCoordinates(Base):
+    """Columnar word coordinates for one page, used for citation mapping.
+
+    Word boxes are packed as little-endian float32 ``(x0, y0, x1, y1)``
+    quadruples and word texts as one string with int32 start offsets, so a
+    page with thousands of words is a handful of compact values instead of
+    a JSON array of dicts.
+    """
+
+    __tablename__ = "document_page_coordinates"
+    __table_args__ = (
+        UniqueConstraint("document_id", "page_number", name="uq_page_coordinates_doc_page"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    document_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
+    )
+    page_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    word_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    boxes: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False,
+        comment="float32 x0, y0, x1, y1 per word (PDF points, bottom-left origin)"
+    )
+    text_offsets: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False,
+        comment="int32 start offset of each word in text, plus the end offset"
+    )
+    text: Mapped[str] = mapped_column(
+        Text, nullable=False,
+        comment="Concatenated word texts"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default="NOW()"
+    )
+
+
 class DocumentTable(Base):
     """First-class table representation with full structural information.
     
@@ -364,6 +418,13 @@ class PageClassificationResult(Base):
     reasoning: Mapped[str | None] = mapped_column(
         Text, nullable=True, comment="Human-readable classification reasoning"
     )
+    cross_document_match: Mapped[dict | None] = mapped_column(
+        JSONB(none_as_null=True), nullable=True,
+        comment="Near-identical page in another document of the workflow"
+    )
+    minhash_signature: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, comment="MinHash signature of the page text for cross-document matching"
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default="NOW()"
     )
@@ -590,6 +651,63 @@ class SectionExtraction(Base):
     )
 
 
+class FormFingerprint(Base):
+    """Extraction output of a standard form, reusable across documents.
+
+    Keyed by the form numbers found in the extracted text plus a hash of the
+    normalized text and extraction prompt, so any document containing the
+    same form word-for-word can reuse the LLM output instead of extracting
+    it again.
+    """
+
+    __tablename__ = "form_fingerprints"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    fingerprint: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True,
+        comment="SHA-256 of form numbers, extractor, prompt and normalized text"
+    )
+    form_number: Mapped[str] = mapped_column(
+        String, nullable=False, index=True, comment="Form number(s), e.g. 'CG 00 01 04 13'"
+    )
+    section_type: Mapped[str] = mapped_column(
+        String, nullable=False, comment="Section type the form was extracted as"
+    )
+    extractor_key: Mapped[str] = mapped_column(
+        String, nullable=False, comment="Extractor that produced the output"
+    )
+    extraction_output: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, comment="Parsed LLM output before page number injection"
+    )
+    confidence: Mapped[Decimal] = mapped_column(
+        Numeric(5, 3), nullable=False, comment="Extraction confidence reported by the LLM"
+    )
+    validated: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, comment="Whether the output may be reused"
+    )
+    source_document_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="SET NULL"), nullable=True
+    )
+    model_version: Mapped[str | None] = mapped_column(
+        String, nullable=True, comment="LLM model version for provenance"
+    )
+    hit_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Times the output was reused"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default="NOW()"
+    )
+    last_used_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        {"comment": "Reusable extraction output of standard ISO forms"},
+    )
+
+
 class EntityMention(Base):
     """Document-scoped entity mentions (Layer 1 for entities).
     
@@ -963,6 +1081,11 @@ class WorkflowDocument(Base):
         foreign_keys=[workflow_id]
     )
 
+    __table_args__ = (
+        # The primary key leads with document_id; listings look documents up per workflow
+        Index("ix_workflow_documents_workflow_id", "workflow_id"),
+    )
+
 
 class Workflow(Base):
     """Temporal workflow instances."""
@@ -1041,6 +1164,11 @@ class Workflow(Base):
         "WorkflowQuery", back_populates="workflow", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Keyset pagination of a user's workflows, newest first
+        Index("ix_workflows_user_created_id", "user_id", "created_at", "id"),
+    )
+
 
 class WorkflowRunEvent(Base):
     """Audit trail for workflow runs."""
@@ -1069,6 +1197,11 @@ class WorkflowRunEvent(Base):
     # Relationships
     workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="events")
 
+    __table_args__ = (
+        # Latest events per workflow
+        Index("ix_workflow_run_events_workflow_created", "workflow_id", "created_at"),
+    )
+
 
 class WorkflowDefinition(Base):
     """Static workflow definitions."""
@@ -1246,7 +1379,7 @@ class VectorEmbedding(Base):
     embedding_model: Mapped[str] = mapped_column(String, nullable=False)
     embedding_dim: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding_version: Mapped[str] = mapped_column(String, nullable=False)
-    embedding: Mapped[list[float]] = mapped_column(Vector(384), nullable=True)
+    embedding: Mapped[list[float]] = mapped_column(Vector(EMBEDDING_DIMENSION), nullable=True)
     effective_date: Mapped[datetime | None] = mapped_column(Date, nullable=True)
     expiration_date: Mapped[datetime | None] = mapped_column(Date, nullable=True)
     location_id: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -1269,6 +1402,15 @@ class VectorEmbedding(Base):
     source_chunk: Mapped["DocumentChunk | None"] = relationship("DocumentChunk")
 
     __table_args__ = (
+        Index(
+            "ix_vector_embeddings_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # Scope filter of every search; serves exact scans of small workflows
+        Index("ix_vector_embeddings_workflow_document", "workflow_id", "document_id"),
         {"comment": "Canonical table for pgvector embeddings"},
     )
 
@@ -15,6 +15,7 @@ from app.utils.logging import get_logger
 import asyncio
 import httpx
 from app.core.database import init_database, close_database
+from app.core.http_client import close_http_clients
 from app.core.neo4j_client import init_neo4j
 from app.api.v1.middleware.auth import JWTAuthenticationMiddleware
 
@@ -131,6 +132,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         LOGGER.info("Keep-alive task cancelled")
     
+    # Close pooled outbound HTTP connections
+    await close_http_clients()
+
     # Close database connection
     try:
         await close_database()
@@ -281,6 +281,13 @@ class PageClassification(BaseModel):
         None,
         description="Position in endorsement sequence (e.g., 2 for page 2 of 3)"
     )
+
+    # Cross-document duplicate tracking (repeated forms within a workflow)
+    cross_document_match: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Near-identical page in another document of the workflow "
+                    "(document_id, page_number, similarity)"
+    )
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -1,7 +1,7 @@
 """Data model for page-specific OCR results."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 @dataclass
@@ -16,6 +16,9 @@ class PageData:
         width_points: Page width in PDF points (1 point = 1/72 inch)
         height_points: Page height in PDF points
         rotation: Page rotation in degrees (0, 90, 180, 270)
+        word_coordinates: Compact word boxes (``t``, ``x0``, ``y0``, ``x1``, ``y1``)
+            for citation mapping; persisted to the columnar coordinate store,
+            not to page metadata
     """
 
     page_number: int
@@ -25,6 +28,7 @@ class PageData:
     width_points: Optional[float] = None
     height_points: Optional[float] = None
     rotation: int = 0
+    word_coordinates: Optional[List[Dict[str, Any]]] = None
     
     def get_content(self, prefer_markdown: bool = True) -> str:
         """Get page content, preferring markdown if available.
@@ -8,7 +8,9 @@ Also extracts word-level coordinates and page dimensions for citation
 source mapping functionality.
 """
 
-from typing import List, Optional, Dict
+import asyncio
+import time
+from typing import List, Optional, Dict, Tuple, Union
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,7 +18,6 @@ from app.utils.logging import get_logger
 from app.models.page_data import PageData
 from app.services.processed.services.ocr.ocr_service import OCRService
 from app.services.processed.services.ocr.coordinate_extraction_service import (
-    CoordinateExtractionService,
     get_coordinate_extraction_service,
 )
 from app.repositories.document_repository import DocumentRepository
@@ -70,6 +71,8 @@ class OCRExtractionPipeline:
         document_id: UUID,
         document_url: str,
         pdf_bytes: Optional[bytes] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+        pdf_path: Optional[str] = None,
     ) -> List[PageData]:
         """Extract text from document and store in database.
 
@@ -78,6 +81,10 @@ class OCRExtractionPipeline:
             document_url: URL or path to the document
             pdf_bytes: Optional PDF content as bytes for coordinate extraction.
                 If not provided, coordinate extraction will be skipped.
+            page_range: Optional inclusive (first, last) page range for sharded
+                OCR. Only pages in the range are extracted and replaced.
+            pdf_path: Optional local PDF path (document cache) for coordinate
+                extraction; preferred over pdf_bytes.
 
         Returns:
             List[PageData]: Extracted page data with optional page dimensions
@@ -88,60 +95,36 @@ class OCRExtractionPipeline:
                 "document_id": str(document_id),
                 "document_url": document_url,
                 "has_pdf_bytes": pdf_bytes is not None,
+                "has_pdf_path": pdf_path is not None,
+                "page_range": page_range,
             }
         )
 
-        # Extract pages using Docling
-        pages = await self.ocr_service.extract_pages(
-            document_url=document_url,
-            document_id=document_id,
-        )
+        # Word coordinates are extracted concurrently with Docling and
+        # only joined once the OCR pages are available
+        pdf_source = pdf_path or pdf_bytes
+        coordinate_task = None
+        if self.enable_coordinate_extraction and self.coordinate_service and pdf_source:
+            coordinate_task = asyncio.create_task(
+                self._collect_coordinates(document_id, pdf_source, page_range)
+            )
 
-        # Extract coordinates and page dimensions if enabled and pdf_bytes provided
-        page_dimensions = {}
-        page_word_coordinates = {}  # page_number -> list of word coordinate dicts
-        if self.enable_coordinate_extraction and self.coordinate_service and pdf_bytes:
-            try:
-                coord_result = await self.coordinate_service.extract_word_coordinates(
-                    pdf_bytes
-                )
-
-                # Build page dimensions lookup
-                for page_meta in coord_result.pages:
-                    page_dimensions[page_meta.page_number] = {
-                        "width": page_meta.width,
-                        "height": page_meta.height,
-                        "rotation": page_meta.rotation,
-                    }
-
-                # Build word coordinates lookup by page (compact format for storage)
-                for word in coord_result.words:
-                    if word.page_number not in page_word_coordinates:
-                        page_word_coordinates[word.page_number] = []
-                    # Store in compact format to minimize storage size
-                    page_word_coordinates[word.page_number].append({
-                        "t": word.text,  # text
-                        "x0": round(word.x0, 2),
-                        "y0": round(word.y0, 2),
-                        "x1": round(word.x1, 2),
-                        "y1": round(word.y1, 2),
-                    })
-
-                LOGGER.info(
-                    f"Extracted coordinates for {coord_result.total_pages} pages, "
-                    f"{coord_result.total_words} words",
-                    extra={
-                        "document_id": str(document_id),
-                        "total_pages": coord_result.total_pages,
-                        "total_words": coord_result.total_words,
-                        "pages_with_words": len(page_word_coordinates),
-                    }
-                )
-            except Exception as e:
-                LOGGER.warning(
-                    f"Coordinate extraction failed, continuing without dimensions: {e}",
-                    extra={"document_id": str(document_id), "error": str(e)}
-                )
+        # Extract pages using Docling
+        try:
+            pages = await self.ocr_service.extract_pages(
+                document_url=document_url,
+                document_id=document_id,
+                page_range=page_range,
+            )
+        except BaseException:
+            if coordinate_task:
+                coordinate_task.cancel()
+            raise
+
+        page_dimensions: Dict[int, Dict] = {}
+        page_word_coordinates: Dict[int, List[Dict]] = {}
+        if coordinate_task:
+            page_dimensions, page_word_coordinates = await coordinate_task
 
         # Add extraction metadata and page dimensions to pages
         for page in pages:
@@ -157,12 +140,12 @@ class OCRExtractionPipeline:
                 page.height_points = dims["height"]
                 page.rotation = dims["rotation"]
 
-            # Add word coordinates for citation mapping
+            # Word coordinates for citation mapping go to the columnar store
             if page.page_number in page_word_coordinates:
-                page.metadata["word_coordinates"] = page_word_coordinates[page.page_number]
+                page.word_coordinates = page_word_coordinates[page.page_number]
 
         # Store in database
-        await self.doc_repo.store_pages(document_id, pages)
+        await self.doc_repo.store_pages(document_id, pages, page_range=page_range)
 
         LOGGER.info(
             f"OCR extraction complete: {len(pages)} pages stored",
@@ -176,6 +159,58 @@ class OCRExtractionPipeline:
 
         return pages
     
+    async def _collect_coordinates(
+        self,
+        document_id: UUID,
+        pdf_source: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]],
+    ) -> Tuple[Dict[int, Dict], Dict[int, List[Dict]]]:
+        """Collect streamed per-page coordinates into dimension/word lookups.
+
+        Failures are logged and yield empty lookups so OCR results are still
+        stored without coordinates.
+
+        Returns:
+            Tuple of (page_number -> dimensions, page_number -> compact words)
+        """
+        page_dimensions: Dict[int, Dict] = {}
+        page_word_coordinates: Dict[int, List[Dict]] = {}
+        start = time.time()
+        total_words = 0
+
+        try:
+            async for record in self.coordinate_service.stream_page_coordinates(
+                pdf_source, page_range=page_range
+            ):
+                page_number = record["page_number"]
+                page_dimensions[page_number] = {
+                    "width": record["width"],
+                    "height": record["height"],
+                    "rotation": record["rotation"],
+                }
+                if record["words"]:
+                    page_word_coordinates[page_number] = record["words"]
+                    total_words += len(record["words"])
+        except Exception as e:
+            LOGGER.warning(
+                f"Coordinate extraction failed, continuing without dimensions: {e}",
+                extra={"document_id": str(document_id), "error": str(e)}
+            )
+            return {}, {}
+
+        LOGGER.info(
+            f"Extracted coordinates for {len(page_dimensions)} pages, "
+            f"{total_words} words",
+            extra={
+                "document_id": str(document_id),
+                "total_pages": len(page_dimensions),
+                "total_words": total_words,
+                "pages_with_words": len(page_word_coordinates),
+                "duration_seconds": round(time.time() - start, 2),
+            }
+        )
+        return page_dimensions, page_word_coordinates
+
     async def extract_pages_only(
         self,
         document_id: UUID,
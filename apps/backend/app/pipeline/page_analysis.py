@@ -20,7 +20,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.page_analysis_repository import PageAnalysisRepository
 from app.services.processed.services.analysis.page_analyzer import PageAnalyzer
 from app.services.processed.services.analysis.page_classifier import PageClassifier
-from app.services.processed.services.analysis.duplicate_detector import DuplicateDetector
+from app.core.config import settings
+from app.services.processed.services.analysis.duplicate_detector import (
+    DuplicateDetector,
+    WorkflowPageIndex,
+)
 from app.services.processed.services.analysis.document_profile_builder import DocumentProfileBuilder
 from app.models.page_analysis_models import (
     PageSignals, 
@@ -72,8 +76,7 @@ class PageAnalysisPipeline:
         page_signals_list = await self.analyzer.analyze_document(document_url)
         
         # Save signals to database
-        for signals in page_signals_list:
-            await self.repository.save_page_signals(document_id, signals)
+        await self.repository.save_page_signals_bulk(document_id, page_signals_list)
             
         return page_signals_list
 
@@ -98,8 +101,7 @@ class PageAnalysisPipeline:
         page_signals_list = self.analyzer.analyze_markdown_batch(pages)
         
         # Save signals to database
-        for signals in page_signals_list:
-            await self.repository.save_page_signals(document_id, signals)
+        await self.repository.save_page_signals_bulk(document_id, page_signals_list)
             
         return page_signals_list, doc_type, confidence
 
@@ -107,7 +109,8 @@ class PageAnalysisPipeline:
         self,
         document_id: UUID,
         page_signals: List[PageSignals],
-        doc_type: DocumentType = DocumentType.UNKNOWN
+        doc_type: DocumentType = DocumentType.UNKNOWN,
+        workflow_id: Optional[UUID] = None,
     ) -> List[PageClassification]:
         """Classify pages with endorsement continuation awareness and detect duplicates.
 
@@ -118,6 +121,8 @@ class PageAnalysisPipeline:
             document_id: Document UUID
             page_signals: List of PageSignals for all pages
             doc_type: Document type context (auto-detected if UNKNOWN)
+            workflow_id: Workflow scope for cross-document duplicate matching
+                (used when PAGE_CROSS_DOCUMENT_DUPLICATES is enabled)
 
         Returns:
             List of PageClassification with continuation tracking
@@ -130,6 +135,12 @@ class PageAnalysisPipeline:
                 LOGGER.debug(f"Detected Base Policy mode for document {document_id}")
 
         self.detector.reset()
+        cross_document_enabled = bool(workflow_id) and settings.page_analysis.cross_document_duplicates
+        self.detector.workflow_index = (
+            await self._load_workflow_index(workflow_id, document_id)
+            if cross_document_enabled
+            else None
+        )
 
         # First pass: detect duplicates and filter signals
         non_duplicate_signals = []
@@ -166,21 +177,58 @@ class PageAnalysisPipeline:
             else:
                 classification = batch_map[signals.page_number]
 
-            # Save to database
-            await self.repository.save_page_classification(document_id, classification)
             classifications.append(classification)
 
+        # Pages repeated from other documents of the workflow (e.g. standard ISO forms)
+        cross_document = self.detector.match_across_documents(document_id)
+        for classification in classifications:
+            match = cross_document.get(classification.page_number)
+            if match:
+                other_document_id, other_page, similarity = match
+                classification.cross_document_match = {
+                    "document_id": str(other_document_id),
+                    "page_number": other_page,
+                    "similarity": round(similarity, 3),
+                }
+
+        # Save to database; signatures let later documents match against this one
+        await self.repository.save_page_classifications_bulk(
+            document_id,
+            classifications,
+            signatures=self.detector.page_signatures() if cross_document_enabled else None,
+        )
+
         LOGGER.info(
             f"Classified {len(classifications)} pages for document {document_id}",
             extra={
                 "doc_type": doc_type.value,
                 "duplicates": len(duplicate_classifications),
+                "cross_document_matches": len(cross_document),
                 "continuations": sum(1 for c in classifications if c.is_continuation),
             }
         )
 
         return classifications
 
+    async def _load_workflow_index(self, workflow_id: UUID, document_id: UUID) -> WorkflowPageIndex:
+        """Build the cross-document page index from the workflow's stored signatures.
+
+        Args:
+            workflow_id: Workflow UUID
+            document_id: Document being classified (its own earlier pages are left out)
+
+        Returns:
+            WorkflowPageIndex of the other documents' pages
+        """
+        rows = await self.repository.get_workflow_page_signatures(
+            workflow_id, exclude_document_id=document_id
+        )
+        return WorkflowPageIndex.from_signatures(
+            rows,
+            settings.page_analysis.cross_document_threshold,
+            num_perm=self.detector.num_perm,
+        )
+
     async def get_document_profile(
         self, 
         document_id: UUID,
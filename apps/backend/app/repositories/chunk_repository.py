@@ -7,7 +7,7 @@ Normalization and classification operations have been moved to dedicated reposit
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import DocumentChunk
@@ -180,25 +180,27 @@ class ChunkRepository(BaseRepository[DocumentChunk]):
             LOGGER.warning("Empty chunks_data provided to bulk_create_chunks")
             return []
         
-        created_chunks = []
-        
-        for chunk_data in chunks_data:
-            chunk = DocumentChunk(
-                document_id=chunk_data["document_id"],
-                page_number=chunk_data["page_number"],
-                chunk_index=chunk_data["chunk_index"],
-                raw_text=chunk_data["raw_text"],
-                token_count=chunk_data["token_count"],
-                section_name=chunk_data.get("section_name"),
-                stable_chunk_id=chunk_data.get("stable_chunk_id"),
-                section_type=chunk_data.get("section_type"),
-                subsection_type=chunk_data.get("subsection_type"),
-            )
-            self.session.add(chunk)
-            created_chunks.append(chunk)
-        
-        # Flush to get IDs assigned
-        await self.session.flush()
+        rows = [
+            {
+                "document_id": chunk_data["document_id"],
+                "page_number": chunk_data["page_number"],
+                "chunk_index": chunk_data["chunk_index"],
+                "raw_text": chunk_data["raw_text"],
+                "token_count": chunk_data["token_count"],
+                "section_name": chunk_data.get("section_name"),
+                "stable_chunk_id": chunk_data.get("stable_chunk_id"),
+                "section_type": chunk_data.get("section_type"),
+                "subsection_type": chunk_data.get("subsection_type"),
+            }
+            for chunk_data in chunks_data
+        ]
+
+        # One batched multi-row INSERT; RETURNING gives back the records with IDs
+        result = await self.session.scalars(
+            insert(DocumentChunk).returning(DocumentChunk, sort_by_parameter_order=True),
+            rows,
+        )
+        created_chunks = list(result.all())
         
         LOGGER.info(
             f"Bulk created {len(created_chunks)} document chunks",
@@ -238,13 +240,11 @@ class ChunkRepository(BaseRepository[DocumentChunk]):
         Returns:
             int: Number of chunks deleted
         """
-        chunks = await self.get_chunks_by_document(document_id)
-        count = len(chunks)
-        
-        for chunk in chunks:
-            await self.session.delete(chunk)
-        
-        await self.session.flush()
+        result = await self.session.execute(
+            delete(DocumentChunk).where(DocumentChunk.document_id == document_id),
+            execution_options={"synchronize_session": False},
+        )
+        count = result.rowcount or 0
         
         LOGGER.info(
             "Deleted document chunks",
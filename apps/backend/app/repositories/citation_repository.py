@@ -4,8 +4,10 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import load_only
 
 from app.database.models import Citation, DocumentPage
 from app.repositories.base_repository import BaseRepository
@@ -13,6 +15,14 @@ from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Only the dimension columns; page text and metadata are never needed here
+_PAGE_DIMENSION_COLUMNS = load_only(
+    DocumentPage.page_number,
+    DocumentPage.width_points,
+    DocumentPage.height_points,
+    DocumentPage.rotation,
+)
+
 
 class CitationRepository(BaseRepository[Citation]):
     """Repository for Citation model.
@@ -209,6 +219,49 @@ class CitationRepository(BaseRepository[Citation]):
             )
             raise
 
+    async def upsert_bulk(self, citations: List[dict]) -> int:
+        """Create or update many citations in one statement.
+
+        Rows are keyed on (document_id, source_type, source_id) like upsert;
+        when a key repeats within the batch the last row wins.
+
+        Args:
+            citations: Citation column dictionaries, all with the same keys
+
+        Returns:
+            Number of citations written
+        """
+        if not citations:
+            return 0
+
+        rows = list({
+            (c["document_id"], c["source_type"], c["source_id"]): c for c in citations
+        }.values())
+        key_columns = {"document_id", "source_type", "source_id"}
+
+        try:
+            stmt = pg_insert(Citation)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_citation_source",
+                set_={
+                    key: stmt.excluded[key] for key in rows[0] if key not in key_columns
+                },
+            )
+            await self.session.execute(stmt, rows)
+
+            LOGGER.info(
+                f"Upserted {len(rows)} citations",
+                extra={"count": len(rows)}
+            )
+            return len(rows)
+        except SQLAlchemyError as e:
+            LOGGER.error(
+                f"Error bulk upserting citations: {e}",
+                extra={"count": len(rows)},
+                exc_info=True
+            )
+            raise
+
     async def delete_by_document(self, document_id: UUID) -> int:
         """Delete all citations for a document.
 
@@ -271,7 +324,7 @@ class PageDimensionsRepository:
             DocumentPage with dimensions, or None if not found
         """
         try:
-            query = select(DocumentPage).where(
+            query = select(DocumentPage).options(_PAGE_DIMENSION_COLUMNS).where(
                 and_(
                     DocumentPage.document_id == document_id,
                     DocumentPage.page_number == page_number
@@ -305,6 +358,7 @@ class PageDimensionsRepository:
         try:
             query = (
                 select(DocumentPage)
+                .options(_PAGE_DIMENSION_COLUMNS)
                 .where(DocumentPage.document_id == document_id)
                 .order_by(DocumentPage.page_number)
             )
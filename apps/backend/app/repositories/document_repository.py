@@ -4,15 +4,23 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.repositories.base_repository import BaseRepository
-from app.database.models import Document, DocumentPage, PageManifestRecord
+from app.database.models import (
+    Document,
+    DocumentPage,
+    DocumentPageCoordinates,
+    PageManifestRecord,
+    WorkflowDocumentStageRun,
+)
 from app.models.page_data import PageData
 from app.utils.logging import get_logger
 from app.services.processed.services.ocr.coordinate_extraction_service import (
     WordCoordinate,
     PageMetadata,
+    PackedPageWords,
 )
 
 LOGGER = get_logger(__name__)
@@ -39,7 +47,8 @@ class DocumentRepository(BaseRepository[Document]):
         user_id: UUID,
         document_name: Optional[str] = None,
         mime_type: str = "application/pdf",
-        status: str = "uploaded"
+        status: str = "uploaded",
+        checksum: Optional[str] = None,
     ) -> Document:
         """Create a new document record.
         
@@ -49,6 +58,7 @@ class DocumentRepository(BaseRepository[Document]):
             user_id: ID of the user owning the document
             mime_type: MIME type of the document
             status: Initial status
+            checksum: SHA-256 of the file content
             
         Returns:
             Created Document record
@@ -60,10 +70,44 @@ class DocumentRepository(BaseRepository[Document]):
             page_count=page_count,
             status=status,
             mime_type=mime_type,
+            checksum=checksum,
             uploaded_at=datetime.now(timezone.utc),
             updated_at=datetime.now(timezone.utc)
         )
 
+    async def get_by_checksum(self, user_id: UUID, checksum: str) -> Optional[Document]:
+        """Get the user's earliest processed document with the given content.
+
+        Only documents whose "processed" stage has completed in some workflow
+        match, so an upload is never linked to a document another workflow is
+        still extracting.
+
+        Args:
+            user_id: ID of the user owning the document
+            checksum: SHA-256 of the file content
+
+        Returns:
+            Matching Document, or None
+        """
+        processed = exists().where(
+            WorkflowDocumentStageRun.document_id == Document.id,
+            WorkflowDocumentStageRun.stage_name == "processed",
+            WorkflowDocumentStageRun.status == "completed",
+        )
+        query = (
+            select(Document)
+            .where(
+                Document.user_id == user_id,
+                Document.checksum == checksum,
+                Document.status != "failed",
+                processed,
+            )
+            .order_by(Document.uploaded_at)
+            .limit(1)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def update_status(self, document_id: UUID, status: str) -> bool:
         """Update document status.
         
@@ -79,45 +123,114 @@ class DocumentRepository(BaseRepository[Document]):
     async def store_pages(
         self,
         document_id: UUID,
-        pages: List[PageData]
+        pages: List[PageData],
+        page_range: Optional[Tuple[int, int]] = None,
     ) -> None:
         """Store OCR pages for a document.
         
         Args:
             document_id: Document ID
             pages: List of PageData objects from OCR extraction
+            page_range: Optional inclusive (first, last) page range. When set,
+                only existing pages in that range are replaced (sharded OCR).
         """
         LOGGER.info(f"Storing {len(pages)} pages for document {document_id}")
         
-        # Delete existing pages for this document (if re-processing)
+        # Delete existing pages for this document (if re-processing) with one
+        # statement per table instead of loading and deleting row by row
+        page_filters = [DocumentPage.document_id == document_id]
+        coordinate_filters = [DocumentPageCoordinates.document_id == document_id]
+        if page_range:
+            page_filters.append(DocumentPage.page_number.between(page_range[0], page_range[1]))
+            coordinate_filters.append(
+                DocumentPageCoordinates.page_number.between(page_range[0], page_range[1])
+            )
         await self.session.execute(
-            select(DocumentPage).where(DocumentPage.document_id == document_id)
+            delete(DocumentPage).where(*page_filters),
+            execution_options={"synchronize_session": False},
         )
-        existing_pages = (await self.session.execute(
-            select(DocumentPage).where(DocumentPage.document_id == document_id)
-        )).scalars().all()
-        
-        for page in existing_pages:
-            await self.session.delete(page)
-        
-        # Create new page records
+        await self.session.execute(
+            delete(DocumentPageCoordinates).where(*coordinate_filters),
+            execution_options={"synchronize_session": False},
+        )
+
+        page_rows = []
+        coordinate_rows = []
         for page_data in pages:
-            page = DocumentPage(
-                document_id=document_id,
-                page_number=page_data.page_number,
-                text=page_data.text,
-                markdown=page_data.markdown,
-                additional_metadata=page_data.metadata or {},
+            page_rows.append({
+                "document_id": document_id,
+                "page_number": page_data.page_number,
+                "text": page_data.text,
+                "markdown": page_data.markdown,
+                "additional_metadata": page_data.metadata or {},
                 # Store page dimensions for citation coordinate transformation
-                width_points=page_data.width_points,
-                height_points=page_data.height_points,
-                rotation=page_data.rotation or 0,
-            )
-            self.session.add(page)
-        
-        await self.session.flush()
+                "width_points": page_data.width_points,
+                "height_points": page_data.height_points,
+                "rotation": page_data.rotation or 0,
+            })
+
+            if page_data.word_coordinates:
+                packed = PackedPageWords.pack(page_data.page_number, page_data.word_coordinates)
+                coordinate_rows.append({
+                    "document_id": document_id,
+                    "page_number": packed.page_number,
+                    "word_count": packed.word_count,
+                    "boxes": packed.boxes_buffer,
+                    "text_offsets": packed.offsets_buffer,
+                    "text": packed.packed_text,
+                })
+
+        # Bulk INSERTs are batched into multi-row VALUES statements
+        if page_rows:
+            await self.session.execute(insert(DocumentPage), page_rows)
+        if coordinate_rows:
+            await self.session.execute(insert(DocumentPageCoordinates), coordinate_rows)
+
         LOGGER.info(f"Successfully stored {len(pages)} pages for document {document_id}")
 
+    async def get_page_numbers(self, document_id: UUID) -> List[int]:
+        """Get the stored page numbers for a document in ascending order.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Sorted list of page numbers
+        """
+        result = await self.session.execute(
+            select(DocumentPage.page_number)
+            .where(DocumentPage.document_id == document_id)
+            .order_by(DocumentPage.page_number)
+        )
+        return list(result.scalars().all())
+
+    async def delete_pages_after(self, document_id: UUID, last_page: int) -> int:
+        """Delete stored pages and their word coordinates numbered above last_page.
+
+        Used after sharded OCR to drop pages left over from an earlier,
+        longer version of the document.
+
+        Args:
+            document_id: Document ID
+            last_page: Highest page number to keep
+
+        Returns:
+            Number of pages deleted
+        """
+        result = await self.session.execute(
+            delete(DocumentPage).where(
+                DocumentPage.document_id == document_id,
+                DocumentPage.page_number > last_page,
+            )
+        )
+        await self.session.execute(
+            delete(DocumentPageCoordinates).where(
+                DocumentPageCoordinates.document_id == document_id,
+                DocumentPageCoordinates.page_number > last_page,
+            )
+        )
+        return result.rowcount or 0
+
     async def get_pages_by_document(
         self,
         document_id: UUID
@@ -139,12 +252,19 @@ class DocumentRepository(BaseRepository[Document]):
         """
         LOGGER.info(f"Fetching pages for document {document_id}")
         
+        # Strip legacy inline word coordinates in SQL so page fetches never
+        # transfer them; citation mapping reads them separately.
         result = await self.session.execute(
-            select(DocumentPage)
+            select(
+                DocumentPage.page_number,
+                DocumentPage.text,
+                DocumentPage.markdown,
+                DocumentPage.additional_metadata.op("-", return_type=JSONB)("word_coordinates").label("metadata"),
+            )
             .where(DocumentPage.document_id == document_id)
             .order_by(DocumentPage.page_number)
         )
-        pages = result.scalars().all()
+        pages = result.all()
         
         if not pages:
             LOGGER.warning(f"No pages found for document {document_id}")
@@ -156,7 +276,7 @@ class DocumentRepository(BaseRepository[Document]):
                 page_number=page.page_number,
                 text=page.text or "",
                 markdown=page.markdown or "",
-                metadata=page.additional_metadata or {},
+                metadata=page.metadata or {},
             )
             for page in pages
         ]
@@ -228,14 +348,70 @@ class DocumentRepository(BaseRepository[Document]):
 
         return pages_to_process
 
+    async def get_page_word_arrays(
+        self,
+        document_id: UUID,
+        page_numbers: Optional[List[int]] = None,
+    ) -> Dict[int, PackedPageWords]:
+        """Load columnar word coordinates for a document.
+
+        Arrays are decoded lazily by PackedPageWords on first access.
+
+        Args:
+            document_id: Document ID
+            page_numbers: Optional subset of pages to load
+
+        Returns:
+            Dict mapping page numbers to PackedPageWords
+        """
+        query = select(
+            DocumentPageCoordinates.page_number,
+            DocumentPageCoordinates.word_count,
+            DocumentPageCoordinates.boxes,
+            DocumentPageCoordinates.text_offsets,
+            DocumentPageCoordinates.text,
+        ).where(DocumentPageCoordinates.document_id == document_id)
+        if page_numbers:
+            query = query.where(DocumentPageCoordinates.page_number.in_(page_numbers))
+
+        result = await self.session.execute(query)
+        return {
+            row.page_number: PackedPageWords(
+                page_number=row.page_number,
+                word_count=row.word_count,
+                boxes=row.boxes,
+                text_offsets=row.text_offsets,
+                text=row.text,
+            )
+            for row in result.all()
+        }
+
+    async def _get_legacy_word_arrays(self, document_id: UUID) -> Dict[int, PackedPageWords]:
+        """Read word coordinates stored inline in page metadata (older documents)."""
+        result = await self.session.execute(
+            select(
+                DocumentPage.page_number,
+                DocumentPage.additional_metadata["word_coordinates"].label("words"),
+            )
+            .where(DocumentPage.document_id == document_id)
+            .where(DocumentPage.additional_metadata.has_key("word_coordinates"))
+        )
+        return {
+            row.page_number: PackedPageWords.pack(row.page_number, row.words)
+            for row in result.all()
+            if row.words
+        }
+
     async def get_word_coordinates_for_citation(
         self,
         document_id: UUID
     ) -> Tuple[Dict[int, List[WordCoordinate]], List[PageMetadata]]:
         """Get word coordinates and page metadata for citation mapping.
 
-        Retrieves stored word coordinates from page metadata and converts
-        them to WordCoordinate and PageMetadata objects for use with CitationMapper.
+        Reads the columnar coordinate store (falling back to coordinates
+        stored inline in page metadata by older pipeline versions) and
+        converts them to WordCoordinate and PageMetadata objects for use
+        with CitationMapper.
 
         Args:
             document_id: Document ID
@@ -247,52 +423,31 @@ class DocumentRepository(BaseRepository[Document]):
         """
         LOGGER.info(f"Loading word coordinates for document {document_id}")
 
-        result = await self.session.execute(
-            select(DocumentPage)
-            .where(DocumentPage.document_id == document_id)
-            .order_by(DocumentPage.page_number)
-        )
-        pages = result.scalars().all()
-
-        if not pages:
+        dimensions = await self.get_page_dimensions(document_id)
+        if not dimensions:
             LOGGER.warning(f"No pages found for document {document_id}")
             return {}, []
 
-        word_index: Dict[int, List[WordCoordinate]] = {}
-        page_metadata_list: List[PageMetadata] = []
-        total_words = 0
-
-        for page in pages:
-            page_num = page.page_number
+        page_metadata_list = [
+            PageMetadata(
+                page_number=page_num,
+                width=dims["width"],
+                height=dims["height"],
+                rotation=dims["rotation"],
+            )
+            for page_num, dims in dimensions.items()
+        ]
 
-            # Build page metadata
-            width = float(page.width_points) if page.width_points else 612.0
-            height = float(page.height_points) if page.height_points else 792.0
-            rotation = page.rotation or 0
+        word_arrays = await self.get_page_word_arrays(document_id)
+        if not word_arrays:
+            word_arrays = await self._get_legacy_word_arrays(document_id)
 
-            page_metadata_list.append(PageMetadata(
-                page_number=page_num,
-                width=width,
-                height=height,
-                rotation=rotation,
-            ))
-
-            # Extract word coordinates from additional_metadata
-            metadata = page.additional_metadata or {}
-            word_coords = metadata.get("word_coordinates", [])
-
-            if word_coords:
-                word_index[page_num] = []
-                for wc in word_coords:
-                    word_index[page_num].append(WordCoordinate(
-                        text=wc.get("t", ""),  # compact format: "t" for text
-                        page_number=page_num,
-                        x0=float(wc.get("x0", 0)),
-                        y0=float(wc.get("y0", 0)),
-                        x1=float(wc.get("x1", 0)),
-                        y1=float(wc.get("y1", 0)),
-                    ))
-                total_words += len(word_index[page_num])
+        word_index: Dict[int, List[WordCoordinate]] = {
+            page_num: packed.to_word_coordinates()
+            for page_num, packed in sorted(word_arrays.items())
+            if packed.word_count
+        }
+        total_words = sum(len(words) for words in word_index.values())
 
         LOGGER.info(
             f"Loaded word coordinates for citation mapping",
@@ -320,11 +475,16 @@ class DocumentRepository(BaseRepository[Document]):
             {page_number: {"width": float, "height": float, "rotation": int}}
         """
         result = await self.session.execute(
-            select(DocumentPage)
+            select(
+                DocumentPage.page_number,
+                DocumentPage.width_points,
+                DocumentPage.height_points,
+                DocumentPage.rotation,
+            )
             .where(DocumentPage.document_id == document_id)
             .order_by(DocumentPage.page_number)
         )
-        pages = result.scalars().all()
+        pages = result.all()
 
         dimensions = {}
         for page in pages:
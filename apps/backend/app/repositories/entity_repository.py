@@ -1,10 +1,15 @@
 import uuid
-from typing import Optional, List, Sequence
-from sqlalchemy import select
+from typing import Any, Dict, Optional, List, Sequence
+from sqlalchemy import and_, case, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models import CanonicalEntity, EntityRelationship, WorkflowEntityScope, WorkflowRelationshipScope, EntityEvidence
 from app.repositories.base_repository import BaseRepository
 
+# Attributes where a longer value replaces a shorter one when entities merge
+LONGEST_TEXT_ATTRIBUTES = ("description", "source_text", "definition_text")
+
+
 class EntityRepository(BaseRepository[CanonicalEntity]):
     """Repository for managing CanonicalEntity records."""
 
@@ -20,6 +25,73 @@ class EntityRepository(BaseRepository[CanonicalEntity]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_keys(
+        self, keys: Sequence[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple[uuid.UUID, Optional[dict]]]:
+        """Bulk fetch canonical entities by (entity_type, canonical_key).
+
+        Returns:
+            Dict mapping (entity_type, canonical_key) to (id, attributes).
+        """
+        if not keys:
+            return {}
+        query = select(
+            CanonicalEntity.id,
+            CanonicalEntity.entity_type,
+            CanonicalEntity.canonical_key,
+            CanonicalEntity.attributes,
+        ).where(tuple_(CanonicalEntity.entity_type, CanonicalEntity.canonical_key).in_(keys))
+        result = await self.session.execute(query)
+        return {
+            (row.entity_type, row.canonical_key): (row.id, row.attributes) for row in result
+        }
+
+    async def upsert_canonical_entities(
+        self, entities: List[Dict[str, Any]]
+    ) -> dict[tuple[str, str], uuid.UUID]:
+        """Insert canonical entities, merging attributes into existing ones in SQL.
+
+        On conflict, an existing attribute is kept unless it is null, except
+        that a longer string replaces a shorter one for LONGEST_TEXT_ATTRIBUTES.
+        Rows must have unique (entity_type, canonical_key).
+
+        Args:
+            entities: Dicts with entity_type, canonical_key and attributes
+
+        Returns:
+            Dict mapping (entity_type, canonical_key) to entity ID.
+        """
+        if not entities:
+            return {}
+
+        # A stable row order keeps concurrent upserts from deadlocking
+        rows = [
+            {"id": uuid.uuid4(), **entity}
+            for entity in sorted(entities, key=lambda e: (e["entity_type"], e["canonical_key"]))
+        ]
+
+        stmt = pg_insert(CanonicalEntity).values(rows)
+        incoming = stmt.excluded.attributes
+        existing = func.coalesce(CanonicalEntity.attributes, func.jsonb_build_object())
+        merged = func.jsonb_strip_nulls(incoming).op("||")(func.jsonb_strip_nulls(existing))
+        for key in LONGEST_TEXT_ATTRIBUTES:
+            longer = and_(
+                func.jsonb_typeof(incoming[key]) == "string",
+                func.length(incoming[key].astext)
+                > func.coalesce(func.length(existing[key].astext), 0),
+            )
+            merged = merged.op("||")(
+                case((longer, func.jsonb_build_object(key, incoming[key])), else_=func.jsonb_build_object())
+            )
+
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_entity_type_canonical_key",
+            set_={"attributes": merged, "updated_at": func.now()},
+        ).returning(CanonicalEntity.id, CanonicalEntity.entity_type, CanonicalEntity.canonical_key)
+
+        result = await self.session.execute(stmt)
+        return {(row.entity_type, row.canonical_key): row.id for row in result}
+
     async def get_by_document(self, document_id: uuid.UUID) -> Sequence[CanonicalEntity]:
         """Get all canonical entities associated with a specific document via evidence mapping."""
         query = (
@@ -97,6 +169,19 @@ class EntityRepository(BaseRepository[CanonicalEntity]):
         await self.session.flush()
 
 
+    async def add_batch_to_workflow_scope(
+        self, workflow_id: uuid.UUID, canonical_entity_ids: Sequence[uuid.UUID]
+    ) -> None:
+        """Add canonical entities to a workflow scope in one statement (idempotent)."""
+        if not canonical_entity_ids:
+            return
+        stmt = pg_insert(WorkflowEntityScope).values([
+            {"workflow_id": workflow_id, "canonical_entity_id": entity_id}
+            for entity_id in dict.fromkeys(canonical_entity_ids)
+        ]).on_conflict_do_nothing()
+        await self.session.execute(stmt)
+
+
 class EntityRelationshipRepository(BaseRepository[EntityRelationship]):
     """Repository for managing EntityRelationship records."""
 
@@ -0,0 +1,111 @@
+"""Repository for reusable standard form extraction output."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import FormFingerprint
+from app.repositories.base_repository import BaseRepository
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class FormFingerprintRepository(BaseRepository[FormFingerprint]):
+    """Repository for form fingerprint records.
+
+    Methods do not commit; the caller owns the transaction.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize form fingerprint repository.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(session, FormFingerprint)
+        self.session = session
+
+    async def get_validated(self, fingerprints: List[str]) -> Dict[str, FormFingerprint]:
+        """Fetch validated records for many fingerprints in one query.
+
+        Args:
+            fingerprints: Fingerprint hashes
+
+        Returns:
+            Mapping of fingerprint to record, for the ones found
+        """
+        if not fingerprints:
+            return {}
+
+        stmt = select(FormFingerprint).where(
+            FormFingerprint.fingerprint.in_(set(fingerprints)),
+            FormFingerprint.validated.is_(True),
+        )
+        result = await self.session.execute(stmt)
+        return {record.fingerprint: record for record in result.scalars().all()}
+
+    async def record_hits(self, fingerprints: List[str]) -> None:
+        """Increment the reuse counter of fingerprints.
+
+        Args:
+            fingerprints: Fingerprint hashes that were reused
+        """
+        if not fingerprints:
+            return
+
+        await self.session.execute(
+            update(FormFingerprint)
+            .where(FormFingerprint.fingerprint.in_(set(fingerprints)))
+            .values(
+                hit_count=FormFingerprint.hit_count + 1,
+                last_used_at=datetime.now(timezone.utc),
+            )
+        )
+
+    async def insert_if_absent(
+        self,
+        fingerprint: str,
+        form_number: str,
+        section_type: str,
+        extractor_key: str,
+        extraction_output: Dict[str, Any],
+        confidence: float,
+        validated: bool,
+        source_document_id: Optional[UUID] = None,
+        model_version: Optional[str] = None,
+    ) -> None:
+        """Store extraction output unless the fingerprint already exists.
+
+        The first stored output of a form is kept, so concurrent workers
+        extracting the same form do not overwrite each other.
+
+        Args:
+            fingerprint: Fingerprint hash
+            form_number: Form number(s) found in the text
+            section_type: Section type value
+            extractor_key: Extractor that produced the output
+            extraction_output: Parsed LLM output
+            confidence: Extraction confidence
+            validated: Whether the output may be reused
+            source_document_id: Document the output was extracted from
+            model_version: LLM model version
+        """
+        stmt = pg_insert(FormFingerprint).values(
+            fingerprint=fingerprint,
+            form_number=form_number,
+            section_type=section_type,
+            extractor_key=extractor_key,
+            extraction_output=extraction_output,
+            confidence=Decimal(str(round(confidence, 3))),
+            validated=validated,
+            source_document_id=source_document_id,
+            model_version=model_version,
+            hit_count=0,
+        ).on_conflict_do_nothing(index_elements=["fingerprint"])
+        await self.session.execute(stmt)
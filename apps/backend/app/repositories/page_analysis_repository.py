@@ -4,16 +4,18 @@ This repository handles CRUD operations for page analysis, classifications,
 and manifests.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from decimal import Decimal
 
 from app.database.models import (
     PageAnalysis,
     PageClassificationResult,
-    PageManifestRecord
+    PageManifestRecord,
+    WorkflowDocument,
 )
 from app.models.page_analysis_models import (
     PageSignals,
@@ -91,6 +93,59 @@ class PageAnalysisRepository(BaseRepository[PageAnalysis]):
         
         return page_analysis
     
+    async def save_page_signals_bulk(
+        self,
+        document_id: UUID,
+        signals_list: List[PageSignals]
+    ) -> int:
+        """Upsert signals for many pages in one batched statement.
+
+        Unlike save_page_signals this does not commit; the caller owns the
+        transaction.
+
+        Args:
+            document_id: Document UUID
+            signals_list: PageSignals for each page
+
+        Returns:
+            Number of pages written
+        """
+        if not signals_list:
+            return 0
+
+        rows = [
+            {
+                "document_id": document_id,
+                "page_number": signals.page_number,
+                "top_lines": signals.top_lines,
+                "text_density": Decimal(str(signals.text_density)),
+                "has_tables": signals.has_tables,
+                "max_font_size": Decimal(str(signals.max_font_size)) if signals.max_font_size else None,
+                "page_hash": signals.page_hash,
+            }
+            for signals in signals_list
+        ]
+
+        stmt = pg_insert(PageAnalysis)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_page_analysis_doc_page",
+            set_={
+                "top_lines": stmt.excluded.top_lines,
+                "text_density": stmt.excluded.text_density,
+                "has_tables": stmt.excluded.has_tables,
+                "max_font_size": stmt.excluded.max_font_size,
+                "page_hash": stmt.excluded.page_hash,
+            },
+        )
+        await self.session.execute(stmt, rows)
+
+        logger.debug(
+            f"Saved page signals for {len(rows)} pages",
+            extra={"document_id": str(document_id), "page_count": len(rows)}
+        )
+
+        return len(rows)
+
     async def save_page_classification(
         self,
         document_id: UUID,
@@ -112,7 +167,8 @@ class PageAnalysisRepository(BaseRepository[PageAnalysis]):
             confidence=Decimal(str(classification.confidence)),
             should_process=classification.should_process,
             duplicate_of=classification.duplicate_of,
-            reasoning=classification.reasoning
+            reasoning=classification.reasoning,
+            cross_document_match=classification.cross_document_match,
         )
         
         self.session.add(page_class)
@@ -129,6 +185,65 @@ class PageAnalysisRepository(BaseRepository[PageAnalysis]):
         
         return page_class
     
+    async def save_page_classifications_bulk(
+        self,
+        document_id: UUID,
+        classifications: List[PageClassification],
+        signatures: Optional[Dict[int, bytes]] = None,
+    ) -> int:
+        """Upsert classifications for many pages in one batched statement.
+
+        Re-classifying a document replaces the previous result for each page.
+
+        Args:
+            document_id: Document UUID
+            classifications: PageClassification for each page
+            signatures: Serialized MinHash signature per page number, kept
+                for cross-document matching by later documents
+
+        Returns:
+            Number of pages written
+        """
+        if not classifications:
+            return 0
+
+        rows = [
+            {
+                "document_id": document_id,
+                "page_number": classification.page_number,
+                "page_type": classification.page_type.value,
+                "confidence": Decimal(str(classification.confidence)),
+                "should_process": classification.should_process,
+                "duplicate_of": classification.duplicate_of,
+                "reasoning": classification.reasoning,
+                "cross_document_match": classification.cross_document_match,
+                "minhash_signature": (signatures or {}).get(classification.page_number),
+            }
+            for classification in classifications
+        ]
+
+        stmt = pg_insert(PageClassificationResult)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_page_classification_doc_page",
+            set_={
+                "page_type": stmt.excluded.page_type,
+                "confidence": stmt.excluded.confidence,
+                "should_process": stmt.excluded.should_process,
+                "duplicate_of": stmt.excluded.duplicate_of,
+                "reasoning": stmt.excluded.reasoning,
+                "cross_document_match": stmt.excluded.cross_document_match,
+                "minhash_signature": stmt.excluded.minhash_signature,
+            },
+        )
+        await self.session.execute(stmt, rows)
+
+        logger.debug(
+            f"Saved classifications for {len(rows)} pages",
+            extra={"document_id": str(document_id), "page_count": len(rows)}
+        )
+
+        return len(rows)
+
     async def save_manifest(self, manifest: PageManifest) -> PageManifestRecord:
         """Save or update page manifest in database (idempotent).
         
@@ -266,12 +381,65 @@ class PageAnalysisRepository(BaseRepository[PageAnalysis]):
                 confidence=float(r.confidence),
                 should_process=r.should_process,
                 duplicate_of=r.duplicate_of,
-                reasoning=r.reasoning
+                reasoning=r.reasoning,
+                cross_document_match=r.cross_document_match,
             )
             for r in records
         ]
         
         return classifications
+
+    async def get_workflow_page_signatures(
+        self,
+        workflow_id: UUID,
+        exclude_document_id: Optional[UUID] = None,
+    ) -> List[Tuple[UUID, int, bytes]]:
+        """Get the stored MinHash signatures of pages in a workflow's documents.
+
+        Args:
+            workflow_id: Workflow UUID
+            exclude_document_id: Document to leave out (e.g. the one being classified)
+
+        Returns:
+            List of (document_id, page_number, signature), oldest classification first
+        """
+        stmt = (
+            select(
+                PageClassificationResult.document_id,
+                PageClassificationResult.page_number,
+                PageClassificationResult.minhash_signature,
+            )
+            .join(
+                WorkflowDocument,
+                WorkflowDocument.document_id == PageClassificationResult.document_id,
+            )
+            .where(
+                WorkflowDocument.workflow_id == workflow_id,
+                PageClassificationResult.minhash_signature.is_not(None),
+            )
+            .order_by(PageClassificationResult.created_at, PageClassificationResult.page_number)
+        )
+        if exclude_document_id is not None:
+            stmt = stmt.where(PageClassificationResult.document_id != exclude_document_id)
+
+        result = await self.session.execute(stmt)
+        return [(row.document_id, row.page_number, row.minhash_signature) for row in result]
+
+    async def get_cross_document_pages(self, document_id: UUID) -> Set[int]:
+        """Get the pages of a document that repeat a page of another workflow document.
+
+        Args:
+            document_id: Document UUID
+
+        Returns:
+            Set of page numbers with a cross-document match
+        """
+        stmt = select(PageClassificationResult.page_number).where(
+            PageClassificationResult.document_id == document_id,
+            PageClassificationResult.cross_document_match.is_not(None),
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
     
     async def get_page_signals(
         self,
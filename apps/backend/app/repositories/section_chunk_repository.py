@@ -8,7 +8,7 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select, and_
+from sqlalchemy import insert, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import DocumentChunk
@@ -72,16 +72,17 @@ class SectionChunkRepository(BaseRepository[DocumentChunk]):
             }
         )
         
-        created_chunks = []
-        
-        for chunk in result.chunks:
-            db_chunk = await self.create_hybrid_chunk(
-                hybrid_chunk=chunk,
-                document_id=document_id,
-            )
-            created_chunks.append(db_chunk)
-        
-        await self.session.flush()
+        rows = [
+            self._hybrid_chunk_row(chunk, document_id)
+            for chunk in result.chunks
+        ]
+
+        # One batched multi-row INSERT instead of a flush + commit per chunk
+        inserted = await self.session.scalars(
+            insert(DocumentChunk).returning(DocumentChunk, sort_by_parameter_order=True),
+            rows,
+        )
+        created_chunks = list(inserted.all())
         
         LOGGER.info(
             "Chunking result saved",
@@ -93,6 +94,31 @@ class SectionChunkRepository(BaseRepository[DocumentChunk]):
         
         return created_chunks
     
+    @staticmethod
+    def _hybrid_chunk_row(hybrid_chunk: HybridChunk, document_id: UUID) -> Dict[str, Any]:
+        """Build DocumentChunk column values for a HybridChunk."""
+        metadata = hybrid_chunk.metadata
+
+        def _enum_value(value):
+            if not value:
+                return None
+            return value.value if hasattr(value, 'value') else str(value)
+
+        return {
+            "document_id": document_id,
+            "page_number": metadata.page_number,
+            "section_name": metadata.section_name,
+            "chunk_index": metadata.chunk_index,
+            "raw_text": hybrid_chunk.text,
+            "token_count": metadata.token_count,
+            "section_type": metadata.section_type.value if metadata.section_type else None,
+            "subsection_type": metadata.subsection_type,
+            "effective_section_type": _enum_value(metadata.effective_section_type),
+            "semantic_role": _enum_value(metadata.semantic_role),
+            "stable_chunk_id": metadata.stable_chunk_id,
+            "created_at": datetime.now(timezone.utc),
+        }
+
     async def create_hybrid_chunk(
         self,
         hybrid_chunk: HybridChunk,
@@ -107,61 +133,18 @@ class SectionChunkRepository(BaseRepository[DocumentChunk]):
         Returns:
             Created DocumentChunk record
         """
-        metadata = hybrid_chunk.metadata
-        
-        # Build additional metadata for JSONB storage
-        additional_metadata = {
-            "page_range": metadata.page_range,
-            "chunk_role": metadata.chunk_role.value if metadata.chunk_role else None,
-            "has_tables": metadata.has_tables,
-            "table_count": metadata.table_count,
-            "context_header": metadata.context_header,
-            "source": metadata.source,
-            "contextualized_text": hybrid_chunk.contextualized_text,
-        }
-        
-        # Resolve effective_section_type and semantic_role for persistence
-        effective_section_type_val = None
-        if metadata.effective_section_type:
-            effective_section_type_val = (
-                metadata.effective_section_type.value
-                if hasattr(metadata.effective_section_type, 'value')
-                else str(metadata.effective_section_type)
-            )
-
-        semantic_role_val = None
-        if metadata.semantic_role:
-            semantic_role_val = (
-                metadata.semantic_role.value
-                if hasattr(metadata.semantic_role, 'value')
-                else str(metadata.semantic_role)
-            )
-
-        chunk = await self.create(
-            document_id=document_id,
-            page_number=metadata.page_number,
-            section_name=metadata.section_name,
-            chunk_index=metadata.chunk_index,
-            raw_text=hybrid_chunk.text,
-            token_count=metadata.token_count,
-            section_type=metadata.section_type.value if metadata.section_type else None,
-            subsection_type=metadata.subsection_type,
-            effective_section_type=effective_section_type_val,
-            semantic_role=semantic_role_val,
-            stable_chunk_id=metadata.stable_chunk_id,
-            # additional_metadata=additional_metadata,
-            created_at=datetime.now(timezone.utc),
-        )
+        row = self._hybrid_chunk_row(hybrid_chunk, document_id)
+        chunk = await self.create(**row)
         
         LOGGER.debug(
             "Created hybrid chunk",
             extra={
                 "document_id": str(document_id),
                 "chunk_id": str(chunk.id),
-                "section_type": metadata.section_type.value if metadata.section_type else None,
-                "effective_section_type": effective_section_type_val,
-                "semantic_role": semantic_role_val,
-                "page_number": metadata.page_number,
+                "section_type": row["section_type"],
+                "effective_section_type": row["effective_section_type"],
+                "semantic_role": row["semantic_role"],
+                "page_number": row["page_number"],
             }
         )
         
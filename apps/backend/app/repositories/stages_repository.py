@@ -20,6 +20,10 @@ from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Stages whose outputs (pages, tables, chunks, page classifications) are keyed
+# by document only; later stages write workflow-scoped rows
+DOCUMENT_SCOPED_STAGES = ("processed", "classified")
+
 
 class StagesRepository(BaseRepository[WorkflowDocumentStageRun]):
     def __init__(self, session: AsyncSession):
@@ -191,3 +195,55 @@ class StagesRepository(BaseRepository[WorkflowDocumentStageRun]):
 
         await self.session.flush()
         return True
+
+    async def carry_over_document_stages(
+        self,
+        document_id: UUID,
+        workflow_id: UUID,
+        stage_names: tuple = DOCUMENT_SCOPED_STAGES,
+    ) -> List[str]:
+        """Mark stages a document already completed in another workflow as completed here.
+
+        Used when an identical upload is linked to a new workflow, so its
+        document-scoped outputs are reused instead of reprocessed.
+
+        Args:
+            document_id: Document linked to the workflow
+            workflow_id: Workflow the document was linked to
+            stage_names: Stages whose outputs do not depend on the workflow
+
+        Returns:
+            Names of the stages carried over
+        """
+        query = (
+            select(WorkflowDocumentStageRun)
+            .where(
+                WorkflowDocumentStageRun.document_id == document_id,
+                WorkflowDocumentStageRun.workflow_id != workflow_id,
+                WorkflowDocumentStageRun.stage_name.in_(stage_names),
+                WorkflowDocumentStageRun.status == "completed",
+            )
+            .order_by(WorkflowDocumentStageRun.completed_at.desc().nulls_last())
+        )
+        result = await self.session.execute(query)
+
+        latest = {}
+        for stage_run in result.scalars().all():
+            latest.setdefault(stage_run.stage_name, stage_run)
+
+        for stage_name in stage_names:
+            source = latest.get(stage_name)
+            if source is None:
+                continue
+            await self.update_stage_status(
+                document_id=document_id,
+                workflow_id=workflow_id,
+                stage_name=stage_name,
+                status="completed",
+                stage_metadata={
+                    **(source.stage_metadata or {}),
+                    "reused_from_workflow_id": str(source.workflow_id),
+                },
+            )
+
+        return [stage_name for stage_name in stage_names if stage_name in latest]
@@ -1,7 +1,7 @@
 from typing import Sequence, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import StepSectionOutput, StepEntityOutput
@@ -32,6 +32,26 @@ class StepSectionOutputRepository(BaseRepository[StepSectionOutput]):
         )
         result = await self.session.execute(query)
         return result.scalars().all()
+
+    async def get_inventory_by_workflow(self, workflow_id: UUID) -> Sequence[Row]:
+        """Get section types and page ranges for all documents of a workflow.
+
+        Skips display_payload, so only the small columns are read.
+
+        Args:
+            workflow_id: The workflow run UUID.
+
+        Returns:
+            Rows of (id, document_id, section_type, page_range).
+        """
+        query = select(
+            self.model.id,
+            self.model.document_id,
+            self.model.section_type,
+            self.model.page_range,
+        ).where(self.model.workflow_id == workflow_id)
+        result = await self.session.execute(query)
+        return result.all()
     
     async def get_by_document_and_section(self, document_id: UUID, section_type: str) -> Optional[StepSectionOutput]:
         """Get a section output for a specific document and section name.
@@ -76,6 +96,27 @@ class StepEntityOutputRepository(BaseRepository[StepEntityOutput]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_inventory_by_workflow(self, workflow_id: UUID) -> Sequence[Row]:
+        """Get entity types and labels for all documents of a workflow.
+
+        Skips display_payload, so only the small columns are read.
+
+        Args:
+            workflow_id: The workflow run UUID.
+
+        Returns:
+            Rows of (id, document_id, entity_type, entity_label, confidence).
+        """
+        query = select(
+            self.model.id,
+            self.model.document_id,
+            self.model.entity_type,
+            self.model.entity_label,
+            self.model.confidence,
+        ).where(self.model.workflow_id == workflow_id)
+        result = await self.session.execute(query)
+        return result.all()
+
     async def get_by_document_and_type(
         self, 
         document_id: UUID, 
@@ -1,10 +1,28 @@
-from typing import List, Optional, Dict, Any, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, or_, and_
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Integer, select, func, or_, and_, cast, column, literal, text, true, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.repositories.base_repository import BaseRepository
-from app.database.models import VectorEmbedding
+from app.database.models import EMBEDDING_DIMENSION, VectorEmbedding
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Accepted values of pgvector's hnsw.iterative_scan
+HNSW_ITERATIVE_SCAN_MODES = frozenset({"strict_order", "relaxed_order"})
+# pgvector's upper bound for hnsw.ef_search
+MAX_HNSW_EF_SEARCH = 1000
+# First pgvector release with hnsw.iterative_scan; older ones reject the setting
+ITERATIVE_SCAN_MIN_VERSION = (0, 8)
+# Filter columns of entity embeddings that can change without the embedded text changing
+ENTITY_METADATA_COLUMNS = ("canonical_entity_id", "effective_date", "expiration_date", "location_id")
+
+# Installed pgvector version, looked up once per process
+_pgvector_version: Optional[Tuple[int, ...]] = None
 
 
 class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
@@ -16,6 +34,13 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
     3. Multi-vector search
     4. Distance thresholds
     5. Batch operations
+
+    Search planning: every search is scoped to a workflow and/or documents.
+    Scopes holding at most VECTOR_EXACT_SCAN_MAX_VECTORS embeddings are
+    searched exactly (scope index + sort), which is both faster and exact
+    for small workflows. Larger scopes use the HNSW index with a per-query
+    ef_search and, on pgvector >= 0.8, iterative scans so the scope filter
+    does not silently drop results.
     """
 
     def __init__(self, session: AsyncSession):
@@ -30,6 +55,104 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         """Get all embeddings for a specific workflow."""
         return await self.get_all(filters={"workflow_id": workflow_id})
 
+    async def count_scope_vectors(
+        self,
+        workflow_id: Optional[UUID] = None,
+        document_ids: Optional[List[UUID]] = None,
+        limit: Optional[int] = None,
+    ) -> int:
+        """Count embeddings in a search scope.
+
+        Args:
+            workflow_id: Workflow scope
+            document_ids: Document scope
+            limit: Stop counting after this many rows
+
+        Returns:
+            Number of embeddings, at most limit
+        """
+        scoped = select(self.model.id)
+        if workflow_id:
+            scoped = scoped.where(self.model.workflow_id == workflow_id)
+        if document_ids:
+            scoped = scoped.where(self.model.document_id.in_(document_ids))
+        if limit is not None:
+            scoped = scoped.limit(limit)
+
+        result = await self.session.execute(select(func.count()).select_from(scoped.subquery()))
+        return int(result.scalar_one())
+
+    async def use_exact_scan(
+        self,
+        workflow_id: Optional[UUID] = None,
+        document_ids: Optional[List[UUID]] = None,
+    ) -> bool:
+        """Decide whether a scoped search should skip the HNSW index.
+
+        Args:
+            workflow_id: Workflow scope
+            document_ids: Document scope
+
+        Returns:
+            True if the scope is small enough to search exactly
+        """
+        threshold = settings.vector_search.exact_scan_max_vectors
+        if threshold <= 0 or not (workflow_id or document_ids):
+            return False
+        count = await self.count_scope_vectors(workflow_id, document_ids, limit=threshold + 1)
+        return count <= threshold
+
+    async def get_pgvector_version(self) -> Tuple[int, ...]:
+        """Get the installed pgvector version (cached for the process).
+
+        Returns:
+            Version as a tuple of ints, e.g. (0, 8, 0); (0,) if unknown
+        """
+        global _pgvector_version
+        if _pgvector_version is None:
+            result = await self.session.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            )
+            version = result.scalar_one_or_none() or ""
+            try:
+                _pgvector_version = tuple(int(part) for part in version.split("."))
+            except ValueError:
+                _pgvector_version = (0,)
+            if _pgvector_version < ITERATIVE_SCAN_MIN_VERSION:
+                LOGGER.info(
+                    f"pgvector {version or 'unknown'} does not support hnsw.iterative_scan; "
+                    "filtered HNSW searches run without it"
+                )
+        return _pgvector_version
+
+    @asynccontextmanager
+    async def hnsw_search_settings(self, ef_search: Optional[int] = None) -> AsyncIterator[None]:
+        """Apply HNSW query settings for the searches run inside the block.
+
+        Uses SET LOCAL, so the settings never outlive the transaction, and
+        restores the defaults afterwards for later queries in it.
+
+        Args:
+            ef_search: Candidate list size (defaults to VECTOR_HNSW_EF_SEARCH)
+        """
+        ef_search = min(max(int(ef_search or settings.vector_search.hnsw_ef_search), 1), MAX_HNSW_EF_SEARCH)
+        iterative_scan = settings.vector_search.hnsw_iterative_scan
+        if iterative_scan not in HNSW_ITERATIVE_SCAN_MODES:
+            iterative_scan = None
+        elif await self.get_pgvector_version() < ITERATIVE_SCAN_MIN_VERSION:
+            iterative_scan = None
+
+        # SET does not take bind parameters; both values are validated above
+        await self.session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+        if iterative_scan:
+            await self.session.execute(text(f"SET LOCAL hnsw.iterative_scan = {iterative_scan}"))
+        try:
+            yield
+        finally:
+            await self.session.execute(text("SET LOCAL hnsw.ef_search TO DEFAULT"))
+            if iterative_scan:
+                await self.session.execute(text("SET LOCAL hnsw.iterative_scan TO DEFAULT"))
+
     async def semantic_search(
         self,
         embedding: List[float],
@@ -39,7 +162,9 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         section_type: Optional[str] = None,
         entity_types: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
-        max_distance: Optional[float] = None
+        max_distance: Optional[float] = None,
+        ef_search: Optional[int] = None,
+        exact: Optional[bool] = None,
     ) -> List[VectorEmbedding]:
         """Semantic search with distance filtering.
 
@@ -52,6 +177,9 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
             entity_types: Optional entity type filter (list of types)
             filters: Optional additional metadata filters
             max_distance: Optional maximum cosine distance threshold
+            ef_search: Optional HNSW candidate list size for this query
+            exact: Force (True) or skip (False) an exact scan; by default
+                decided from the size of the scope
 
         Returns:
             List of VectorEmbedding records ordered by relevance
@@ -84,12 +212,28 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         if max_distance is not None:
             query = query.where(distance_expr <= max_distance)
 
-        query = query.order_by(distance_expr)
-        query = query.limit(top_k)
+        if exact is None:
+            exact = await self.use_exact_scan(workflow_id, [document_id] if document_id else None)
 
-        result = await self.session.execute(query)
+        if exact:
+            query = query.order_by(self._exact_order(distance_expr)).limit(top_k)
+            result = await self.session.execute(query)
+        else:
+            query = query.order_by(distance_expr).limit(top_k)
+            async with self.hnsw_search_settings(ef_search):
+                result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    def _exact_order(distance_expr):
+        """Distance ordering that the HNSW index cannot serve.
+
+        Adding zero leaves the value unchanged but is not an indexable
+        ``<=>`` expression, so Postgres filters by the scope indexes and
+        sorts the scope's vectors exactly.
+        """
+        return distance_expr + literal(0.0)
+
     async def semantic_search_multi_query(
         self,
         embeddings: List[List[float]],
@@ -99,11 +243,15 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         section_types: Optional[List[str]] = None,
         entity_types: Optional[List[str]] = None,
         max_distance: float = 0.7,
+        ef_search: Optional[int] = None,
+        exact: Optional[bool] = None,
     ) -> List[Tuple[VectorEmbedding, float]]:
         """Multi-query semantic search with deduplication and real distance scores.
 
-        Executes multiple expanded query embeddings, deduplicates results by
-        (document_id, entity_id), and keeps the best distance for each unique result.
+        Runs all expanded query embeddings in a single statement: each query
+        vector gets its own nearest-neighbour scan (LATERAL join over a VALUES
+        list), and DISTINCT ON (document_id, entity_id) keeps the best distance
+        for each unique result.
 
         Args:
             embeddings: List of query embedding vectors (e.g., from expanded queries)
@@ -113,50 +261,74 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
             section_types: Optional section type filters
             entity_types: Optional entity type filters
             max_distance: Maximum cosine distance threshold (0-2, lower = more similar)
+            ef_search: Optional HNSW candidate list size for this query
+            exact: Force (True) or skip (False) an exact scan; by default
+                decided from the size of the scope
 
         Returns:
             List of (VectorEmbedding, best_distance) tuples, sorted by distance ascending
         """
-        # Track best distance per unique (document_id, entity_id)
-        seen: Dict[str, Tuple[VectorEmbedding, float]] = {}
-        per_query_k = max(top_k, top_k * 2 // len(embeddings)) if embeddings else top_k
-
-        for query_embedding in embeddings:
-            # Build query with actual distance column
-            query = select(
-                self.model,
-                self.model.embedding.cosine_distance(query_embedding).label("distance"),
-            )
+        if not embeddings:
+            return []
 
-            # Apply filters
-            if workflow_id:
-                query = query.where(self.model.workflow_id == workflow_id)
-            if document_ids:
-                query = query.where(self.model.document_id.in_(document_ids))
-            if section_types:
-                query = query.where(self.model.section_type.in_(section_types))
-            if entity_types:
-                query = query.where(self.model.entity_type.in_(entity_types))
+        if exact is None:
+            exact = await self.use_exact_scan(workflow_id, document_ids)
 
-            query = query.where(
-                self.model.embedding.cosine_distance(query_embedding) <= max_distance
-            )
-            query = query.order_by("distance")
-            query = query.limit(per_query_k)
+        per_query_k = max(top_k, top_k * 2 // len(embeddings))
 
-            result = await self.session.execute(query)
+        # One row per query vector; each is joined LATERAL to its own
+        # nearest-neighbour scan so the whole search is a single round trip.
+        queries = values(
+            column("query_embedding", Vector(EMBEDDING_DIMENSION)), name="queries"
+        ).data([(query_embedding,) for query_embedding in embeddings])
 
-            for row in result:
-                emb = row.VectorEmbedding
-                dist = float(row.distance)
-                dedup_key = f"{emb.document_id}:{emb.entity_id}"
+        # VALUES parameters arrive untyped; cast so <=> resolves to pgvector
+        distance = self.model.embedding.cosine_distance(
+            cast(queries.c.query_embedding, Vector(EMBEDDING_DIMENSION))
+        )
+        nearest = select(
+            self.model.id,
+            self.model.document_id,
+            self.model.entity_id,
+            distance.label("distance"),
+        )
+        if workflow_id:
+            nearest = nearest.where(self.model.workflow_id == workflow_id)
+        if document_ids:
+            nearest = nearest.where(self.model.document_id.in_(document_ids))
+        if section_types:
+            nearest = nearest.where(self.model.section_type.in_(section_types))
+        if entity_types:
+            nearest = nearest.where(self.model.entity_type.in_(entity_types))
+        # Plain ORDER BY distance LIMIT k keeps the scan index-friendly; the
+        # threshold is applied to the computed column outside the lateral.
+        order = self._exact_order(distance) if exact else distance
+        nearest = nearest.order_by(order).limit(per_query_k).lateral("nearest")
+
+        # Best distance per unique (document_id, entity_id) across all queries
+        best = (
+            select(nearest.c.id, nearest.c.distance)
+            .select_from(queries)
+            .join(nearest, true())
+            .where(nearest.c.distance <= max_distance)
+            .distinct(nearest.c.document_id, nearest.c.entity_id)
+            .order_by(nearest.c.document_id, nearest.c.entity_id, nearest.c.distance)
+            .subquery("best")
+        )
 
-                if dedup_key not in seen or dist < seen[dedup_key][1]:
-                    seen[dedup_key] = (emb, dist)
+        query = (
+            select(self.model, best.c.distance)
+            .join(best, self.model.id == best.c.id)
+            .order_by(best.c.distance)
+            .limit(top_k)
+        )
 
-        # Sort by best distance and return top_k
-        sorted_results = sorted(seen.values(), key=lambda x: x[1])
-        return sorted_results[:top_k]
+        if exact:
+            result = await self.session.execute(query)
+        else:
+            async with self.hnsw_search_settings(ef_search):
+                result = await self.session.execute(query)
+        return [(row.VectorEmbedding, float(row.distance)) for row in result]
 
     async def hybrid_search(
         self,
@@ -402,6 +574,77 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         result = await self.session.execute(query)
         return [(row.VectorEmbedding, row.distance) for row in result]
 
+    async def search_chunk_embeddings_batch(
+        self,
+        embeddings: List[List[float]],
+        document_id: UUID,
+        top_k: int = 5,
+        max_distance: Optional[float] = None,
+        exact: Optional[bool] = None,
+    ) -> List[List[Tuple[Any, float]]]:
+        """Search chunk-level embeddings for many query vectors in one statement.
+
+        Each query vector gets its own nearest-neighbour scan (LATERAL join
+        over a VALUES list) with the same semantics as search_chunk_embeddings.
+
+        Args:
+            embeddings: Query embedding vectors (384 dimensions)
+            document_id: Document to search within
+            top_k: Number of results per query vector
+            max_distance: Optional maximum cosine distance threshold
+            exact: Force (True) or skip (False) an exact scan; by default
+                decided from the size of the document
+
+        Returns:
+            One list of (VectorEmbedding, distance) tuples per query vector,
+            in input order, each ordered by similarity
+        """
+        if not embeddings:
+            return []
+
+        if exact is None:
+            exact = await self.use_exact_scan(document_ids=[document_id])
+
+        queries = values(
+            column("ordinal", Integer), column("query_embedding", Vector(EMBEDDING_DIMENSION)), name="queries"
+        ).data([(i, query_embedding) for i, query_embedding in enumerate(embeddings)])
+
+        distance = self.model.embedding.cosine_distance(
+            cast(queries.c.query_embedding, Vector(EMBEDDING_DIMENSION))
+        )
+        nearest = select(
+            self.model.id,
+            distance.label("distance"),
+        ).where(
+            self.model.document_id == document_id,
+            self.model.entity_type == "chunk",
+        )
+        order = self._exact_order(distance) if exact else distance
+        # Correlate only the query vector; the outer join to vector_embeddings
+        # must not swallow the scan's own FROM
+        nearest = nearest.order_by(order).limit(top_k).correlate(queries).lateral("nearest")
+
+        query = (
+            select(queries.c.ordinal, self.model, nearest.c.distance)
+            .select_from(queries)
+            .join(nearest, true())
+            .join(self.model, self.model.id == nearest.c.id)
+            .order_by(queries.c.ordinal, nearest.c.distance)
+        )
+        if max_distance is not None:
+            query = query.where(nearest.c.distance <= max_distance)
+
+        if exact:
+            result = await self.session.execute(query)
+        else:
+            async with self.hnsw_search_settings():
+                result = await self.session.execute(query)
+
+        matches: List[List[Tuple[Any, float]]] = [[] for _ in embeddings]
+        for row in result:
+            matches[row.ordinal].append((row.VectorEmbedding, float(row.distance)))
+        return matches
+
     async def batch_search(
         self,
         queries: List[Tuple[List[float], Dict[str, Any]]],
@@ -437,6 +680,128 @@ class VectorEmbeddingRepository(BaseRepository[VectorEmbedding]):
         await self.session.flush()
         return result.rowcount
 
+    async def get_entity_embedding_states(
+        self,
+        document_id: UUID,
+        workflow_id: UUID,
+        embedding_model: str,
+        section_types: Optional[List[str]] = None,
+    ) -> List[Tuple[UUID, str, str, Dict[str, Any]]]:
+        """Get the identity, content hash and filter metadata of a document's entity embeddings.
+
+        Chunk-level embeddings (with a source chunk) are excluded.
+
+        Args:
+            document_id: Document ID
+            workflow_id: Workflow ID
+            embedding_model: Embedding model name
+            section_types: Optional section type scope
+
+        Returns:
+            List of (embedding id, entity_id, content_hash, metadata) tuples,
+            where metadata holds the ENTITY_METADATA_COLUMNS values
+        """
+        query = select(
+            self.model.id,
+            self.model.entity_id,
+            self.model.content_hash,
+            *(getattr(self.model, name) for name in ENTITY_METADATA_COLUMNS),
+        ).where(
+            self.model.document_id == document_id,
+            self.model.workflow_id == workflow_id,
+            self.model.embedding_model == embedding_model,
+            self.model.source_chunk_id.is_(None),
+        )
+        if section_types:
+            query = query.where(self.model.section_type.in_(section_types))
+
+        result = await self.session.execute(query)
+        return [
+            (
+                row.id,
+                row.entity_id,
+                row.content_hash,
+                {name: getattr(row, name) for name in ENTITY_METADATA_COLUMNS},
+            )
+            for row in result.all()
+        ]
+
+    async def update_metadata_by_ids(self, updates: List[Dict[str, Any]]) -> int:
+        """Update filter metadata of embeddings by primary key in one batched statement.
+
+        Args:
+            updates: Dicts with ``id`` and the ENTITY_METADATA_COLUMNS to set
+
+        Returns:
+            Number of rows updated
+        """
+        if not updates:
+            return 0
+
+        from sqlalchemy import update
+
+        await self.session.execute(update(self.model), updates)
+        return len(updates)
+
+    async def get_vectors_by_content_hash(
+        self,
+        content_hashes: List[str],
+        embedding_model: str,
+    ) -> Dict[str, List[float]]:
+        """Look up already-computed vectors for identical content.
+
+        Args:
+            content_hashes: SHA-256 hashes of embedded texts
+            embedding_model: Embedding model name
+
+        Returns:
+            Dict mapping content hash to its stored vector
+        """
+        if not content_hashes:
+            return {}
+
+        query = (
+            select(self.model.content_hash, self.model.embedding)
+            .where(
+                self.model.content_hash.in_(content_hashes),
+                self.model.embedding_model == embedding_model,
+                self.model.embedding.is_not(None),
+            )
+            .distinct(self.model.content_hash)
+        )
+        result = await self.session.execute(query)
+        return {row.content_hash: list(row.embedding) for row in result.all()}
+
+    async def delete_by_ids(self, ids: List[UUID]) -> int:
+        """Delete embeddings by primary key in one statement."""
+        if not ids:
+            return 0
+
+        from sqlalchemy import delete
+
+        result = await self.session.execute(
+            delete(self.model).where(self.model.id.in_(ids)),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount or 0
+
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many embeddings with one batched multi-row INSERT.
+
+        Args:
+            rows: Column values for each VectorEmbedding
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        from sqlalchemy import insert
+
+        await self.session.execute(insert(self.model), rows)
+        return len(rows)
+
     async def get_embedding_statistics(
         self,
         document_id: Optional[UUID] = None
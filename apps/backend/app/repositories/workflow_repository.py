@@ -2,11 +2,12 @@ import uuid
 from typing import Optional, List, Sequence, Any
 from datetime import datetime, timezone
 
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import JSON, select, and_, delete, func, null, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.models import Workflow, WorkflowDefinition, WorkflowDocument, WorkflowStageRun, WorkflowDocumentStageRun, WorkflowRunEvent, WorkflowQuery
+from app.database.models import Document, Workflow, WorkflowDefinition, WorkflowDocument, WorkflowStageRun, WorkflowDocumentStageRun, WorkflowRunEvent, WorkflowQuery
 from app.repositories.base_repository import BaseRepository
 
 
@@ -144,6 +145,177 @@ class WorkflowRepository(BaseRepository[Workflow]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def list_workflow_summaries(
+        self,
+        user_id: uuid.UUID,
+        limit: int = 50,
+        after: Optional[tuple[datetime, uuid.UUID]] = None,
+        offset: int = 0,
+        include_documents: bool = True,
+        include_stages: bool = True,
+        include_events: bool = True,
+        events_limit: int = 5,
+    ) -> Sequence[Any]:
+        """Project a page of a user's workflows for the dashboard in one statement.
+
+        Workflows are ordered newest first on (created_at, id). Document
+        counts, stage runs and the latest events are aggregated in SQL for
+        the page only, so the cost does not grow with the user's history.
+
+        Args:
+            user_id: Owner of the workflows
+            limit: Max workflows to return
+            after: (created_at, id) of the last workflow of the previous page
+            offset: Workflows to skip (only used without ``after``)
+            include_documents: Aggregate document summaries
+            include_stages: Aggregate stage runs
+            include_events: Aggregate the latest events
+            events_limit: Latest events per workflow
+
+        Returns:
+            Row mappings with workflow columns, definition_name, workflow_type,
+            documents_total/completed/failed, last_stage_at, last_event_at,
+            total (all of the user's workflows) and, when included, documents,
+            stages and recent_events as JSON lists
+        """
+        page = select(Workflow.id).where(Workflow.user_id == user_id)
+        if after is not None:
+            page = page.where(tuple_(Workflow.created_at, Workflow.id) < tuple_(*after))
+        else:
+            page = page.offset(offset)
+        page = page.order_by(Workflow.created_at.desc(), Workflow.id.desc()).limit(limit).cte("page")
+        page_ids = select(page.c.id)
+
+        document_name = func.coalesce(
+            func.nullif(Document.document_name, ""),
+            func.regexp_replace(Document.file_path, "^.*/", ""),
+        )
+        document_columns = [
+            WorkflowDocument.workflow_id,
+            func.count().label("documents_total"),
+            func.count().filter(Document.status == "extracted").label("documents_completed"),
+            func.count().filter(Document.status == "failed").label("documents_failed"),
+        ]
+        if include_documents:
+            document_columns.append(func.json_agg(aggregate_order_by(
+                func.json_build_object(
+                    "document_id", Document.id,
+                    "document_name", document_name,
+                    "file_name", document_name,
+                    "page_count", Document.page_count,
+                    "file_path", Document.file_path,
+                    "status", Document.status,
+                    "uploaded_at", Document.uploaded_at,
+                ),
+                WorkflowDocument.created_at, WorkflowDocument.document_id,
+            ), type_=JSON).label("documents"))
+        documents = (
+            select(*document_columns)
+            .join(Document, Document.id == WorkflowDocument.document_id)
+            .where(WorkflowDocument.workflow_id.in_(page_ids))
+            .group_by(WorkflowDocument.workflow_id)
+            .subquery("document_summary")
+        )
+
+        stage_columns = [
+            WorkflowStageRun.workflow_id,
+            func.greatest(
+                func.max(WorkflowStageRun.completed_at), func.max(WorkflowStageRun.started_at)
+            ).label("last_stage_at"),
+        ]
+        if include_stages:
+            stage_columns.append(func.json_agg(aggregate_order_by(
+                func.json_build_object(
+                    "stage_name", WorkflowStageRun.stage_name,
+                    "status", WorkflowStageRun.status,
+                    "started_at", WorkflowStageRun.started_at,
+                    "completed_at", WorkflowStageRun.completed_at,
+                    "duration_seconds", func.extract(
+                        "epoch", WorkflowStageRun.completed_at - WorkflowStageRun.started_at
+                    ),
+                ),
+                WorkflowStageRun.started_at.asc().nulls_last(), WorkflowStageRun.stage_name,
+            ), type_=JSON).label("stages"))
+        stages = (
+            select(*stage_columns)
+            .where(WorkflowStageRun.workflow_id.in_(page_ids))
+            .group_by(WorkflowStageRun.workflow_id)
+            .subquery("stage_summary")
+        )
+
+        ranked_events = (
+            select(
+                WorkflowRunEvent.workflow_id,
+                WorkflowRunEvent.event_type,
+                WorkflowRunEvent.event_payload,
+                WorkflowRunEvent.created_at,
+                func.row_number().over(
+                    partition_by=WorkflowRunEvent.workflow_id,
+                    order_by=(WorkflowRunEvent.created_at.desc(), WorkflowRunEvent.id.desc()),
+                ).label("event_rank"),
+            )
+            .where(WorkflowRunEvent.workflow_id.in_(page_ids))
+            .subquery("ranked_events")
+        )
+        event_columns = [
+            ranked_events.c.workflow_id,
+            func.max(ranked_events.c.created_at).label("last_event_at"),
+        ]
+        if include_events:
+            event_columns.append(func.json_agg(aggregate_order_by(
+                func.json_build_object(
+                    "event_type", ranked_events.c.event_type,
+                    "event_payload", ranked_events.c.event_payload,
+                    "created_at", ranked_events.c.created_at,
+                ),
+                ranked_events.c.event_rank,
+            ), type_=JSON).filter(ranked_events.c.event_rank <= events_limit).label("recent_events"))
+        events = (
+            select(*event_columns)
+            .group_by(ranked_events.c.workflow_id)
+            .subquery("event_summary")
+        )
+
+        all_workflows = aliased(Workflow)
+        total = (
+            select(func.count())
+            .select_from(all_workflows)
+            .where(all_workflows.user_id == user_id)
+            .scalar_subquery()
+        )
+
+        query = (
+            select(
+                Workflow.id,
+                Workflow.temporal_workflow_id,
+                Workflow.workflow_name,
+                Workflow.workflow_definition_id,
+                Workflow.status,
+                Workflow.created_at,
+                Workflow.updated_at,
+                WorkflowDefinition.display_name.label("definition_name"),
+                WorkflowDefinition.workflow_key.label("workflow_type"),
+                func.coalesce(documents.c.documents_total, 0).label("documents_total"),
+                func.coalesce(documents.c.documents_completed, 0).label("documents_completed"),
+                func.coalesce(documents.c.documents_failed, 0).label("documents_failed"),
+                stages.c.last_stage_at,
+                events.c.last_event_at,
+                total.label("total"),
+                documents.c.documents if include_documents else null().label("documents"),
+                stages.c.stages if include_stages else null().label("stages"),
+                events.c.recent_events if include_events else null().label("recent_events"),
+            )
+            .join(page, page.c.id == Workflow.id)
+            .outerjoin(WorkflowDefinition, WorkflowDefinition.id == Workflow.workflow_definition_id)
+            .outerjoin(documents, documents.c.workflow_id == Workflow.id)
+            .outerjoin(stages, stages.c.workflow_id == Workflow.id)
+            .outerjoin(events, events.c.workflow_id == Workflow.id)
+            .order_by(Workflow.created_at.desc(), Workflow.id.desc())
+        )
+
+        result = await self.session.execute(query)
+        return result.mappings().all()
+
     async def update_temporal_id(
         self,
         workflow_id: uuid.UUID,
@@ -346,6 +518,55 @@ class WorkflowDocumentRepository(BaseRepository[WorkflowDocument]):
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_document_names(
+        self,
+        workflow_id: uuid.UUID
+    ) -> List[tuple[uuid.UUID, Optional[str]]]:
+        """Get (document_id, document_name) for all documents of a workflow.
+        
+        Args:
+            workflow_id: Workflow ID
+            
+        Returns:
+            Tuples in the order documents were linked to the workflow
+        """
+        query = (
+            select(WorkflowDocument.document_id, Document.document_name)
+            .join(Document, Document.id == WorkflowDocument.document_id)
+            .where(WorkflowDocument.workflow_id == workflow_id)
+            .order_by(WorkflowDocument.created_at, WorkflowDocument.document_id)
+        )
+        result = await self.session.execute(query)
+        return [(row.document_id, row.document_name) for row in result]
+
+    async def get_context_version(
+        self,
+        workflow_id: uuid.UUID
+    ) -> tuple:
+        """Get a token that changes whenever the workflow's documents or
+        their processing stages change.
+        
+        Covers documents being linked or unlinked and every document stage
+        transition, including indexing completing.
+        
+        Args:
+            workflow_id: Workflow ID
+            
+        Returns:
+            Opaque, comparable version tuple
+        """
+        documents = select(
+            func.count().label("document_count"),
+            func.max(WorkflowDocument.updated_at).label("documents_updated_at"),
+        ).where(WorkflowDocument.workflow_id == workflow_id).subquery()
+        stage_runs = select(
+            func.count().label("stage_run_count"),
+            func.max(WorkflowDocumentStageRun.updated_at).label("stages_updated_at"),
+        ).where(WorkflowDocumentStageRun.workflow_id == workflow_id).subquery()
+
+        result = await self.session.execute(select(documents, stage_runs))
+        return tuple(result.one())
     
     async def get_by_workflow_and_document_id(
         self,
@@ -367,6 +588,50 @@ class WorkflowDocumentRepository(BaseRepository[WorkflowDocument]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def count_document_links(self, document_id: uuid.UUID) -> int:
+        """Count the workflows a document is linked to.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Number of workflow_documents rows for the document
+        """
+        query = select(func.count()).select_from(WorkflowDocument).where(
+            WorkflowDocument.document_id == document_id
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one()
+
+    async def unlink_document(
+        self,
+        workflow_id: uuid.UUID,
+        document_id: uuid.UUID
+    ) -> bool:
+        """Remove a document from a workflow, with its stage runs there.
+
+        Args:
+            workflow_id: Workflow ID
+            document_id: Document ID
+
+        Returns:
+            True if the document was linked to the workflow
+        """
+        result = await self.session.execute(
+            delete(WorkflowDocument).where(
+                WorkflowDocument.workflow_id == workflow_id,
+                WorkflowDocument.document_id == document_id,
+            )
+        )
+        await self.session.execute(
+            delete(WorkflowDocumentStageRun).where(
+                WorkflowDocumentStageRun.workflow_id == workflow_id,
+                WorkflowDocumentStageRun.document_id == document_id,
+            )
+        )
+        await self.session.flush()
+        return result.rowcount > 0
+
     async def get_documents_for_workflow(
         self,
         workflow_id: uuid.UUID
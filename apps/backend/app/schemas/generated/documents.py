@@ -17,6 +17,7 @@ class DocumentResponse(BaseModel):
     document_name: str | None = None
     page_count: int | None = None
     created_at: AwareDatetime
+    deduplicated: bool | None = False
 
 
 class FailedUpload(BaseModel):
@@ -13,6 +13,17 @@ class HealthCheckResponse(BaseModel):
     status: str = Field(..., description='Health check status')
     version: str = Field(..., description='Running application version')
     service: str = Field(..., description='Service name')
+    database: dict[str, Any] | None = Field(
+        None, description='Database connectivity and connection pool metrics'
+    )
+    retrieval: dict[str, Any] | None = Field(
+        None,
+        description='GraphRAG query latency histograms per pipeline stage (milliseconds, since process start)',
+    )
+    llm: dict[str, Any] | None = Field(
+        None,
+        description='LLM response cache and per-provider rate limiter counters (since process start)',
+    )
 
 
 class ResponseMeta(BaseModel):
@@ -297,3 +297,4 @@ class ApiResponse(BaseModel):
 class WorkflowListResponse(BaseModel):
     total: int | None = None
     workflows: list[WorkflowListItem] | None = None
+    next_cursor: str | None = None
@@ -76,6 +76,9 @@ class WorkflowContext(BaseModel):
     document_ids: list[UUID] = Field(
         default_factory=list, description="Document IDs in this workflow"
     )
+    document_names: dict[UUID, str] = Field(
+        default_factory=dict, description="Document ID to document name"
+    )
     document_count: int = Field(default=0, description="Total documents in workflow")
 
     @field_validator("document_count", mode="before")
@@ -684,6 +687,19 @@ class GraphRAGResponse(BaseModel):
         }
 
 
+class QueryStreamEvent(BaseModel):
+    """Server-sent event of a streamed GraphRAG query.
+
+    A stream emits one ``context_ready`` event once retrieval is done,
+    ``delta`` events with answer text as it is generated, and a ``final``
+    event carrying the complete GraphRAGResponse with citations. ``error``
+    ends the stream if the query fails.
+    """
+
+    event_type: Literal["context_ready", "delta", "final", "error"]
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
 class WorkflowMessage(BaseModel):
     """Chat message schema for history retrieval."""
     
@@ -9,6 +9,7 @@ Uses CitationResolutionService for tiered coordinate resolution:
 - Tier 3: Placeholder fallback
 """
 
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import List, Dict, Any, Optional
 from uuid import UUID
@@ -18,11 +19,14 @@ from pydantic import BaseModel
 
 from app.services.citation.citation_service import CitationService
 from app.services.citation.citation_mapper import CitationMapper
-from app.services.citation.citation_resolution_service import CitationResolutionService
+from app.services.citation.citation_resolution_service import (
+    CitationResolutionService,
+    ResolutionRequest,
+    ResolutionResult,
+)
 from app.repositories.document_repository import DocumentRepository
 from app.schemas.citation import (
     CitationCreate,
-    CitationResponse,
     PageRange,
     SourceType,
     ExtractionMethod,
@@ -44,6 +48,17 @@ def _to_dict(item: Any) -> Dict[str, Any]:
         return {"value": item}
 
 
+@dataclass
+class _PreparedItem:
+    """A validated synthesized item awaiting resolution."""
+
+    source_type: SourceType
+    source_id: str
+    page_numbers: List[int]
+    source_text: str
+    item: Dict[str, Any]
+
+
 class CitationCreationService:
     """Service for creating citations from synthesis results.
 
@@ -122,7 +137,6 @@ class CitationCreationService:
         Returns:
             Dict with created citation counts and any errors
         """
-        created_count = 0
         skipped_count = 0
         errors = []
         resolution_stats = {"direct_text_match": 0, "semantic_chunk_match": 0, "placeholder": 0}
@@ -155,92 +169,85 @@ class CitationCreationService:
                 },
             )
 
-        # Create citations for coverages
-        for i, coverage in enumerate(effective_coverages):
-            coverage_dict = _to_dict(coverage)
-            coverage_name = coverage_dict.get("coverage_name", f"coverage_{i}")
+        # Validate every item first so resolution runs once for the document
+        prepared: List[_PreparedItem] = []
+        for source_type, items, name_field in (
+            (SourceType.EFFECTIVE_COVERAGE, effective_coverages, "coverage_name"),
+            (SourceType.EFFECTIVE_EXCLUSION, effective_exclusions, "exclusion_name"),
+        ):
+            label = name_field.split("_")[0]
+            for i, item in enumerate(items):
+                item_dict = _to_dict(item)
+                item_name = item_dict.get(name_field, f"{label}_{i}")
+
+                LOGGER.debug(
+                    f"[CITATION] Processing {label} {i+1}/{len(items)}: {item_name}",
+                    extra={
+                        "canonical_id": item_dict.get("canonical_id"),
+                        "page_numbers": item_dict.get("page_numbers"),
+                        "has_source_text": bool(item_dict.get("source_text")),
+                        "has_description": bool(item_dict.get("description")),
+                    },
+                )
 
-            LOGGER.debug(
-                f"[CITATION] Processing coverage {i+1}/{len(effective_coverages)}: {coverage_name}",
-                extra={
-                    "canonical_id": coverage_dict.get("canonical_id"),
-                    "page_numbers": coverage_dict.get("page_numbers"),
-                    "has_source_text": bool(coverage_dict.get("source_text")),
-                    "has_description": bool(coverage_dict.get("description")),
-                },
-            )
+                try:
+                    prepared_item = self._prepare_item(item_dict, source_type)
+                except Exception as e:
+                    error_msg = f"Failed to create citation for {label} {item_dict.get('canonical_id')}: {e}"
+                    LOGGER.error(f"[CITATION] Exception for {label} {item_name}: {e}", exc_info=True)
+                    errors.append(error_msg)
+                    continue
 
-            try:
-                citation = await self._create_citation_from_item(
-                    document_id=document_id,
-                    item=coverage_dict,
-                    source_type=SourceType.EFFECTIVE_COVERAGE,
-                )
-                if citation:
-                    created_count += 1
-                    if citation.resolution_method:
-                        resolution_stats[citation.resolution_method] = (
-                            resolution_stats.get(citation.resolution_method, 0) + 1
-                        )
-                    LOGGER.debug(
-                        f"[CITATION] Created citation for coverage: {coverage_name}",
-                        extra={
-                            "citation_id": str(citation.id),
-                            "canonical_id": coverage_dict.get("canonical_id"),
-                            "primary_page": citation.primary_page,
-                            "resolution_method": citation.resolution_method,
-                        },
-                    )
+                if prepared_item:
+                    prepared.append(prepared_item)
                 else:
                     skipped_count += 1
-            except Exception as e:
-                error_msg = f"Failed to create citation for coverage {coverage_dict.get('canonical_id')}: {e}"
-                LOGGER.error(f"[CITATION] Exception for coverage {coverage_name}: {e}", exc_info=True)
-                errors.append(error_msg)
 
-        # Create citations for exclusions
-        for i, exclusion in enumerate(effective_exclusions):
-            exclusion_dict = _to_dict(exclusion)
-            exclusion_name = exclusion_dict.get("exclusion_name", f"exclusion_{i}")
-
-            LOGGER.debug(
-                f"[CITATION] Processing exclusion {i+1}/{len(effective_exclusions)}: {exclusion_name}",
-                extra={
-                    "canonical_id": exclusion_dict.get("canonical_id"),
-                    "page_numbers": exclusion_dict.get("page_numbers"),
-                    "has_source_text": bool(exclusion_dict.get("source_text")),
-                    "has_description": bool(exclusion_dict.get("description")),
-                },
+        # Tiered resolution for all items (Tier 1 → Tier 2 → Tier 3)
+        requests = [
+            ResolutionRequest(
+                source_text=prepared_item.source_text,
+                expected_page=min(prepared_item.page_numbers),
+                page_numbers=prepared_item.page_numbers,
             )
-
-            try:
-                citation = await self._create_citation_from_item(
-                    document_id=document_id,
-                    item=exclusion_dict,
-                    source_type=SourceType.EFFECTIVE_EXCLUSION,
+            for prepared_item in prepared
+        ]
+        try:
+            resolutions = await self._resolution_service.resolve_batch(requests, document_id)
+        except Exception as e:
+            LOGGER.error(f"[CITATION] Citation resolution failed, using placeholders: {e}", exc_info=True)
+            errors.append(f"Failed to resolve {len(requests)} citations, using placeholders: {e}")
+            resolutions = [self._resolution_service.build_placeholder(request) for request in requests]
+
+        citations: List[CitationCreate] = []
+        for prepared_item, resolution in zip(prepared, resolutions):
+            label = prepared_item.source_type.value.split("_")[-1]
+            if resolution.error:
+                errors.append(
+                    f"Citation for {label} {prepared_item.source_id} resolved by "
+                    f"{resolution.method} after an error: {resolution.error}"
                 )
-                if citation:
-                    created_count += 1
-                    if citation.resolution_method:
-                        resolution_stats[citation.resolution_method] = (
-                            resolution_stats.get(citation.resolution_method, 0) + 1
-                        )
-                    LOGGER.debug(
-                        f"[CITATION] Created citation for exclusion: {exclusion_name}",
-                        extra={
-                            "citation_id": str(citation.id),
-                            "canonical_id": exclusion_dict.get("canonical_id"),
-                            "primary_page": citation.primary_page,
-                            "resolution_method": citation.resolution_method,
-                        },
-                    )
-                else:
-                    skipped_count += 1
+            try:
+                citations.append(self._build_citation(document_id, prepared_item, resolution))
             except Exception as e:
-                error_msg = f"Failed to create citation for exclusion {exclusion_dict.get('canonical_id')}: {e}"
-                LOGGER.error(f"[CITATION] Exception for exclusion {exclusion_name}: {e}", exc_info=True)
+                error_msg = f"Failed to create citation for {label} {prepared_item.source_id}: {e}"
+                LOGGER.error(f"[CITATION] Exception for {label} {prepared_item.source_id}: {e}", exc_info=True)
                 errors.append(error_msg)
 
+        try:
+            await self.citation_service.create_citations(citations)
+        except Exception as e:
+            LOGGER.error(f"[CITATION] Failed to persist citations: {e}", exc_info=True)
+            errors.append(f"Failed to persist {len(citations)} citations: {e}")
+            await self.session.rollback()
+            citations = []
+
+        created_count = len(citations)
+        for citation in citations:
+            resolution_stats[citation.resolution_method] = (
+                resolution_stats.get(citation.resolution_method, 0) + 1
+            )
+
         LOGGER.info(
             "="*60 + "\n[CITATION] Citation creation completed\n" + "="*60,
             extra={
@@ -264,13 +271,12 @@ class CitationCreationService:
             "resolution_stats": resolution_stats,
         }
 
-    async def _create_citation_from_item(
+    def _prepare_item(
         self,
-        document_id: UUID,
         item: Dict[str, Any],
         source_type: SourceType,
-    ) -> Optional[CitationResponse]:
-        """Create a citation from a synthesized item."""
+    ) -> Optional[_PreparedItem]:
+        """Validate a synthesized item and extract what its citation needs."""
         item_name = item.get('coverage_name') or item.get('exclusion_name') or 'unknown'
 
         source_id = item.get("canonical_id")
@@ -303,25 +309,23 @@ class CitationCreationService:
                 )
                 return None
 
-        LOGGER.debug(
-            f"[CITATION] Resolving citation for: {item_name}",
-            extra={
-                "source_id": source_id,
-                "source_type": source_type.value,
-                "page_numbers": page_numbers,
-                "text_length": len(source_text),
-            },
-        )
-
-        # Use tiered resolution service (Tier 1 → Tier 2 → Tier 3)
-        resolution = await self._resolution_service.resolve(
-            source_text=source_text,
-            document_id=document_id,
-            expected_page=min(page_numbers),
+        return _PreparedItem(
+            source_type=source_type,
+            source_id=source_id,
             page_numbers=page_numbers,
+            source_text=source_text,
+            item=item,
         )
 
-        primary_page = min(page_numbers) if page_numbers else 1
+    def _build_citation(
+        self,
+        document_id: UUID,
+        prepared_item: _PreparedItem,
+        resolution: ResolutionResult,
+    ) -> CitationCreate:
+        """Build the citation for a resolved item."""
+        page_numbers = prepared_item.page_numbers
+        item = prepared_item.item
 
         page_range = None
         if len(page_numbers) > 1:
@@ -331,13 +335,13 @@ class CitationCreationService:
         if confidence is not None:
             confidence = Decimal(str(confidence))
 
-        citation_data = CitationCreate(
+        return CitationCreate(
             document_id=document_id,
-            source_type=source_type,
-            source_id=source_id,
+            source_type=prepared_item.source_type,
+            source_id=prepared_item.source_id,
             spans=resolution.spans,
-            verbatim_text=source_text[:5000],
-            primary_page=primary_page,
+            verbatim_text=prepared_item.source_text[:5000],
+            primary_page=min(page_numbers),
             page_range=page_range,
             extraction_confidence=confidence,
             extraction_method=ExtractionMethod.DOCLING,
@@ -345,8 +349,6 @@ class CitationCreationService:
             resolution_method=resolution.method,
         )
 
-        return await self.citation_service.create_citation(citation_data)
-
     def _extract_page_numbers(self, item: Dict[str, Any]) -> List[int]:
         """Extract page numbers from item."""
         page_numbers = item.get("page_numbers")
@@ -2,12 +2,21 @@
 
 Implements text-to-coordinate mapping using fuzzy matching
 to handle OCR variations and text normalization differences.
+
+Page words are normalized once per document and indexed by position
+(token -> positions per page). A search resolves each of its words to the
+document tokens it fuzzily matches (one rapidfuzz batch per new word),
+then every matching position votes for the window start it implies, so
+the cost of a lookup follows the number of matching positions rather than
+the page length.
 """
 
 import re
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from app.schemas.citation import BoundingBox, CitationSpan, TextMatch
 from app.services.processed.services.ocr.coordinate_extraction_service import (
@@ -18,6 +27,12 @@ from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+_LEADING_LIST_MARKER = re.compile(r'^[\s\-\*]*\(?\d+\)?[\.\):]?\s+')
+_INLINE_LIST_MARKER = re.compile(r'\n[\s\-\*]*\(?\d+\)?[\.\):]?\s+')
+_WHITESPACE = re.compile(r'\s+')
+_SPECIAL_CHARACTERS = re.compile(r'[^\w\s\-\.,;:\'"()&/%$]')
+_EMPTY_POSITIONS = np.empty(0, dtype=np.int64)
+
 
 @dataclass
 class MatchConfig:
@@ -60,6 +75,28 @@ class CitationMapper:
         self.config = config or MatchConfig()
         # Flatten multi-word entries (lines/phrases) into word-level coordinates
         self.word_index = self._flatten_word_index(word_index)
+        self._build_match_index()
+
+    def _build_match_index(self) -> None:
+        """Normalize page words once and index their positions by token."""
+        self._vocabulary: Dict[str, int] = {}
+        self._page_postings: Dict[int, Dict[int, np.ndarray]] = {}
+
+        for page_num, words in self.word_index.items():
+            positions: Dict[int, List[int]] = {}
+            for position, word in enumerate(words):
+                token = self._normalize_text(word.text)
+                if not token:
+                    continue
+                token_id = self._vocabulary.setdefault(token, len(self._vocabulary))
+                positions.setdefault(token_id, []).append(position)
+            self._page_postings[page_num] = {
+                token_id: np.array(found, dtype=np.int64) for token_id, found in positions.items()
+            }
+
+        self._tokens = list(self._vocabulary)
+        # Search word -> ids of document tokens it matches
+        self._word_matches: Dict[str, np.ndarray] = {}
 
     def _flatten_word_index(self, word_index: Dict[int, List[WordCoordinate]]) -> Dict[int, List[WordCoordinate]]:
         """Flatten line-level coordinates into individual words."""
@@ -144,10 +181,9 @@ class CitationMapper:
             if page_num not in self.word_index:
                 continue
 
-            page_words = self.word_index[page_num]
             span = self._find_sequence_in_page(
                 search_words,
-                page_words,
+                page_num,
                 threshold
             )
 
@@ -188,10 +224,9 @@ class CitationMapper:
 
         matches = []
         for page_num in sorted(self.word_index.keys()):
-            page_words = self.word_index[page_num]
             span = self._find_sequence_in_page(
                 search_words,
-                page_words,
+                page_num,
                 threshold
             )
 
@@ -208,46 +243,85 @@ class CitationMapper:
     def _find_sequence_in_page(
         self,
         search_words: List[str],
-        page_words: List[WordCoordinate],
+        page_num: int,
         threshold: float
     ) -> Optional[CitationSpan]:
         """Find word sequence in page words.
 
-        Uses anchor-based matching for long texts (> anchor_size words)
-        and full sliding window for short texts.
+        Uses anchor-based matching for long texts (> anchor_size words):
+        the first anchor_size words locate the start, and the span is then
+        extended to the full search length.
         """
+        page_words = self.word_index.get(page_num)
         if not search_words or not page_words:
             return None
 
-        page_texts = [self._normalize_text(w.text) for w in page_words]
         anchor_size = self.config.anchor_size
+        window = search_words if len(search_words) <= anchor_size else search_words[:anchor_size]
 
-        # For short texts, use full sliding window (original approach)
-        if len(search_words) <= anchor_size:
-            for i in range(len(page_words) - len(search_words) + 1):
-                window = page_texts[i:i + len(search_words)]
-                similarity = self._sequence_similarity(search_words, window)
-                if similarity >= threshold:
-                    matched_words = page_words[i:i + len(search_words)]
-                    return self._words_to_span(matched_words)
+        start = self._first_matching_window(window, page_num, threshold)
+        if start is None:
             return None
 
-        # For long texts, use anchor-based matching:
-        # 1. Find start position using first N words as anchor
-        # 2. Extend to cover the full search length
-        anchor_words = search_words[:anchor_size]
+        end_idx = min(start + len(search_words), len(page_words))
+        return self._words_to_span(page_words[start:end_idx])
 
-        for i in range(len(page_texts) - anchor_size + 1):
-            anchor_window = page_texts[i:i + anchor_size]
-            anchor_sim = self._sequence_similarity(anchor_words, anchor_window)
+    def _first_matching_window(
+        self,
+        window: List[str],
+        page_num: int,
+        threshold: float
+    ) -> Optional[int]:
+        """First page offset where at least threshold of window's words match.
 
-            if anchor_sim >= threshold:
-                # Anchor matched — take the full span from this start position
-                end_idx = min(i + len(search_words), len(page_words))
-                matched_words = page_words[i:end_idx]
-                return self._words_to_span(matched_words)
+        A page word matching the window word at offset j is a vote for the
+        window starting j positions earlier; a start's votes are the number
+        of its words that match.
+        """
+        last_start = len(self.word_index[page_num]) - len(window)
+        if last_start < 0:
+            return None
 
-        return None
+        postings = self._page_postings[page_num]
+        self._resolve_word_matches(window)
+
+        starts = []
+        for offset, word in enumerate(window):
+            for token_id in self._word_matches[word]:
+                positions = postings.get(token_id)
+                if positions is not None:
+                    starts.append(positions - offset)
+        if not starts:
+            return None
+
+        starts = np.concatenate(starts)
+        starts = starts[(starts >= 0) & (starts <= last_start)]
+        if not starts.size:
+            return None
+
+        votes = np.bincount(starts)
+        hits = np.flatnonzero(votes / len(window) >= threshold)
+        return int(hits[0]) if hits.size else None
+
+    def _resolve_word_matches(self, words: Iterable[str]) -> None:
+        """Find the document tokens each new search word matches.
+
+        A token matches when equal to the word or when their character
+        similarity reaches word_similarity_threshold.
+        """
+        pending = list(dict.fromkeys(w for w in words if w not in self._word_matches))
+        if not pending:
+            return
+        if not self._tokens:
+            self._word_matches.update((word, _EMPTY_POSITIONS) for word in pending)
+            return
+
+        cutoff = self.config.word_similarity_threshold * 100
+        scores = process.cdist(
+            pending, self._tokens, scorer=fuzz.ratio, score_cutoff=cutoff, dtype=np.float64
+        )
+        for word, row in zip(pending, scores):
+            self._word_matches[word] = np.flatnonzero(row >= cutoff)
 
     def _words_to_span(self, words: List[WordCoordinate]) -> CitationSpan:
         """Convert matched words to a CitationSpan."""
@@ -288,42 +362,17 @@ class CitationMapper:
         
         # Strip markdown-style list prefixes (e.g., "- (1)", "* 2.", "1. ", etc.)
         # Strip from start of string
-        text = re.sub(r'^[\s\-\*]*\(?\d+\)?[\.\):]?\s+', '', text)
+        text = _LEADING_LIST_MARKER.sub('', text)
         # Strip from middle of string (converted to single space later)
-        text = re.sub(r'\n[\s\-\*]*\(?\d+\)?[\.\):]?\s+', ' ', text)
+        text = _INLINE_LIST_MARKER.sub(' ', text)
         
         # Remove extra whitespace (including newlines), lowercase
-        text = re.sub(r'\s+', ' ', text.strip().lower())
+        text = _WHITESPACE.sub(' ', text.strip().lower())
         
         # Remove special characters except common punctuation used in insurance clauses
-        text = re.sub(r'[^\w\s\-\.,;:\'"()&/%$]', '', text)
+        text = _SPECIAL_CHARACTERS.sub('', text)
         return text
 
-    def _sequence_similarity(
-        self,
-        seq1: List[str],
-        seq2: List[str]
-    ) -> float:
-        """Calculate similarity between word sequences using fuzzy per-word matching."""
-        if len(seq1) != len(seq2):
-            return 0.0
-
-        word_thresh = self.config.word_similarity_threshold
-        matches = 0
-        for w1, w2 in zip(seq1, seq2):
-            if w1 == w2:
-                matches += 1
-            elif self._word_similarity(w1, w2) >= word_thresh:
-                matches += 1
-        return matches / len(seq1)
-
-    @staticmethod
-    def _word_similarity(w1: str, w2: str) -> float:
-        """Character-level similarity between two words."""
-        if not w1 or not w2:
-            return 0.0
-        return SequenceMatcher(None, w1, w2).ratio()
-
     def _group_into_lines(
         self,
         words: List[WordCoordinate],
@@ -10,10 +10,13 @@ Usage:
     result = await resolver.resolve(source_text, document_id, expected_page=3)
     # result.spans -> List[CitationSpan]
     # result.method -> "direct_text_match" | "semantic_chunk_match" | "placeholder"
+
+    # Many items of one document: one embedding call and one chunk search
+    results = await resolver.resolve_batch(requests, document_id)
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
@@ -23,11 +26,11 @@ from app.database.models import DocumentChunk
 from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
 from app.schemas.citation import BoundingBox, CitationSpan
 from app.services.citation.citation_mapper import CitationMapper
+from app.services.embedding_service import get_embedding_service
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
-EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 SEMANTIC_MAX_DISTANCE = 0.65
 SEMANTIC_TOP_K = 3
 
@@ -41,6 +44,21 @@ class ResolutionResult:
     confidence: float = 0.0
     matched_chunk_id: Optional[UUID] = None
     semantic_distance: Optional[float] = None
+    # Set when a tier failed for this item and resolution fell through
+    error: Optional[str] = None
+
+
+@dataclass
+class ResolutionRequest:
+    """Source text to resolve, with its page hints."""
+
+    source_text: str
+    expected_page: Optional[int] = None
+    page_numbers: Optional[List[int]] = None
+
+    @property
+    def primary_page(self) -> int:
+        return self.expected_page or (min(self.page_numbers) if self.page_numbers else 1)
 
 
 class CitationResolutionService:
@@ -51,16 +69,15 @@ class CitationResolutionService:
         coordinates from pdfplumber. Fast and precise when text exists verbatim.
 
     Tier 2 (Semantic Search):
-        Embeds the source text with all-MiniLM-L6-v2, searches chunk embeddings
+        Embeds the source text with the shared embedding model, searches chunk embeddings
         via pgvector cosine distance. Returns the best matching chunk's page.
         Then retries CitationMapper on that page with a lower threshold.
+        A batch embeds all texts Tier 1 missed together and searches them in one query.
 
     Tier 3 (Placeholder):
         Falls back to full-page bounding boxes when no match is found.
     """
 
-    _shared_model = None
-
     def __init__(
         self,
         session: AsyncSession,
@@ -70,14 +87,6 @@ class CitationResolutionService:
         self.citation_mapper = citation_mapper
         self.vector_repo = VectorEmbeddingRepository(session)
 
-    @classmethod
-    def _get_model(cls):
-        if cls._shared_model is None:
-            from sentence_transformers import SentenceTransformer
-            LOGGER.info(f"Loading embedding model for citation resolution: {EMBEDDING_MODEL}")
-            cls._shared_model = SentenceTransformer(EMBEDDING_MODEL)
-        return cls._shared_model
-
     async def resolve(
         self,
         source_text: str,
@@ -96,48 +105,71 @@ class CitationResolutionService:
         Returns:
             ResolutionResult with spans and the method used
         """
-        primary_page = expected_page or (min(page_numbers) if page_numbers else 1)
-        all_pages = page_numbers or [primary_page]
+        request = ResolutionRequest(source_text, expected_page, page_numbers)
+        return (await self.resolve_batch([request], document_id))[0]
+
+    async def resolve_batch(
+        self,
+        requests: List[ResolutionRequest],
+        document_id: UUID,
+    ) -> List[ResolutionResult]:
+        """Resolve many source texts of one document.
+
+        Tier 1 runs for every request first; the requests it leaves
+        unresolved share one embedding call and one chunk search. A tier
+        failing for one item does not affect the others: the item falls
+        through to the next tier and the failure is kept in its error.
+
+        Args:
+            requests: Texts to locate, with their page hints
+            document_id: Document UUID
+
+        Returns:
+            One ResolutionResult per request, in input order
+        """
+        results: List[Optional[ResolutionResult]] = [None] * len(requests)
+        errors: Dict[int, str] = {}
 
         # Tier 1: Direct text match
-        result = self._try_direct_match(source_text, primary_page)
-        if result:
-            LOGGER.info(
-                "[RESOLUTION] Tier 1 (direct text match) succeeded",
-                extra={
-                    "document_id": str(document_id),
-                    "page": result.spans[0].page_number if result.spans else primary_page,
-                    "confidence": result.confidence,
-                },
-            )
-            return result
+        unresolved = []
+        for i, request in enumerate(requests):
+            try:
+                results[i] = self._try_direct_match(request.source_text, request.primary_page)
+            except Exception as e:
+                LOGGER.warning(
+                    f"[RESOLUTION] Direct match failed: {e}",
+                    extra={"document_id": str(document_id), "expected_page": request.primary_page},
+                )
+                errors[i] = f"Direct text match failed: {e}"
+            if results[i] is None:
+                unresolved.append(i)
 
         # Tier 2: Semantic chunk search
-        result = await self._try_semantic_search(
-            source_text, document_id, primary_page
+        semantic_results = await self._try_semantic_search(
+            [requests[i] for i in unresolved], document_id
         )
-        if result:
-            LOGGER.info(
-                "[RESOLUTION] Tier 2 (semantic chunk match) succeeded",
-                extra={
-                    "document_id": str(document_id),
-                    "matched_chunk_id": str(result.matched_chunk_id) if result.matched_chunk_id else None,
-                    "distance": result.semantic_distance,
-                    "confidence": result.confidence,
-                },
-            )
-            return result
+        for i, result in zip(unresolved, semantic_results):
+            results[i] = result
 
         # Tier 3: Placeholder fallback
+        for i, request in enumerate(requests):
+            if results[i] is None:
+                results[i] = self.build_placeholder(request)
+            if i in errors and results[i].error is None:
+                results[i].error = errors[i]
+
+        stats: Dict[str, int] = {}
+        for result in results:
+            stats[result.method] = stats.get(result.method, 0) + 1
         LOGGER.info(
-            "[RESOLUTION] Falling back to Tier 3 (placeholder)",
+            "[RESOLUTION] Resolved citation batch",
             extra={
                 "document_id": str(document_id),
-                "page": primary_page,
-                "text_length": len(source_text) if source_text else 0,
+                "request_count": len(requests),
+                "resolution_stats": stats,
             },
         )
-        return self._build_placeholder(all_pages, source_text)
+        return results
 
     # ------------------------------------------------------------------
     # Tier 1: Direct text match
@@ -171,27 +203,39 @@ class CitationResolutionService:
 
     async def _try_semantic_search(
         self,
-        source_text: str,
+        requests: List[ResolutionRequest],
         document_id: UUID,
-        primary_page: int,
-    ) -> Optional[ResolutionResult]:
-        if not source_text or len(source_text.strip()) < 20:
-            return None
+    ) -> List[Optional[ResolutionResult]]:
+        results: List[Optional[ResolutionResult]] = [None] * len(requests)
+        eligible = [
+            i for i, request in enumerate(requests)
+            if request.source_text and len(request.source_text.strip()) >= 20
+        ]
+        if not eligible:
+            return results
 
         try:
-            model = self._get_model()
-            query_embedding = model.encode(
-                source_text[:1000], show_progress_bar=False
-            ).tolist()
-
-            results = await self.vector_repo.search_chunk_embeddings(
-                embedding=query_embedding,
+            query_embeddings = await get_embedding_service().embed(
+                [requests[i].source_text[:1000] for i in eligible]
+            )
+            matches = await self.vector_repo.search_chunk_embeddings_batch(
+                query_embeddings,
                 document_id=document_id,
                 top_k=SEMANTIC_TOP_K,
                 max_distance=SEMANTIC_MAX_DISTANCE,
             )
+            chunks = await self._load_chunks(
+                chunk_matches[0][0].source_chunk_id for chunk_matches in matches if chunk_matches
+            )
+        except Exception as e:
+            LOGGER.warning(
+                f"[RESOLUTION] Semantic search failed: {e}",
+                extra={"document_id": str(document_id), "request_count": len(eligible)},
+            )
+            return results
 
-            if not results:
+        for i, chunk_matches in zip(eligible, matches):
+            if not chunk_matches:
                 LOGGER.debug(
                     "[RESOLUTION] No chunk embeddings within threshold",
                     extra={
@@ -199,98 +243,126 @@ class CitationResolutionService:
                         "threshold": SEMANTIC_MAX_DISTANCE,
                     },
                 )
-                return None
-
-            best_embedding, best_distance = results[0]
+                continue
 
-            chunk = await self._load_chunk(best_embedding.source_chunk_id)
+            best_embedding, best_distance = chunk_matches[0]
+            chunk = chunks.get(best_embedding.source_chunk_id)
             if not chunk:
                 LOGGER.warning(
                     "[RESOLUTION] Could not load source chunk",
                     extra={"source_chunk_id": str(best_embedding.source_chunk_id)},
                 )
-                return None
+                continue
+
+            try:
+                results[i] = self._match_on_chunk_page(
+                    requests[i].source_text, document_id, chunk, best_distance
+                )
+            except Exception as e:
+                LOGGER.warning(
+                    f"[RESOLUTION] Match on chunk page failed: {e}",
+                    extra={"document_id": str(document_id), "chunk_id": str(chunk.id)},
+                )
+                results[i] = self._chunk_page_result(requests[i].source_text, chunk, best_distance)
+                results[i].error = f"Text match on chunk page {chunk.page_number} failed: {e}"
 
-            confidence = max(0.0, min(1.0, 1.0 - best_distance))
+        return results
 
-            # Try narrowed direct match on the chunk's page.
-            if self.citation_mapper:
-                search_text = source_text[:500] if len(source_text) > 500 else source_text
-                match = self.citation_mapper.find_text_location(
-                    search_text=search_text,
-                    expected_page=chunk.page_number,
-                    fuzzy_threshold=0.6,
+    def _match_on_chunk_page(
+        self,
+        source_text: str,
+        document_id: UUID,
+        chunk: DocumentChunk,
+        best_distance: float,
+    ) -> ResolutionResult:
+        confidence = max(0.0, min(1.0, 1.0 - best_distance))
+
+        # Try narrowed direct match on the chunk's page.
+        if self.citation_mapper:
+            search_text = source_text[:500] if len(source_text) > 500 else source_text
+            match = self.citation_mapper.find_text_location(
+                search_text=search_text,
+                expected_page=chunk.page_number,
+                fuzzy_threshold=0.6,
+            )
+            if match and match.spans:
+                return ResolutionResult(
+                    spans=match.spans,
+                    method="semantic_chunk_match",
+                    confidence=confidence,
+                    matched_chunk_id=chunk.id,
+                    semantic_distance=best_distance,
                 )
-                if match and match.spans:
-                    return ResolutionResult(
-                        spans=match.spans,
-                        method="semantic_chunk_match",
-                        confidence=confidence,
-                        matched_chunk_id=chunk.id,
-                        semantic_distance=best_distance,
-                    )
 
-                # NEW: Substring fallback - try matching shortened versions of the text
-                # (Often LLM synthesis truncates or slightly alters the end of a clause)
-                if len(search_text) > 50:
-                    for fraction in [0.5, 0.25]:
-                        substring = search_text[:int(len(search_text) * fraction)]
-                        # Use a slightly higher threshold for partial matches to avoid false positives
-                        match = self.citation_mapper.find_text_location(
-                            search_text=substring,
-                            expected_page=chunk.page_number,
-                            fuzzy_threshold=0.7,
+            # NEW: Substring fallback - try matching shortened versions of the text
+            # (Often LLM synthesis truncates or slightly alters the end of a clause)
+            if len(search_text) > 50:
+                for fraction in [0.5, 0.25]:
+                    substring = search_text[:int(len(search_text) * fraction)]
+                    # Use a slightly higher threshold for partial matches to avoid false positives
+                    match = self.citation_mapper.find_text_location(
+                        search_text=substring,
+                        expected_page=chunk.page_number,
+                        fuzzy_threshold=0.7,
+                    )
+                    if match and match.spans:
+                        LOGGER.info(
+                            f"[RESOLUTION] Partial text match found ({int(fraction*100)}% of text)",
+                            extra={
+                                "document_id": str(document_id),
+                                "chunk_id": str(chunk.id),
+                                "fraction": fraction
+                            }
+                        )
+                        return ResolutionResult(
+                            spans=match.spans,
+                            method="semantic_chunk_match",
+                            confidence=confidence * float(fraction),
+                            matched_chunk_id=chunk.id,
+                            semantic_distance=best_distance,
                         )
-                        if match and match.spans:
-                            LOGGER.info(
-                                f"[RESOLUTION] Partial text match found ({int(fraction*100)}% of text)",
-                                extra={
-                                    "document_id": str(document_id),
-                                    "chunk_id": str(chunk.id),
-                                    "fraction": fraction
-                                }
-                            )
-                            return ResolutionResult(
-                                spans=match.spans,
-                                method="semantic_chunk_match",
-                                confidence=confidence * float(fraction),
-                                matched_chunk_id=chunk.id,
-                                semantic_distance=best_distance,
-                            )
-
-            # Chunk matched semantically but no precise bbox — use chunk's page
-            span = CitationSpan(
-                page_number=chunk.page_number,
-                bounding_boxes=[BoundingBox(x0=0.0, y0=0.0, x1=612.0, y1=792.0)],
-                text_content=source_text[:1000],
-            )
-            return ResolutionResult(
-                spans=[span],
-                method="semantic_chunk_match",
-                confidence=confidence,
-                matched_chunk_id=chunk.id,
-                semantic_distance=best_distance,
-            )
 
-        except Exception as e:
-            LOGGER.warning(
-                f"[RESOLUTION] Semantic search failed: {e}",
-                extra={"document_id": str(document_id)},
-            )
-            return None
+        return self._chunk_page_result(source_text, chunk, best_distance)
 
-    async def _load_chunk(self, chunk_id: Optional[UUID]) -> Optional[DocumentChunk]:
-        if not chunk_id:
-            return None
+    def _chunk_page_result(
+        self,
+        source_text: str,
+        chunk: DocumentChunk,
+        best_distance: float,
+    ) -> ResolutionResult:
+        # Chunk matched semantically but no precise bbox — use chunk's page
+        span = CitationSpan(
+            page_number=chunk.page_number,
+            bounding_boxes=[BoundingBox(x0=0.0, y0=0.0, x1=612.0, y1=792.0)],
+            text_content=source_text[:1000],
+        )
+        return ResolutionResult(
+            spans=[span],
+            method="semantic_chunk_match",
+            confidence=max(0.0, min(1.0, 1.0 - best_distance)),
+            matched_chunk_id=chunk.id,
+            semantic_distance=best_distance,
+        )
+
+    async def _load_chunks(self, chunk_ids: Iterable[Optional[UUID]]) -> Dict[UUID, DocumentChunk]:
+        ids = {chunk_id for chunk_id in chunk_ids if chunk_id}
+        if not ids:
+            return {}
         result = await self.session.execute(
-            select(DocumentChunk).where(DocumentChunk.id == chunk_id)
+            select(DocumentChunk).where(DocumentChunk.id.in_(ids))
         )
-        return result.scalar_one_or_none()
+        return {chunk.id: chunk for chunk in result.scalars()}
 
     # ------------------------------------------------------------------
     # Tier 3: Placeholder fallback
     # ------------------------------------------------------------------
 
+    def build_placeholder(self, request: ResolutionRequest) -> ResolutionResult:
+        """Full-page placeholder citation for a request that could not be located."""
+        return self._build_placeholder(
+            request.page_numbers or [request.primary_page], request.source_text
+        )
+
     def _build_placeholder(
         self, page_numbers: List[int], source_text: str
     ) -> ResolutionResult:
@@ -323,5 +395,6 @@ class CitationResolutionService:
 
 __all__ = [
     "CitationResolutionService",
+    "ResolutionRequest",
     "ResolutionResult",
 ]
@@ -73,51 +73,20 @@ class CitationService:
             }
         )
 
-        # Convert spans to JSON-serializable format
-        spans_json = [
-            {
-                "page_number": span.page_number,
-                "bounding_boxes": [
-                    {"x0": bb.x0, "y0": bb.y0, "x1": bb.x1, "y1": bb.y1}
-                    for bb in span.bounding_boxes
-                ],
-                "text_content": span.text_content
-            }
-            for span in citation_data.spans
-        ]
-
-        # Convert page_range to dict if present
-        page_range_dict = None
-        if citation_data.page_range:
-            page_range_dict = {
-                "start": citation_data.page_range.start,
-                "end": citation_data.page_range.end
-            }
+        row = self._to_row(citation_data)
 
         LOGGER.debug(
             "[CITATION-SVC] Calling citation_repo.create",
             extra={
-                "spans_json_length": len(spans_json),
-                "has_page_range": page_range_dict is not None,
+                "spans_json_length": len(row["spans"]),
+                "has_page_range": row["page_range"] is not None,
             }
         )
 
         try:
             # Use upsert to handle duplicate (document_id, source_type, source_id)
             # gracefully - updates existing citation instead of throwing error
-            citation = await self.citation_repo.upsert(
-                document_id=citation_data.document_id,
-                source_type=citation_data.source_type.value,
-                source_id=citation_data.source_id,
-                spans=spans_json,
-                verbatim_text=citation_data.verbatim_text,
-                primary_page=citation_data.primary_page,
-                page_range=page_range_dict,
-                extraction_confidence=citation_data.extraction_confidence,
-                extraction_method=citation_data.extraction_method.value,
-                clause_reference=citation_data.clause_reference,
-                resolution_method=citation_data.resolution_method,
-            )
+            citation = await self.citation_repo.upsert(**row)
 
             LOGGER.info(
                 "[CITATION-SVC] ✓ Citation persisted to database",
@@ -145,6 +114,22 @@ class CitationService:
             )
             raise
 
+    async def create_citations(
+        self,
+        citations: List[CitationCreate]
+    ) -> int:
+        """Create or update many citations in one statement.
+
+        Args:
+            citations: Citation creation data
+
+        Returns:
+            Number of citations written
+        """
+        return await self.citation_repo.upsert_bulk(
+            [self._to_row(citation_data) for citation_data in citations]
+        )
+
     async def get_citation(
         self,
         document_id: UUID,
@@ -309,6 +294,48 @@ class CitationService:
         """
         return await self.citation_repo.delete_by_document(document_id)
 
+    def _to_row(self, citation_data: CitationCreate) -> dict:
+        """Convert citation creation data to Citation column values.
+
+        Args:
+            citation_data: Citation creation data
+
+        Returns:
+            Column dictionary with JSON-serializable spans and page range
+        """
+        spans_json = [
+            {
+                "page_number": span.page_number,
+                "bounding_boxes": [
+                    {"x0": bb.x0, "y0": bb.y0, "x1": bb.x1, "y1": bb.y1}
+                    for bb in span.bounding_boxes
+                ],
+                "text_content": span.text_content
+            }
+            for span in citation_data.spans
+        ]
+
+        page_range_dict = None
+        if citation_data.page_range:
+            page_range_dict = {
+                "start": citation_data.page_range.start,
+                "end": citation_data.page_range.end
+            }
+
+        return {
+            "document_id": citation_data.document_id,
+            "source_type": citation_data.source_type.value,
+            "source_id": citation_data.source_id,
+            "spans": spans_json,
+            "verbatim_text": citation_data.verbatim_text,
+            "primary_page": citation_data.primary_page,
+            "page_range": page_range_dict,
+            "extraction_confidence": citation_data.extraction_confidence,
+            "extraction_method": citation_data.extraction_method.value,
+            "clause_reference": citation_data.clause_reference,
+            "resolution_method": citation_data.resolution_method,
+        }
+
     def _to_response(self, citation: Citation) -> CitationResponse:
         """Convert Citation model to response schema.
 
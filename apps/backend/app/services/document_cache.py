@@ -0,0 +1,355 @@
+"""Content-addressed local cache for source documents.
+
+Processing a document touches the original PDF several times (Docling,
+pdfplumber coordinate extraction, page signal extraction, re-run stages).
+Instead of each consumer downloading it from storage, the file is fetched
+once, stored on local disk under its SHA-256, and every consumer reads the
+local path. The cache is bounded by total size with least-recently-used
+eviction (recency is tracked through file mtimes so it survives restarts
+and is shared between the worker and its OCR processes). Readers hold a
+lease on a blob while they use it, and eviction skips leased blobs.
+
+Layout under the cache root:
+    blobs/<sha256>.pdf          document content
+    index/<sha256(file_path)>   content hash for a storage path
+    leases/<sha256>.<id>        one file per reader using a blob
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+ChunkSource = Callable[[], AsyncIterator[bytes]]
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[mmap.mmap]:
+    """Memory-map a local file read-only.
+
+    The mapping is file-like (read/seek/tell), so pdfplumber can parse a
+    cached PDF through the page cache without copying it into process memory.
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """A document available on local disk."""
+
+    path: str
+    sha256: str
+    size_bytes: int
+
+    def open_mmap(self) -> Iterator[mmap.mmap]:
+        """Memory-map the document read-only (see map_file)."""
+        return map_file(self.path)
+
+
+class DocumentCache:
+    """Size-bounded, content-addressed on-disk document cache.
+
+    Attributes:
+        root: Cache root directory
+        max_bytes: Total blob size above which LRU blobs are evicted
+    """
+
+    def __init__(self, root: str, max_bytes: int, lease_ttl_seconds: int = 3600):
+        """Initialize the cache and create its directories.
+
+        Args:
+            root: Cache root directory
+            max_bytes: Maximum total size of cached blobs
+            lease_ttl_seconds: Age after which a lease is considered abandoned
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self._blob_dir = self.root / "blobs"
+        self._index_dir = self.root / "index"
+        self._lease_dir = self.root / "leases"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        self._lease_dir.mkdir(parents=True, exist_ok=True)
+
+        # One in-flight fetch per storage key in this process; a key's lock
+        # is dropped once nothing holds or waits for it
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
+        self._fetch_lock_users: Dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key_for(storage_key: str) -> str:
+        return hashlib.sha256(storage_key.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self._blob_dir / f"{sha256}.pdf"
+
+    def _touch(self, path: Path) -> None:
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            pass
+
+    def lookup(self, storage_key: str, checksum: Optional[str] = None) -> Optional[CachedDocument]:
+        """Find a cached document without fetching.
+
+        Args:
+            storage_key: Storage location (e.g. ``docs/<file_path>``)
+            checksum: Expected SHA-256, if known. Takes precedence over the
+                path index, so a changed object at the same path is a miss.
+
+        Returns:
+            CachedDocument or None
+        """
+        sha256 = checksum
+        if sha256 is None:
+            index_path = self._index_dir / self._key_for(storage_key)
+            try:
+                sha256 = index_path.read_text().strip()
+            except FileNotFoundError:
+                return None
+
+        blob = self._blob_path(sha256)
+        try:
+            size = blob.stat().st_size
+        except FileNotFoundError:
+            return None
+
+        self._touch(blob)
+        return CachedDocument(path=str(blob), sha256=sha256, size_bytes=size)
+
+    def _pin(self, sha256: str) -> Path:
+        """Take a lease on a blob so eviction leaves it alone."""
+        lease = self._lease_dir / f"{sha256}.{os.getpid()}-{uuid.uuid4().hex}"
+        lease.touch()
+        return lease
+
+    @staticmethod
+    def _unpin(lease: Path) -> None:
+        try:
+            lease.unlink()
+        except FileNotFoundError:
+            pass
+
+    def is_pinned(self, sha256: str) -> bool:
+        """Whether any reader (in any process) holds a lease on a blob.
+
+        Leases older than lease_ttl_seconds belong to readers that died
+        without releasing them and are removed.
+        """
+        pinned = False
+        now = time.time()
+        for lease in self._lease_dir.glob(f"{sha256}.*"):
+            try:
+                age = now - lease.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age > self.lease_ttl_seconds:
+                self._unpin(lease)
+            else:
+                pinned = True
+        return pinned
+
+    def _lookup_pinned(
+        self, storage_key: str, checksum: Optional[str]
+    ) -> Optional[Tuple[CachedDocument, Path]]:
+        """Look a document up and lease it, if it is still there once leased."""
+        cached = self.lookup(storage_key, checksum)
+        if cached is None:
+            return None
+        lease = self._pin(cached.sha256)
+        # It may have been evicted between the lookup and the lease
+        if not os.path.exists(cached.path):
+            self._unpin(lease)
+            return None
+        return cached, lease
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        storage_key: str,
+        fetch_chunks: ChunkSource,
+        checksum: Optional[str] = None,
+    ) -> AsyncIterator[CachedDocument]:
+        """Provide a cached document for the duration of the block, fetching it once on a miss.
+
+        The blob is leased until the block exits, so eviction triggered by
+        other activities or OCR processes cannot delete it while it is read.
+
+        Args:
+            storage_key: Storage location used as the index key
+            fetch_chunks: Factory returning an async iterator of content chunks
+            checksum: Expected SHA-256, if known
+
+        Yields:
+            CachedDocument on local disk
+        """
+        cached, lease, fetched = await self._acquire(storage_key, fetch_chunks, checksum)
+        try:
+            if fetched:
+                await asyncio.to_thread(self.evict)
+            yield cached
+        finally:
+            self._unpin(lease)
+
+    async def _acquire(
+        self,
+        storage_key: str,
+        fetch_chunks: ChunkSource,
+        checksum: Optional[str],
+    ) -> Tuple[CachedDocument, Path, bool]:
+        """Return a leased cached document, fetching it once per key on a miss.
+
+        Returns:
+            Tuple of (document, its lease, whether it was fetched)
+        """
+        found = self._lookup_pinned(storage_key, checksum)
+        if found:
+            self.hits += 1
+            return (*found, False)
+
+        lock = self._fetch_locks.setdefault(storage_key, asyncio.Lock())
+        self._fetch_lock_users[storage_key] = self._fetch_lock_users.get(storage_key, 0) + 1
+        try:
+            async with lock:
+                # Another coroutine may have populated it while we waited
+                found = self._lookup_pinned(storage_key, checksum)
+                if found:
+                    self.hits += 1
+                    return (*found, False)
+
+                self.misses += 1
+                start = time.time()
+                cached, lease = await self._store(storage_key, fetch_chunks)
+
+                if checksum and cached.sha256 != checksum:
+                    LOGGER.warning(
+                        "Cached document checksum differs from expected",
+                        extra={"storage_key": storage_key, "expected": checksum, "actual": cached.sha256},
+                    )
+
+                LOGGER.info(
+                    f"Cached document {storage_key} ({cached.size_bytes} bytes) in {time.time() - start:.2f}s",
+                    extra={"storage_key": storage_key, "sha256": cached.sha256},
+                )
+                return cached, lease, True
+        finally:
+            self._fetch_lock_users[storage_key] -= 1
+            if not self._fetch_lock_users[storage_key]:
+                del self._fetch_lock_users[storage_key]
+                del self._fetch_locks[storage_key]
+
+    async def _store(self, storage_key: str, fetch_chunks: ChunkSource) -> Tuple[CachedDocument, Path]:
+        """Stream content to a temp file while hashing, then lease and publish it atomically."""
+        hasher = hashlib.sha256()
+        size = 0
+        lease = None
+        fd, tmp_path = tempfile.mkstemp(dir=self._blob_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                async for chunk in fetch_chunks():
+                    hasher.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            sha256 = hasher.hexdigest()
+            lease = self._pin(sha256)
+            os.replace(tmp_path, self._blob_path(sha256))
+        except BaseException:
+            if lease is not None:
+                self._unpin(lease)
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        index_path = self._index_dir / self._key_for(storage_key)
+        index_tmp = index_path.with_suffix(".part")
+        index_tmp.write_text(sha256)
+        os.replace(index_tmp, index_path)
+
+        return CachedDocument(path=str(self._blob_path(sha256)), sha256=sha256, size_bytes=size), lease
+
+    def evict(self) -> int:
+        """Evict least-recently-used blobs until the cache fits max_bytes.
+
+        Leased blobs are skipped, so the cache can stay above max_bytes
+        while they are in use. Index entries pointing at evicted blobs are
+        left in place; lookup treats them as misses.
+
+        Returns:
+            Number of blobs evicted
+        """
+        blobs = []
+        total = 0
+        for blob in self._blob_dir.glob("*.pdf"):
+            try:
+                stat = blob.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, blob))
+            total += stat.st_size
+
+        evicted = 0
+        for _, size, blob in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            if self.is_pinned(blob.stem):
+                continue
+            try:
+                blob.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+            evicted += 1
+
+        if evicted:
+            LOGGER.info(
+                f"Evicted {evicted} cached documents",
+                extra={"evicted": evicted, "cache_bytes": total, "max_bytes": self.max_bytes},
+            )
+        return evicted
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_document_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Get or create the process-wide document cache.
+
+    Returns:
+        DocumentCache instance
+    """
+    global _document_cache
+    if _document_cache is None:
+        _document_cache = DocumentCache(
+            root=settings.document_cache.directory,
+            max_bytes=settings.document_cache.max_bytes,
+            lease_ttl_seconds=settings.document_cache.lease_ttl_seconds,
+        )
+    return _document_cache
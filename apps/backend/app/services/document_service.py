@@ -1,6 +1,8 @@
 """Document service for document management operations."""
 
-from typing import List, Optional, Any, Dict
+import asyncio
+import uuid
+from typing import List, Optional, Any, Dict, Tuple
 from uuid import UUID
 from datetime import datetime
 
@@ -10,13 +12,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models import Document, SectionExtraction
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.workflow_repository import WorkflowDocumentRepository
+from app.repositories.stages_repository import StagesRepository
 from app.repositories.entity_mention_repository import EntityMentionRepository
 from app.repositories.section_chunk_repository import SectionChunkRepository
 from app.services.base_service import BaseService
 from app.services.storage_service import StorageService
+from app.core.config import settings
 from app.schemas.generated.documents import DocumentResponse, EntityResponse, SectionResponse, MultipleDocumentResponse
 from app.utils.logging import get_logger
-from app.core.exceptions import AppError
+from app.core.exceptions import AppError, ValidationError
 
 LOGGER = get_logger(__name__)
 
@@ -40,6 +44,7 @@ class DocumentService(BaseService):
         self.chunk_repo = SectionChunkRepository(session)
         self.storage_service = StorageService()
         self.wf_doc_repo = WorkflowDocumentRepository(session)
+        self.stage_repo = StagesRepository(session)
 
     async def run(self, *args, **kwargs) -> Any:
         """Route to appropriate handler based on action.
@@ -92,81 +97,66 @@ class DocumentService(BaseService):
         user_id: UUID,
         workflow_id: UUID
     ) -> MultipleDocumentResponse:
-        """Core logic for uploading and creating documents."""
+        """Core logic for uploading and creating documents.
+
+        Files are streamed to storage concurrently (at most
+        STORAGE_UPLOAD_CONCURRENCY at a time); records are then written one
+        file at a time on the request session. A file whose SHA-256 matches
+        one of the user's already processed documents (or an earlier file in
+        the same batch) is linked to that document instead of creating a new
+        one, so its processed artifacts are reused.
+        """
         uploaded_documents: List[DocumentResponse] = []
         failed_uploads: List[dict] = []
-        
+        documents_by_checksum: Dict[str, Document] = {}
+
+        named_files = []
         for file in files:
+            # Validate file
+            if not file.filename:
+                failed_uploads.append({
+                    "filename": "unknown",
+                    "error": "File has no filename"
+                })
+            else:
+                named_files.append(file)
+
+        semaphore = asyncio.Semaphore(max(1, settings.supabase.upload_concurrency))
+
+        async def store(file: UploadFile) -> Tuple[str, str]:
+            async with semaphore:
+                return await self._store_file(file, user_id)
+
+        stored = await asyncio.gather(
+            *(store(file) for file in named_files), return_exceptions=True
+        )
+
+        deduplicated_count = 0
+        for file, result in zip(named_files, stored):
             try:
-                # Validate file
-                if not file.filename:
-                    failed_uploads.append({
-                        "filename": "unknown",
-                        "error": "File has no filename"
-                    })
-                    continue
-                
-                # Generate storage path
-                import uuid
-                file_extension = file.filename.split(".")[-1] if "." in file.filename else "pdf"
-                storage_path = f"{user_id}/uploads/{uuid.uuid4()}.{file_extension}"
-                
-                # Upload to Supabase Storage
-                await self.storage_service.upload_file(file, bucket="docs", path=storage_path)
-                
-                # Store the storage path, not the public URL
-                # URLs will be generated on-demand with proper signing
-                pdf_storage_path = storage_path
-                
-                LOGGER.info(
-                    f"File uploaded to storage: "
-                    f"filename={file.filename}, "
-                    f"path={storage_path}"
-                )
-                
-                # Create document record
-                document = await self.doc_repo.create_document(
-                    user_id=user_id,
-                    file_path=pdf_storage_path,  # Store path, generate signed URL on access
-                    document_name=file.filename,
-                    page_count=0,
-                )
-                
-                if not document or not document.id:
-                    raise ValueError(f"Document creation failed for {file.filename}")
-                
-                LOGGER.info(
-                    f"Document created: "
-                    f"document_id={document.id}, "
-                    f"filename={file.filename}, "
-                    f"status={document.status}"
-                )
-                
-                # Create workflow-document association
-                workflow_doc = await self.wf_doc_repo.create_workflow_document(
-                    document_id=document.id,
-                    workflow_id=workflow_id,
-                )
-                
-                if not workflow_doc:
-                    raise ValueError(
-                        f"Workflow document association failed: "
-                        f"document_id={document.id}, workflow_id={workflow_id}"
-                    )
-                
-                LOGGER.info(
-                    f"Workflow association created: "
-                    f"document_id={document.id}, "
-                    f"workflow_id={workflow_id}"
+                if isinstance(result, BaseException):
+                    raise result
+                storage_path, checksum = result
+
+                document = documents_by_checksum.get(checksum) or await self.doc_repo.get_by_checksum(
+                    user_id, checksum
                 )
+                deduplicated = document is not None
+                if deduplicated:
+                    await self._link_existing_document(document, workflow_id, storage_path)
+                    deduplicated_count += 1
+                else:
+                    document = await self._create_document(file, storage_path, checksum, user_id, workflow_id)
                 
                 # Commit transaction
                 await self.session.commit()
+                documents_by_checksum[checksum] = document
                 
                 LOGGER.info(
                     f"Document upload completed: "
                     f"filename={file.filename}, "
-                    f"document_id={document.id}"
+                    f"document_id={document.id}, "
+                    f"deduplicated={deduplicated}"
                 )
                 
                 # Add to successful uploads
@@ -177,7 +167,8 @@ class DocumentService(BaseService):
                         file_path=document.file_path,
                         document_name=document.document_name,
                         page_count=document.page_count,
-                        created_at=document.uploaded_at
+                        created_at=document.uploaded_at,
+                        deduplicated=deduplicated,
                     )
                 )
                 
@@ -191,7 +182,8 @@ class DocumentService(BaseService):
                     f"error={str(e)}",
                     exc_info=True,
                     extra={
-                        "filename": file.filename,
+                        # "filename" is a reserved LogRecord attribute
+                        "upload_filename": file.filename,
                         "user_id": str(user_id),
                         "workflow_id": str(workflow_id),
                         "error_type": type(e).__name__
@@ -209,6 +201,7 @@ class DocumentService(BaseService):
             f"Upload batch completed: "
             f"total={len(files)}, "
             f"successful={len(uploaded_documents)}, "
+            f"deduplicated={deduplicated_count}, "
             f"failed={len(failed_uploads)}, "
             f"workflow_id={workflow_id}"
         )
@@ -219,6 +212,111 @@ class DocumentService(BaseService):
             failed_uploads=failed_uploads
         )
 
+    async def _store_file(self, file: UploadFile, user_id: UUID) -> Tuple[str, str]:
+        """Stream a file to storage.
+
+        Returns:
+            Tuple of (storage path, SHA-256 of the content)
+        """
+        file_extension = file.filename.split(".")[-1] if "." in file.filename else "pdf"
+        storage_path = f"{user_id}/uploads/{uuid.uuid4()}.{file_extension}"
+
+        # Upload to Supabase Storage
+        result = await self.storage_service.upload_file(file, bucket="docs", path=storage_path)
+
+        LOGGER.info(
+            f"File uploaded to storage: "
+            f"filename={file.filename}, "
+            f"path={storage_path}, "
+            f"size_bytes={result['size_bytes']}"
+        )
+        return storage_path, result["sha256"]
+
+    async def _create_document(
+        self,
+        file: UploadFile,
+        storage_path: str,
+        checksum: str,
+        user_id: UUID,
+        workflow_id: UUID,
+    ) -> Document:
+        """Create the document record and its workflow association."""
+        # Store the storage path, not the public URL
+        # URLs will be generated on-demand with proper signing
+        document = await self.doc_repo.create_document(
+            user_id=user_id,
+            file_path=storage_path,
+            document_name=file.filename,
+            page_count=0,
+            checksum=checksum,
+        )
+        
+        if not document or not document.id:
+            raise ValueError(f"Document creation failed for {file.filename}")
+        
+        LOGGER.info(
+            f"Document created: "
+            f"document_id={document.id}, "
+            f"filename={file.filename}, "
+            f"status={document.status}"
+        )
+        
+        # Create workflow-document association
+        workflow_doc = await self.wf_doc_repo.create_workflow_document(
+            document_id=document.id,
+            workflow_id=workflow_id,
+        )
+        
+        if not workflow_doc:
+            raise ValueError(
+                f"Workflow document association failed: "
+                f"document_id={document.id}, workflow_id={workflow_id}"
+            )
+        
+        LOGGER.info(
+            f"Workflow association created: "
+            f"document_id={document.id}, "
+            f"workflow_id={workflow_id}"
+        )
+        return document
+
+    async def _link_existing_document(
+        self,
+        document: Document,
+        workflow_id: UUID,
+        storage_path: str,
+    ) -> None:
+        """Link an identical existing document to the workflow and drop the new copy.
+
+        Stages whose outputs are keyed by document alone (OCR, page analysis,
+        tables, chunking) are marked completed for the workflow if the document
+        completed them elsewhere, so the workflow does not rerun them.
+        """
+        existing_links = await self.wf_doc_repo.get_by_workflow_and_document_id(workflow_id, document.id)
+        reused_stages = []
+        if not existing_links:
+            await self.wf_doc_repo.create_workflow_document(
+                document_id=document.id,
+                workflow_id=workflow_id,
+            )
+            reused_stages = await self.stage_repo.carry_over_document_stages(document.id, workflow_id)
+
+        LOGGER.info(
+            f"Identical document already uploaded, linking it: "
+            f"document_id={document.id}, "
+            f"workflow_id={workflow_id}, "
+            f"already_linked={bool(existing_links)}, "
+            f"reused_stages={reused_stages}"
+        )
+
+        try:
+            await self.storage_service.delete_file(bucket="docs", path=storage_path)
+        except Exception as e:
+            # An orphaned object only costs storage
+            LOGGER.warning(
+                f"Could not delete duplicate upload: path={storage_path}, error={str(e)}"
+            )
+
     async def list_documents(
         self, 
         user_id: UUID, 
@@ -293,21 +391,48 @@ class DocumentService(BaseService):
             created_at=document.uploaded_at
         )
 
-    async def delete_document(self, document_id: UUID, user_id: UUID) -> bool:
-        """Delete a document.
+    async def delete_document(
+        self,
+        document_id: UUID,
+        user_id: UUID,
+        workflow_id: Optional[UUID] = None,
+    ) -> bool:
+        """Delete a document, or remove it from one workflow.
+
+        Identical uploads share one document across workflows. With a
+        workflow_id the document is unlinked from that workflow and only
+        deleted once no workflow uses it anymore.
         
         Args:
             document_id: Document ID
             user_id: User ID
+            workflow_id: Workflow to remove the document from
             
         Returns:
-            True if deleted, False if not found/no access
+            True if deleted/unlinked, False if not found/no access
+
+        Raises:
+            ValidationError: If no workflow_id is given for a document
+                shared by several workflows
         """
         document = await self.doc_repo.get_by_id(document_id)
         if not document or document.user_id != user_id:
             return False
-        
-        await self.doc_repo.delete(document_id)
+
+        if workflow_id is not None:
+            if not await self.wf_doc_repo.unlink_document(workflow_id, document_id):
+                return False
+            remaining_links = await self.wf_doc_repo.count_document_links(document_id)
+            if remaining_links == 0:
+                await self.doc_repo.delete(document_id)
+        else:
+            if await self.wf_doc_repo.count_document_links(document_id) > 1:
+                raise ValidationError(
+                    f"Document {document_id} is shared by several workflows; "
+                    f"pass workflow_id to remove it from one of them"
+                )
+            await self.doc_repo.delete(document_id)
+
         await self.session.commit()
         return True
 
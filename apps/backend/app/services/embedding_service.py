@@ -0,0 +1,258 @@
+"""Process-wide sentence embedding service.
+
+Indexing (entity and chunk embeddings), vector retrieval and citation
+resolution all use the same sentence-transformer. This module loads it
+once per process and exposes:
+
+- ``encode`` for synchronous, batched encoding (worker threads),
+- ``embed`` for async callers; concurrent calls arriving within a short
+  window are coalesced into a single forward pass,
+- ``embed_query`` / ``embed_queries`` with an LRU cache of recent query
+  embeddings, so repeated and expanded queries skip the model entirely.
+
+The model can run on the default PyTorch backend or on ONNX Runtime
+(optionally a quantized int8 export) for cheaper CPU inference.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+
+class EmbeddingService:
+    """Shared embedding model with micro-batching and a query cache.
+
+    Attributes:
+        model_name: Sentence-transformer model name
+        backend: "torch" or "onnx"
+        batch_size: Texts per forward pass
+        batch_window: Seconds to wait for concurrent callers before encoding
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        backend: str = "torch",
+        onnx_file_name: Optional[str] = None,
+        batch_size: int = 64,
+        batch_window_ms: float = 5.0,
+        query_cache_size: int = 2048,
+    ):
+        """Initialize the service. The model is loaded on first use.
+
+        Args:
+            model_name: Sentence-transformer model name
+            backend: "torch" or "onnx"
+            onnx_file_name: Optional ONNX file inside the model repo
+                (e.g. a quantized int8 export)
+            batch_size: Texts per forward pass
+            batch_window_ms: Time to collect concurrent embed() calls
+            query_cache_size: Number of query embeddings kept in the LRU cache
+        """
+        self.model_name = model_name
+        self.backend = backend
+        self.onnx_file_name = onnx_file_name or None
+        self.batch_size = batch_size
+        self.batch_window = batch_window_ms / 1000.0
+        self.query_cache_size = query_cache_size
+
+        self._model = None
+        self._load_lock = threading.Lock()
+
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._drain_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        self.forward_passes = 0
+        self.texts_encoded = 0
+        self.coalesced_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def model(self):
+        """Lazily load the sentence-transformer (thread-safe, once per process).
+
+        Raises:
+            ValueError: If the model's output size does not match the
+                vector_embeddings column
+        """
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    from app.database.models import EMBEDDING_DIMENSION
+
+                    kwargs: Dict[str, Any] = {}
+                    if self.backend == "onnx":
+                        kwargs["backend"] = "onnx"
+                        if self.onnx_file_name:
+                            kwargs["model_kwargs"] = {"file_name": self.onnx_file_name}
+
+                    LOGGER.info(
+                        f"Loading embedding model: {self.model_name}",
+                        extra={"backend": self.backend, "onnx_file": self.onnx_file_name},
+                    )
+                    model = SentenceTransformer(self.model_name, **kwargs)
+                    dimension = model.get_sentence_embedding_dimension()
+                    if dimension != EMBEDDING_DIMENSION:
+                        raise ValueError(
+                            f"Embedding model {self.model_name} produces {dimension}-dim vectors; "
+                            f"vector_embeddings stores {EMBEDDING_DIMENSION}-dim vectors"
+                        )
+                    self._model = model
+        return self._model
+
+    def encode(self, texts: Sequence[str], batch_size: Optional[int] = None) -> List[List[float]]:
+        """Encode texts synchronously in batches.
+
+        Blocking; call from a worker thread or use ``embed`` from async code.
+
+        Args:
+            texts: Texts to encode
+            batch_size: Override for texts per forward pass
+
+        Returns:
+            One vector per text
+        """
+        if not texts:
+            return []
+
+        vectors = self.model.encode(
+            list(texts),
+            batch_size=batch_size or self.batch_size,
+            show_progress_bar=False,
+        )
+        self.forward_passes += 1
+        self.texts_encoded += len(texts)
+        return vectors.tolist()
+
+    async def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """Embed texts, sharing forward passes with concurrent callers.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector per text, in input order
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures are bound to a loop; never mix callers across loops
+            self._loop = loop
+            self._pending = []
+            self._drain_task = None
+
+        future = loop.create_future()
+        self._pending.append((list(texts), future))
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = loop.create_task(self._drain())
+        else:
+            self.coalesced_calls += 1
+
+        return await future
+
+    async def _drain(self) -> None:
+        """Encode pending requests, one combined forward pass per round."""
+        await asyncio.sleep(self.batch_window)
+
+        while self._pending:
+            batch, self._pending = self._pending, []
+            unique = list(dict.fromkeys(text for texts, _ in batch for text in texts))
+
+            try:
+                vectors = await asyncio.to_thread(self.encode, unique)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            by_text = dict(zip(unique, vectors))
+            for texts, future in batch:
+                if not future.done():
+                    future.set_result([by_text[text] for text in texts])
+
+    async def embed_queries(self, queries: Sequence[str]) -> List[List[float]]:
+        """Embed query strings through the LRU query cache.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            One vector per query, in input order
+        """
+        results: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        for query in queries:
+            cached = self._query_cache.get(query)
+            if cached is not None:
+                self._query_cache.move_to_end(query)
+                results[query] = cached
+                self.cache_hits += 1
+            elif query not in missing:
+                missing.append(query)
+                self.cache_misses += 1
+
+        if missing:
+            for query, vector in zip(missing, await self.embed(missing)):
+                results[query] = vector
+                self._query_cache[query] = vector
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+        return [results[query] for query in queries]
+
+    async def embed_query(self, query: str) -> List[float]:
+        """Embed a single query string through the LRU query cache."""
+        return (await self.embed_queries([query]))[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this process."""
+        return {
+            "model": self.model_name,
+            "backend": self.backend,
+            "loaded": self._model is not None,
+            "forward_passes": self.forward_passes,
+            "texts_encoded": self.texts_encoded,
+            "coalesced_calls": self.coalesced_calls,
+            "query_cache_size": len(self._query_cache),
+            "query_cache_hits": self.cache_hits,
+            "query_cache_misses": self.cache_misses,
+        }
+
+
+_embedding_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Get or create the process-wide embedding service.
+
+    Returns:
+        EmbeddingService instance
+    """
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService(
+            model_name=settings.embedding.model_name,
+            backend=settings.embedding.backend,
+            onnx_file_name=settings.embedding.onnx_file_name,
+            batch_size=settings.embedding.batch_size,
+            batch_window_ms=settings.embedding.batch_window_ms,
+            query_cache_size=settings.embedding.query_cache_size,
+        )
+    return _embedding_service
@@ -4,25 +4,35 @@ This service resolves entity mentions to canonical entities, creating new
 canonical entities when needed and linking chunks to them.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from uuid import UUID
-import hashlib
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.models import (
-    CanonicalEntity,
-    EntityEvidence,    
-)
 from app.repositories.entity_mention_repository import EntityMentionRepository
 from app.repositories.entity_evidence_repository import EntityEvidenceRepository
+from app.repositories.entity_repository import EntityRepository, LONGEST_TEXT_ATTRIBUTES
 from app.utils.logging import get_logger
 from decimal import Decimal
 
 LOGGER = get_logger(__name__)
 
 
+@dataclass
+class _PreparedMention:
+    """An entity mention with its canonical key and derived fields."""
+
+    entity_type: str
+    canonical_key: str
+    normalized_value: Any
+    raw_value: Any
+    additional_attributes: Dict[str, Any]
+    mention_text: str
+    confidence: Decimal
+    mention: Dict[str, Any]
+
+
 class EntityResolver:
     """Resolves entity mentions to canonical entities.
     
@@ -43,6 +53,7 @@ class EntityResolver:
         self.session = session
         self.mention_repo = EntityMentionRepository(session)
         self.evidence_repo = EntityEvidenceRepository(session)
+        self.entity_repo = EntityRepository(session)
     
     async def resolve_entity(
         self,
@@ -65,6 +76,48 @@ class EntityResolver:
         Returns:
             UUID: Canonical entity ID
         """
+        prepared = self._prepare_mention(entity_mention)
+        return (await self._resolve_prepared([prepared], chunk_id, document_id, workflow_id))[0]
+    
+    async def resolve_entities_batch(
+        self,
+        entities: list[Dict[str, Any]],
+        chunk_id: Optional[UUID],
+        document_id: UUID,
+        workflow_id: Optional[UUID] = None
+    ) -> list[UUID]:
+        """Resolve multiple entity mentions in batch.
+
+        Canonical keys are computed in memory; existing entities are fetched
+        with one query, new or changed ones upserted with one statement, and
+        mentions, evidence and workflow scope are written in bulk.
+        
+        Args:
+            entities: List of entity mention dicts
+            chunk_id: ID of the chunk (None for document-level entities)
+            document_id: ID of the document
+            workflow_id: ID of the workflow
+        Returns:
+            list[UUID]: Canonical entity ID per valid mention, in input order
+        """
+        prepared = []
+        for entity in entities:
+            try:
+                prepared.append(self._prepare_mention(entity))
+            except Exception as e:
+                LOGGER.error(
+                    f"Failed to resolve entity: {e}",
+                    extra={"entity": entity, "chunk_id": str(chunk_id)}
+                )
+        
+        return await self._resolve_prepared(prepared, chunk_id, document_id, workflow_id)
+    
+    def _prepare_mention(self, entity_mention: Dict[str, Any]) -> _PreparedMention:
+        """Derive canonical key, attributes and mention text for an entity mention.
+
+        Raises:
+            ValueError: If the mention has no type or value
+        """
         entity_type = entity_mention.get("type") or entity_mention.get("entity_type")
         normalized_value = entity_mention.get("id") or entity_mention.get("normalized_value") or entity_mention.get("value")
         
@@ -79,6 +132,8 @@ class EntityResolver:
         additional_attributes = entity_mention.get("attributes", {})
         if not isinstance(additional_attributes, dict):
             additional_attributes = {}
+        else:
+            additional_attributes = dict(additional_attributes)
 
         # Merge top-level enrichment fields that _enrich_with_rich_context sets
         merged_fields = []
@@ -100,28 +155,6 @@ class EntityResolver:
                     "has_source_text": "source_text" in merged_fields
                 }
             )
-
-        # Check if canonical entity exists
-        canonical_entity = await self._get_or_create_canonical_entity(
-            entity_type=entity_type,
-            canonical_key=canonical_key,
-            normalized_value=normalized_value,
-            raw_value=entity_mention.get("raw_value", normalized_value),
-            additional_attributes=additional_attributes
-        )
-        
-        # Create entity mention (document-scoped) and evidence
-        source_document_chunk_id = None
-        source_stable_chunk_id = None
-        
-        if chunk_id is not None:
-            from app.repositories.chunk_repository import ChunkRepository
-            chunk_repo = ChunkRepository(self.session)
-            document_chunk = await chunk_repo.get_chunk_by_id(chunk_id)
-            
-            if document_chunk:
-                source_document_chunk_id = document_chunk.id
-                source_stable_chunk_id = document_chunk.stable_chunk_id
         
         # Derive human-readable name for mention text (used in Evidence quotes)
         readable_name = (
@@ -148,79 +181,88 @@ class EntityResolver:
                 }
             )
 
-        # Create EntityMention record (document-scoped)
-        mention = await self.mention_repo.create_entity_mention(
-            document_id=document_id,
+        return _PreparedMention(
             entity_type=entity_type,
+            canonical_key=canonical_key,
+            normalized_value=normalized_value,
+            raw_value=entity_mention.get("raw_value", normalized_value),
+            additional_attributes=additional_attributes,
             mention_text=readable_name,
-            extracted_fields={
-                "normalized_value": normalized_value,
-                "raw_value": entity_mention.get("raw_value", normalized_value),
-                **{k: v for k, v in entity_mention.items() if k not in ["type", "entity_type", "id", "normalized_value", "value", "raw_value", "confidence"]}
-            },
             confidence=Decimal(str(entity_mention.get("confidence", 0.8))),
-            source_document_chunk_id=source_document_chunk_id,
-            source_stable_chunk_id=source_stable_chunk_id,
+            mention=entity_mention,
         )
+
+    async def _resolve_prepared(
+        self,
+        prepared: list[_PreparedMention],
+        chunk_id: Optional[UUID],
+        document_id: UUID,
+        workflow_id: Optional[UUID],
+    ) -> list[UUID]:
+        """Resolve prepared mentions with a fixed number of statements."""
+        if not prepared:
+            return []
+
+        entity_ids = await self._resolve_canonical_entities(prepared)
         
-        # Create EntityEvidence record linking canonical entity to mention
-        await self.evidence_repo.create_entity_evidence(
-            canonical_entity_id=canonical_entity.id,
-            entity_mention_id=mention.id,
-            document_id=document_id,
-            confidence=Decimal(str(entity_mention.get("confidence", 0.8))),
-            evidence_type="extracted",
-        )
+        # Create entity mention (document-scoped) and evidence
+        source_document_chunk_id = None
+        source_stable_chunk_id = None
         
+        if chunk_id is not None:
+            from app.repositories.chunk_repository import ChunkRepository
+            chunk_repo = ChunkRepository(self.session)
+            document_chunk = await chunk_repo.get_chunk_by_id(chunk_id)
+            
+            if document_chunk:
+                source_document_chunk_id = document_chunk.id
+                source_stable_chunk_id = document_chunk.stable_chunk_id
+
+        # Create EntityMention records (document-scoped)
+        mentions = await self.mention_repo.create_batch([
+            {
+                "document_id": document_id,
+                "entity_type": item.entity_type,
+                "mention_text": item.mention_text,
+                "extracted_fields": {
+                    "normalized_value": item.normalized_value,
+                    "raw_value": item.raw_value,
+                    **{k: v for k, v in item.mention.items() if k not in ["type", "entity_type", "id", "normalized_value", "value", "raw_value", "confidence"]}
+                },
+                "confidence": item.confidence,
+                "source_document_chunk_id": source_document_chunk_id,
+                "source_stable_chunk_id": source_stable_chunk_id,
+            }
+            for item in prepared
+        ])
+
+        # Create EntityEvidence records linking canonical entities to mentions
+        canonical_entity_ids = [entity_ids[(item.entity_type, item.canonical_key)] for item in prepared]
+        await self.evidence_repo.create_batch([
+            {
+                "canonical_entity_id": canonical_entity_id,
+                "entity_mention_id": mention.id,
+                "document_id": document_id,
+                "confidence": item.confidence,
+                "evidence_type": "extracted",
+            }
+            for item, mention, canonical_entity_id in zip(prepared, mentions, canonical_entity_ids)
+        ])
+
+        # Add to workflow scope if provided
+        if workflow_id:
+            await self.entity_repo.add_batch_to_workflow_scope(workflow_id, canonical_entity_ids)
+
         LOGGER.debug(
-            "Resolved entity mention to canonical entity",
+            "Resolved entity mentions to canonical entities",
             extra={
-                "entity_type": entity_type,
-                "canonical_key": canonical_key,
-                "canonical_entity_id": str(canonical_entity.id),
+                "mention_count": len(prepared),
+                "canonical_entity_count": len(entity_ids),
                 "chunk_id": str(chunk_id),
                 "workflow_id": str(workflow_id) if workflow_id else None
             }
         )
-        
-        # Add to workflow scope if provided
-        if workflow_id:
-            from app.repositories.entity_repository import EntityRepository
-            entity_repo = EntityRepository(self.session)
-            await entity_repo.add_to_workflow_scope(workflow_id, canonical_entity.id)
-        
-        return canonical_entity.id
-    
-    async def resolve_entities_batch(
-        self,
-        entities: list[Dict[str, Any]],
-        chunk_id: Optional[UUID],
-        document_id: UUID,
-        workflow_id: UUID
-    ) -> list[UUID]:
-        """Resolve multiple entity mentions in batch.
-        
-        Args:
-            entities: List of entity mention dicts
-            chunk_id: ID of the chunk (None for document-level entities)
-            document_id: ID of the document
-            workflow_id: ID of the workflow
-        Returns:
-            list[UUID]: List of canonical entity IDs
-        """
-        canonical_entity_ids = []
-        
-        for entity in entities:
-            try:
-                entity_id = await self.resolve_entity(entity, chunk_id, document_id, workflow_id)
-                canonical_entity_ids.append(entity_id)
-            except Exception as e:
-                LOGGER.error(
-                    f"Failed to resolve entity: {e}",
-                    extra={"entity": entity, "chunk_id": str(chunk_id)}
-                )
-                continue
-        
+
         return canonical_entity_ids
     
     def _generate_canonical_key(self, entity_type: str, normalized_value: str) -> str:
@@ -238,86 +280,81 @@ class EntityResolver:
         from app.utils.canonical_key import generate_canonical_key
         return generate_canonical_key(entity_type, normalized_value)
     
-    async def _get_or_create_canonical_entity(
+    async def _resolve_canonical_entities(
         self,
-        entity_type: str,
-        canonical_key: str,
-        normalized_value: str,
-        raw_value: str,
-        additional_attributes: Optional[Dict[str, Any]] = None
-    ) -> CanonicalEntity:
-        """Get existing or create new canonical entity.
+        prepared: list[_PreparedMention],
+    ) -> dict[tuple[str, str], UUID]:
+        """Get existing or create new canonical entities for prepared mentions.
+
+        Mentions sharing a key are merged in memory first, in input order. Only
+        new entities and existing ones whose attributes would change are
+        written; the attribute merge itself runs in SQL so concurrent
+        documents resolving the same entity do not lose each other's updates.
         
         Args:
-            entity_type: Type of entity
-            canonical_key: Canonical key
-            normalized_value: Normalized value
-            raw_value: Raw value
+            prepared: Prepared mentions
             
         Returns:
-            CanonicalEntity: The canonical entity
+            Dict mapping (entity_type, canonical_key) to canonical entity ID
         """
-        # Try to find existing entity
-        query = select(CanonicalEntity).where(
-            CanonicalEntity.entity_type == entity_type,
-            CanonicalEntity.canonical_key == canonical_key
-        )
-        result = await self.session.execute(query)
-        existing = result.scalar_one_or_none()
-        
-        if existing:
-            LOGGER.debug(f"Found existing canonical entity: {existing.id}")
-            # Merge attributes if new ones provided
-            if additional_attributes:
-                if not existing.attributes:
-                    existing.attributes = {}
-                else:
-                    # Convert to dict if it's not (though it should be JSONB/dict)
-                    existing.attributes = dict(existing.attributes)
-                
-                # Update attributes with new data
-                for k, v in additional_attributes.items():
-                    if v is None:
-                        continue
-                        
-                    # Overwrite if current value is missing, None, or significantly shorter (for descriptions)
-                    current_v = existing.attributes.get(k)
-                    if current_v is None:
-                        existing.attributes[k] = v
-                    elif k in ["description", "source_text", "definition_text"] and isinstance(v, str) and isinstance(current_v, str):
-                        if len(v) > len(current_v):
-                            existing.attributes[k] = v
-                    elif k not in existing.attributes:
-                        existing.attributes[k] = v
-                
-                self.session.add(existing)
-            return existing
-        
-        # Create new canonical entity
-        base_attributes = {
-            "normalized_value": normalized_value,
-            "raw_value": raw_value
-        }
-        if additional_attributes:
-            base_attributes.update(additional_attributes)
-
-        canonical_entity = CanonicalEntity(
-            entity_type=entity_type,
-            canonical_key=canonical_key,
-            attributes=base_attributes
-        )
-        
-        self.session.add(canonical_entity)
-        await self.session.flush()
+        additional_by_key: Dict[tuple[str, str], Dict[str, Any]] = {}
+        first_by_key: Dict[tuple[str, str], _PreparedMention] = {}
+        for item in prepared:
+            key = (item.entity_type, item.canonical_key)
+            first_by_key.setdefault(key, item)
+            additional_by_key[key] = _merge_attributes(
+                additional_by_key.get(key), item.additional_attributes
+            )
+
+        existing = await self.entity_repo.get_by_keys(list(additional_by_key))
+        entity_ids = {key: entity_id for key, (entity_id, _) in existing.items()}
+
+        upserts = []
+        for key, additional in additional_by_key.items():
+            if key in existing:
+                current = existing[key][1] or {}
+                if _merge_attributes(current, additional) == current:
+                    continue
+                attributes = additional
+            else:
+                first = first_by_key[key]
+                attributes = {
+                    "normalized_value": first.normalized_value,
+                    "raw_value": first.raw_value,
+                    **additional,
+                }
+            upserts.append({"entity_type": key[0], "canonical_key": key[1], "attributes": attributes})
+
+        entity_ids.update(await self.entity_repo.upsert_canonical_entities(upserts))
         
         LOGGER.debug(
-            "Created new canonical entity",
+            "Resolved canonical entities",
             extra={
-                "entity_id": str(canonical_entity.id),
-                "entity_type": entity_type,
-                "canonical_key": canonical_key
+                "key_count": len(additional_by_key),
+                "existing_count": len(existing),
+                "upsert_count": len(upserts),
             }
         )
         
-        return canonical_entity
+        return entity_ids
+
 
+def _merge_attributes(
+    current: Optional[Dict[str, Any]], additional: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge attributes the way EntityRepository.upsert_canonical_entities does in SQL.
+
+    Missing or None values are filled; a longer string replaces a shorter
+    one for LONGEST_TEXT_ATTRIBUTES; other existing values are kept.
+    """
+    merged = dict(current or {})
+    for k, v in additional.items():
+        if v is None:
+            continue
+        current_v = merged.get(k)
+        if current_v is None:
+            merged[k] = v
+        elif k in LONGEST_TEXT_ATTRIBUTES and isinstance(v, str) and isinstance(current_v, str):
+            if len(v) > len(current_v):
+                merged[k] = v
+    return merged
@@ -0,0 +1,249 @@
+"""Cross-document store of extraction output for standard forms.
+
+Insurance documents repeat the same ISO forms (CG 00 01, IL 00 17, ...)
+across policies. Text carrying a form number is fingerprinted by its form
+numbers, the normalized text and the extraction prompt and model; when a
+later document contains the same form word-for-word, the stored LLM output
+is reused instead of extracting it again.
+
+Text without a form number is also eligible when page analysis found its
+pages repeated in another document of the workflow (cross_document_match),
+which catches unnumbered boilerplate such as notices and disclosures.
+
+Reuse requires exact equality of the normalized text. Near-duplicate
+matching is deliberately not used here: two pages of the same form that
+differ in a single limit or date would otherwise share extracted values.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.repositories.form_fingerprint_repository import FormFingerprintRepository
+from app.services.processed.services.analysis.markdown_page_analyzer import MarkdownPageAnalyzer
+from app.services.processed.services.chunking.hybrid_models import SectionType
+from app.utils.logging import get_logger
+from app.utils.pattern_matcher import PatternSet
+
+LOGGER = get_logger(__name__)
+
+# Sections whose content is specific to one policy even on a printed form
+POLICY_SPECIFIC_SECTIONS = frozenset({
+    SectionType.DECLARATIONS,
+    SectionType.SOV,
+    SectionType.LOSS_RUN,
+    SectionType.PREMIUM,
+    SectionType.PREMIUM_SUMMARY,
+    SectionType.PREMIUM_BREAKDOWN,
+    SectionType.PAYMENT_SCHEDULE,
+    SectionType.BILLING_INFORMATION,
+    SectionType.FINANCIAL_STATEMENT,
+    SectionType.CERTIFICATE_OF_INSURANCE,
+})
+
+# Package page numbering differs between documents containing the same form
+_PAGE_NUMBER_PATTERN = re.compile(r"\bpage\s+\d+\s+of\s+\d+\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_form_number_matcher = PatternSet(MarkdownPageAnalyzer.FORM_NUMBER_PATTERNS)
+
+# Stored in place of a form number for repeated pages that carry none
+REPEATED_PAGE_LABEL = "repeated page"
+
+
+def normalize_form_text(text: str) -> str:
+    """Normalize text so formatting differences do not change the fingerprint."""
+    normalized = _WHITESPACE_PATTERN.sub(" ", text.casefold())
+    return _PAGE_NUMBER_PATTERN.sub("", normalized).strip()
+
+
+def extract_form_numbers(texts: List[str]) -> List[str]:
+    """Distinct form numbers found in texts, in order of appearance.
+
+    Uses the same patterns as MarkdownPageAnalyzer._extract_form_number.
+    """
+    form_numbers: List[str] = []
+    for text in texts:
+        match = _form_number_matcher.find(text)
+        if match:
+            form_number = _WHITESPACE_PATTERN.sub(" ", match.group(1).upper())
+            if form_number not in form_numbers:
+                form_numbers.append(form_number)
+    return form_numbers
+
+
+@dataclass(frozen=True)
+class FormFingerprintKey:
+    """Identity of a standard form extraction.
+
+    Attributes:
+        fingerprint: SHA-256 hex digest
+        form_number: Form numbers found in the text, comma-separated
+    """
+    fingerprint: str
+    form_number: str
+
+
+def fingerprint_form_text(
+    texts: List[str],
+    section_type: SectionType,
+    extractor_key: str,
+    prompt: str,
+    model: Optional[str] = None,
+    repeated_pages: bool = False,
+) -> Optional[FormFingerprintKey]:
+    """Fingerprint text for form output reuse.
+
+    Args:
+        texts: Texts sent to the LLM, in order
+        section_type: Section type being extracted
+        extractor_key: Extractor used
+        prompt: Extraction prompt
+        model: LLM model name
+        repeated_pages: Whether every page of the text repeats a page of
+            another workflow document; makes text without a form number eligible
+
+    Returns:
+        FormFingerprintKey, or None if the text is not a reusable standard form
+    """
+    if section_type in POLICY_SPECIFIC_SECTIONS:
+        return None
+
+    form_numbers = extract_form_numbers(texts)
+    if not form_numbers and not repeated_pages:
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        ",".join(form_numbers),
+        section_type.value,
+        extractor_key,
+        model or "",
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    for text in texts:
+        digest.update(normalize_form_text(text).encode("utf-8"))
+        digest.update(b"\x00")
+
+    return FormFingerprintKey(
+        fingerprint=digest.hexdigest(),
+        form_number=", ".join(form_numbers) or REPEATED_PAGE_LABEL,
+    )
+
+
+class FormFingerprintStore:
+    """Persistent lookup of extraction output by form fingerprint.
+
+    Uses its own short-lived sessions so stored output is committed
+    independently of the extraction transaction. Database errors are
+    logged and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        min_confidence: Optional[float] = None,
+        session_maker=async_session_maker,
+    ):
+        """Initialize the store.
+
+        Args:
+            enabled: Whether reuse is enabled (defaults to settings)
+            min_confidence: Minimum confidence for reuse (defaults to settings)
+            session_maker: Factory for database sessions
+        """
+        self.enabled = settings.form_cache.enabled if enabled is None else enabled
+        self.min_confidence = (
+            settings.form_cache.min_confidence if min_confidence is None else min_confidence
+        )
+        self.session_maker = session_maker
+
+    async def lookup(self, key: FormFingerprintKey) -> Optional[Dict[str, Any]]:
+        """Get the stored output for a fingerprint.
+
+        Args:
+            key: Form fingerprint
+
+        Returns:
+            Parsed LLM output, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            async with self.session_maker() as session:
+                repo = FormFingerprintRepository(session)
+                records = await repo.get_validated([key.fingerprint])
+                record = records.get(key.fingerprint)
+                if record is None:
+                    return None
+                await repo.record_hits([key.fingerprint])
+                await session.commit()
+                return dict(record.extraction_output)
+        except Exception as e:
+            LOGGER.warning(f"Form fingerprint lookup failed: {e}")
+            return None
+
+    async def store(
+        self,
+        key: FormFingerprintKey,
+        section_type: SectionType,
+        extractor_key: str,
+        parsed: Dict[str, Any],
+        document_id: Optional[UUID] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        """Store extraction output for a fingerprint.
+
+        Output is marked reusable only if it is non-empty and its confidence
+        reaches the threshold.
+
+        Args:
+            key: Form fingerprint
+            section_type: Section type extracted
+            extractor_key: Extractor used
+            parsed: Parsed LLM output
+            document_id: Source document
+            model: LLM model name
+        """
+        if not self.enabled or not parsed:
+            return
+
+        try:
+            confidence = float(parsed.get("confidence", 0.0))
+        except (TypeError, ValueError):
+            confidence = 0.0
+
+        try:
+            async with self.session_maker() as session:
+                await FormFingerprintRepository(session).insert_if_absent(
+                    fingerprint=key.fingerprint,
+                    form_number=key.form_number,
+                    section_type=section_type.value,
+                    extractor_key=extractor_key,
+                    extraction_output=parsed,
+                    confidence=confidence,
+                    validated=confidence >= self.min_confidence,
+                    source_document_id=document_id,
+                    model_version=model,
+                )
+                await session.commit()
+        except Exception as e:
+            LOGGER.warning(f"Failed to store form fingerprint {key.form_number}: {e}")
+
+
+_form_fingerprint_store: Optional[FormFingerprintStore] = None
+
+
+def get_form_fingerprint_store() -> FormFingerprintStore:
+    """Get the process-wide form fingerprint store."""
+    global _form_fingerprint_store
+    if _form_fingerprint_store is None:
+        _form_fingerprint_store = FormFingerprintStore()
+    return _form_fingerprint_store
@@ -1,17 +1,20 @@
 """Section extraction orchestrator for Tier 2 LLM processing.
 
 This service implements the processing:
-- Sequential section-level extraction
+- Concurrent section-level extraction, reassembled in priority order
 - Section-specific field extraction using factory pattern
 - Batch processing of section super-chunks
 - Structured JSON output per section type
 
-Processes sections in priority order using section-specific extractors from factory.
+Sections and their batches are dispatched concurrently; the process-wide
+LLM rate limiter (app.core.llm_rate_limiter) bounds how many calls are in
+flight. Results are collected in section priority order.
 """
 
+import asyncio
 import json
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from uuid import UUID
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -42,7 +45,14 @@ from app.services.extracted.services.extraction.section.extractors import (
 from app.services.extracted.services.extraction.section.endorsement_provision_extractor import (
     EndorsementProvisionExtractor,
 )
+from app.services.extracted.services.extraction.section.form_fingerprint_store import (
+    extract_form_numbers,
+    fingerprint_form_text,
+    get_form_fingerprint_store,
+)
 from app.models.page_analysis_models import SemanticRole
+from app.core.config import settings
+from app.repositories.page_analysis_repository import PageAnalysisRepository
 from app.utils.logging import get_logger
 from app.utils.json_parser import parse_json_safely
 from app.repositories.section_extraction_repository import SectionExtractionRepository
@@ -168,7 +178,7 @@ BATCH_CHUNK_THRESHOLD = 5
 class SectionExtractionOrchestrator:
     """Tier 2 orchestrator for section-level extraction.
     
-    This service processes section super-chunks sequentially, using
+    This service processes section super-chunks concurrently, using
     section-specific extractors from the factory pattern to extract structured data.
     
     Attributes:
@@ -225,6 +235,12 @@ class SectionExtractionOrchestrator:
         self.section_extraction_repo = SectionExtractionRepository(session)
         self.step_section_repo = StepSectionOutputRepository(session)
         self.step_entity_repo = StepEntityOutputRepository(session)
+
+        # Previously extracted standard forms are reused across documents
+        self.form_store = get_form_fingerprint_store()
+        self.form_cache_hits = 0
+        # Pages that repeat a page of another workflow document (page analysis)
+        self.repeated_pages: Set[int] = set()
         
         # Register all section extractors with the factory
         self._register_extractors()
@@ -347,7 +363,7 @@ class SectionExtractionOrchestrator:
     ) -> DocumentExtractionResult:
         """Extract data from all section super-chunks and PERSIST.
         
-        Processes sections sequentially in priority order.
+        Sections are extracted concurrently; results keep priority order.
         
         Args:
             super_chunks: List of section super-chunks
@@ -374,7 +390,8 @@ class SectionExtractionOrchestrator:
     ) -> DocumentExtractionResult:
         """Extract data from all section super-chunks WITHOUT persisting.
         
-        Processes sections sequentially in priority order.
+        Sections are extracted concurrently and results are returned in
+        priority order.
         
         Args:
             super_chunks: List of section super-chunks
@@ -389,6 +406,8 @@ class SectionExtractionOrchestrator:
         
         # Filter to LLM-required sections only
         llm_sections = [sc for sc in super_chunks if sc.requires_llm]
+
+        self.repeated_pages = await self._load_repeated_pages(document_id)
         
         LOGGER.info(
             "Starting section extraction compute",
@@ -406,41 +425,52 @@ class SectionExtractionOrchestrator:
         total_time_ms = 0
         
         # Process sections in priority order
-        sorted_sections = sorted(llm_sections, key=lambda sc: sc.processing_priority)
-        
-        for super_chunk in sorted_sections:
+        sorted_sections = []
+        for super_chunk in sorted(llm_sections, key=lambda sc: sc.processing_priority):
             # TERMINAL GUARD: Never extract from certificates in coverage pipeline
             if super_chunk.section_type == SectionType.CERTIFICATE_OF_INSURANCE:
                 LOGGER.info(f"Skipping extraction for certificate section on pages {super_chunk.page_range}")
                 continue
+            sorted_sections.append(super_chunk)
+
+        # gather keeps the input order, so results stay in priority order
+        outcomes = await asyncio.gather(
+            *(
+                self.extract_section_compute(super_chunk, document_id, workflow_id)
+                for super_chunk in sorted_sections
+            ),
+            return_exceptions=True,
+        )
 
-            try:
-                # Use compute-only version
-                result = await self.extract_section_compute(super_chunk, document_id, workflow_id)
-                section_results.append(result)
-                all_entities.extend(result.entities)
-                total_tokens += result.token_count
-                total_time_ms += result.processing_time_ms
-                
-                LOGGER.debug(
-                    f"Extracted section (compute): {super_chunk.section_type.value}",
-                    extra={
-                        "document_id": str(document_id) if document_id else None,
-                        "entities_found": len(result.entities),
-                        "confidence": result.confidence,
-                    }
-                )
-                
-            except Exception as e:
+        for super_chunk, outcome in zip(sorted_sections, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
                 LOGGER.error(
-                    f"Failed to extract section {super_chunk.section_type.value}: {e}",
-                    exc_info=True,
+                    f"Failed to extract section {super_chunk.section_type.value}: {outcome}",
+                    exc_info=outcome,
                 )
                 # Add empty result for failed section
                 section_results.append(SectionExtractionResult(
                     section_type=super_chunk.section_type,
                     confidence=0.0,
                 ))
+                continue
+
+            result = outcome
+            section_results.append(result)
+            all_entities.extend(result.entities)
+            total_tokens += result.token_count
+            total_time_ms += result.processing_time_ms
+            
+            LOGGER.debug(
+                f"Extracted section (compute): {super_chunk.section_type.value}",
+                extra={
+                    "document_id": str(document_id) if document_id else None,
+                    "entities_found": len(result.entities),
+                    "confidence": result.confidence,
+                }
+            )
         
         result = DocumentExtractionResult(
             document_id=document_id,
@@ -450,6 +480,12 @@ class SectionExtractionOrchestrator:
             total_processing_time_ms=total_time_ms,
         )
 
+        if self.form_cache_hits:
+            LOGGER.info(
+                f"Reused stored output for {self.form_cache_hits} standard form extractions",
+                extra={"document_id": str(document_id), "form_cache_hits": self.form_cache_hits},
+            )
+
         # Run synthesis to produce effective coverages/exclusions
         if section_results:
             try:
@@ -950,6 +986,9 @@ class SectionExtractionOrchestrator:
         super_chunk: SectionSuperChunk,
     ) -> Dict[str, Any]:
         """Run a single LLM extraction call.
+
+        Standard forms already extracted from another document are served
+        from the form fingerprint store without calling the LLM.
         
         Args:
             extractor: The section extractor to use
@@ -958,15 +997,78 @@ class SectionExtractionOrchestrator:
         Returns:
             Parsed JSON dictionary
         """
+        prompt = extractor.get_extraction_prompt()
+        extractor_key = type(extractor).__name__
+
+        form_key = None
+        if self.form_store.enabled:
+            form_key = fingerprint_form_text(
+                [c.get_embedding_text() for c in super_chunk.chunks],
+                super_chunk.section_type,
+                extractor_key,
+                prompt,
+                self.model,
+                repeated_pages=self._is_repeated(super_chunk.chunks),
+            )
+        if form_key is not None:
+            cached = await self.form_store.lookup(form_key)
+            if cached is not None:
+                self.form_cache_hits += 1
+                LOGGER.debug(
+                    f"Reusing stored extraction for form {form_key.form_number}",
+                    extra={
+                        "section_type": super_chunk.section_type.value,
+                        "form_number": form_key.form_number,
+                    }
+                )
+                return cached
+
         section_text = super_chunk.get_contextualized_text()
         
         response = await extractor.client.generate_content(
             contents=f"Extract from this {super_chunk.section_type.value} section:\n\n{section_text}",
-            system_instruction=extractor.get_extraction_prompt(),
+            system_instruction=prompt,
             generation_config={"response_mime_type": "application/json"}
         )
         
-        return parse_json_safely(response)
+        parsed = parse_json_safely(response)
+
+        if form_key is not None and isinstance(parsed, dict):
+            await self.form_store.store(
+                form_key,
+                super_chunk.section_type,
+                extractor_key,
+                parsed,
+                document_id=super_chunk.document_id,
+                model=self.model,
+            )
+
+        return parsed
+
+    async def _load_repeated_pages(self, document_id: UUID) -> Set[int]:
+        """Load the document's pages that page analysis matched in other workflow documents.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Page numbers with a cross-document match (empty if unavailable)
+        """
+        if not (self.form_store.enabled and settings.page_analysis.cross_document_duplicates):
+            return set()
+        try:
+            return await PageAnalysisRepository(self.session).get_cross_document_pages(document_id)
+        except Exception as e:
+            LOGGER.warning(f"Could not load cross-document page matches: {e}")
+            return set()
+
+    def _is_repeated(self, chunks: List[HybridChunk]) -> bool:
+        """Whether every page of the chunks repeats a page of another workflow document."""
+        pages = set()
+        for chunk in chunks:
+            pages.add(chunk.metadata.page_number)
+            pages.update(chunk.metadata.page_range)
+        return bool(pages) and pages <= self.repeated_pages
 
     def _group_chunks_by_endorsement(
         self,
@@ -1095,6 +1197,13 @@ class SectionExtractionOrchestrator:
             current_batch = []
             current_tokens = 0
             for endo_group in endorsement_groups:
+                # Standard forms are extracted on their own so the output
+                # can be reused for the same form in other documents
+                if self.form_store.enabled and (
+                    extract_form_numbers([c.text for c in endo_group]) or self._is_repeated(endo_group)
+                ):
+                    chunk_batches.append(endo_group)
+                    continue
                 group_tokens = sum(c.metadata.token_count for c in endo_group)
                 if current_batch and (current_tokens + group_tokens > BATCH_TOKEN_THRESHOLD or
                                     len(current_batch) + len(endo_group) > BATCH_CHUNK_THRESHOLD):
@@ -1120,22 +1229,32 @@ class SectionExtractionOrchestrator:
             if current_batch:
                 chunk_batches.append(current_batch)
 
-        parsed_results = []
-        total_input_tokens = 0
-        for i, batch in enumerate(chunk_batches):
-            batch_super_chunk = SectionSuperChunk(
+        batch_super_chunks = [
+            SectionSuperChunk(
                 section_type=super_chunk.section_type,
                 section_name=super_chunk.section_name,
                 chunks=batch,
                 document_id=document_id,
             )
-            try:
-                parsed = await self._run_extraction_call(extractor, batch_super_chunk)
-                if parsed:
-                    parsed_results.append(parsed)
-                total_input_tokens += batch_super_chunk.total_tokens
-            except Exception as e:
-                LOGGER.error(f"Batch {i+1} failed: {e}")
+            for batch in chunk_batches
+        ]
+        # Batches run concurrently; results are aggregated in batch order
+        outcomes = await asyncio.gather(
+            *(self._run_extraction_call(extractor, batch) for batch in batch_super_chunks),
+            return_exceptions=True,
+        )
+
+        parsed_results = []
+        total_input_tokens = 0
+        for i, (batch_super_chunk, parsed) in enumerate(zip(batch_super_chunks, outcomes)):
+            if isinstance(parsed, BaseException):
+                if not isinstance(parsed, Exception):
+                    raise parsed
+                LOGGER.error(f"Batch {i+1} failed: {parsed}")
+                continue
+            if parsed:
+                parsed_results.append(parsed)
+            total_input_tokens += batch_super_chunk.total_tokens
 
         if not parsed_results:
             return SectionExtractionResult(section_type=super_chunk.section_type)
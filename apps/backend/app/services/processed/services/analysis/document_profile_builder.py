@@ -10,7 +10,6 @@ replacing the need for Tier 1 LLM classification. It derives:
 from typing import List, Dict, Optional, Tuple
 from uuid import UUID
 from collections import Counter
-import re
 
 from app.models.page_analysis_models import (
     PageClassification,
@@ -23,6 +22,7 @@ from app.models.page_analysis_models import (
 )
 from app.utils.section_type_mapper import SectionTypeMapper
 from app.utils.logging import get_logger
+from app.utils.pattern_matcher import PatternSet
 
 LOGGER = get_logger(__name__)
 
@@ -122,8 +122,24 @@ class DocumentProfileBuilder:
         PageType.TABLE_OF_CONTENTS,
     ]
     
+    # Context triggers for ISO forms (ordered specifically to avoid partial matches)
+    SECTION_CONTEXT_TRIGGERS: Dict[str, List[str]] = {
+        "definitions": [r"SECTION\s+V\b"],
+        "conditions": [r"SECTION\s+IV\b"],
+        "physical_damage": [r"SECTION\s+III\b"],
+        "liability": [r"SECTION\s+II\b"],
+        "covered_autos": [r"SECTION\s+I\b"],
+    }
+    # Reasoning keywords that confirm mid-policy continuity
+    CONTINUITY_KEYWORDS: Dict[SemanticSection, List[str]] = {
+        SemanticSection.COVERAGES: [r"pay", r"limit", r"loss", r"liability"],
+        SemanticSection.EXCLUSIONS: [r"not\s+apply", r"exclude", r"except"],
+    }
+    
     def __init__(self):
         """Initialize document profile builder."""
+        self._context_trigger_matcher = PatternSet(self.SECTION_CONTEXT_TRIGGERS)
+        self._continuity_matcher = PatternSet(self.CONTINUITY_KEYWORDS)
         LOGGER.info("Initialized DocumentProfileBuilder")
     
     @classmethod
@@ -528,23 +544,13 @@ class DocumentProfileBuilder:
         """
         current_context = None
         
-        # Context triggers for ISO forms (ordered specifically to avoid partial matches)
-        triggers = [
-            (r"SECTION\s+V\b", "definitions"),
-            (r"SECTION\s+IV\b", "conditions"),
-            (r"SECTION\s+III\b", "physical_damage"),
-            (r"SECTION\s+II\b", "liability"),
-            (r"SECTION\s+I\b", "covered_autos"),
-        ]
-        
         for b in boundaries:
             anchor = (b.anchor_text or "").upper()
             
             # Check for context switch
-            for pattern, context in triggers:
-                if re.search(pattern, anchor, re.IGNORECASE):
-                    current_context = context
-                    break
+            context = self._context_trigger_matcher.first(anchor)
+            if context is not None:
+                current_context = context
             
             # Apply context to metadata
             if current_context:
@@ -718,16 +724,13 @@ class DocumentProfileBuilder:
                     if last_meaningful_semantic not in {SemanticSection.UNKNOWN, SemanticSection.BOILERPLATE}:
                         # mid-policy continuity: if we are between significant sections and 
                         # text contains related keywords, inherit
-                        coverage_keywords = [r"pay", r"limit", r"loss", r"liability"]
-                        exclusion_keywords = [r"not\s+apply", r"exclude", r"except"]
-                        
                         if last_meaningful_semantic in {SemanticSection.COVERAGES, SemanticSection.LIABILITY_COVERAGE}:
-                             if any(re.search(kw, c.reasoning, re.IGNORECASE) for kw in coverage_keywords):
+                             if self._continuity_matcher.search(c.reasoning, SemanticSection.COVERAGES):
                                  selected_semantic = last_meaningful_semantic
                              else:
                                  selected_semantic = last_meaningful_semantic # Fallback for mid-policy consistency
                         elif last_meaningful_semantic == SemanticSection.EXCLUSIONS:
-                             if any(re.search(kw, c.reasoning, re.IGNORECASE) for kw in exclusion_keywords):
+                             if self._continuity_matcher.search(c.reasoning, SemanticSection.EXCLUSIONS):
                                  selected_semantic = last_meaningful_semantic
                              else:
                                  selected_semantic = last_meaningful_semantic # Fallback for mid-policy consistency
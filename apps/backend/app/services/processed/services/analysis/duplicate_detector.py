@@ -1,119 +1,351 @@
-"""Duplicate page detector using MinHash for similarity detection.
+"""Duplicate page detector using MinHash LSH for similarity detection.
 
 This module detects duplicate pages in insurance documents, which is common
 for repeated ISO forms and boilerplate disclaimers.
+
+Pages are represented by word shingles of their full text and indexed in a
+MinHashLSH, so each lookup only verifies the few pages that share an LSH
+band with it instead of comparing against every page seen so far.
+
+A WorkflowPageIndex keeps the same signatures across all documents of a
+workflow, so standard forms (CG 00 01, IL 00 17) repeated across a book of
+business can be recognised once. Signatures are stored with the page
+classifications, so the index is rebuilt from the database by whichever
+worker classifies the next document.
 """
 
-from typing import Dict, Optional, Tuple
-from datasketch import MinHash
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from datasketch import LeanMinHash, MinHash, MinHashLSH
 
+from app.core.config import settings
 from app.models.page_analysis_models import PageSignals
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# LSH banding loses some pairs just above the similarity threshold. Candidates
+# are retrieved at a lower threshold and verified with the MinHash estimate.
+LSH_RECALL_FACTOR = 0.8
+
+# Empty MinHash per num_perm; copies share its permutations instead of
+# regenerating them for every page
+_empty_minhashes: Dict[int, MinHash] = {}
+
+
+def _empty_minhash(num_perm: int) -> MinHash:
+    if num_perm not in _empty_minhashes:
+        _empty_minhashes[num_perm] = MinHash(num_perm=num_perm)
+    return _empty_minhashes[num_perm]
+
+
+def page_shingles(lines: List[str], size: int) -> List[bytes]:
+    """Build word n-gram shingles from page lines.
+
+    Text is lowercased and whitespace-normalized. Pages shorter than one
+    shingle fall back to their individual words.
+
+    Args:
+        lines: Page text lines
+        size: Words per shingle
+
+    Returns:
+        Distinct shingles as UTF-8 bytes
+    """
+    words = " ".join(lines).lower().split()
+    if len(words) < size or size <= 1:
+        return [word.encode("utf-8") for word in set(words)]
+
+    shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return [shingle.encode("utf-8") for shingle in shingles]
+
+
+def create_page_minhash(lines: List[str], num_perm: int = 128, shingle_size: int = 3) -> MinHash:
+    """Create a MinHash signature for page text.
+
+    Args:
+        lines: Page text lines
+        num_perm: Number of permutations
+        shingle_size: Words per shingle
+
+    Returns:
+        MinHash object
+    """
+    minhash = _empty_minhash(num_perm).copy()
+    shingles = page_shingles(lines, shingle_size)
+    if shingles:
+        minhash.update_batch(shingles)
+    return minhash
+
+
+def minhash_to_bytes(minhash: MinHash) -> bytes:
+    """Serialize a MinHash signature for storage."""
+    return np.asarray(minhash.hashvalues, dtype=np.uint64).tobytes()
+
+
+def minhash_from_bytes(data: bytes) -> LeanMinHash:
+    """Restore a signature stored by minhash_to_bytes.
+
+    The seed and hash scheme are those create_page_minhash uses.
+    """
+    hashvalues = np.frombuffer(data, dtype=np.uint64)
+    template = _empty_minhash(len(hashvalues))
+    return LeanMinHash(seed=template.seed, hashvalues=hashvalues, scheme=template.scheme)
+
+
+class PageSignatureIndex:
+    """MinHash signatures with an LSH index for near-duplicate lookup."""
+
+    def __init__(self, similarity_threshold: float, num_perm: int = 128):
+        """Initialize the index.
+
+        Args:
+            similarity_threshold: Jaccard similarity for a match
+            num_perm: Number of permutations of the stored MinHashes
+        """
+        self.similarity_threshold = similarity_threshold
+        self.num_perm = num_perm
+        self.signatures: Dict[Hashable, MinHash] = {}
+        self._insert_order: Dict[Hashable, int] = {}
+        self._next_order = 0
+        self._lsh = MinHashLSH(
+            threshold=max(similarity_threshold * LSH_RECALL_FACTOR, 0.05),
+            num_perm=num_perm,
+        )
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def add(self, key: Hashable, minhash: MinHash) -> None:
+        """Index a signature under a unique key."""
+        if key in self.signatures:
+            self.remove(key)
+        self._lsh.insert(key, minhash)
+        self.signatures[key] = minhash
+        self._insert_order[key] = self._next_order
+        self._next_order += 1
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a signature if present."""
+        if key in self.signatures:
+            self._lsh.remove(key)
+            del self.signatures[key]
+            del self._insert_order[key]
+
+    def find(
+        self,
+        minhash: MinHash,
+        exclude=None,
+    ) -> Optional[Tuple[Hashable, float]]:
+        """Find the earliest indexed signature at or above the threshold.
+
+        Args:
+            minhash: Signature to look up
+            exclude: Optional predicate; keys for which it returns True are skipped
+
+        Returns:
+            Tuple of (key, similarity), or None
+        """
+        candidates = self._lsh.query(minhash)
+
+        # Insertion order keeps "duplicate of the first occurrence" semantics
+        for key in sorted(candidates, key=self._insert_order.__getitem__):
+            if exclude is not None and exclude(key):
+                continue
+            similarity = minhash.jaccard(self.signatures[key])
+            if similarity >= self.similarity_threshold:
+                return key, similarity
+        return None
+
+
+class WorkflowPageIndex(PageSignatureIndex):
+    """Page signatures of every document in a workflow, keyed by (document_id, page_number)."""
+
+    @classmethod
+    def from_signatures(
+        cls,
+        rows: Iterable[Tuple[UUID, int, bytes]],
+        similarity_threshold: float,
+        num_perm: int = 128,
+    ) -> "WorkflowPageIndex":
+        """Build an index from stored signatures.
+
+        Args:
+            rows: (document_id, page_number, serialized signature), oldest first
+            similarity_threshold: Jaccard similarity for a match
+            num_perm: Number of permutations of the stored signatures
+
+        Returns:
+            WorkflowPageIndex containing the pages
+        """
+        index = cls(similarity_threshold, num_perm)
+        for document_id, page_number, data in rows:
+            minhash = minhash_from_bytes(data)
+            if len(minhash.hashvalues) == num_perm:
+                index.add((document_id, page_number), minhash)
+        return index
+
+    def remove_document(self, document_id: UUID) -> None:
+        """Drop all pages of a document (e.g. before re-classifying it)."""
+        for key in [k for k in self.signatures if k[0] == document_id]:
+            self.remove(key)
+
+    def find_in_other_documents(
+        self, minhash: MinHash, document_id: UUID
+    ) -> Optional[Tuple[UUID, int, float]]:
+        """Find a near-identical page in another document of the workflow.
+
+        Returns:
+            Tuple of (document_id, page_number, similarity), or None
+        """
+        match = self.find(minhash, exclude=lambda key: key[0] == document_id)
+        if match is None:
+            return None
+        (other_document_id, page_number), similarity = match
+        return other_document_id, page_number, similarity
+
 
 class DuplicateDetector:
-    """Detector for duplicate pages using MinHash similarity.
-    
-    Maintains a registry of seen pages and compares new pages against them
-    using Jaccard similarity.
+    """Detector for duplicate pages using MinHash LSH similarity.
+
+    Maintains an LSH index of seen pages and looks up candidates for each new
+    page, verifying them with the Jaccard similarity estimate.
     """
-    
-    def __init__(self, similarity_threshold: float = 0.8, num_perm: int = 128):
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: Optional[int] = None,
+        workflow_index: Optional[WorkflowPageIndex] = None,
+    ):
         """Initialize duplicate detector.
-        
+
         Args:
             similarity_threshold: Jaccard similarity threshold (0.0 to 1.0)
                 Pages above this threshold are considered duplicates
             num_perm: Number of permutations for MinHash (higher = more accurate)
+            shingle_size: Words per shingle (defaults to settings)
+            workflow_index: Optional cross-document index for the workflow
         """
         self.similarity_threshold = similarity_threshold
         self.num_perm = num_perm
+        self.shingle_size = shingle_size or settings.page_analysis.duplicate_shingle_size
+        self.workflow_index = workflow_index
         self.seen_pages: Dict[int, MinHash] = {}  # page_number -> MinHash
-        
+        self._index = PageSignatureIndex(similarity_threshold, num_perm)
+
         logger.info(
             f"Initialized DuplicateDetector with threshold {similarity_threshold}, "
             f"num_perm {num_perm}"
         )
-    
+
     def is_duplicate(
-        self, 
+        self,
         signals: PageSignals
     ) -> Tuple[bool, Optional[int]]:
         """Check if a page is a duplicate of a previously seen page.
-        
+
         Args:
             signals: PageSignals for the page to check
-            
+
         Returns:
             Tuple of (is_duplicate, duplicate_of_page_number)
             If not a duplicate, returns (False, None)
         """
         # Create MinHash for this page
         current_hash = self._create_minhash(signals)
-        
-        # Compare against all previously seen pages
-        for seen_page_num, seen_hash in self.seen_pages.items():
-            similarity = current_hash.jaccard(seen_hash)
-            
-            if similarity >= self.similarity_threshold:
-                logger.info(
-                    f"Page {signals.page_number} is duplicate of page {seen_page_num} "
-                    f"(similarity: {similarity:.3f})",
-                    extra={
-                        "page_number": signals.page_number,
-                        "duplicate_of": seen_page_num,
-                        "similarity": similarity
-                    }
-                )
-                return True, seen_page_num
-        
+
+        # Verify only the LSH candidates instead of every seen page
+        match = self._index.find(current_hash)
+        if match is not None:
+            seen_page_num, similarity = match
+            logger.info(
+                f"Page {signals.page_number} is duplicate of page {seen_page_num} "
+                f"(similarity: {similarity:.3f})",
+                extra={
+                    "page_number": signals.page_number,
+                    "duplicate_of": seen_page_num,
+                    "similarity": similarity
+                }
+            )
+            return True, seen_page_num
+
         # Not a duplicate - add to registry
         self.seen_pages[signals.page_number] = current_hash
-        
+        self._index.add(signals.page_number, current_hash)
+
         logger.debug(
-            f"Page {signals.page_number} is unique (checked against "
-            f"{len(self.seen_pages)-1} previous pages)"
+            f"Page {signals.page_number} is unique ({len(self.seen_pages)} unique pages indexed)"
         )
-        
+
         return False, None
-    
+
+    def match_across_documents(self, document_id: UUID) -> Dict[int, Tuple[UUID, int, float]]:
+        """Match this document's unique pages against other documents of the workflow.
+
+        The document's pages are then added to the workflow index, replacing
+        any pages from an earlier run of the same document.
+
+        Args:
+            document_id: Document the seen pages belong to
+
+        Returns:
+            Mapping of page number to (document_id, page_number, similarity)
+            of the matching page in another document
+        """
+        if self.workflow_index is None:
+            return {}
+
+        self.workflow_index.remove_document(document_id)
+        matches = {}
+        for page_number, minhash in self.seen_pages.items():
+            match = self.workflow_index.find_in_other_documents(minhash, document_id)
+            if match is not None:
+                matches[page_number] = match
+
+        for page_number, minhash in self.seen_pages.items():
+            self.workflow_index.add((document_id, page_number), minhash)
+
+        if matches:
+            logger.info(
+                f"{len(matches)} pages of document {document_id} match pages in other workflow documents",
+                extra={"document_id": str(document_id), "matches": len(matches)},
+            )
+        return matches
+
+    def page_signatures(self) -> Dict[int, bytes]:
+        """Serialized signatures of the unique pages seen, by page number."""
+        return {page_number: minhash_to_bytes(minhash) for page_number, minhash in self.seen_pages.items()}
+
     def _create_minhash(self, signals: PageSignals) -> MinHash:
         """Create MinHash from page signals.
-        
+
+        Uses the full page text when available, falling back to top lines.
+
         Args:
             signals: PageSignals to hash
-            
+
         Returns:
             MinHash object
         """
-        minhash = MinHash(num_perm=self.num_perm)
-        
-        # Hash each line from top_lines
-        for line in signals.top_lines:
-            # Normalize: lowercase, remove extra whitespace
-            normalized = ' '.join(line.lower().split())
-            
-            # Split into words and hash each
-            words = normalized.split()
-            for word in words:
-                if word:  # Skip empty strings
-                    minhash.update(word.encode('utf-8'))
-        
-        return minhash
-    
+        lines = signals.all_lines or signals.top_lines
+        return create_page_minhash(lines, self.num_perm, self.shingle_size)
+
     def reset(self):
         """Reset the seen pages registry.
-        
+
         Useful when starting analysis of a new document.
         """
         self.seen_pages.clear()
+        self._index = PageSignatureIndex(self.similarity_threshold, self.num_perm)
         logger.info("Reset duplicate detector registry")
-    
+
     def get_stats(self) -> Dict[str, int]:
         """Get statistics about duplicate detection.
-        
+
         Returns:
             Dictionary with statistics
         """
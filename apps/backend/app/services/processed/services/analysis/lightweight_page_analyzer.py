@@ -5,14 +5,16 @@ classification and filtering of large insurance documents (100+ pages).
 """
 
 import hashlib
-import httpx
 import pdfplumber
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Union
 from pathlib import Path
 from io import BytesIO
 import time
 
+from app.core.http_client import get_http_client
 from app.models.page_analysis_models import PageSignals
+from app.services.document_cache import map_file
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -71,19 +73,22 @@ class LightweightPageAnalyzer:
             )
             
             # Download or load PDF
-            pdf_bytes = await self._load_pdf(document_url)
+            pdf_source = await self._load_pdf(document_url)
             load_time = time.time() - start_time
+            size_bytes = (
+                len(pdf_source) if isinstance(pdf_source, bytes) else Path(pdf_source).stat().st_size
+            )
             
             logger.info(
                 f"PDF loaded successfully in {load_time:.2f}s",
-                extra={"size_bytes": len(pdf_bytes), "load_time_seconds": load_time}
+                extra={"size_bytes": size_bytes, "load_time_seconds": load_time}
             )
             
             # Open PDF with pdfplumber
             all_signals = []
             extraction_start = time.time()
             
-            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+            with self._open_pdf(pdf_source) as pdf:
                 total_pages = len(pdf.pages)
                 
                 logger.info(
@@ -148,14 +153,14 @@ class LightweightPageAnalyzer:
             )
             raise ValueError(f"Failed to analyze document: {e}") from e
     
-    async def _load_pdf(self, document_url: str) -> bytes:
-        """Load PDF from URL or local path.
+    async def _load_pdf(self, document_url: str) -> Union[bytes, str]:
+        """Load PDF from URL or resolve a local path.
         
         Args:
             document_url: URL or local path to PDF
             
         Returns:
-            PDF bytes
+            PDF bytes for a URL, or the local path (read later through mmap)
         """
         is_url = document_url.startswith(('http://', 'https://'))
         
@@ -164,15 +169,15 @@ class LightweightPageAnalyzer:
                 "Downloading PDF from URL",
                 extra={"url": document_url, "source": "remote"}
             )
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(document_url)
-                response.raise_for_status()
-                
-                logger.debug(
-                    f"Downloaded {len(response.content)} bytes",
-                    extra={"size_bytes": len(response.content)}
-                )
-                return response.content
+            client = get_http_client(document_url)
+            response = await client.get(document_url, timeout=60.0)
+            response.raise_for_status()
+            
+            logger.debug(
+                f"Downloaded {len(response.content)} bytes",
+                extra={"size_bytes": len(response.content)}
+            )
+            return response.content
         else:
             logger.debug(
                 "Loading PDF from local filesystem",
@@ -181,7 +186,25 @@ class LightweightPageAnalyzer:
             path = Path(document_url)
             if not path.exists():
                 raise FileNotFoundError(f"PDF file not found: {document_url}")
-            return path.read_bytes()
+            return str(path)
+
+    @staticmethod
+    @contextmanager
+    def _open_pdf(pdf_source: Union[bytes, str]) -> Iterator["pdfplumber.PDF"]:
+        """Open a PDF with pdfplumber, memory-mapping local files.
+        
+        Args:
+            pdf_source: PDF bytes or a local file path
+            
+        Yields:
+            Open pdfplumber PDF
+        """
+        if isinstance(pdf_source, bytes):
+            with pdfplumber.open(BytesIO(pdf_source)) as pdf:
+                yield pdf
+        else:
+            with map_file(pdf_source) as mapped, pdfplumber.open(mapped) as pdf:
+                yield pdf
     
     def _extract_page_signals(self, page, page_num: int) -> PageSignals:
         """Extract signals from a single page.
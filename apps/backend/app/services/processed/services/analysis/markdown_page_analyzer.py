@@ -16,6 +16,7 @@ import hashlib
 from typing import List, Optional, Dict, Any, Tuple
 from app.models.page_analysis_models import PageSignals, DocumentType
 from app.utils.logging import get_logger
+from app.utils.pattern_matcher import PatternSet
 
 logger = get_logger(__name__)
 
@@ -69,8 +70,26 @@ class MarkdownPageAnalyzer:
         r'(?:continued|cont[\'.]?d)\s+(?:from|on)\s+(?:previous|next)',
     ]
 
+    # Strong standalone section headers (checked on the first lines of a page)
+    STRONG_SECTION_HEADER_PATTERNS = [
+        r'^#\s+SECTION\s+[IVX]+',           # "# SECTION II" at page start
+        r'^##?\s+[A-Z]{2,}\s+[A-Z]{2,}',    # "## DECLARATIONS PAGE"
+        r'THIS\s+ENDORSEMENT\s+CHANGES',    # Endorsement header
+        r'^COVERAGE\s+FORM',                 # Coverage form header
+    ]
+
     def __init__(self):
         """Initialize MarkdownPageAnalyzer."""
+        # Pattern lists are compiled once per analyzer instead of per page
+        self._policy_number_matcher = PatternSet(self.POLICY_NUMBER_PATTERNS)
+        self._form_number_matcher = PatternSet(self.FORM_NUMBER_PATTERNS)
+        self._endorsement_header_matcher = PatternSet(self.ENDORSEMENT_HEADER_PATTERNS)
+        self._explicit_continuation_matcher = PatternSet(self.EXPLICIT_CONTINUATION_PATTERNS)
+        self._content_continuity_matcher = PatternSet(self.CONTENT_CONTINUITY_PATTERNS)
+        self._strong_header_matcher = PatternSet(
+            self.STRONG_SECTION_HEADER_PATTERNS, flags=re.IGNORECASE | re.MULTILINE
+        )
+
         # Common insurance patterns for signal extraction
         self.ANCHOR_PHRASES = [
             "DECLARATIONS", "POLICY NUMBER", "INSURED", "PREMIUM",
@@ -299,26 +318,21 @@ class MarkdownPageAnalyzer:
 
     def _extract_policy_number(self, text: str) -> Optional[str]:
         """Extract policy number from page text."""
-        for pattern in self.POLICY_NUMBER_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper().replace(' ', '-')
+        match = self._policy_number_matcher.find(text)
+        if match:
+            return match.group(1).upper().replace(' ', '-')
         return None
 
     def _extract_form_number(self, text: str) -> Optional[str]:
         """Extract form number from page text (often unavailable in markdown)."""
-        for pattern in self.FORM_NUMBER_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
+        match = self._form_number_matcher.find(text)
+        if match:
+            return match.group(1).upper()
         return None
 
     def _has_endorsement_header(self, text: str) -> bool:
         """Check if page has endorsement header."""
-        for pattern in self.ENDORSEMENT_HEADER_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._endorsement_header_matcher.search(text)
 
     def _detect_mid_sentence_start(self, text: str) -> Tuple[bool, Optional[str]]:
         """Detect if page starts mid-sentence.
@@ -390,10 +404,9 @@ class MarkdownPageAnalyzer:
 
     def _extract_explicit_continuation(self, text: str) -> Optional[str]:
         """Extract explicit continuation references."""
-        for pattern in self.EXPLICIT_CONTINUATION_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
+        match = self._explicit_continuation_matcher.find(text)
+        if match:
+            return match.group(0)
         return None
 
     def _detect_content_continuity(self, text: str) -> bool:
@@ -419,29 +432,14 @@ class MarkdownPageAnalyzer:
             return False
 
         # Check for content continuity patterns
-        for pattern in self.CONTENT_CONTINUITY_PATTERNS:
-            if re.search(pattern, first_substantial, re.IGNORECASE):
-                return True
-
-        return False
+        return self._content_continuity_matcher.search(first_substantial)
 
     def _has_strong_section_header(self, text: str) -> bool:
         """Check if page has a strong standalone section header.
 
         Strong headers indicate a new section rather than continuation.
         """
-        strong_header_patterns = [
-            r'^#\s+SECTION\s+[IVX]+',           # "# SECTION II" at page start
-            r'^##?\s+[A-Z]{2,}\s+[A-Z]{2,}',    # "## DECLARATIONS PAGE"
-            r'THIS\s+ENDORSEMENT\s+CHANGES',    # Endorsement header
-            r'^COVERAGE\s+FORM',                 # Coverage form header
-        ]
-
         # Check only first 5 lines for headers
         first_lines = '\n'.join(text.split('\n')[:5])
 
-        for pattern in strong_header_patterns:
-            if re.search(pattern, first_lines, re.IGNORECASE | re.MULTILINE):
-                return True
-
-        return False
+        return self._strong_header_matcher.search(first_lines)
@@ -7,7 +7,6 @@ Includes endorsement continuation detection for cross-page tracking via
 the EndorsementTracker class.
 """
 
-import re
 from typing import List, Dict, Tuple, Optional
 
 from app.models.page_analysis_models import (
@@ -26,6 +25,7 @@ from app.services.processed.services.analysis.endorsement_tracker import (
     EndorsementContext
 )
 from app.utils.logging import get_logger
+from app.utils.pattern_matcher import PatternSet
 
 logger = get_logger(__name__)
 
@@ -382,6 +382,35 @@ class PageClassifier:
     ENDORSEMENT_HEADER_OVERRIDE_PATTERNS: List[str] = [
         r"this\s+endorsement\s+changes\s+the\s+policy\.?\s*please\s+read\s+it\s+carefully",
     ]
+    # Specific endorsement language that wins over base coverage/condition sections
+    ENDORSEMENT_REFERENCE_PATTERNS: List[str] = [
+        r"this\s+endorsement\s+(changes|modifies)",
+        r"endorsement\s+no\.?\s*\d*",
+    ]
+    # Exclusion carve-backs ("Exclusion X does not apply")
+    EXCLUSION_CARVE_BACK_PATTERNS: List[str] = [
+        r"exclusion\s+[a-z0-9\.\(\)]+\s+does\s+not\s+apply",
+        r"does\s+not\s+apply\s+to\s+one\s+or\s+more",
+    ]
+    # Section types that can open a span within a page, in detection order
+    SECTION_SPAN_TYPES: List[PageType] = [
+        PageType.DECLARATIONS,
+        PageType.COVERAGES,
+        PageType.EXCLUSIONS,
+        PageType.ENDORSEMENT,
+        PageType.DEFINITIONS,
+        PageType.CERTIFICATE_OF_INSURANCE,
+        PageType.COVERAGES_CONTEXT,
+        PageType.VEHICLE_DETAILS,
+        PageType.LIABILITY_COVERAGES,
+        PageType.INSURED_DECLARED_VALUE,
+        PageType.COVERAGE_GRANT,
+        PageType.COVERAGE_EXTENSION,
+        PageType.LIMITS,
+        PageType.INSURED_DEFINITION,
+    ]
+    # Allows optional prefixes like "## C. " or "11. " before a section anchor
+    SECTION_ANCHOR_PREFIX = r'^\s*#*\s*(?:[a-z\d]{1,2}[\.\)]\s+)*'
     # Regex for modifier detection in endorsements (to be deprecated in favor of specific mappings)
     MODIFIER_PATTERNS = {
         "adds_coverage": [r"adds\s+coverage", r"additional\s+coverage", r"extension\s+of\s+coverage"],
@@ -509,6 +538,27 @@ class PageClassifier:
         """
         self.confidence_threshold = confidence_threshold
         self.endorsement_tracker = EndorsementTracker()
+
+        # Compile every pattern list once; a page is then matched with a
+        # literal prefilter instead of hundreds of re.search calls
+        self._section_matcher = PatternSet(self.SECTION_PATTERNS)
+        self._declarations_matcher = PatternSet(self.SECTION_PATTERNS[PageType.DECLARATIONS])
+        self._span_anchor_matcher = PatternSet(
+            {p_type: self.SECTION_PATTERNS.get(p_type, []) for p_type in self.SECTION_SPAN_TYPES},
+            prefix=self.SECTION_ANCHOR_PREFIX,
+        )
+        self._structural_exclusion_header_matcher = PatternSet(self.STRUCTURAL_EXCLUSION_HEADERS)
+        self._coverage_context_header_matcher = PatternSet(self.COVERAGE_CONTEXT_TABLE_HEADERS)
+        self._acord_certificate_matcher = PatternSet(self.ACORD_CERTIFICATE_OVERRIDE_PATTERNS)
+        self._endorsement_header_matcher = PatternSet(self.ENDORSEMENT_HEADER_OVERRIDE_PATTERNS)
+        self._endorsement_reference_matcher = PatternSet(self.ENDORSEMENT_REFERENCE_PATTERNS)
+        self._base_policy_matcher = PatternSet(self.BASE_POLICY_INDICATORS)
+        self._coverage_effect_matcher = PatternSet(self.COVERAGE_EFFECT_PATTERNS)
+        self._exclusion_effect_matcher = PatternSet(self.EXCLUSION_EFFECT_PATTERNS)
+        self._structural_exclusion_matcher = PatternSet(self.STRUCTURAL_EXCLUSION_PATTERNS)
+        self._carve_back_matcher = PatternSet(self.EXCLUSION_CARVE_BACK_PATTERNS)
+        self._semantic_role_matcher = PatternSet(self.SEMANTIC_ROLE_PATTERNS)
+        self._section_reference_matcher = PatternSet(self.SECTION_REFERENCE_PATTERNS)
         logger.info(
             f"Initialized PageClassifier with threshold {confidence_threshold}"
         )
@@ -541,10 +591,7 @@ class PageClassifier:
         Returns:
             True if this is an ACORD certificate
         """
-        for pattern in self.ACORD_CERTIFICATE_OVERRIDE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._acord_certificate_matcher.search(text)
 
     def _has_strong_endorsement_header(self, text: str) -> bool:
         """Check if text contains strong endorsement header indicators.
@@ -558,10 +605,7 @@ class PageClassifier:
         Returns:
             True if this has a strong endorsement header
         """
-        for pattern in self.ENDORSEMENT_HEADER_OVERRIDE_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._endorsement_header_matcher.search(text)
 
     def classify(self, signals: PageSignals, doc_type: DocumentType = DocumentType.UNKNOWN) -> PageClassification:
         """Classify a page based on its signals.
@@ -842,10 +886,10 @@ class PageClassifier:
         best_score = 0.0
         
         if doc_type == DocumentType.POLICY or doc_type == DocumentType.UNKNOWN:
-            if any(re.search(p, text, re.IGNORECASE) for p in self.STRUCTURAL_EXCLUSION_HEADERS):
+            if self._structural_exclusion_header_matcher.search(text):
                 return PageType.EXCLUSIONS, 0.95
             
-            if any(re.search(p, text, re.IGNORECASE) for p in self.COVERAGE_CONTEXT_TABLE_HEADERS):
+            if self._coverage_context_header_matcher.search(text):
                 return PageType.COVERAGES_CONTEXT, 0.90
         match_scores: dict[PageType, tuple[int, float]] = {}
         
@@ -858,11 +902,10 @@ class PageClassifier:
             PageType.LIABILITY_COVERAGES
         }
         
-        for page_type, patterns in self.SECTION_PATTERNS.items():
-            matches = 0
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    matches += 1
+        # Number of matching patterns per page type, in one pass over the page
+        pattern_counts = self._section_matcher.count(text)
+        for page_type in self.SECTION_PATTERNS:
+            matches = pattern_counts.get(page_type, 0)
             
             # Calculate score: base bonus of 0.6 for any match, plus unique pattern weight
             if matches > 0:
@@ -899,7 +942,7 @@ class PageClassifier:
                         best_match = PageType.ENDORSEMENT
                         best_score = max(best_score, end_score)
                     # ALSO override if we have a very specific endorsement pattern (like "THIS ENDORSEMENT CHANGES THE POLICY")
-                    if any(re.search(p, text, re.IGNORECASE) for p in [r"this\s+endorsement\s+(changes|modifies)", r"endorsement\s+no\.?\s*\d*"]):
+                    if self._endorsement_reference_matcher.search(text):
                         best_match = PageType.ENDORSEMENT
                         best_score = max(best_score, end_score)
         
@@ -943,19 +986,12 @@ class PageClassifier:
         Returns:
             Tuple of (PageType, confidence score)
         """
-        declarations_patterns = self.SECTION_PATTERNS[PageType.DECLARATIONS]
-        matches = 0
-        
         # Check combined text
-        for pattern in declarations_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                matches += 1
+        matches = self._declarations_matcher.count(combined_text).get(None, 0)
         
         for line in individual_lines:
-            for pattern in declarations_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    matches += 1
-                    break
+            if self._declarations_matcher.search(line):
+                matches += 1
         
         if matches > 0:
             score = min(0.3 + (matches * 0.15), 0.95)
@@ -1050,23 +1086,6 @@ class PageClassifier:
         current_reasoning = None
         line_count = len(lines)
         
-        TARGET_SPAN_TYPES = [
-            PageType.DECLARATIONS,
-            PageType.COVERAGES,
-            PageType.EXCLUSIONS,
-            PageType.ENDORSEMENT,
-            PageType.DEFINITIONS,
-            PageType.CERTIFICATE_OF_INSURANCE,
-            PageType.COVERAGES_CONTEXT,
-            PageType.VEHICLE_DETAILS,
-            PageType.LIABILITY_COVERAGES,
-            PageType.INSURED_DECLARED_VALUE,
-            PageType.COVERAGE_GRANT,
-            PageType.COVERAGE_EXTENSION,
-            PageType.LIMITS,
-            PageType.INSURED_DEFINITION,
-        ]
-        
         for i, line in enumerate(lines, 1):
             line_clean = line.strip().lower()
             if len(line_clean) < 5: continue
@@ -1074,28 +1093,22 @@ class PageClassifier:
             detected_type = PageType.UNKNOWN
             
             # Sub-pass 1: Check for high-priority structural exclusion headers
-            if any(re.search(p, line_clean, re.IGNORECASE) for p in self.STRUCTURAL_EXCLUSION_HEADERS):
+            if self._structural_exclusion_header_matcher.search(line_clean):
                 detected_type = PageType.EXCLUSIONS
                 # Use the actual line text as reasoning for structural inheritance
                 structural_reasoning = f"Structural exclusion header: {line_clean[:50]}"
             
             # Sub-pass 2: Check for coverage context tables
-            elif any(re.search(p, line_clean, re.IGNORECASE) for p in self.COVERAGE_CONTEXT_TABLE_HEADERS):
+            elif self._coverage_context_header_matcher.search(line_clean):
                 detected_type = PageType.COVERAGES_CONTEXT
                 structural_reasoning = f"Coverage context table: {line_clean[:50]}"
             # Sub-pass 3: Standard pattern matching
             else:
-                for p_type in TARGET_SPAN_TYPES:
-                    patterns = self.SECTION_PATTERNS.get(p_type, [])
-                    for pattern in patterns:
-                        # Allow optional prefixes like "## C. " or "11. " before the pattern
-                        # We look for Optional #, optional alphanumeric+dot prefix, then the pattern
-                        anchor_regex = r'^\s*#*\s*(?:[a-z\d]{1,2}[\.\)]\s+)*' + pattern
-                        if re.search(anchor_regex, line_clean, re.IGNORECASE):
-                            detected_type = p_type
-                            structural_reasoning = f"Section anchor: {line_clean[:50]}"
-                            break
-                    if detected_type != PageType.UNKNOWN: break
+                # Patterns are anchored at line start, allowing prefixes like "## C. "
+                anchor_type = self._span_anchor_matcher.first(line_clean)
+                if anchor_type is not None:
+                    detected_type = anchor_type
+                    structural_reasoning = f"Section anchor: {line_clean[:50]}"
             
             if detected_type != PageType.UNKNOWN and detected_type != current_type:
                 if current_type != PageType.UNKNOWN and i - 1 >= current_start:
@@ -1150,10 +1163,7 @@ class PageClassifier:
         Checks for multiple canonical ISO policy sections in order.
         """
         combined = " ".join(all_page_texts[:20]).lower() # Check first 20 pages for headers
-        section_count = 0
-        for pattern in self.BASE_POLICY_INDICATORS:
-            if re.search(pattern, combined, re.IGNORECASE):
-                section_count += 1
+        section_count = self._base_policy_matcher.count(combined).get(None, 0)
         
         # If we find 3 or more canonical sections, it's highly likely a base policy form
         return section_count >= 3
@@ -1213,28 +1223,19 @@ class PageClassifier:
     ) -> Tuple[SemanticRole, List[CoverageEffect], List[ExclusionEffect]]:
         """Detect semantic role and specific effects from endorsement text."""
         matched_role = SemanticRole.UNKNOWN
-        cov_effects = []
-        excl_effects = []
         # Detect Coverage Effects
-        for effect, patterns in self.COVERAGE_EFFECT_PATTERNS.items():
-            if any(re.search(p, text, re.IGNORECASE) for p in patterns):
-                cov_effects.append(effect)
+        cov_effects = self._coverage_effect_matcher.matching_keys(text)
         # Detect Exclusion Effects
-        for effect, patterns in self.EXCLUSION_EFFECT_PATTERNS.items():
-            if any(re.search(p, text, re.IGNORECASE) for p in patterns):
-                excl_effects.append(effect)
+        excl_effects = self._exclusion_effect_matcher.matching_keys(text)
         # Apply structural exclusion weighting: if structural exclusion patterns match,
         # it strongly suggests EXCLUSION_MODIFIER even if ambiguous
-        has_structural_exclusion = any(re.search(p, text, re.IGNORECASE) for p in self.STRUCTURAL_EXCLUSION_PATTERNS)
+        has_structural_exclusion = self._structural_exclusion_matcher.search(text)
         
         # Determine Role based on effects or direct patterns
         if cov_effects and excl_effects:
             # Rule 1: Exclusion carve-backs override coverage signals for role
             # If we have "Exclusion X does not apply", it's primarily an exclusion modifier
-            if any(re.search(p, text, re.IGNORECASE) for p in [
-                r"exclusion\s+[a-z0-9\.\(\)]+\s+does\s+not\s+apply",
-                r"does\s+not\s+apply\s+to\s+one\s+or\s+more"
-            ]):
+            if self._carve_back_matcher.search(text):
                 matched_role = SemanticRole.EXCLUSION_MODIFIER
             else:
                 matched_role = SemanticRole.BOTH
@@ -1244,10 +1245,7 @@ class PageClassifier:
             # but structural exclusion is a very strong signal.
             if has_structural_exclusion:
                 # If "does not apply" carve-back is present, it's often an exclusion modifier
-                if any(re.search(p, text, re.IGNORECASE) for p in [
-                    r"exclusion\s+[a-z0-9\.\(\)]+\s+does\s+not\s+apply",
-                    r"does\s+not\s+apply\s+to\s+one\s+or\s+more"
-                ]):
+                if self._carve_back_matcher.search(text):
                     matched_role = SemanticRole.EXCLUSION_MODIFIER
                 else:
                     matched_role = SemanticRole.BOTH
@@ -1257,10 +1255,7 @@ class PageClassifier:
             matched_role = SemanticRole.EXCLUSION_MODIFIER
         else:
             # Try direct role patterns if no specific effects found
-            for role, patterns in self.SEMANTIC_ROLE_PATTERNS.items():
-                if any(re.search(p, text, re.IGNORECASE) for p in patterns):
-                    matched_role = role
-                    break
+            matched_role = self._semantic_role_matcher.first(text) or SemanticRole.UNKNOWN
         return matched_role, cov_effects, excl_effects
     def _has_section_reference(self, text: str) -> bool:
         """Check if text contains section references that boost semantic confidence.
@@ -1268,4 +1263,4 @@ class PageClassifier:
         Section references (SECTION II, Coverage A, Exclusion B.1) indicate the endorsement
         is modifying specific policy sections, which is a strong semantic signal.
         """
-        return any(re.search(p, text, re.IGNORECASE) for p in self.SECTION_REFERENCE_PATTERNS)
\ No newline at end of file
+        return self._section_reference_matcher.search(text)
\ No newline at end of file
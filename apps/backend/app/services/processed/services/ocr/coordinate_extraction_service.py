@@ -6,16 +6,28 @@ enabling citation source mapping for extracted items.
 This service is used during the extraction pipeline to persist
 word-level coordinates that can later be used to map extracted
 text (coverages, exclusions, etc.) back to their source locations.
+
+For the pipeline, pages are extracted in page-range chunks on a small
+process pool and streamed back one page at a time in the compact storage
+format, so coordinate extraction can overlap Docling conversion.
 """
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
+from app.core.config import settings
+from app.services.document_cache import map_file
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+_coordinate_pool: Optional[ProcessPoolExecutor] = None
+
 
 @dataclass
 class WordCoordinate:
@@ -61,6 +73,212 @@ class CoordinateExtractionResult:
         self.total_pages = len(self.pages)
 
 
+class PackedPageWords:
+    """Columnar word coordinates for a single page.
+
+    Holds the stored representation (float32 box buffer, int32 text
+    offsets, concatenated text) and decodes to NumPy arrays only on first
+    access, so loading a page's coordinates costs nothing until a citation
+    actually needs them.
+    """
+
+    __slots__ = ("page_number", "word_count", "_boxes_buffer", "_offsets_buffer",
+                 "_text", "_boxes", "_texts")
+
+    def __init__(
+        self,
+        page_number: int,
+        word_count: int,
+        boxes: bytes,
+        text_offsets: bytes,
+        text: str,
+    ):
+        self.page_number = page_number
+        self.word_count = word_count
+        self._boxes_buffer = boxes
+        self._offsets_buffer = text_offsets
+        self._text = text
+        self._boxes = None
+        self._texts: Optional[List[str]] = None
+
+    @classmethod
+    def pack(cls, page_number: int, words: List[Dict[str, Any]]) -> "PackedPageWords":
+        """Pack compact word dicts (``t``, ``x0``, ``y0``, ``x1``, ``y1``).
+
+        Args:
+            page_number: 1-indexed page number
+            words: Words in the compact storage format
+
+        Returns:
+            PackedPageWords ready to persist
+        """
+        import numpy as np
+
+        # NUL is not allowed in Postgres text columns
+        texts = [str(w.get("t", "")).replace("\x00", "") for w in words]
+        offsets = np.zeros(len(texts) + 1, dtype="<i4")
+        if texts:
+            np.cumsum([len(t) for t in texts], out=offsets[1:])
+        boxes = np.array(
+            [[w.get("x0", 0), w.get("y0", 0), w.get("x1", 0), w.get("y1", 0)] for w in words],
+            dtype="<f4",
+        ).reshape(-1, 4)
+        return cls(
+            page_number=page_number,
+            word_count=len(texts),
+            boxes=boxes.tobytes(),
+            text_offsets=offsets.tobytes(),
+            text="".join(texts),
+        )
+
+    @property
+    def boxes_buffer(self) -> bytes:
+        return self._boxes_buffer
+
+    @property
+    def offsets_buffer(self) -> bytes:
+        return self._offsets_buffer
+
+    @property
+    def packed_text(self) -> str:
+        return self._text
+
+    @property
+    def boxes(self):
+        """``(word_count, 4)`` float32 array of x0, y0, x1, y1."""
+        if self._boxes is None:
+            import numpy as np
+
+            self._boxes = np.frombuffer(self._boxes_buffer, dtype="<f4").reshape(-1, 4)
+        return self._boxes
+
+    @property
+    def texts(self) -> List[str]:
+        """Word texts in page order."""
+        if self._texts is None:
+            import numpy as np
+
+            offsets = np.frombuffer(self._offsets_buffer, dtype="<i4").tolist()
+            text = self._text
+            self._texts = [text[offsets[i]:offsets[i + 1]] for i in range(self.word_count)]
+        return self._texts
+
+    def to_word_coordinates(self) -> List[WordCoordinate]:
+        """Materialize WordCoordinate objects (for CitationMapper)."""
+        return [
+            WordCoordinate(
+                text=text,
+                page_number=self.page_number,
+                x0=x0,
+                y0=y0,
+                x1=x1,
+                y1=y1,
+            )
+            for text, (x0, y0, x1, y1) in zip(self.texts, self.boxes.tolist())
+        ]
+
+
+@contextmanager
+def _open_pdf(pdf_source: Union[bytes, str]):
+    """Open a PDF with pdfplumber; local files are memory-mapped rather than read."""
+    import pdfplumber
+
+    if isinstance(pdf_source, bytes):
+        with pdfplumber.open(BytesIO(pdf_source)) as pdf:
+            yield pdf
+    else:
+        with map_file(pdf_source) as mapped, pdfplumber.open(mapped) as pdf:
+            yield pdf
+
+
+def _page_words(page) -> List[Dict[str, Any]]:
+    return page.extract_words(
+        keep_blank_chars=True,
+        x_tolerance=3,
+        y_tolerance=3,
+        extra_attrs=["fontname", "size"]
+    )
+
+
+def count_pdf_pages(pdf_source: Union[bytes, str]) -> int:
+    """Count pages in a PDF without extracting any content."""
+    with _open_pdf(pdf_source) as pdf:
+        return len(pdf.pages)
+
+
+def iter_page_coordinates(
+    pdf_source: Union[bytes, str],
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield compact coordinate records for an inclusive page range.
+
+    Each record holds the page dimensions and its words in the storage
+    format used for ``PageData.word_coordinates``
+    (``t``, ``x0``, ``y0``, ``x1``, ``y1`` in bottom-left PDF coordinates).
+
+    Args:
+        pdf_source: PDF content as bytes, or a local file path
+        first_page: First 1-indexed page to extract
+        last_page: Last 1-indexed page to extract (None for the last page)
+
+    Yields:
+        Dict with page_number, width, height, rotation and words
+    """
+    with _open_pdf(pdf_source) as pdf:
+        last_page = min(last_page or len(pdf.pages), len(pdf.pages))
+        for page_num in range(first_page, last_page + 1):
+            page = pdf.pages[page_num - 1]
+            height = float(page.height)
+            words = [
+                {
+                    "t": word["text"],
+                    "x0": round(word["x0"], 2),
+                    "y0": round(height - word["bottom"], 2),
+                    "x1": round(word["x1"], 2),
+                    "y1": round(height - word["top"], 2),
+                }
+                for word in _page_words(page)
+            ]
+            yield {
+                "page_number": page_num,
+                "width": float(page.width),
+                "height": height,
+                "rotation": page.rotation or 0,
+                "words": words,
+            }
+            # pdfplumber caches parsed objects per page; drop them as we go
+            page.close()
+
+
+def extract_coordinate_range(
+    pdf_source: Union[bytes, str],
+    first_page: int,
+    last_page: int,
+) -> List[Dict[str, Any]]:
+    """Extract compact coordinate records for one page range (pool entry point)."""
+    return list(iter_page_coordinates(pdf_source, first_page, last_page))
+
+
+def _get_coordinate_pool() -> Optional[ProcessPoolExecutor]:
+    global _coordinate_pool
+    if _coordinate_pool is None and settings.ocr.coordinate_workers > 0:
+        # Spawn rather than fork, for the same reasons as the OCR pool
+        _coordinate_pool = ProcessPoolExecutor(
+            max_workers=settings.ocr.coordinate_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _coordinate_pool
+
+
+def shutdown_coordinate_pool() -> None:
+    """Shut down the coordinate extraction process pool if it was started."""
+    global _coordinate_pool
+    if _coordinate_pool is not None:
+        _coordinate_pool.shutdown(wait=True, cancel_futures=True)
+        _coordinate_pool = None
+
+
 class CoordinateExtractionService:
     """Service for extracting word-level coordinates from PDFs.
 
@@ -71,7 +289,7 @@ class CoordinateExtractionService:
 
     Example usage:
         service = CoordinateExtractionService()
-        result = await service.extract_word_coordinates(pdf_bytes)
+        result = await service.extract_word_coordinates(pdf_bytes_or_path)
         word_index = service.build_text_index(result.words)
     """
 
@@ -89,24 +307,35 @@ class CoordinateExtractionService:
 
     async def extract_word_coordinates(
         self,
-        pdf_bytes: bytes,
+        pdf_source: Union[bytes, str],
         pages_to_extract: Optional[List[int]] = None,
     ) -> CoordinateExtractionResult:
         """Extract all words with bounding boxes from PDF.
 
         Args:
-            pdf_bytes: PDF file content as bytes
+            pdf_source: PDF file content as bytes, or a local file path
+                (e.g. from the document cache) which pdfplumber reads lazily
             pages_to_extract: Optional list of 1-indexed page numbers to extract.
                             If None, extracts all pages.
 
         Returns:
             CoordinateExtractionResult containing words and page metadata
         """
+        return await asyncio.to_thread(
+            self._extract_word_coordinates_sync, pdf_source, pages_to_extract
+        )
+
+    def _extract_word_coordinates_sync(
+        self,
+        pdf_source: Union[bytes, str],
+        pages_to_extract: Optional[List[int]] = None,
+    ) -> CoordinateExtractionResult:
         words: List[WordCoordinate] = []
         pages: List[PageMetadata] = []
+        page_filter = set(pages_to_extract) if pages_to_extract else None
 
         try:
-            with self.pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
+            with _open_pdf(pdf_source) as pdf:
                 total_pages = len(pdf.pages)
                 LOGGER.info(
                     f"Starting coordinate extraction for {total_pages} pages",
@@ -115,7 +344,7 @@ class CoordinateExtractionService:
 
                 for page_num, page in enumerate(pdf.pages, start=1):
                     # Skip pages not in the extraction list
-                    if pages_to_extract and page_num not in pages_to_extract:
+                    if page_filter and page_num not in page_filter:
                         continue
 
                     # Store page dimensions
@@ -127,12 +356,7 @@ class CoordinateExtractionService:
                     ))
 
                     # Extract words with coordinates
-                    page_words = page.extract_words(
-                        keep_blank_chars=True,
-                        x_tolerance=3,
-                        y_tolerance=3,
-                        extra_attrs=["fontname", "size"]
-                    )
+                    page_words = _page_words(page)
 
                     for word in page_words:
                         # Convert pdfplumber coordinates to PDF coordinates
@@ -167,6 +391,62 @@ class CoordinateExtractionService:
             )
             raise
 
+    async def stream_page_coordinates(
+        self,
+        pdf_source: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream compact per-page coordinate records without blocking the loop.
+
+        Local files are split into page-range chunks that run concurrently on
+        the coordinate process pool; records are yielded as each chunk
+        finishes, so pages may arrive out of order. In-memory bytes are
+        extracted in a thread instead of being copied to every process.
+
+        Args:
+            pdf_source: PDF content as bytes, or a local file path
+            page_range: Optional inclusive (first, last) page range
+
+        Yields:
+            Dict with page_number, width, height, rotation and words
+        """
+        pool = _get_coordinate_pool() if isinstance(pdf_source, str) else None
+
+        if pool is None:
+            first, last = page_range or (1, None)
+            records = await asyncio.to_thread(
+                extract_coordinate_range, pdf_source, first, last
+            )
+            for record in records:
+                yield record
+            return
+
+        if page_range:
+            first, last = page_range
+        else:
+            first, last = 1, await asyncio.to_thread(count_pdf_pages, pdf_source)
+
+        chunk = max(settings.ocr.coordinate_chunk_pages, 1)
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(
+                pool,
+                extract_coordinate_range,
+                pdf_source,
+                start,
+                min(start + chunk - 1, last),
+            )
+            for start in range(first, last + 1, chunk)
+        ]
+
+        try:
+            for completed in asyncio.as_completed(futures):
+                for record in await completed:
+                    yield record
+        finally:
+            for future in futures:
+                future.cancel()
+
     def build_text_index(
         self,
         words: List[WordCoordinate]
@@ -268,6 +548,11 @@ __all__ = [
     "WordCoordinate",
     "PageMetadata",
     "CoordinateExtractionResult",
+    "PackedPageWords",
     "CoordinateExtractionService",
     "get_coordinate_extraction_service",
+    "count_pdf_pages",
+    "iter_page_coordinates",
+    "extract_coordinate_range",
+    "shutdown_coordinate_pool",
 ]
@@ -0,0 +1,219 @@
+"""Process pool for running Docling conversions off the event loop.
+
+Docling conversion is synchronous and CPU-bound (layout models, table
+former, OCR). Running it directly inside an ``async def`` blocks the
+Temporal worker's event loop for minutes, starving heartbeats and every
+other activity. This executor runs conversions in dedicated processes,
+each holding a warm ``DocumentConverter`` that is loaded once at process
+start and reused across jobs.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.models.page_data import PageData
+from app.utils.logging import get_logger
+
+LOGGER = get_logger(__name__)
+
+# Per-process OCRService holding the warm Docling converter (worker side only)
+_WORKER_SERVICE = None
+
+
+def _init_worker() -> None:
+    """Load the Docling converter once when a pool process starts."""
+    global _WORKER_SERVICE
+    from app.services.processed.services.ocr.ocr_service import OCRService
+
+    _WORKER_SERVICE = OCRService(use_process_pool=False)
+    LOGGER.info("OCR worker process ready", extra={"pid": os.getpid()})
+
+
+def _run_conversion(
+    document_url: str,
+    document_id: str,
+    submitted_at: float,
+    page_range: Optional[Tuple[int, int]] = None,
+) -> Tuple[List[PageData], Dict[str, Any]]:
+    """Convert a document (or a page range of it) inside a pool process.
+
+    Returns:
+        Tuple of (pages, timing dict with queue wait and conversion time)
+    """
+    started_at = time.time()
+    pages = _WORKER_SERVICE.convert_document(document_url, UUID(document_id), page_range)
+    return pages, {
+        "queue_wait_seconds": max(started_at - submitted_at, 0.0),
+        "conversion_seconds": time.time() - started_at,
+        "worker_pid": os.getpid(),
+    }
+
+
+@dataclass
+class OCRJobMetrics:
+    """Timing for a single OCR conversion job."""
+
+    queue_wait_seconds: float
+    conversion_seconds: float
+    worker_pid: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class OCRExecutor:
+    """Bounded process pool that runs Docling conversions.
+
+    Attributes:
+        max_workers: Number of OCR worker processes
+        max_tasks_per_worker: Conversions before a worker process is recycled
+    """
+
+    def __init__(self, max_workers: int, max_tasks_per_worker: Optional[int] = None):
+        """Initialize the executor. Processes are started lazily on first job.
+
+        Args:
+            max_workers: Number of OCR worker processes
+            max_tasks_per_worker: Recycle a worker after this many jobs
+                (None keeps workers for the lifetime of the pool)
+        """
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker or None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._total_queue_wait = 0.0
+        self._total_conversion = 0.0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawn rather than fork: the parent runs an event loop and
+            # native thread pools that must not be duplicated into children.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                max_tasks_per_child=self.max_tasks_per_worker,
+            )
+            LOGGER.info(
+                "Started OCR process pool",
+                extra={
+                    "max_workers": self.max_workers,
+                    "max_tasks_per_worker": self.max_tasks_per_worker,
+                },
+            )
+        return self._pool
+
+    async def convert(
+        self,
+        document_url: str,
+        document_id: UUID,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[PageData], OCRJobMetrics]:
+        """Run a Docling conversion in the pool and await its pages.
+
+        Args:
+            document_url: URL or local path to the document
+            document_id: Document ID
+            page_range: Optional inclusive (first, last) page range
+
+        Returns:
+            Tuple of (extracted pages, job metrics)
+        """
+        loop = asyncio.get_running_loop()
+        self._submitted += 1
+        self._in_flight += 1
+        try:
+            try:
+                pages, timing = await loop.run_in_executor(
+                    self._get_pool(),
+                    _run_conversion,
+                    document_url,
+                    str(document_id),
+                    time.time(),
+                    page_range,
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM on a huge document); drop the pool so
+                # the next job starts fresh processes instead of failing forever.
+                LOGGER.error(
+                    "OCR process pool broken, recreating on next job",
+                    extra={"document_id": str(document_id)},
+                )
+                self._reset_pool()
+                raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+
+        metrics = OCRJobMetrics(**timing)
+        self._completed += 1
+        self._total_queue_wait += metrics.queue_wait_seconds
+        self._total_conversion += metrics.conversion_seconds
+        return pages, metrics
+
+    def _reset_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Aggregate executor metrics for health reporting."""
+        completed = self._completed or 1
+        return {
+            "max_workers": self.max_workers,
+            "started": self._pool is not None,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "in_flight": self._in_flight,
+            "avg_queue_wait_seconds": round(self._total_queue_wait / completed, 3),
+            "avg_conversion_seconds": round(self._total_conversion / completed, 3),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            LOGGER.info("OCR process pool shut down")
+
+
+_ocr_executor: Optional[OCRExecutor] = None
+
+
+def get_ocr_executor() -> OCRExecutor:
+    """Get the process-wide OCR executor."""
+    global _ocr_executor
+    if _ocr_executor is None:
+        _ocr_executor = OCRExecutor(
+            max_workers=settings.ocr.process_pool_workers,
+            max_tasks_per_worker=settings.ocr.max_tasks_per_worker,
+        )
+    return _ocr_executor
+
+
+def get_ocr_executor_stats() -> Optional[Dict[str, Any]]:
+    """Get executor metrics, or None if no executor was created in this process."""
+    return _ocr_executor.stats() if _ocr_executor is not None else None
+
+
+def shutdown_ocr_executor() -> None:
+    """Shut down the process-wide OCR executor if it was started."""
+    global _ocr_executor
+    if _ocr_executor is not None:
+        _ocr_executor.shutdown()
+        _ocr_executor = None
@@ -6,12 +6,12 @@ This service uses Docling as the primary document parser, providing:
 - Page-level extraction with coordinates and metadata
 - Selective page processing
 """
+import asyncio
 import re
 import time
 from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 from itertools import count
-import re
 
 from app.models.page_data import PageData
 from app.models.table_json import (
@@ -20,7 +20,13 @@ from app.models.table_json import (
     TableExtractionSource,
     create_table_id,
 )
+from app.core.config import settings
 from app.core.exceptions import OCRExtractionError
+from app.services.processed.services.ocr.ocr_executor import (
+    OCRExecutor,
+    OCRJobMetrics,
+    get_ocr_executor,
+)
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -35,8 +41,13 @@ class OCRService:
     - Selective page processing based on page manifest
     - Rich metadata including coordinates and structure
     
+    Conversions never run on the event loop: by default they are sent to
+    the process-wide OCR process pool, otherwise to a thread.
+
     Attributes:
-        converter: Docling DocumentConverter instance
+        converter: Docling DocumentConverter instance (None when using the pool)
+        executor: OCR process pool, or None for in-process conversion
+        last_job_metrics: Queue-wait and conversion timing of the last extraction
         _docling_result: Cached Docling conversion result for table extraction
     """
     
@@ -46,9 +57,29 @@ class OCRService:
         re.MULTILINE
     )
     
-    def __init__(self):
-        """Initialize OCRService with Docling converter."""
+    def __init__(self, use_process_pool: Optional[bool] = None):
+        """Initialize OCRService.
+
+        Args:
+            use_process_pool: Run conversions in the shared OCR process pool.
+                Defaults to True when OCR_PROCESS_POOL_WORKERS > 0. When False,
+                a Docling converter is loaded in this process.
+        """
         self._docling_result = None
+        self.last_job_metrics: Optional[OCRJobMetrics] = None
+        self.converter = None
+
+        if use_process_pool is None:
+            use_process_pool = settings.ocr.process_pool_workers > 0
+        self.executor: Optional[OCRExecutor] = get_ocr_executor() if use_process_pool else None
+
+        if self.executor is not None:
+            LOGGER.info(
+                "Initialized OCRService",
+                extra={"service": "docling", "process_pool_workers": self.executor.max_workers}
+            )
+            return
+
         try:
             from docling.document_converter import DocumentConverter
             self.converter = DocumentConverter()
@@ -67,12 +98,15 @@ class OCRService:
         self,
         document_url: str,
         document_id: UUID,
+        page_range: Optional[Tuple[int, int]] = None,
     ) -> List[PageData]:
         """Extract text from document pages using Docling.
         
         Args:
             document_url: URL or local path to the document
             document_id: Document ID for logging and tracking
+            page_range: Optional inclusive (first, last) 1-indexed page range.
+                Returned pages keep their absolute page numbers.
         
         Returns:
             List[PageData]: Extracted page data with text, markdown, and metadata
@@ -86,99 +120,27 @@ class OCRService:
             "Starting Docling extraction",
             extra={
                 "document_url": document_url,
-                "document_id": str(document_id)
+                "document_id": str(document_id),
+                "page_range": page_range,
             }
         )
         
-        if self.converter is None:
-            raise OCRExtractionError(
-                "Docling is not available. Please install docling package."
-            )
-        
         try:
-            # Convert document using Docling
-            result = self.converter.convert(document_url)
-            
-            # Cache the result for structural table extraction
-            self._docling_result = result
-
-            raw_document_markdown = result.document.export_to_markdown(
-                page_break_placeholder="\n\n<<PAGE_BREAK>>\n\n"
-            )
-
-            pages = raw_document_markdown.split("<<PAGE_BREAK>>")
-
-            transformed_pages = []
-
-            for idx, page in enumerate(pages, start=1):
-                page_with_number = f"\n\n<<PAGE {idx}>>\n\n{page.strip()}"
-                transformed_pages.append(page_with_number)
-
-            document = "".join(transformed_pages)
-
-            total_pages = len(transformed_pages)
-            
-            # Extract rich page metadata from Docling blocks
-            rich_page_metadata = self._extract_rich_page_metadata(result)
-            
-            LOGGER.info(
-                f"Document converted successfully: {total_pages} pages",
-                extra={
-                    "document_id": str(document_id),
-                    "total_pages": total_pages
-                }
-            )
-            
-            # Extract structural tables from Docling result
-            structural_tables = self._extract_structural_tables(result, document_id)
-            
-            # Group tables by page number
-            tables_by_page: Dict[int, List[TableJSON]] = {}
-            for table in structural_tables:
-                page_num = table.page_number
-                if page_num not in tables_by_page:
-                    tables_by_page[page_num] = []
-                tables_by_page[page_num].append(table)
-            
-            LOGGER.info(
-                f"Extracted {len(structural_tables)} structural tables",
-                extra={
-                    "document_id": str(document_id),
-                    "total_tables": len(structural_tables),
-                    "pages_with_tables": len(tables_by_page)
-                }
-            )
-            
-            # Extract pages with table detection and structural tables
-            all_pages = self._extract_all_pages(
-                transformed_pages, 
-                document_id,
-                tables_by_page,
-                rich_page_metadata
-            )
-
-            result_pages = all_pages
-            
-            processing_time = time.time() - start_time
-            
-            # Count pages with tables
-            pages_with_tables = sum(
-                1 for p in result_pages if p.metadata.get("has_tables", False)
-            )
-            
-            LOGGER.info(
-                f"Docling extraction completed in {processing_time:.2f}s",
-                extra={
-                    "document_id": str(document_id),
-                    "pages_extracted": len(result_pages),
-                    "pages_with_tables": pages_with_tables,
-                    "structural_tables_extracted": len(structural_tables),
-                    "processing_time_seconds": processing_time
-                }
-            )
-            
-            return result_pages
-            
+            if self.executor is not None:
+                result_pages, metrics = await self.executor.convert(
+                    document_url, document_id, page_range
+                )
+            else:
+                if self.converter is None:
+                    raise OCRExtractionError(
+                        "Docling is not available. Please install docling package."
+                    )
+                submitted_at = time.time()
+                result_pages, metrics = await asyncio.to_thread(
+                    self._convert_with_metrics, document_url, document_id, submitted_at, page_range
+                )
+        except OCRExtractionError:
+            raise
         except Exception as e:
             LOGGER.error(
                 f"Docling extraction failed: {e}",
@@ -190,7 +152,130 @@ class OCRService:
                 exc_info=True
             )
             raise OCRExtractionError(f"Failed to extract document: {e}") from e
-    
+
+        self.last_job_metrics = metrics
+        processing_time = time.time() - start_time
+
+        # Count pages with tables
+        pages_with_tables = sum(
+            1 for p in result_pages if p.metadata.get("has_tables", False)
+        )
+
+        LOGGER.info(
+            f"Docling extraction completed in {processing_time:.2f}s",
+            extra={
+                "document_id": str(document_id),
+                "pages_extracted": len(result_pages),
+                "pages_with_tables": pages_with_tables,
+                "processing_time_seconds": processing_time,
+                **metrics.to_dict(),
+            }
+        )
+
+        return result_pages
+
+    def _convert_with_metrics(
+        self,
+        document_url: str,
+        document_id: UUID,
+        submitted_at: float,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[List[PageData], OCRJobMetrics]:
+        """Run convert_document and time it (thread-pool path)."""
+        started_at = time.time()
+        pages = self.convert_document(document_url, document_id, page_range)
+        return pages, OCRJobMetrics(
+            queue_wait_seconds=max(started_at - submitted_at, 0.0),
+            conversion_seconds=time.time() - started_at,
+        )
+
+    def convert_document(
+        self,
+        document_url: str,
+        document_id: UUID,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[PageData]:
+        """Synchronously convert a document with the local Docling converter.
+
+        Blocking; callers on an event loop must go through extract_pages.
+
+        Args:
+            document_url: URL or local path to the document
+            document_id: Document ID for logging and tracking
+            page_range: Optional inclusive (first, last) 1-indexed page range
+
+        Returns:
+            List[PageData]: Extracted page data with text, markdown, and metadata
+        """
+        if self.converter is None:
+            raise OCRExtractionError(
+                "Docling is not available. Please install docling package."
+            )
+
+        # Convert document using Docling
+        if page_range:
+            result = self.converter.convert(document_url, page_range=page_range)
+        else:
+            result = self.converter.convert(document_url)
+        first_page = page_range[0] if page_range else 1
+
+        # Cache the result for structural table extraction
+        self._docling_result = result
+
+        raw_document_markdown = result.document.export_to_markdown(
+            page_break_placeholder="\n\n<<PAGE_BREAK>>\n\n"
+        )
+
+        pages = raw_document_markdown.split("<<PAGE_BREAK>>")
+
+        transformed_pages = []
+
+        for idx, page in enumerate(pages, start=first_page):
+            page_with_number = f"\n\n<<PAGE {idx}>>\n\n{page.strip()}"
+            transformed_pages.append(page_with_number)
+
+        total_pages = len(transformed_pages)
+
+        # Extract rich page metadata from Docling blocks
+        rich_page_metadata = self._extract_rich_page_metadata(result)
+
+        LOGGER.info(
+            f"Document converted successfully: {total_pages} pages",
+            extra={
+                "document_id": str(document_id),
+                "total_pages": total_pages
+            }
+        )
+
+        # Extract structural tables from Docling result
+        structural_tables = self._extract_structural_tables(result, document_id)
+
+        # Group tables by page number
+        tables_by_page: Dict[int, List[TableJSON]] = {}
+        for table in structural_tables:
+            page_num = table.page_number
+            if page_num not in tables_by_page:
+                tables_by_page[page_num] = []
+            tables_by_page[page_num].append(table)
+
+        LOGGER.info(
+            f"Extracted {len(structural_tables)} structural tables",
+            extra={
+                "document_id": str(document_id),
+                "total_tables": len(structural_tables),
+                "pages_with_tables": len(tables_by_page)
+            }
+        )
+
+        # Extract pages with table detection and structural tables
+        return self._extract_all_pages(
+            transformed_pages,
+            document_id,
+            tables_by_page,
+            rich_page_metadata,
+            first_page=first_page,
+        )
+
     def _extract_structural_tables(
         self,
         docling_result: Any,
@@ -473,7 +558,8 @@ class OCRService:
         transformed_pages: List[str], 
         document_id: UUID,
         tables_by_page: Optional[Dict[int, List[TableJSON]]] = None,
-        rich_page_metadata: Optional[Dict[int, Dict[str, Any]]] = None
+        rich_page_metadata: Optional[Dict[int, Dict[str, Any]]] = None,
+        first_page: int = 1,
     ) -> List[PageData]:
         """Extract data from all pages in the document.
         
@@ -482,6 +568,8 @@ class OCRService:
             document_id: Document ID for metadata
             tables_by_page: Optional dict mapping page numbers to TableJSON objects
             rich_page_metadata: Optional dict mapping page numbers to Docling metadata
+            first_page: Absolute page number of the first transformed page
+                (Docling provenance keeps absolute page numbers for page ranges)
         
         Returns:
             List[PageData]: All extracted pages with table detection
@@ -491,7 +579,7 @@ class OCRService:
         rich_page_metadata = rich_page_metadata or {}
         
         for idx, page_content in enumerate(transformed_pages):
-            page_number = idx + 1
+            page_number = idx + first_page
             
             # Get structural tables for this page
             structural_tables = tables_by_page.get(page_number, [])
@@ -7,10 +7,11 @@ It coordinates node mapping, traversal, and relevance filtering.
 
 import time
 from uuid import UUID
-from typing import List, Dict, Any
+from typing import Any, List, Sequence, Tuple
 
 from app.schemas.query import (
     VectorSearchResult, 
+    GraphNode,
     GraphTraversalResult, 
     QueryPlan
 )
@@ -64,49 +65,13 @@ class GraphExpansionService:
             return []
 
         try:
-            # 1. Node Mapping
-            # Bridge the vector search results to graph starting points
-            mapped_nodes = await self.node_mapper.map_nodes(
-                vector_results, 
-                workflow_id
+            mapped_nodes, traversal_results = await self.traverse(
+                vector_results, query_plan, workflow_id
             )
-            
-            if not mapped_nodes:
-                LOGGER.info(
-                    "No graph nodes found for vector results",
-                    extra={"workflow_id": str(workflow_id)}
-                )
-                return []
-
-            # Log sample of mapped nodes
-            sample_mapped = [n.properties.get('name', 'unnamed') for n in mapped_nodes[:5]]
-            LOGGER.info(
-                f"Mapped {len(mapped_nodes)} nodes | sample: {sample_mapped}"
-            )
-
-            # 2. Graph Traversal
-            # Navigate relationships based on intent (QA/ANALYSIS/AUDIT)
-            traversal_results = await self.traverser.traverse(
-                mapped_nodes,
-                query_plan.intent,
-                workflow_id
-            )
-            
-            LOGGER.info(
-                f"Graph traversal found {len(traversal_results)} paths"
-            )
-            
             if not traversal_results:
                 return []
 
-            # 3. Relevance Filtering & Hydration
-            # Score results and fetch missing text from PostgreSQL
-            final_results = await self.relevance_filter.filter_and_score(
-                traversal_results,
-                query_plan.extracted_entities,
-                query_plan.intent,
-                workflow_id
-            )
+            final_results = await self.score(traversal_results, query_plan, workflow_id)
             
             latency_ms = int((time.time() - start_time) * 1000)
             
@@ -126,3 +91,85 @@ class GraphExpansionService:
             )
             # return empty instead of failing entire pipeline
             return []
+
+    async def traverse(
+        self,
+        seeds: Sequence[Any],
+        query_plan: QueryPlan,
+        workflow_id: UUID
+    ) -> Tuple[List[GraphNode], List[GraphTraversalResult]]:
+        """
+        Neo4j phase of expansion: map seeds to graph nodes and traverse.
+
+        Only needs each seed's entity_id and section_type, so it can run
+        from reranked VectorEmbedding rows while their content is still
+        being resolved. Errors propagate to the caller.
+
+        Args:
+            seeds: VectorSearchResult or VectorEmbedding objects
+            query_plan: Plan from query understanding
+            workflow_id: Workflow scope
+
+        Returns:
+            (mapped nodes, traversal results)
+        """
+        if not seeds:
+            return [], []
+
+        # 1. Node Mapping
+        # Bridge the vector search results to graph starting points
+        mapped_nodes = await self.node_mapper.map_nodes(seeds, workflow_id)
+
+        if not mapped_nodes:
+            LOGGER.info(
+                "No graph nodes found for vector results",
+                extra={"workflow_id": str(workflow_id)}
+            )
+            return [], []
+
+        # Log sample of mapped nodes
+        sample_mapped = [n.properties.get('name', 'unnamed') for n in mapped_nodes[:5]]
+        LOGGER.info(
+            f"Mapped {len(mapped_nodes)} nodes | sample: {sample_mapped}"
+        )
+
+        # 2. Graph Traversal
+        # Navigate relationships based on intent (QA/ANALYSIS/AUDIT)
+        traversal_results = await self.traverser.traverse(
+            mapped_nodes,
+            query_plan.intent,
+            workflow_id
+        )
+        
+        LOGGER.info(
+            f"Graph traversal found {len(traversal_results)} paths"
+        )
+        return mapped_nodes, traversal_results
+
+    async def score(
+        self,
+        traversal_results: List[GraphTraversalResult],
+        query_plan: QueryPlan,
+        workflow_id: UUID
+    ) -> List[GraphTraversalResult]:
+        """
+        PostgreSQL phase of expansion: score results and hydrate missing text.
+
+        Args:
+            traversal_results: Output of traverse()
+            query_plan: Plan from query understanding
+            workflow_id: Workflow scope
+
+        Returns:
+            Scored and hydrated GraphTraversalResult objects
+        """
+        if not traversal_results:
+            return []
+
+        # 3. Relevance Filtering & Hydration
+        return await self.relevance_filter.filter_and_score(
+            traversal_results,
+            query_plan.extracted_entities,
+            query_plan.intent,
+            workflow_id
+        )
@@ -1,5 +1,9 @@
+import asyncio
+import re
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,7 +14,11 @@ from app.schemas.query import (
     ResponseMetadata,
     SourceCitation,
     ContextPayload,
+    ProvenanceEntry,
+    QueryPlan,
+    QueryStreamEvent,
 )
+from app.core.config import settings
 from app.core.neo4j_client import Neo4jClientManager
 from app.repositories.entity_repository import EntityRepository
 from app.services.retrieval.graph.graph_expansion import GraphExpansionService
@@ -23,10 +31,66 @@ from app.services.retrieval.context.result_merger import ResultMergerService
 from app.services.retrieval.context.hierarchical_builder import HierarchicalContextBuilder
 from app.services.retrieval.context.context_formatter import format_context_for_llm
 from app.services.retrieval.response.generation_service import ResponseGenerationService
+from app.utils.latency_histogram import observe_stage_latencies
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
+# Inline citation markers in generated answers, e.g. "[1]" or "[2, 3]"
+_CITATION_PATTERN = re.compile(r"\[(\d+(?:\s*,\s*\d+)*)\]")
+
+GENERATION_TIMEOUT_ANSWER = (
+    "I'm sorry, generating an answer took too long. Please try again or narrow down your question."
+)
+
+
+@dataclass
+class RetrievedContext:
+    """Output of retrieval stages 2-4 for one query."""
+
+    vector_results: list
+    graph_results: list
+    merged_results: list
+    context_payload: ContextPayload
+    graph_available: bool = True
+    fallback_mode: bool = False
+
+
+def build_source_citations(
+    answer: str, provenance_index: Dict[str, ProvenanceEntry]
+) -> List[SourceCitation]:
+    """Build structured citations for the markers used in an answer.
+
+    Args:
+        answer: Generated answer with inline citations
+        provenance_index: Citation ID ("[1]") to provenance mapping
+
+    Returns:
+        SourceCitation per cited provenance entry, in order of first use
+    """
+    cited: List[str] = []
+    for match in _CITATION_PATTERN.finditer(answer):
+        for number in match.group(1).split(","):
+            citation_id = number.strip()
+            if citation_id not in cited and f"[{citation_id}]" in provenance_index:
+                cited.append(citation_id)
+
+    sources = []
+    for citation_id in cited:
+        entry = provenance_index[f"[{citation_id}]"]
+        sources.append(SourceCitation(
+            citation_id=citation_id,
+            document_name=entry.document_name,
+            document_id=entry.document_id,
+            page_numbers=entry.page_numbers,
+            section_type=entry.section_type or "unknown",
+            relationship_context=(
+                f"Related via: {' → '.join(entry.relationship_path)}"
+                if entry.relationship_path else None
+            ),
+        ))
+    return sources
+
 
 class GraphRAGService:
     """
@@ -77,13 +141,191 @@ class GraphRAGService:
         start_time = time.time()
         stage_latencies = {}
         
-        # 1. Stage 1: Query Understanding
+        query_plan, query_embeddings = await self._understand_query(workflow_id, request, stage_latencies)
+
+        # Early exit for GENERAL intent (conversational queries)
+        if query_plan.intent == "GENERAL":
+            return self._general_response(request, start_time, stage_latencies)
+
+        retrieved = await self._retrieve_context(
+            workflow_id, request, query_plan, stage_latencies, query_embeddings
+        )
+
+        # 5. Stage 5: Response Generation (within its latency budget)
+        s5_start = time.time()
+        try:
+            generated_response = await asyncio.wait_for(
+                self.response_generator.generate_response(
+                    query=request.query,
+                    context=retrieved.context_payload
+                ),
+                timeout=settings.graphrag.generation_timeout_seconds,
+            )
+            answer = generated_response.answer
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                f"Response generation exceeded its {settings.graphrag.generation_timeout_seconds}s budget",
+                extra={"workflow_id": str(workflow_id)}
+            )
+            answer = GENERATION_TIMEOUT_ANSWER
+        
+        stage_latencies["response_generation"] = int((time.time() - s5_start) * 1000)
+
+        # Final Metadata and Response Assembly
+        metadata = self._build_metadata(query_plan, retrieved, start_time, stage_latencies)
+        observe_stage_latencies({**stage_latencies, "total": metadata.latency_ms})
+
+        return GraphRAGResponse(
+            answer=answer,
+            sources=self._answer_sources(answer, retrieved.context_payload, request),
+            metadata=metadata,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+    async def query_stream(
+        self, workflow_id: UUID, request: GraphRAGRequest
+    ) -> AsyncIterator[QueryStreamEvent]:
+        """
+        Execute the GraphRAG pipeline, streaming the answer as it is generated.
+
+        Stages 1-4 run as in query(). A ``context_ready`` event is emitted
+        once context is assembled, then ``delta`` events with answer text,
+        then a ``final`` event with the complete GraphRAGResponse including
+        citations for the markers used in the answer. Generation shares
+        query()'s budget: if no text arrives in time the apology is streamed
+        instead, and a stream still running at the deadline is cut off.
+
+        Args:
+            workflow_id: ID of the insurance workflow to query.
+            request: The user's query and retrieval parameters.
+
+        Yields:
+            QueryStreamEvent
+        """
+        start_time = time.time()
+        stage_latencies = {}
+
+        query_plan, query_embeddings = await self._understand_query(workflow_id, request, stage_latencies)
+
+        if query_plan.intent == "GENERAL":
+            response = self._general_response(request, start_time, stage_latencies)
+            yield QueryStreamEvent(event_type="context_ready", data={"intent": "GENERAL"})
+            yield QueryStreamEvent(event_type="delta", data={"text": response.answer})
+            yield QueryStreamEvent(event_type="final", data=response.model_dump(mode="json"))
+            return
+
+        retrieved = await self._retrieve_context(
+            workflow_id, request, query_plan, stage_latencies, query_embeddings
+        )
+        context_payload = retrieved.context_payload
+
+        yield QueryStreamEvent(
+            event_type="context_ready",
+            data={
+                "intent": query_plan.intent,
+                "traversal_depth": query_plan.traversal_depth,
+                "full_text_count": len(context_payload.full_text_results),
+                "summary_count": len(context_payload.summary_results),
+                "total_context_tokens": context_payload.token_count,
+                "graph_available": retrieved.graph_available,
+                "stage_latencies": dict(stage_latencies),
+            },
+        )
+
+        # 5. Stage 5: Response Generation (streamed, within its latency budget)
+        s5_start = time.time()
+        deadline = s5_start + settings.graphrag.generation_timeout_seconds
+        parts: List[str] = []
+        stream = self.response_generator.generate_response_stream(
+            query=request.query,
+            context=context_payload
+        )
+        try:
+            while True:
+                try:
+                    delta = await asyncio.wait_for(
+                        stream.__anext__(), timeout=max(0.0, deadline - time.time())
+                    )
+                except StopAsyncIteration:
+                    break
+                if not parts:
+                    stage_latencies["first_token"] = int((time.time() - s5_start) * 1000)
+                parts.append(delta)
+                yield QueryStreamEvent(event_type="delta", data={"text": delta})
+        except asyncio.TimeoutError:
+            await stream.aclose()
+            LOGGER.warning(
+                f"Streamed response generation exceeded its {settings.graphrag.generation_timeout_seconds}s budget",
+                extra={"workflow_id": str(workflow_id), "streamed_deltas": len(parts)}
+            )
+            # An answer cut off mid-stream is kept as is
+            if not parts:
+                parts.append(GENERATION_TIMEOUT_ANSWER)
+                yield QueryStreamEvent(event_type="delta", data={"text": GENERATION_TIMEOUT_ANSWER})
+
+        stage_latencies["response_generation"] = int((time.time() - s5_start) * 1000)
+
+        answer = "".join(parts).strip()
+        sources = self._answer_sources(answer, context_payload, request)
+        metadata = self._build_metadata(query_plan, retrieved, start_time, stage_latencies)
+        observe_stage_latencies({**stage_latencies, "total": metadata.latency_ms})
+        response = GraphRAGResponse(
+            answer=answer,
+            sources=sources,
+            metadata=metadata,
+            timestamp=datetime.now(timezone.utc)
+        )
+        yield QueryStreamEvent(event_type="final", data=response.model_dump(mode="json"))
+
+    @staticmethod
+    def _answer_sources(
+        answer: str, context_payload: ContextPayload, request: GraphRAGRequest
+    ) -> List[SourceCitation]:
+        """Citations for the markers used in an answer, if the request wants sources."""
+        if not request.include_sources:
+            return []
+        return build_source_citations(answer, context_payload.provenance_index)
+
+    async def _understand_query(
+        self,
+        workflow_id: UUID,
+        request: GraphRAGRequest,
+        stage_latencies: Dict[str, int],
+    ) -> Tuple[QueryPlan, Optional[List[List[float]]]]:
+        """Stage 1: Query Understanding, applying any intent override.
+
+        Intent and query expansion are rule-based, so unless the query is
+        conversational its expansions are embedded (Stage 2's first step)
+        while the workflow context is fetched from PostgreSQL.
+
+        Returns:
+            (query plan, embeddings of its expanded queries or None)
+        """
         s1_start = time.time()
-        query_plan = await self.query_understanding.understand_query(
+        understanding = self.query_understanding.understand_query(
             query=request.query,
             workflow_id=workflow_id,
             target_document_ids=request.document_ids,
         )
+
+        query_embeddings = None
+        predicted_intent, _, _ = self.query_understanding.intent_classifier.classify(request.query)
+        if request.intent_override or predicted_intent != "GENERAL":
+            expanded_queries = self.query_understanding.query_expander.expand(request.query)
+            query_plan, embedded = await asyncio.gather(
+                understanding,
+                self._embed_queries(expanded_queries, stage_latencies),
+                return_exceptions=True,
+            )
+            if isinstance(query_plan, BaseException):
+                raise query_plan
+            if isinstance(embedded, BaseException):
+                LOGGER.warning(f"Early query embedding failed, retrying in vector retrieval: {embedded}")
+            elif query_plan.expanded_queries == expanded_queries:
+                query_embeddings = embedded
+        else:
+            query_plan = await understanding
+
         # Apply intent override if provided
         if request.intent_override:
             query_plan.intent = request.intent_override
@@ -92,57 +334,105 @@ class GraphRAGService:
             query_plan.traversal_depth = depth_map.get(request.intent_override, 1)
             
         stage_latencies["query_understanding"] = int((time.time() - s1_start) * 1000)
+        return query_plan, query_embeddings
 
-        # Early exit for GENERAL intent (conversational queries)
-        if query_plan.intent == "GENERAL":
-            from app.services.retrieval.constants import GENERAL_QUERY_RESPONSE
-            
-            LOGGER.info(
-                "Short-circuiting GraphRAG pipeline for GENERAL intent",
-                extra={"query": request.query[:100]}
-            )
-            
-            total_latency_ms = int((time.time() - start_time) * 1000)
-            metadata = ResponseMetadata(
-                intent="GENERAL",
-                traversal_depth=0,
-                vector_results_count=0,
-                graph_results_count=0,
-                merged_results_count=0,
-                full_text_count=0,
-                summary_count=0,
-                total_context_tokens=0,
-                latency_ms=total_latency_ms,
-                stage_latencies=stage_latencies,
-                graph_available=True,
-                fallback_mode=False
-            )
-            
-            return GraphRAGResponse(
-                answer=GENERAL_QUERY_RESPONSE.strip(),
-                sources=[],
-                metadata=metadata,
-                timestamp=datetime.now(timezone.utc)
-            )
+    async def _embed_queries(
+        self, queries: List[str], stage_latencies: Dict[str, int]
+    ) -> List[List[float]]:
+        """Embed expanded queries, recording the time taken."""
+        started = time.time()
+        embeddings = await self.vector_retrieval.embed_queries(queries)
+        stage_latencies["query_embedding"] = int((time.time() - started) * 1000)
+        return embeddings
+
+    def _general_response(
+        self,
+        request: GraphRAGRequest,
+        start_time: float,
+        stage_latencies: Dict[str, int],
+    ) -> GraphRAGResponse:
+        """Canned response for conversational (GENERAL intent) queries."""
+        from app.services.retrieval.constants import GENERAL_QUERY_RESPONSE
+        
+        LOGGER.info(
+            "Short-circuiting GraphRAG pipeline for GENERAL intent",
+            extra={"query": request.query[:100]}
+        )
+        
+        total_latency_ms = int((time.time() - start_time) * 1000)
+        observe_stage_latencies({**stage_latencies, "total": total_latency_ms})
+        metadata = ResponseMetadata(
+            intent="GENERAL",
+            traversal_depth=0,
+            vector_results_count=0,
+            graph_results_count=0,
+            merged_results_count=0,
+            full_text_count=0,
+            summary_count=0,
+            total_context_tokens=0,
+            latency_ms=total_latency_ms,
+            stage_latencies=stage_latencies,
+            graph_available=True,
+            fallback_mode=False
+        )
+        
+        return GraphRAGResponse(
+            answer=GENERAL_QUERY_RESPONSE.strip(),
+            sources=[],
+            metadata=metadata,
+            timestamp=datetime.now(timezone.utc)
+        )
 
+    async def _retrieve_context(
+        self,
+        workflow_id: UUID,
+        request: GraphRAGRequest,
+        query_plan: QueryPlan,
+        stage_latencies: Dict[str, int],
+        query_embeddings: Optional[List[List[float]]] = None,
+    ) -> RetrievedContext:
+        """Stages 2-4: vector retrieval, graph expansion and context assembly.
+
+        Graph traversal (Neo4j) only needs the reranked embeddings' entity
+        ids, so it starts as soon as the vector search returns and runs
+        while their content is resolved. It gets GRAPHRAG_GRAPH_TIMEOUT_SECONDS;
+        past that, or on failure, the answer uses vector context only.
+        PostgreSQL steps stay sequential as they share the request session.
+        """
         # 2. Stage 2: Vector Retrieval
         s2_start = time.time()
-        vector_results = await self.vector_retrieval.retrieve(query_plan)
+        reranked = await self.vector_retrieval.search(query_plan, query_embeddings=query_embeddings)
+
+        # 3. Stage 3: Graph Expansion, traversal overlapping content resolution
+        s3_start = time.time()
+        seeds = [embedding for embedding, _, _ in reranked]
+        traversal = asyncio.create_task(
+            self.graph_expansion.traverse(seeds, query_plan, workflow_id)
+        )
+        try:
+            vector_results = await self.vector_retrieval.resolve(reranked, query_plan)
+        except BaseException:
+            traversal.cancel()
+            raise
         vector_dicts = [res.model_dump() for res in vector_results]
         stage_latencies["vector_retrieval"] = int((time.time() - s2_start) * 1000)
 
-        # 3. Stage 3: Graph Expansion
-        s3_start = time.time()
         graph_results = []
         graph_available = True
         fallback_mode = False
         
+        budget = settings.graphrag.graph_timeout_seconds
         try:
-            graph_results = await self.graph_expansion.expand(
-                vector_results=vector_results,
-                query_plan=query_plan,
-                workflow_id=workflow_id
+            remaining = max(0.0, budget - (time.time() - s3_start))
+            _, traversal_results = await asyncio.wait_for(traversal, timeout=remaining)
+            graph_results = await self.graph_expansion.score(traversal_results, query_plan, workflow_id)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                f"Graph traversal exceeded its {budget}s budget, falling back to vector-only",
+                extra={"workflow_id": str(workflow_id)}
             )
+            graph_available = False
+            fallback_mode = True
         except Exception as e:
             LOGGER.error(f"Graph expansion failed, falling back to vector-only: {e}", exc_info=True)
             graph_available = False
@@ -165,18 +455,6 @@ class GraphRAGService:
         markdown_context = format_context_for_llm(context_payload)
         stage_latencies["context_assembly"] = int((time.time() - s4_start) * 1000)
 
-        # 5. Stage 5: Response Generation
-        s5_start = time.time()
-        generated_response = await self.response_generator.generate_response(
-            query=request.query,
-            context=context_payload
-        )
-        
-        stage_latencies["response_generation"] = int((time.time() - s5_start) * 1000)
-
-        # Final Metadata and Response Assembly
-        total_latency_ms = int((time.time() - start_time) * 1000)
-        
         if vector_results:
             # detailed logging for top 3 vector results
             detailed_vector_log = []
@@ -209,24 +487,36 @@ class GraphRAGService:
             f"summaries: {len(context_payload.summary_results)} | "
             f"context_chars: {len(markdown_context)}"
         )
-        metadata = ResponseMetadata(
+
+        return RetrievedContext(
+            vector_results=vector_results,
+            graph_results=graph_results,
+            merged_results=merged_results,
+            context_payload=context_payload,
+            graph_available=graph_available,
+            fallback_mode=fallback_mode,
+        )
+
+    def _build_metadata(
+        self,
+        query_plan: QueryPlan,
+        retrieved: RetrievedContext,
+        start_time: float,
+        stage_latencies: Dict[str, int],
+    ) -> ResponseMetadata:
+        """Assemble retrieval process metadata for a response."""
+        context_payload = retrieved.context_payload
+        return ResponseMetadata(
             intent=query_plan.intent,
             traversal_depth=query_plan.traversal_depth,
-            vector_results_count=len(vector_results),
-            graph_results_count=len(graph_results),
-            merged_results_count=len(merged_results),
+            vector_results_count=len(retrieved.vector_results),
+            graph_results_count=len(retrieved.graph_results),
+            merged_results_count=len(retrieved.merged_results),
             full_text_count=len(context_payload.full_text_results),
             summary_count=len(context_payload.summary_results),
             total_context_tokens=context_payload.token_count,
-            latency_ms=total_latency_ms,
+            latency_ms=int((time.time() - start_time) * 1000),
             stage_latencies=stage_latencies,
-            graph_available=graph_available,
-            fallback_mode=fallback_mode
-        )
-
-        return GraphRAGResponse(
-            answer=generated_response.answer,
-            sources=[],
-            metadata=metadata,
-            timestamp=datetime.now(timezone.utc)
+            graph_available=retrieved.graph_available,
+            fallback_mode=retrieved.fallback_mode
         )
@@ -27,6 +27,11 @@ from app.services.retrieval.query_understanding.intent_classifier import (
     IntentClassifier,
 )
 from app.services.retrieval.query_understanding.query_expander import QueryExpander
+from app.services.retrieval.query_understanding.workflow_context_cache import (
+    WorkflowContextSnapshot,
+    get_cached_workflow_context,
+    store_workflow_context,
+)
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -173,6 +178,10 @@ class QueryUnderstandingService:
         """
         Fetch workflow context (sections, entities, documents) from PostgreSQL.
 
+        The workflow's inventory is cached per context version, so repeated
+        questions cost a single version lookup; it is rebuilt (three queries
+        for the whole workflow) once documents or their stages change.
+
         Args:
             workflow_id: Workflow to fetch context for
             target_document_ids: Specific documents to include (None = all)
@@ -180,80 +189,57 @@ class QueryUnderstandingService:
         Returns:
             WorkflowContext with sections, entities, and document IDs
         """
-        # Fetch all documents in the workflow
-        workflow_docs = await self.workflow_doc_repo.get_by_workflow_id(workflow_id)
+        version = await self.workflow_doc_repo.get_context_version(workflow_id)
+        snapshot = get_cached_workflow_context(workflow_id, version)
+        if snapshot is None:
+            snapshot = await self._build_workflow_snapshot(workflow_id, version)
+            store_workflow_context(snapshot)
 
-        if not workflow_docs:
+        if not snapshot.document_names:
             LOGGER.warning(
                 "No documents found for workflow",
                 extra={"workflow_id": str(workflow_id)},
             )
-            return WorkflowContext(
-                workflow_id=workflow_id,
-                sections=[],
-                entities=[],
-                document_ids=[],
-                document_count=0,
-            )
-
-        # Filter to target documents if specified
-        if target_document_ids:
-            document_ids = [
-                wd.document_id
-                for wd in workflow_docs
-                if wd.document_id in target_document_ids
-            ]
-        else:
-            document_ids = [wd.document_id for wd in workflow_docs]
-
-        # Fetch all sections and entities for these documents
-        all_sections = []
-        all_entities = []
-
-        for doc_id in document_ids:
-            # Fetch sections for this document
-            sections = await self.section_repo.get_by_document_and_workflow(
-                doc_id, workflow_id
-            )
-            all_sections.extend(
-                [
-                    {
-                        "id": str(section.id),
-                        "document_id": str(section.document_id),
-                        "section_type": section.section_type,
-                        "section_name": section.section_type,
-                        "content": section.display_payload,
-                        "page_numbers": [section.page_range.get("start")] if section.page_range and "start" in section.page_range else [],
-                    }
-                    for section in sections
-                ]
-            )
 
-            # Fetch entities for this document
-            entities = await self.entity_repo.get_by_document_and_workflow(
-                doc_id, workflow_id
-            )
-            all_entities.extend(
-                [
-                    {
-                        "id": str(entity.id),
-                        "document_id": str(entity.document_id),
-                        "entity_type": entity.entity_type,
-                        "entity_name": entity.entity_label,
-                        "attributes": entity.display_payload,
-                        "confidence": float(entity.confidence) if entity.confidence else None,
-                    }
-                    for entity in entities
-                ]
-            )
+        return snapshot.to_context(target_document_ids)
+
+    async def _build_workflow_snapshot(
+        self, workflow_id: UUID, version: tuple
+    ) -> WorkflowContextSnapshot:
+        """Load the document, section and entity inventory of a workflow."""
+        documents = await self.workflow_doc_repo.get_document_names(workflow_id)
+        document_names = {doc_id: name or "unknown" for doc_id, name in documents}
+        if not document_names:
+            return WorkflowContextSnapshot(workflow_id, version, {}, (), ())
+
+        sections = tuple(
+            {
+                "id": str(row.id),
+                "document_id": str(row.document_id),
+                "section_type": row.section_type,
+                "section_name": row.section_type,
+                "page_numbers": [row.page_range.get("start")] if row.page_range and "start" in row.page_range else [],
+            }
+            for row in await self.section_repo.get_inventory_by_workflow(workflow_id)
+            if row.document_id in document_names
+        )
+        entities = tuple(
+            {
+                "id": str(row.id),
+                "document_id": str(row.document_id),
+                "entity_type": row.entity_type,
+                "entity_name": row.entity_label,
+                "confidence": float(row.confidence) if row.confidence else None,
+            }
+            for row in await self.entity_repo.get_inventory_by_workflow(workflow_id)
+            if row.document_id in document_names
+        )
 
-        return WorkflowContext(
-            workflow_id=workflow_id,
-            sections=all_sections,
-            entities=all_entities,
-            document_ids=document_ids,
-            document_count=len(document_ids),
+        LOGGER.info(
+            f"Workflow context cached | workflow: {workflow_id} | documents: {len(document_names)} | "
+            f"sections: {len(sections)} | entities: {len(entities)}"
         )
+        return WorkflowContextSnapshot(workflow_id, version, document_names, sections, entities)
 
     def _derive_section_filters(
         self, section_hints: list[str], intent: str
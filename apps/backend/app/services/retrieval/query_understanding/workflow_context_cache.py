@@ -0,0 +1,99 @@
+"""
+Per-workflow cache of query understanding context.
+
+Chat sessions ask many questions against the same workflow, and its
+document, section and entity inventory only changes while documents are
+processed. Each entry is stored with the workflow's context version
+(see WorkflowDocumentRepository.get_context_version), so a stage transition
+written by the Temporal worker - indexing completing in particular -
+invalidates it in every API process; a query then costs one version lookup
+instead of reloading the inventory.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.schemas.query import WorkflowContext
+
+
+@dataclass(frozen=True)
+class WorkflowContextSnapshot:
+    """Compact inventory of a workflow's documents, sections and entities.
+
+    Attributes:
+        workflow_id: Workflow UUID
+        version: Context version the snapshot was built at
+        document_names: Document ID to name, in workflow order
+        sections: Section inventory (no display payloads)
+        entities: Entity inventory (no display payloads)
+    """
+
+    workflow_id: UUID
+    version: Tuple
+    document_names: Dict[UUID, str]
+    sections: Tuple[Dict[str, Any], ...]
+    entities: Tuple[Dict[str, Any], ...]
+
+    def to_context(self, target_document_ids: Optional[list[UUID]] = None) -> WorkflowContext:
+        """Build the WorkflowContext for a query, optionally limited to some documents.
+
+        Args:
+            target_document_ids: Specific documents to include (None = all)
+
+        Returns:
+            WorkflowContext with the selected documents' sections and entities
+        """
+        if target_document_ids:
+            targets = set(target_document_ids)
+            document_ids = [doc_id for doc_id in self.document_names if doc_id in targets]
+        else:
+            document_ids = list(self.document_names)
+
+        selected = {str(doc_id) for doc_id in document_ids}
+        return WorkflowContext(
+            workflow_id=self.workflow_id,
+            sections=[section for section in self.sections if section["document_id"] in selected],
+            entities=[entity for entity in self.entities if entity["document_id"] in selected],
+            document_ids=document_ids,
+            document_names={doc_id: self.document_names[doc_id] for doc_id in document_ids},
+            document_count=len(document_ids),
+        )
+
+
+_snapshots: "OrderedDict[UUID, WorkflowContextSnapshot]" = OrderedDict()
+
+
+def get_cached_workflow_context(workflow_id: UUID, version: Tuple) -> Optional[WorkflowContextSnapshot]:
+    """Get a workflow's snapshot if it was built at the given version.
+
+    Args:
+        workflow_id: Workflow UUID
+        version: Current context version of the workflow
+
+    Returns:
+        WorkflowContextSnapshot, or None if missing or stale
+    """
+    snapshot = _snapshots.get(workflow_id)
+    if snapshot is None or snapshot.version != version:
+        return None
+    _snapshots.move_to_end(workflow_id)
+    return snapshot
+
+
+def store_workflow_context(snapshot: WorkflowContextSnapshot) -> None:
+    """Cache a snapshot, evicting the least recently used workflows."""
+    _snapshots[snapshot.workflow_id] = snapshot
+    _snapshots.move_to_end(snapshot.workflow_id)
+    while len(_snapshots) > settings.graphrag.workflow_context_cache_size:
+        _snapshots.popitem(last=False)
+
+
+def invalidate_workflow_context(workflow_id: Optional[UUID] = None) -> None:
+    """Drop one workflow's snapshot, or all of them."""
+    if workflow_id is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(workflow_id, None)
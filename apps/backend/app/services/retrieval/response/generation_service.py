@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 
 from app.core.config import settings
 from app.core.unified_llm import create_llm_client_from_settings
@@ -177,7 +177,14 @@ The deductible information is not available in the supplied policy materials.
 
 """
 
-
+NO_CONTEXT_ANSWER = (
+    "I'm sorry, I couldn't find any relevant information in the provided documents to answer your question."
+)
+GENERATION_ERROR_ANSWER = "An error occurred while generating the response. Please try again."
+GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "max_output_tokens": 2000
+}
 
 
 class ResponseGenerationService:
@@ -207,26 +214,17 @@ class ResponseGenerationService:
         """
         if not context.full_text_results and not context.summary_results:
             return GeneratedResponse(
-                answer="I'm sorry, I couldn't find any relevant information in the provided documents to answer your question.",
+                answer=NO_CONTEXT_ANSWER,
                 provenance={},
                 context_used=context
             )
 
-        # Format context for LLM
-        formatted_context = format_context_for_llm(context)
-        
-        # Prepare user prompt
-        user_prompt = f"Question: {query}\n\nRelevant Context:\n{formatted_context}\n\nPlease answer the question using the context above."
-
         try:
             # Generate response
             response_text = await self.client.generate_content(
-                contents=user_prompt,
+                contents=self._build_prompt(query, context),
                 system_instruction=system_instruction or SYSTEM_PROMPT,
-                generation_config={
-                    "temperature": 0.1,
-                    "max_output_tokens": 2000
-                }
+                generation_config=GENERATION_CONFIG
             )
 
             LOGGER.info(
@@ -243,7 +241,54 @@ class ResponseGenerationService:
         except Exception as e:
             LOGGER.error(f"Failed to generate LLM response: {e}", exc_info=True)
             return GeneratedResponse(
-                answer="An error occurred while generating the response. Please try again.",
+                answer=GENERATION_ERROR_ANSWER,
                 provenance={},
                 context_used=context
             )
+
+    async def generate_response_stream(
+        self,
+        query: str,
+        context: ContextPayload,
+        system_instruction: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the answer from the LLM as text deltas.
+
+        Yields the same fallback answers as generate_response when there is
+        no context or the LLM fails before producing text. A failure after
+        text has been streamed is raised to the caller.
+        """
+        if not context.full_text_results and not context.summary_results:
+            yield NO_CONTEXT_ANSWER
+            return
+
+        emitted = 0
+        try:
+            async for delta in self.client.generate_content_stream(
+                contents=self._build_prompt(query, context),
+                system_instruction=system_instruction or SYSTEM_PROMPT,
+                generation_config=GENERATION_CONFIG
+            ):
+                # Leading whitespace is stripped in the non-streaming answer too
+                if not emitted:
+                    delta = delta.lstrip()
+                    if not delta:
+                        continue
+                emitted += len(delta)
+                yield delta
+
+        except Exception as e:
+            if emitted:
+                LOGGER.error(f"LLM response stream interrupted after {emitted} chars: {e}", exc_info=True)
+                raise
+            LOGGER.error(f"Failed to generate LLM response: {e}", exc_info=True)
+            yield GENERATION_ERROR_ANSWER
+            return
+
+        LOGGER.info(f"LLM response streamed | length: {emitted} chars")
+
+    def _build_prompt(self, query: str, context: ContextPayload) -> str:
+        """Build the user prompt from the query and formatted context."""
+        formatted_context = format_context_for_llm(context)
+        return f"Question: {query}\n\nRelevant Context:\n{formatted_context}\n\nPlease answer the question using the context above."
@@ -0,0 +1,150 @@
+"""Recall@k and latency of vector search against brute force.
+
+Samples embeddings stored for a workflow as queries, computes the exact
+top-k for each with an exact scan, and measures recall and latency of the
+HNSW index at several ef_search values and of the planned search (the mode
+retrieval actually uses for this workflow):
+
+    python -m app.services.retrieval.vector.index_benchmark <workflow_id> \
+        --queries 50 --k 10 --ef-search 40 100 200
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.models import VectorEmbedding
+from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
+
+
+@dataclass
+class BenchmarkResult:
+    """Recall and latency of one search mode.
+
+    Attributes:
+        mode: "exact", "hnsw" or "planned"
+        ef_search: HNSW candidate list size (None for exact scans)
+        recall: Mean recall@k against the exact scan
+        p50_ms: Median query latency
+        p95_ms: 95th percentile query latency
+    """
+    mode: str
+    ef_search: Optional[int]
+    recall: float
+    p50_ms: float
+    p95_ms: float
+
+
+def recall_at_k(truth: Sequence, found: Sequence, k: int) -> float:
+    """Fraction of the true top-k found in the first k results."""
+    expected = set(truth[:k])
+    if not expected:
+        return 1.0
+    return len(expected & set(found[:k])) / len(expected)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+async def run_benchmark(
+    session: AsyncSession,
+    workflow_id: UUID,
+    queries: int = 50,
+    k: int = 10,
+    ef_search_values: Sequence[int] = (40, 100, 200),
+) -> List[BenchmarkResult]:
+    """Benchmark search modes on a workflow's embeddings.
+
+    Args:
+        session: Database session
+        workflow_id: Workflow whose embeddings are searched
+        queries: Number of stored embeddings sampled as queries
+        k: Results per query
+        ef_search_values: HNSW ef_search values to measure
+
+    Returns:
+        BenchmarkResult per mode, exact scan first
+    """
+    repo = VectorEmbeddingRepository(session)
+    sample = await session.execute(
+        select(VectorEmbedding.embedding)
+        .where(VectorEmbedding.workflow_id == workflow_id)
+        .where(VectorEmbedding.embedding.is_not(None))
+        .order_by(func.random())
+        .limit(queries)
+    )
+    query_embeddings = [list(row[0]) for row in sample]
+    if not query_embeddings:
+        return []
+
+    async def measure(**search_kwargs):
+        ids, latencies = [], []
+        for embedding in query_embeddings:
+            started = time.perf_counter()
+            results = await repo.semantic_search(
+                embedding, top_k=k, workflow_id=workflow_id, **search_kwargs
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            ids.append([result.id for result in results])
+        return ids, latencies
+
+    truth, exact_latencies = await measure(exact=True)
+    results = [BenchmarkResult("exact", None, 1.0, percentile(exact_latencies, 50), percentile(exact_latencies, 95))]
+
+    runs = [("hnsw", ef, {"exact": False, "ef_search": ef}) for ef in ef_search_values]
+    runs.append(("planned", None, {}))
+    for mode, ef_search, search_kwargs in runs:
+        found, latencies = await measure(**search_kwargs)
+        recall = sum(recall_at_k(t, f, k) for t, f in zip(truth, found)) / len(truth)
+        results.append(BenchmarkResult(
+            mode, ef_search, round(recall, 4), percentile(latencies, 50), percentile(latencies, 95)
+        ))
+    return results
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.core.database import async_session_maker
+
+    async with async_session_maker() as session:
+        repo = VectorEmbeddingRepository(session)
+        vectors = await repo.count_scope_vectors(workflow_id=args.workflow_id)
+        exact = await repo.use_exact_scan(workflow_id=args.workflow_id)
+        print(
+            f"workflow {args.workflow_id}: {vectors} vectors, planner uses "
+            f"{'exact scan' if exact else 'HNSW'} "
+            f"(VECTOR_EXACT_SCAN_MAX_VECTORS={settings.vector_search.exact_scan_max_vectors})"
+        )
+
+        results = await run_benchmark(
+            session, args.workflow_id, queries=args.queries, k=args.k, ef_search_values=args.ef_search
+        )
+
+    print(f"{'mode':<8} {'ef_search':>9} {f'recall@{args.k}':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for result in results:
+        print(
+            f"{result.mode:<8} {result.ef_search or '-':>9} {result.recall:>10.4f} "
+            f"{result.p50_ms:>8.2f} {result.p95_ms:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("workflow_id", type=UUID)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200])
+    asyncio.run(_main(parser.parse_args()))
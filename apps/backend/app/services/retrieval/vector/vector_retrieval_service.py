@@ -9,7 +9,6 @@ Orchestrates the full vector retrieval pipeline:
 5. Return scored VectorSearchResult list
 """
 
-import asyncio
 from pathlib import Path
 from uuid import UUID
 
@@ -20,6 +19,7 @@ from app.database.models import Document, VectorEmbedding
 from app.repositories.section_extraction_repository import SectionExtractionRepository
 from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
 from app.schemas.query import QueryPlan, VectorSearchResult
+from app.services.embedding_service import get_embedding_service
 from app.services.retrieval.constants import (
     DEFAULT_DISTANCE_THRESHOLD,
     DEFAULT_VECTOR_TOP_K,
@@ -32,19 +32,6 @@ from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
 
-# Module-level singleton for the embedding model (expensive to load)
-_embedding_model = None
-
-
-def _get_embedding_model():
-    """Get or lazily load the shared SentenceTransformer model."""
-    global _embedding_model
-    if _embedding_model is None:
-        from sentence_transformers import SentenceTransformer
-        LOGGER.info("Loading embedding model: all-MiniLM-L6-v2")
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-    return _embedding_model
-
 
 class VectorRetrievalService:
     """Orchestrates vector-based retrieval (Stage 2 of the GraphRAG pipeline).
@@ -66,6 +53,7 @@ class VectorRetrievalService:
         query_plan: QueryPlan,
         top_k: int = DEFAULT_VECTOR_TOP_K,
         max_distance: float = DEFAULT_DISTANCE_THRESHOLD,
+        query_embeddings: list[list[float]] | None = None,
     ) -> list[VectorSearchResult]:
         """Execute vector retrieval pipeline.
 
@@ -73,14 +61,43 @@ class VectorRetrievalService:
             query_plan: QueryPlan from Stage 1 (query understanding)
             top_k: Maximum number of results to return
             max_distance: Maximum cosine distance threshold (0-2)
+            query_embeddings: Embeddings of query_plan.expanded_queries, if
+                already computed
 
         Returns:
             List of VectorSearchResult, sorted by final_score descending
         """
+        reranked = await self.search(query_plan, top_k, max_distance, query_embeddings)
+        return await self.resolve(reranked, query_plan)
+
+    async def search(
+        self,
+        query_plan: QueryPlan,
+        top_k: int = DEFAULT_VECTOR_TOP_K,
+        max_distance: float = DEFAULT_DISTANCE_THRESHOLD,
+        query_embeddings: list[list[float]] | None = None,
+    ) -> list[tuple[VectorEmbedding, float, float]]:
+        """Search and rerank embeddings, without resolving their content.
+
+        The reranked embeddings already carry entity_id and section_type,
+        which is all graph node mapping needs, so graph expansion can start
+        while resolve() hydrates content.
+
+        Args:
+            query_plan: QueryPlan from Stage 1 (query understanding)
+            top_k: Maximum number of results to return
+            max_distance: Maximum cosine distance threshold (0-2)
+            query_embeddings: Embeddings of query_plan.expanded_queries, if
+                already computed
+
+        Returns:
+            (VectorEmbedding, similarity, final_score) tuples, best first
+        """
         workflow_id = query_plan.workflow_context.workflow_id
 
         # Step 1: Embed expanded queries
-        query_embeddings = await self._embed_queries(query_plan.expanded_queries)
+        if query_embeddings is None:
+            query_embeddings = await self.embed_queries(query_plan.expanded_queries)
         if not query_embeddings:
             LOGGER.warning("No query embeddings generated")
             return []
@@ -112,15 +129,32 @@ class VectorRetrievalService:
         )
 
         # Step 3: Rerank with intent-aware boosting
-        reranked = self.reranker.rerank(
+        return self.reranker.rerank(
             results=raw_results,
             intent=query_plan.intent,
             extracted_entities=query_plan.extracted_entities,
             entity_type_filters=query_plan.entity_type_filters or None,
         )
 
+    async def resolve(
+        self,
+        reranked: list[tuple[VectorEmbedding, float, float]],
+        query_plan: QueryPlan,
+    ) -> list[VectorSearchResult]:
+        """Resolve content and document names of reranked embeddings.
+
+        Args:
+            reranked: Output of search()
+            query_plan: QueryPlan from Stage 1 (query understanding)
+
+        Returns:
+            List of VectorSearchResult, sorted by final_score descending
+        """
+        if not reranked:
+            return []
+
         # Step 4: Resolve content and document names in bulk
-        results = await self._resolve_results(reranked, workflow_id)
+        results = await self._resolve_results(reranked, query_plan.workflow_context.workflow_id)
 
         # Log sample content for debugging
         if results:
@@ -132,26 +166,27 @@ class VectorRetrievalService:
         avg_score = sum([r.final_score for r in results]) / len(results) if results else 0.0
 
         LOGGER.info(
-            f"Vector retrieval complete | intent: {query_plan.intent} | raw_count: {len(raw_results)} | "
+            f"Vector retrieval complete | intent: {query_plan.intent} | reranked: {len(reranked)} | "
             f"final_count: {len(results)} | top_score: {results[0].final_score if results else 0.0:.3f} | "
             f"min_score: {min_score:.3f} | avg_score: {avg_score:.3f}"
         )
 
         return results
 
-    # ------------------------------------------------------------------
-    # Private helpers
-    # ------------------------------------------------------------------
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed query strings with the shared model.
 
-    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
-        """Embed query strings using SentenceTransformer (offloaded to thread)."""
+        Repeated queries are served from the query embedding cache, and
+        concurrent requests share a single forward pass.
+        """
         if not queries:
             return []
 
-        model = _get_embedding_model()
-        # SentenceTransformer.encode is CPU-bound; run in a thread
-        embeddings = await asyncio.to_thread(model.encode, queries)
-        return [emb.tolist() for emb in embeddings]
+        return await get_embedding_service().embed_queries(queries)
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
 
     async def _resolve_results(
         self,
@@ -1,17 +1,23 @@
 """Storage service for handling Supabase storage operations."""
 
-import httpx
 import asyncio
-from typing import Dict, Any, Optional, Union
+import hashlib
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, Tuple, Union
 from fastapi import UploadFile
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.utils.logging import get_logger
 from app.core.exceptions import AppError
+from app.services.document_cache import CachedDocument, get_document_cache
 
 LOGGER = get_logger(__name__)
 
 class StorageService:
-    """Service for managing files in Supabase storage."""
+    """Service for managing files in Supabase storage.
+
+    Requests use the process-wide pooled HTTP client of the Supabase origin.
+    """
 
     def __init__(self):
         self.url = settings.supabase_url
@@ -27,52 +33,77 @@ class StorageService:
         file: Any, 
         bucket: str, 
         path: str,
-        content_type: str = "application/octet-stream"
+        content_type: str = "application/octet-stream",
+        chunk_size: int = 1024 * 1024,
     ) -> Dict[str, Any]:
         """Upload a file to Supabase storage.
 
+        File-like objects are streamed in chunks rather than read into
+        memory, and the SHA-256 of the content is computed on the way.
+
         Args:
-            file: The file to upload.
+            file: The file to upload (file-like object or bytes).
             bucket: Target bucket name.
             path: Target path within the bucket.
+            content_type: Content type used when the file has none.
+            chunk_size: Read size for file-like objects, in bytes.
 
         Returns:
-            Dict containing the upload result.
+            Dict containing the upload result, plus ``sha256`` and
+            ``size_bytes`` of the uploaded content.
 
         Raises:
             AppError: If the upload fails.
         """
         upload_url = f"{self.base_api_url}/object/{bucket}/{path}"
-        
+        digest = hashlib.sha256()
+        size_bytes = 0
+
+        async def stream_chunks() -> AsyncIterator[bytes]:
+            nonlocal size_bytes
+            while True:
+                chunk = file.read(chunk_size)
+                if asyncio.iscoroutine(chunk):
+                    chunk = await chunk
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size_bytes += len(chunk)
+                yield chunk
+
         try:
-            if hasattr(file, "read"):
-                content = file.read()
-                if asyncio.iscoroutine(content):
-                    content = await content
-            else:
-                content = file
-                
             # Use provided content_type or file's if available
             final_content_type = content_type
             if hasattr(file, "content_type") and file.content_type:
                 final_content_type = file.content_type
+            headers = {**self.headers, "Content-Type": final_content_type}
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    upload_url,
-                    headers={**self.headers, "Content-Type": final_content_type},
-                    content=content,
-                    timeout=settings.http_timeout
-                )
+            if hasattr(file, "read"):
+                content = stream_chunks()
+                # A known size avoids chunked transfer encoding
+                if isinstance(getattr(file, "size", None), int):
+                    headers["Content-Length"] = str(file.size)
+            else:
+                content = file
+                digest.update(content)
+                size_bytes = len(content)
+
+            client = get_http_client(self.base_api_url)
+            response = await client.post(
+                upload_url,
+                headers=headers,
+                content=content,
+                timeout=settings.http_timeout
+            )
                 
-                if response.status_code != 200:
-                    LOGGER.error(
-                        f"Failed to upload file to Supabase: {response.text}",
-                        extra={"bucket": bucket, "path": path, "status_code": response.status_code}
-                    )
-                    raise AppError(f"Upload failed: {response.text}")
+            if response.status_code != 200:
+                LOGGER.error(
+                    f"Failed to upload file to Supabase: {response.text}",
+                    extra={"bucket": bucket, "path": path, "status_code": response.status_code}
+                )
+                raise AppError(f"Upload failed: {response.text}")
                 
-                return response.json()
+            return {**response.json(), "sha256": digest.hexdigest(), "size_bytes": size_bytes}
         except Exception as e:
             LOGGER.error(f"Error uploading file to Supabase: {str(e)}", exc_info=True)
             raise AppError(f"Storage upload error: {str(e)}", original_error=e)
@@ -82,6 +113,32 @@ class StorageService:
                 if asyncio.iscoroutine(seek_res):
                     await seek_res
 
+    async def delete_file(self, bucket: str, path: str) -> None:
+        """Delete an object from Supabase storage.
+
+        Args:
+            bucket: Bucket name.
+            path: Object path.
+
+        Raises:
+            AppError: If the deletion fails.
+        """
+        url = f"{self.base_api_url}/object/{bucket}/{path.lstrip('/')}"
+        try:
+            client = get_http_client(self.base_api_url)
+            response = await client.delete(url, headers=self.headers, timeout=settings.http_timeout)
+            if response.status_code != 200:
+                LOGGER.error(
+                    f"Failed to delete file from Supabase: {response.text}",
+                    extra={"bucket": bucket, "path": path, "status_code": response.status_code}
+                )
+                raise AppError(f"Delete failed: {response.text}")
+        except AppError:
+            raise
+        except Exception as e:
+            LOGGER.error(f"Error deleting file from Supabase: {str(e)}", exc_info=True)
+            raise AppError(f"Storage delete error: {str(e)}", original_error=e)
+
     async def get_signed_url(
         self, 
         bucket: str, 
@@ -104,49 +161,49 @@ class StorageService:
         url = f"{self.base_api_url}/object/sign/{bucket}/{path}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json={"expiresIn": expires_in},
-                    timeout=settings.http_timeout
-                )
+            client = get_http_client(self.base_api_url)
+            response = await client.post(
+                url,
+                headers=self.headers,
+                json={"expiresIn": expires_in},
+                timeout=settings.http_timeout
+            )
                 
-                if response.status_code != 200:
-                    LOGGER.error(
-                        f"Failed to generate signed URL: {response.text}",
-                        extra={"bucket": bucket, "path": path, "status_code": response.status_code}
-                    )
-                    raise AppError(f"Signed URL generation failed: {response.text}")
+            if response.status_code != 200:
+                LOGGER.error(
+                    f"Failed to generate signed URL: {response.text}",
+                    extra={"bucket": bucket, "path": path, "status_code": response.status_code}
+                )
+                raise AppError(f"Signed URL generation failed: {response.text}")
                 
-                data = response.json()
-                signed_path = data.get("signedURL")
-                if not signed_path:
-                    raise AppError("Supabase response did not contain signedURL")
+            data = response.json()
+            signed_path = data.get("signedURL")
+            if not signed_path:
+                raise AppError("Supabase response did not contain signedURL")
                 
-                # Force the structure requested: 
-                # {supabase_url}/storage/v1/object/sign/{bucket}/{path}?token={token}
+            # Force the structure requested: 
+            # {supabase_url}/storage/v1/object/sign/{bucket}/{path}?token={token}
                 
-                # Extract token from signed_path
-                token = ""
-                if "?token=" in signed_path:
-                    token = signed_path.split("?token=")[1]
-                elif "&token=" in signed_path:
-                    token = signed_path.split("&token=")[1]
+            # Extract token from signed_path
+            token = ""
+            if "?token=" in signed_path:
+                token = signed_path.split("?token=")[1]
+            elif "&token=" in signed_path:
+                token = signed_path.split("&token=")[1]
                     
-                # Construct clean URL
-                # Ensure no double slashes in path parts
-                clean_path = path.lstrip("/")
+            # Construct clean URL
+            # Ensure no double slashes in path parts
+            clean_path = path.lstrip("/")
                 
-                # Base URL should not have trailing slash
-                base_url = self.url.rstrip("/")
+            # Base URL should not have trailing slash
+            base_url = self.url.rstrip("/")
                 
-                signed_url = f"{base_url}/storage/v1/object/sign/{bucket}/{clean_path}?token={token}"
+            signed_url = f"{base_url}/storage/v1/object/sign/{bucket}/{clean_path}?token={token}"
 
-                return {
-                    "signed_url": signed_url,
-                    "storage_path": path
-                }
+            return {
+                "signed_url": signed_url,
+                "storage_path": path
+            }
                 
         except Exception as e:
             LOGGER.error(f"Error generating signed URL: {str(e)}", exc_info=True)
@@ -170,3 +227,103 @@ class StorageService:
         """
         result = await self.get_signed_url(bucket, path, expires_in)
         return result["signed_url"]
+
+    async def iter_file_chunks(
+        self,
+        bucket: str,
+        path: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """Stream a stored object in chunks using the service role key.
+
+        Args:
+            bucket: Bucket name.
+            path: Object path.
+            chunk_size: Chunk size in bytes.
+
+        Yields:
+            Content chunks.
+
+        Raises:
+            AppError: If the download fails.
+        """
+        url = f"{self.base_api_url}/object/{bucket}/{path.lstrip('/')}"
+        client = get_http_client(self.base_api_url)
+        async with client.stream(
+            "GET", url, headers=self.headers, timeout=settings.http_timeout
+        ) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                LOGGER.error(
+                    f"Failed to download file from Supabase: {body[:500]!r}",
+                    extra={"bucket": bucket, "path": path, "status_code": response.status_code}
+                )
+                raise AppError(f"Download failed with status {response.status_code}")
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    @asynccontextmanager
+    async def local_document(
+        self,
+        bucket: str,
+        path: str,
+        checksum: Optional[str] = None,
+    ) -> AsyncIterator[CachedDocument]:
+        """Provide a local copy of a stored document, downloading it at most once.
+
+        Docling, pdfplumber and re-run stages read the yielded path instead
+        of fetching the object again. The copy is protected from cache
+        eviction until the block exits.
+
+        Args:
+            bucket: Bucket name.
+            path: Object path.
+            checksum: Expected SHA-256 of the content, if known.
+
+        Yields:
+            CachedDocument pointing at the local file.
+        """
+        async with get_document_cache().lease(
+            storage_key=f"{bucket}/{path}",
+            fetch_chunks=lambda: self.iter_file_chunks(bucket, path),
+            checksum=checksum,
+        ) as cached:
+            yield cached
+
+    @asynccontextmanager
+    async def document_source(
+        self,
+        bucket: str,
+        path: str,
+        checksum: Optional[str] = None,
+        expires_in: int = 3600,
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """Provide a document from the local cache, or a signed URL if it cannot be cached.
+
+        Args:
+            bucket: Bucket name.
+            path: Object path.
+            checksum: Expected SHA-256 of the content, if known.
+            expires_in: Validity of the fallback signed URL in seconds.
+
+        Yields:
+            Tuple of (local path or signed URL, local path or None)
+        """
+        async with AsyncExitStack() as stack:
+            try:
+                cached = await stack.enter_async_context(
+                    self.local_document(bucket=bucket, path=path, checksum=checksum)
+                )
+            except Exception as e:
+                LOGGER.warning(
+                    f"Could not cache document locally, falling back to signed URL: {e}",
+                    extra={"bucket": bucket, "path": path, "error": str(e)}
+                )
+                cached = None
+
+            if cached is not None:
+                yield cached.path, cached.path
+            else:
+                # Bucket "docs" is private, so the fallback needs a signed URL
+                url = await self.create_download_url(bucket=bucket, path=path, expires_in=expires_in)
+                yield url, None
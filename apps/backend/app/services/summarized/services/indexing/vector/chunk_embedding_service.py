@@ -8,6 +8,7 @@ Uses the same embedding model (all-MiniLM-L6-v2, 384-dim) as the entity-level
 embeddings for consistency.
 """
 
+import asyncio
 import hashlib
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -18,6 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import DocumentChunk
 from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
+from app.services.embedding_service import get_embedding_service
 from app.utils.logging import get_logger
 
 LOGGER = get_logger(__name__)
@@ -36,22 +38,13 @@ class ChunkEmbeddingService:
     - source_chunk_id = FK to document_chunks.id
     """
 
-    MODEL_NAME = "all-MiniLM-L6-v2"
     EMBEDDING_DIM = 384
 
     def __init__(self, session: AsyncSession):
         self.session = session
         self.vector_repo = VectorEmbeddingRepository(session)
-        self._model = None
-
-    @property
-    def model(self):
-        """Lazy loader for the SentenceTransformer model."""
-        if self._model is None:
-            from sentence_transformers import SentenceTransformer
-            LOGGER.info(f"Loading embedding model: {self.MODEL_NAME}")
-            self._model = SentenceTransformer(self.MODEL_NAME)
-        return self._model
+        self.embedder = get_embedding_service()
+        self.model_name = self.embedder.model_name
 
     async def generate_chunk_embeddings(
         self,
@@ -111,7 +104,7 @@ class ChunkEmbeddingService:
             "chunks_embedded": embeddings_created,
             "total_chunks": len(chunks),
             "status": "completed",
-            "model": self.MODEL_NAME,
+            "model": self.model_name,
         }
 
     async def _fetch_chunks(self, document_id: UUID) -> List[DocumentChunk]:
@@ -178,7 +171,7 @@ class ChunkEmbeddingService:
             f"Batch encoding {len(texts)} chunk texts",
             extra={"document_id": str(document_id)},
         )
-        vectors = self.model.encode(texts, show_progress_bar=False).tolist()
+        vectors = await asyncio.to_thread(self.embedder.encode, texts)
 
         # Store each embedding
         embeddings_created = 0
@@ -194,7 +187,7 @@ class ChunkEmbeddingService:
                     section_type=chunk.effective_section_type or chunk.section_type or "unknown",
                     entity_type="chunk",
                     entity_id=entity_id,
-                    embedding_model=self.MODEL_NAME,
+                    embedding_model=self.model_name,
                     embedding_dim=self.EMBEDDING_DIM,
                     embedding_version="v1",
                     embedding=vector,
@@ -220,7 +213,7 @@ class ChunkEmbeddingService:
         Prefers contextualized text (with section header) over raw text.
         """
         # Check if contextualized_text is stored in additional_metadata
-        # (saved by SectionChunkRepository.create_hybrid_chunk)
+        # (saved by SectionChunkRepository.save_chunking_result)
         if chunk.raw_text:
             # Build a context-enriched version with section info
             parts = []
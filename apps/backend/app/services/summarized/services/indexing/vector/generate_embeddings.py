@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import json
 from typing import List, Dict, Any, Optional, Tuple
@@ -6,8 +7,13 @@ from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 
 
+from app.core.config import settings
 from app.services.base_service import BaseService
-from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
+from app.services.embedding_service import get_embedding_service
+from app.repositories.vector_embedding_repository import (
+    ENTITY_METADATA_COLUMNS,
+    VectorEmbeddingRepository,
+)
 from app.repositories.section_extraction_repository import SectionExtractionRepository
 from app.repositories.workflow_repository import WorkflowDocumentRepository
 from app.repositories.entity_repository import EntityRepository
@@ -17,7 +23,7 @@ from app.utils.canonical_key import generate_canonical_key, extract_normalized_v
 
 LOGGER = get_logger(__name__)
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
@@ -110,14 +116,28 @@ class SectionProcessorFactory:
 SectionProcessorFactory.initialize_default_processors()
 
 
+@dataclass
+class EmbeddingEntry:
+    """A templated business unit ready to be embedded."""
+    section_type: str
+    entity_type: str
+    entity_id: str
+    data: Dict[str, Any]
+    text: str
+    content_hash: str
+    # Filter columns (ENTITY_METADATA_COLUMNS), resolved before diffing
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
 class GenerateEmbeddingsService(BaseService):
     """Service for generating vector embeddings for document sections.
     
     This service implements the high-accuracy vector indexing strategy:
     1. Retrieves extracted sections for a document.
     2. Uses templates to create deterministic semantic text for each business unit.
-    3. Generates 384-dimensional embeddings using 'all-MiniLM-L6-v2'.
-    4. Persists embeddings in pgvector for semantic recall.
+    3. Skips units whose text (content_hash) already has a stored vector.
+    4. Generates 384-dimensional embeddings using 'all-MiniLM-L6-v2' in batches.
+    5. Persists embeddings in pgvector for semantic recall.
     """
 
     def __init__(self, session):
@@ -129,17 +149,10 @@ class GenerateEmbeddingsService(BaseService):
         self.workflow_doc_repo = WorkflowDocumentRepository(session)
         self.entity_repo = EntityRepository(session)
         self.template_service = VectorTemplateService()
-        self.model_name = "all-MiniLM-L6-v2"
-        self._model = None  # Lazy load the model
-
-    @property
-    def model(self):
-        """Lazy loader for the SentenceTransformer model."""
-        if self._model is None:
-            from sentence_transformers import SentenceTransformer
-            LOGGER.info(f"Loading embedding model: {self.model_name}")
-            self._model = SentenceTransformer(self.model_name)
-        return self._model
+        # Process-wide model, shared with retrieval and citation resolution
+        self.embedder = get_embedding_service()
+        self.model_name = self.embedder.model_name
+        self.batch_size = settings.embedding.batch_size
 
     async def run(
         self, 
@@ -148,6 +161,11 @@ class GenerateEmbeddingsService(BaseService):
         target_sections: Optional[List[str]] = None
     ) -> EmbeddingResult:
         """Generate and store embeddings for all sections of a document.
+
+        Re-indexing is incremental: rows whose entity and content hash are
+        unchanged keep their vector (only changed filter metadata such as the
+        canonical entity or policy dates is updated), vectors for text already
+        embedded elsewhere are reused, and only the remaining texts are encoded.
         
         Args:
             document_id: UUID of the document to process
@@ -157,9 +175,6 @@ class GenerateEmbeddingsService(BaseService):
         Returns:
             EmbeddingResult with processing statistics
         """
-        # 0. Clean up existing embeddings for this document to avoid duplicates
-        await self.vector_repo.delete_by_document(document_id)
-
         # 1. Fetch all section extractions for this document
         sections = await self._fetch_sections(document_id, workflow_id)
 
@@ -167,116 +182,205 @@ class GenerateEmbeddingsService(BaseService):
             LOGGER.info(f"Filtering embeddings for target sections: {target_sections}")
             sections = [s for s in sections if s.section_type in target_sections]
 
-        if not sections:
+        # 2. Build deterministic texts for every business unit
+        entries = await self._collect_entries(sections)
+        await self._resolve_entry_metadata(entries)
+
+        # 3. Diff against what is already stored for this document/workflow
+        existing = await self.vector_repo.get_entity_embedding_states(
+            document_id, workflow_id, self.model_name, section_types=target_sections
+        )
+        new_entries, metadata_updates, stale_ids = self._diff_entries(entries, existing)
+
+        # 4. Embed only new or changed content, then write in bulk
+        vectors = await self._embed_entries(new_entries)
+        rows = self._build_rows(new_entries, vectors, document_id, workflow_id)
+
+        removed = await self.vector_repo.delete_by_ids(stale_ids)
+        updated = await self.vector_repo.update_metadata_by_ids(metadata_updates)
+        written = await self.vector_repo.bulk_create(rows)
+
+        await self.session.commit()
+
+        unchanged = len(entries) - len(new_entries)
+        LOGGER.info(
+            f"Indexed {len(entries)} embeddings for document {document_id}",
+            extra={
+                "document_id": str(document_id),
+                "written": written,
+                "unchanged": unchanged,
+                "updated": updated,
+                "removed": removed,
+            }
+        )
+
+        if not entries:
             LOGGER.info(f"No sections found for indexing (document: {document_id})")
             return EmbeddingResult(
                 vector_dimension=384, 
                 chunks_embedded=0, 
-                storage_details={"status": "no_sections_to_index"}
+                storage_details={"status": "no_sections_to_index", "removed": removed}
             )
-
-        # 2. Process each section and generate embeddings
-        embeddings_created = await self._process_all_sections(sections, document_id, workflow_id)
-
-        await self.session.commit()
         
         return EmbeddingResult(
             vector_dimension=384,
-            chunks_embedded=embeddings_created,
-            storage_details={"status": "success", "model": self.model_name}
+            chunks_embedded=written + unchanged,
+            storage_details={
+                "status": "success",
+                "model": self.model_name,
+                "written": written,
+                "unchanged": unchanged,
+                "updated": updated,
+                "removed": removed,
+            }
         )
 
     async def _fetch_sections(self, document_id: UUID, workflow_id: UUID) -> List:
         """Fetch section extractions for the document and workflow."""
         return await self.section_repo.get_by_document_and_workflow(document_id, workflow_id)
 
-    async def _process_all_sections(
-        self, 
-        sections: List, 
-        document_id: UUID, 
-        workflow_id: Optional[UUID]
-    ) -> int:
-        """Process all sections and return count of embeddings created."""
-        embeddings_created = 0
-        
+    async def _collect_entries(self, sections: List) -> List[EmbeddingEntry]:
+        """Template every entity of every section into an EmbeddingEntry."""
+        entries: List[EmbeddingEntry] = []
+
         for section in sections:
             section_type = section.section_type
             data = section.extracted_fields
             
             # Use factory to get appropriate processor
             processor = SectionProcessorFactory.get_processor(section_type)
-            entities = processor.get_entities(data)
-            
-            # Process each entity
-            for entity_data, entity_id_suffix, entity_type in entities:
-                embeddings_created += await self._process_entry(
-                    document_id, 
-                    workflow_id,
-                    section_type, 
-                    entity_data, 
-                    entity_id_suffix, 
-                    entity_type, 
-                )
-        
-        return embeddings_created
 
-    async def _process_entry(
-        self, 
-        document_id: UUID, 
-        workflow_id: UUID,
-        section_type: str, 
-        data: Dict[str, Any],
-        entity_id_suffix: str,
-        entity_type: str,
-    ) -> int:
-        """Process a single unit of data, generate embedding and save."""
-        try:
-            # Generate deterministic text
-            text = await self.template_service.run(section_type, data)
-            if not text or len(text.strip()) < 10:
-                return 0
+            for entity_data, entity_id_suffix, entity_type in processor.get_entities(data):
+                try:
+                    # Generate deterministic text
+                    text = await self.template_service.run(section_type, entity_data)
+                except Exception as e:
+                    LOGGER.error(f"Failed to template {section_type} for embedding: {e}", exc_info=True)
+                    continue
+
+                if not text or len(text.strip()) < 10:
+                    continue
+
+                entries.append(EmbeddingEntry(
+                    section_type=section_type,
+                    entity_type=entity_type,
+                    entity_id=f"{section_type}_{entity_id_suffix}",
+                    data=entity_data,
+                    text=text,
+                    content_hash=hashlib.sha256(text.encode()).hexdigest(),
+                ))
+
+        return entries
+
+    async def _resolve_entry_metadata(self, entries: List[EmbeddingEntry]) -> None:
+        """Fill in each entry's filter metadata, resolving canonical entities in one query."""
+        keys: List[Optional[Tuple[str, str]]] = []
+        for entry in entries:
+            entry.metadata = self._extract_metadata(entry.data)
+            keys.append(self._canonical_entity_key(entry.entity_type, entry.data))
+
+        canonical_ids = await self._resolve_canonical_entities(keys)
+        for entry, key in zip(entries, keys):
+            entry.metadata["canonical_entity_id"] = canonical_ids.get(key) if key else None
+
+    @staticmethod
+    def _diff_entries(
+        entries: List[EmbeddingEntry],
+        existing: List[Tuple[UUID, str, str, Dict[str, Any]]],
+    ) -> Tuple[List[EmbeddingEntry], List[Dict[str, Any]], List[UUID]]:
+        """Split entries into rows to write, rows to update and rows that are stale.
+
+        An existing row is kept when an entry has the same entity_id and
+        content_hash; if its filter metadata differs it is updated in place.
+        Every other existing row is stale.
 
-            # Check if this content has changed (deterministic)
-            content_hash = hashlib.sha256(text.encode()).hexdigest()
-            
-            # Generate ID for the entity
-            entity_id = f"{section_type}_{entity_id_suffix}"
+        Returns:
+            Tuple of (entries to write, metadata updates by id, ids of stored rows to delete)
+        """
+        stored: Dict[Tuple[str, str], List[Tuple[UUID, Dict[str, Any]]]] = {}
+        for row_id, entity_id, content_hash, metadata in existing:
+            stored.setdefault((entity_id, content_hash), []).append((row_id, metadata))
 
-            # Generate embedding vector
-            vector = self.model.encode(text).tolist()
+        new_entries = []
+        updates = []
+        for entry in entries:
+            matches = stored.get((entry.entity_id, entry.content_hash))
+            if not matches:
+                new_entries.append(entry)
+                continue
 
-            # Extract and parse metadata
-            metadata = self._extract_metadata(data)
+            row_id, metadata = matches.pop()
+            wanted = {name: entry.metadata.get(name) for name in ENTITY_METADATA_COLUMNS}
+            if metadata != wanted:
+                updates.append({"id": row_id, **wanted})
 
-            # Attempt to resolve canonical entity (best-effort bridge)
-            canonical_entity_id = await self._resolve_canonical_entity(
-                entity_type, data
-            )
+        stale_ids = [row_id for rows in stored.values() for row_id, _ in rows]
+        return new_entries, updates, stale_ids
 
-            # Save embedding
-            await self.vector_repo.create(
-                document_id=document_id,
-                section_type=section_type,
-                entity_type=entity_type,
-                entity_id=entity_id,
-                embedding_model=self.model_name,
-                embedding_dim=384,
-                embedding_version="v1",
-                embedding=vector,
-                content_hash=content_hash,
-                workflow_id=workflow_id,
-                canonical_entity_id=canonical_entity_id,
-                effective_date=metadata["effective_date"],
-                expiration_date=metadata["expiration_date"],
-                location_id=metadata["location_id"],
-                status="EMBEDDED",
-                embedded_at=datetime.now(timezone.utc)
+    async def _embed_entries(self, entries: List[EmbeddingEntry]) -> Dict[str, List[float]]:
+        """Get a vector for each distinct content hash, encoding only unseen text.
+
+        Returns:
+            Dict mapping content hash to vector
+        """
+        if not entries:
+            return {}
+
+        texts_by_hash = {entry.content_hash: entry.text for entry in entries}
+        vectors = await self.vector_repo.get_vectors_by_content_hash(
+            list(texts_by_hash), self.model_name
+        )
+
+        to_encode = [(h, t) for h, t in texts_by_hash.items() if h not in vectors]
+        if to_encode:
+            LOGGER.info(
+                f"Batch encoding {len(to_encode)} texts "
+                f"({len(vectors)} reused from identical content)"
             )
-            return 1
-            
-        except Exception as e:
-            LOGGER.error(f"Failed to process embedding for {section_type}: {e}", exc_info=True)
-            return 0
+            # Model inference is CPU-bound; keep it off the event loop
+            encoded = await asyncio.to_thread(
+                self.embedder.encode,
+                [text for _, text in to_encode],
+                batch_size=self.batch_size,
+            )
+            for (content_hash, _), vector in zip(to_encode, encoded):
+                vectors[content_hash] = vector
+
+        return vectors
+
+    def _build_rows(
+        self,
+        entries: List[EmbeddingEntry],
+        vectors: Dict[str, List[float]],
+        document_id: UUID,
+        workflow_id: UUID,
+    ) -> List[Dict[str, Any]]:
+        """Build VectorEmbedding column values for entries to write."""
+        rows = []
+        embedded_at = datetime.now(timezone.utc)
+
+        for entry in entries:
+            vector = vectors.get(entry.content_hash)
+            if vector is None:
+                continue
+
+            rows.append({
+                "document_id": document_id,
+                "section_type": entry.section_type,
+                "entity_type": entry.entity_type,
+                "entity_id": entry.entity_id,
+                "embedding_model": self.model_name,
+                "embedding_dim": 384,
+                "embedding_version": "v1",
+                "embedding": vector,
+                "content_hash": entry.content_hash,
+                "workflow_id": workflow_id,
+                **{name: entry.metadata.get(name) for name in ENTITY_METADATA_COLUMNS},
+                "status": "EMBEDDED",
+                "embedded_at": embedded_at,
+            })
+
+        return rows
 
     def _extract_metadata(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and parse metadata from entity data."""
@@ -303,14 +407,13 @@ class GenerateEmbeddingsService(BaseService):
             "location_id": str(loc_id) if loc_id else None
         }
 
-    async def _resolve_canonical_entity(
-        self,
+    @staticmethod
+    def _canonical_entity_key(
         entity_type: str,
         entity_data: Dict[str, Any]
-    ) -> Optional[UUID]:
-        """Attempt to resolve the canonical entity for this embedding.
+    ) -> Optional[Tuple[str, str]]:
+        """Build the (entity_type, canonical_key) of an entity.
 
-        Best-effort lookup to bridge vector embeddings to canonical entities.
         Uses the same canonical key generation algorithm as EntityResolver.
 
         Args:
@@ -318,38 +421,49 @@ class GenerateEmbeddingsService(BaseService):
             entity_data: Dictionary of entity attributes
 
         Returns:
-            UUID of canonical entity if found, None otherwise
+            Lookup key, or None if the entity has no normalized value
         """
         try:
-            # Extract normalized value using shared utility
             normalized_value = extract_normalized_value(entity_type.title(), entity_data)
             if not normalized_value:
                 return None
+            return entity_type.title(), generate_canonical_key(entity_type.title(), normalized_value)
+        except Exception as e:
+            LOGGER.warning(
+                f"Failed to build canonical key for {entity_type}: {e}",
+                extra={"entity_type": entity_type}
+            )
+            return None
 
-            # Generate canonical key using shared algorithm
-            canonical_key = generate_canonical_key(entity_type.title(), normalized_value)
+    async def _resolve_canonical_entities(
+        self,
+        keys: List[Optional[Tuple[str, str]]]
+    ) -> Dict[Tuple[str, str], UUID]:
+        """Resolve canonical entities for many keys in one query.
 
-            # Look up canonical entity by key
-            canonical_entity = await self.entity_repo.get_by_key(
-                entity_type.title(), canonical_key
-            )
+        Best-effort lookup to bridge vector embeddings to canonical entities.
 
-            if canonical_entity:
-                LOGGER.debug(
-                    f"Resolved canonical entity for {entity_type}",
-                    extra={
-                        "entity_type": entity_type,
-                        "canonical_key": canonical_key,
-                        "canonical_entity_id": str(canonical_entity.id)
-                    }
-                )
-                return canonical_entity.id
+        Args:
+            keys: (entity_type, canonical_key) per entry; None entries are skipped
 
-            return None
+        Returns:
+            Dict mapping found keys to canonical entity IDs
+        """
+        unique_keys = list({key for key in keys if key})
+        if not unique_keys:
+            return {}
 
+        try:
+            found = await self.entity_repo.get_by_keys(unique_keys)
         except Exception as e:
             LOGGER.warning(
-                f"Failed to resolve canonical entity for {entity_type}: {e}",
-                extra={"entity_type": entity_type}
+                f"Failed to resolve canonical entities: {e}",
+                extra={"keys": len(unique_keys)}
             )
-            return None
\ No newline at end of file
+            return {}
+
+        LOGGER.debug(
+            f"Resolved {len(found)} of {len(unique_keys)} canonical entities",
+            extra={"resolved": len(found), "keys": len(unique_keys)}
+        )
+        return {key: entity_id for key, (entity_id, _) in found.items()}
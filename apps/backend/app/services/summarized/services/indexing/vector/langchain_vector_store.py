@@ -6,6 +6,31 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 
 from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
+from app.services.embedding_service import get_embedding_service
+
+
+class SharedModelEmbeddings(Embeddings):
+    """LangChain Embeddings backed by the process-wide embedding service.
+
+    Avoids loading a second copy of the model through HuggingFaceEmbeddings;
+    the async methods go through micro-batching and the query cache.
+    """
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents synchronously."""
+        return get_embedding_service().encode(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query synchronously (bypasses the query cache)."""
+        return get_embedding_service().encode([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents without blocking the event loop."""
+        return await get_embedding_service().embed(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a query through the shared query cache."""
+        return await get_embedding_service().embed_query(text)
 
 
 class BridgedVectorStore(VectorStore):
@@ -38,7 +63,7 @@ class BridgedVectorStore(VectorStore):
         self, query: str, k: int = 4, **kwargs: Any
     ) -> List[Document]:
         """Perform a similarity search using the repository."""
-        query_embedding = self._embeddings.embed_query(query)
+        query_embedding = await self._embeddings.aembed_query(query)
         
         # Extract filters from kwargs
         document_id = kwargs.get("document_id")
@@ -59,7 +84,7 @@ class BridgedVectorStore(VectorStore):
         self, query: str, k: int = 4, **kwargs: Any
     ) -> List[Document]:
         """Asynchronous similarity search."""
-        query_embedding = self._embeddings.embed_query(query)
+        query_embedding = await self._embeddings.aembed_query(query)
         
         document_id = kwargs.get("document_id")
         section_type = kwargs.get("section_type")
@@ -99,7 +124,7 @@ class BridgedVectorStore(VectorStore):
         self, query: str, k: int = 4, **kwargs: Any
     ) -> List[Tuple[Document, float]]:
         """Asynchronous similarity search with distance scores."""
-        query_embedding = self._embeddings.embed_query(query)
+        query_embedding = await self._embeddings.aembed_query(query)
         
         document_id = kwargs.get("document_id")
         section_type = kwargs.get("section_type")
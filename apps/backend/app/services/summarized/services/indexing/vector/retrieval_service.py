@@ -3,7 +3,6 @@ from uuid import UUID
 import re
 from datetime import datetime
 
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_classic.retrievers.multi_query import MultiQueryRetriever
 from langchain_core.documents import Document
@@ -13,7 +12,10 @@ from app.repositories.vector_embedding_repository import VectorEmbeddingReposito
 from app.repositories.section_extraction_repository import SectionExtractionRepository
 from app.services.summarized.services.indexing.vector.vector_template_service import VectorTemplateService
 from app.services.summarized.services.indexing.vector.intent_classifier_service import IntentClassifierService
-from app.services.summarized.services.indexing.vector.langchain_vector_store import BridgedVectorStore
+from app.services.summarized.services.indexing.vector.langchain_vector_store import (
+    BridgedVectorStore,
+    SharedModelEmbeddings,
+)
 from app.services.summarized.constants import (
     DOMAIN_KEYWORDS, 
     TERM_MAPPINGS, 
@@ -42,7 +44,7 @@ class RetrievalService(BaseService):
         self.section_repo = SectionExtractionRepository(session)
         self.template_service = VectorTemplateService()
         self.intent_classifier = IntentClassifierService()
-        self.model_name = "all-MiniLM-L6-v2"
+        self.model_name = settings.embedding.model_name
         
         # Lazy loaders for LangChain/ML components
         self._embeddings = None
@@ -57,11 +59,10 @@ class RetrievalService(BaseService):
         self.general_section_boost = GENERAL_SECTION_BOOST
 
     @property
-    def embeddings(self) -> HuggingFaceEmbeddings:
-        """Lazy loader for HuggingFaceEmbeddings."""
+    def embeddings(self) -> SharedModelEmbeddings:
+        """LangChain embeddings backed by the process-wide embedding model."""
         if self._embeddings is None:
-            LOGGER.info(f"Loading embedding model: {self.model_name}")
-            self._embeddings = HuggingFaceEmbeddings(model_name=self.model_name)
+            self._embeddings = SharedModelEmbeddings()
         return self._embeddings
 
     @property
@@ -279,7 +280,7 @@ class RetrievalService(BaseService):
         # Step 5: Domain-specific Reranking
         scored_results = []
         if docs:
-            query_vec = self.embeddings.embed_query(processed_query)
+            query_vec = await self.embeddings.aembed_query(processed_query)
 
         for doc in docs:
             # Base similarity score
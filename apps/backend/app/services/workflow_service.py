@@ -1,5 +1,6 @@
 """Workflow service for orchestrating document processing pipelines."""
 
+import base64
 from uuid import UUID
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
@@ -26,6 +27,28 @@ from app.core.temporal_client import get_temporal_client
 
 LOGGER = get_logger(__name__)
 
+_TERMINAL_STATUSES = {"completed", "failed"}
+
+
+def encode_workflow_cursor(created_at: datetime, workflow_id: UUID) -> str:
+    """Encode the position of a workflow in the listing as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{workflow_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_workflow_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from encode_workflow_cursor into (created_at, id).
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, workflow_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(workflow_id)
+    except ValueError as e:
+        raise ValidationError(f"Invalid workflow cursor: {cursor}") from e
+
 
 class WorkflowService(BaseService):
     """Service for managing document processing workflows.
@@ -752,34 +775,85 @@ class WorkflowService(BaseService):
         include_documents: bool = True,
         include_stages: bool = True,
         include_events: bool = True,
-        events_limit: int = 5
+        events_limit: int = 5,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """List workflows with comprehensive dashboard data."""
-        filters = {"user_id": user_id}
-        workflows = await self.wf_repo.get_all_with_relationships(
-            skip=offset, 
-            limit=limit, 
-            filters=filters,
+        """List workflows with comprehensive dashboard data.
+
+        Workflows are returned newest first from a single projection query.
+        Pass the returned next_cursor to fetch the following page; offset is
+        kept for positional paging and ignored when a cursor is given.
+
+        Args:
+            user_id: Owner of the workflows
+            limit: Max workflows per page
+            offset: Workflows to skip when no cursor is given
+            include_documents: Include document summaries
+            include_stages: Include stage runs
+            include_events: Include the latest events
+            events_limit: Latest events per workflow
+            cursor: next_cursor of the previous page
+
+        Returns:
+            Dict with total, workflows and next_cursor (None on the last page)
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        after = decode_workflow_cursor(cursor) if cursor else None
+        rows = await self.wf_repo.list_workflow_summaries(
+            user_id,
+            limit=limit + 1,
+            after=after,
+            offset=offset,
             include_documents=include_documents,
             include_stages=include_stages,
-            include_events=include_events
+            include_events=include_events,
+            events_limit=events_limit,
         )
-        total = await self.wf_repo.count(filters=filters)
-        
-        workflow_items = []
-        for wf in workflows:
-            item = await self._build_workflow_list_item(
-                wf, 
-                include_documents=include_documents,
-                include_stages=include_stages,
-                include_events=include_events,
-                events_limit=events_limit
-            )
-            workflow_items.append(item)
-            
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if rows:
+            total = rows[0]["total"]
+        elif after is None and not offset:
+            total = 0
+        else:
+            total = await self.wf_repo.count(filters={"user_id": user_id})
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_workflow_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
         return {
             "total": total,
-            "workflows": workflow_items
+            "workflows": [self._summary_to_list_item(row) for row in rows],
+            "next_cursor": next_cursor,
+        }
+
+    def _summary_to_list_item(self, row: Any) -> Dict[str, Any]:
+        """Build a workflow list item from a list_workflow_summaries row."""
+        activity = [row["last_stage_at"], row["last_event_at"]]
+        duration = self._lifecycle_duration(
+            row["status"], row["created_at"], row["updated_at"], [at for at in activity if at]
+        )
+        return {
+            "id": row["id"],
+            "temporal_workflow_id": row["temporal_workflow_id"],
+            "workflow_name": row["workflow_name"],
+            "definition_id": row["workflow_definition_id"],
+            "definition_name": row["definition_name"] or "Unknown",
+            "workflow_type": row["workflow_type"] or "unknown",
+            "status": row["status"],
+            "metrics": self._document_metrics(
+                row["documents_total"], row["documents_completed"], row["documents_failed"], duration
+            ),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "duration_seconds": duration,
+            "documents": row["documents"] or [],
+            "stages": row["stages"] or [],
+            "recent_events": row["recent_events"] or [],
         }
 
     async def _build_workflow_list_item(
@@ -860,7 +934,6 @@ class WorkflowService(BaseService):
         total_docs = len(workflow.workflow_documents) if workflow.workflow_documents else 0
         completed_docs = 0
         failed_docs = 0
-        processing_docs = 0
         
         if workflow.workflow_documents:
             for wd in workflow.workflow_documents:
@@ -869,52 +942,80 @@ class WorkflowService(BaseService):
                     completed_docs += 1
                 elif status == "failed":
                     failed_docs += 1
-                else:
-                    processing_docs += 1
-                    
+
+        return self._document_metrics(
+            total_docs, completed_docs, failed_docs, self._get_total_duration(workflow)
+        )
+
+    @staticmethod
+    def _document_metrics(
+        total_docs: int,
+        completed_docs: int,
+        failed_docs: int,
+        total_duration: Optional[float],
+    ) -> Dict[str, Any]:
+        """Shape document counts into the metrics of a workflow list item."""
         progress = 0
         if total_docs > 0:
             progress = int((completed_docs / total_docs) * 100)
-            
-        # Calculate total duration if terminal
-        total_duration = self._get_total_duration(workflow)
-            
+
         return {
             "documents_total": total_docs,
             "documents_completed": completed_docs,
             "documents_failed": failed_docs,
-            "documents_processing": processing_docs,
+            "documents_processing": total_docs - completed_docs - failed_docs,
             "progress_percent": progress,
             "total_duration_seconds": total_duration
         }
 
     def _get_total_duration(self, workflow: Any) -> Optional[float]:
         """Calculate total workflow duration in seconds."""
-        if not workflow.created_at:
+        activity = []
+        # updated_at can be stale on terminal workflows; stage runs and
+        # events tell when the last activity actually happened
+        if workflow.status in _TERMINAL_STATUSES:
+            if workflow.stage_runs:
+                activity.extend([sr.completed_at for sr in workflow.stage_runs if sr.completed_at])
+                activity.extend([sr.started_at for sr in workflow.stage_runs if sr.started_at])
+            if workflow.events:
+                activity.extend([e.created_at for e in workflow.events if e.created_at])
+
+        return self._lifecycle_duration(
+            workflow.status, workflow.created_at, workflow.updated_at, activity
+        )
+
+    @staticmethod
+    def _lifecycle_duration(
+        status: str,
+        created_at: Optional[datetime],
+        updated_at: Optional[datetime],
+        activity: List[datetime],
+    ) -> Optional[float]:
+        """Duration in seconds from creation to the latest activity (or now while running).
+
+        Args:
+            status: Workflow status
+            created_at: Workflow creation time
+            updated_at: Workflow last update time
+            activity: Stage and event timestamps of the workflow
+
+        Returns:
+            Duration in seconds, or None if it cannot be determined
+        """
+        if not created_at:
             return None
 
         # Authoritative source: workflow lifecycle
-        if workflow.status in {"completed", "failed"} and workflow.updated_at:
-            # If updated_at is very close to created_at but we have stages/events, 
-            # it might be stale. Let's find the true end time.
-            potential_ends = [workflow.updated_at]
-            
-            if workflow.stage_runs:
-                potential_ends.extend([sr.completed_at for sr in workflow.stage_runs if sr.completed_at])
-                potential_ends.extend([sr.started_at for sr in workflow.stage_runs if sr.started_at])
-            
-            if workflow.events:
-                potential_ends.extend([e.created_at for e in workflow.events if e.created_at])
-            
+        if status in _TERMINAL_STATUSES and updated_at:
             # Use the latest known activity as the end time
-            end_time = max(potential_ends)
-            duration = (end_time - workflow.created_at).total_seconds()
+            end_time = max([updated_at, *activity])
+            duration = (end_time - created_at).total_seconds()
             return max(duration, 0)
 
         # Running workflow: created_at -> now (using UTC)
-        if workflow.status == "running":
+        if status == "running":
             now = datetime.now(timezone.utc)
-            duration = (now - workflow.created_at).total_seconds()
+            duration = (now - created_at).total_seconds()
             return max(duration, 0)
 
         return None
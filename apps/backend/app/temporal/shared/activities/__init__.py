@@ -1,4 +1,4 @@
-from .ocr import extract_ocr
+from .ocr import extract_ocr, plan_ocr_shards, extract_ocr_shard, finalize_ocr_shards
 from .table_extraction import extract_tables
 from .page_analysis import extract_page_signals
 from .chunking import perform_hybrid_chunking
@@ -17,6 +17,9 @@ from .indexing import (
 
 __all__ = [
     "extract_ocr",
+    "plan_ocr_shards",
+    "extract_ocr_shard",
+    "finalize_ocr_shards",
     "extract_tables",
     "extract_page_signals",
     "perform_hybrid_chunking",
@@ -1,10 +1,13 @@
 """OCR activities for OCR Extraction."""
 
+from contextlib import asynccontextmanager
 from temporalio import activity
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
+import asyncio
 import time
 
+from app.core.config import settings
 from app.core.database import async_session_maker
 from app.pipeline.ocr_extraction import OCRExtractionPipeline
 from app.utils.logging import get_logger
@@ -14,15 +17,73 @@ from app.services.storage_service import StorageService
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def _load_document_source(session, document_id: str) -> AsyncIterator[Tuple[str, Optional[str]]]:
+    """Resolve a local copy of a document through the shared document cache.
+
+    The PDF is downloaded at most once per worker host; Docling and
+    pdfplumber both read the cached file instead of fetching it again. The
+    cached file is protected from eviction until the block exits.
+
+    Yields:
+        Tuple of (source for Docling, local PDF path or None). If the cache
+        cannot be populated, falls back to a signed URL without a local path.
+    """
+    from app.repositories.document_repository import DocumentRepository
+    doc_repo = DocumentRepository(session)
+    document = await doc_repo.get_by_id(UUID(document_id))
+
+    if not document or not document.file_path:
+        raise ValueError(f"Document {document_id} not found or has no file path")
+
+    async with StorageService().document_source(
+        bucket="docs",
+        path=document.file_path,
+        checksum=document.checksum,
+        expires_in=3600,  # 1 hour for extraction
+    ) as (document_source, pdf_path):
+        if pdf_path:
+            activity.logger.info(
+                f"Using cached PDF for extraction: {pdf_path}",
+                extra={"document_id": document_id}
+            )
+        yield document_source, pdf_path
+
+
+def _count_pdf_pages(pdf_path: str) -> int:
+    """Count pages in a local PDF without rendering any of them."""
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def build_page_shards(page_count: int, shard_size: int) -> List[List[int]]:
+    """Split 1..page_count into inclusive [first, last] page ranges.
+
+    Args:
+        page_count: Total pages in the document
+        shard_size: Maximum pages per shard
+
+    Returns:
+        Ordered list of [first_page, last_page] pairs
+    """
+    shard_size = max(shard_size, 1)
+    return [
+        [first, min(first + shard_size - 1, page_count)]
+        for first in range(1, page_count + 1, shard_size)
+    ]
+
+
 @ActivityRegistry.register("shared", "extract_ocr")
 @activity.defn
 async def extract_ocr(
     workflow_id: str,
-    document_id: str, 
+    document_id: str,
 ) -> Dict:
     """Extract OCR text from document and persist pages to database."""
     start = time.time()
-    
+
     try:
         activity.logger.info(
             f"[Phase 2: Full OCR] Starting OCR extraction for all pages "
@@ -31,60 +92,23 @@ async def extract_ocr(
                 "document_id": document_id,
             }
         )
-        
+
         async with async_session_maker() as session:
-            # Get document URL
-            from app.repositories.document_repository import DocumentRepository
-            doc_repo = DocumentRepository(session)
-            document = await doc_repo.get_by_id(UUID(document_id))
-
-            if not document or not document.file_path:
-                raise ValueError(f"Document {document_id} not found or has no file path")
-
-            # Load PDF bytes for coordinate extraction (enables page dimensions)
-            pdf_bytes = None
-            
-            # Use signed URL for storage access (bucket "docs" is private)
-            storage_service = StorageService()
-            document_url = await storage_service.create_download_url(
-                bucket="docs",
-                path=document.file_path,
-                expires_in=3600 # 1 hour for extraction
-            )
-            
-            try:
-                # Download from signed URL
-                import httpx
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(document_url, timeout=120.0)
-                    response.raise_for_status()
-                    pdf_bytes = response.content
-
-                activity.logger.info(
-                    f"Loaded PDF bytes for coordinate extraction: {len(pdf_bytes)} bytes",
-                    extra={"document_id": document_id}
-                )
-            except Exception as e:
-                activity.logger.warning(
-                    f"Could not load PDF bytes for coordinate extraction: {e}",
-                    extra={"document_id": document_id, "error": str(e)}
-                )
+            async with _load_document_source(session, document_id) as (document_source, pdf_path):
+                # Create pipeline and extract pages
+                pipeline = OCRExtractionPipeline(session)
 
-            # Create pipeline and extract pages
-            pipeline = OCRExtractionPipeline(session)
+                # Docling and coordinate extraction both read the cached local file
+                pages = await pipeline.extract_and_store_pages(
+                    document_id=UUID(document_id),
+                    document_url=document_source,
+                    pdf_path=pdf_path,
+                )
 
-            # Pass (signed) document_url for coordinate extraction and page dimensions
-            pages = await pipeline.extract_and_store_pages(
-                document_id=UUID(document_id),
-                document_url=document_url,
-                pdf_bytes=pdf_bytes,
-            )
-            
             await session.commit()
-            
+
             pages_processed = [int(p.page_number) for p in pages]
-            markdown_pages = [(p.markdown, int(p.page_number), p.metadata) for p in pages]
-            
+
             activity.logger.info(
                 "OCR Extraction Complete",
                 extra={
@@ -92,13 +116,13 @@ async def extract_ocr(
                     "pages_processed": pages_processed,
                 }
             )
-        
+
         return {
             "document_id": document_id,
             "page_count": len(pages),
             "pages_processed": pages_processed,
         }
-        
+
     except Exception as e:
         activity.logger.error(
             f"OCR extraction failed for {document_id}: {e}",
@@ -114,3 +138,130 @@ async def extract_ocr(
             f"OCR extraction duration: {duration:.2f}s",
             extra={"document_id": document_id, "duration_seconds": duration}
         )
+
+
+@ActivityRegistry.register("shared", "plan_ocr_shards")
+@activity.defn
+async def plan_ocr_shards(
+    workflow_id: str,
+    document_id: str,
+) -> Dict:
+    """Decide whether a document is OCR'd in one activity or as page-range shards.
+
+    Returns:
+        Dict with page_count and shards ([first, last] page ranges). An empty
+        shard list means the document is small enough for extract_ocr.
+    """
+    async with async_session_maker() as session:
+        async with _load_document_source(session, document_id) as (_, pdf_path):
+            if not pdf_path:
+                # Without a local copy we cannot count pages; fall back to a single activity
+                return {"document_id": document_id, "page_count": 0, "shards": []}
+
+            page_count = await asyncio.to_thread(_count_pdf_pages, pdf_path)
+
+    shards: List[List[int]] = []
+    if page_count > settings.ocr.shard_threshold_pages:
+        shards = build_page_shards(page_count, settings.ocr.shard_size_pages)
+
+    activity.logger.info(
+        f"OCR plan for {document_id}: {page_count} pages, {len(shards)} shards",
+        extra={"document_id": document_id, "page_count": page_count, "shard_count": len(shards)}
+    )
+
+    return {"document_id": document_id, "page_count": page_count, "shards": shards}
+
+
+@ActivityRegistry.register("shared", "extract_ocr_shard")
+@activity.defn
+async def extract_ocr_shard(
+    workflow_id: str,
+    document_id: str,
+    first_page: int,
+    last_page: int,
+) -> Dict:
+    """OCR one page range of a document and persist just those pages.
+
+    Each shard replaces only its own pages, so a retry redoes a single shard.
+    """
+    start = time.time()
+    page_range = (first_page, last_page)
+
+    try:
+        async with async_session_maker() as session:
+            async with _load_document_source(session, document_id) as (document_source, pdf_path):
+                pipeline = OCRExtractionPipeline(session)
+                pages = await pipeline.extract_and_store_pages(
+                    document_id=UUID(document_id),
+                    document_url=document_source,
+                    pdf_path=pdf_path,
+                    page_range=page_range,
+                )
+
+            await session.commit()
+
+        return {
+            "document_id": document_id,
+            "page_range": [first_page, last_page],
+            "pages_processed": [int(p.page_number) for p in pages],
+        }
+
+    except Exception as e:
+        activity.logger.error(
+            f"OCR shard {first_page}-{last_page} failed for {document_id}: {e}",
+            extra={
+                "document_id": document_id,
+                "page_range": page_range,
+                "error_type": type(e).__name__
+            }
+        )
+        raise
+    finally:
+        duration = time.time() - start
+        activity.logger.info(
+            f"OCR shard {first_page}-{last_page} duration: {duration:.2f}s",
+            extra={"document_id": document_id, "duration_seconds": duration}
+        )
+
+
+@ActivityRegistry.register("shared", "finalize_ocr_shards")
+@activity.defn
+async def finalize_ocr_shards(
+    workflow_id: str,
+    document_id: str,
+    page_count: int,
+) -> Dict:
+    """Verify that sharded OCR produced every page and return the merged result.
+
+    Returns:
+        Same shape as extract_ocr: document_id, page_count, pages_processed
+    """
+    from app.repositories.document_repository import DocumentRepository
+
+    async with async_session_maker() as session:
+        doc_repo = DocumentRepository(session)
+        stale = await doc_repo.delete_pages_after(UUID(document_id), page_count)
+        pages_processed = await doc_repo.get_page_numbers(UUID(document_id))
+        await session.commit()
+
+    missing = sorted(set(range(1, page_count + 1)) - set(pages_processed))
+    if missing:
+        raise ValueError(
+            f"Sharded OCR for {document_id} is missing {len(missing)} pages "
+            f"(first missing: {missing[:10]})"
+        )
+
+    activity.logger.info(
+        "Sharded OCR Extraction Complete",
+        extra={
+            "document_id": document_id,
+            "page_count": page_count,
+            "stale_pages_removed": stale,
+        }
+    )
+
+    return {
+        "document_id": document_id,
+        "page_count": len(pages_processed),
+        "pages_processed": pages_processed,
+    }
@@ -44,16 +44,17 @@ async def extract_page_signals(document_id: str) -> List[Dict]:
                 )
             else:
                 from app.services.storage_service import StorageService
-                storage_service = StorageService()
-                signed_url = await storage_service.create_download_url(
+                # Read from the local document cache so the later OCR stage
+                # reuses the same download; a signed URL if caching fails
+                async with StorageService().document_source(
                     bucket="docs",
                     path=document.file_path,
-                    expires_in=3600 # 1 hour
-                )
-                signals = await pipeline.extract_signals(
-                    document_id=UUID(document_id), 
-                    document_url=signed_url
-                )
+                    checksum=document.checksum,
+                ) as (document_source, _):
+                    signals = await pipeline.extract_signals(
+                        document_id=UUID(document_id), 
+                        document_url=document_source
+                    )
             
             await session.commit()
             return [s.dict() for s in signals]
@@ -86,13 +87,21 @@ async def extract_page_signals_from_markdown(
 
 @ActivityRegistry.register("shared", "classify_pages")
 @activity.defn
-async def classify_pages(document_id: str, page_signals: List[Dict]) -> List[Dict]:
+async def classify_pages(
+    document_id: str,
+    page_signals: List[Dict],
+    workflow_id: Optional[str] = None,
+) -> List[Dict]:
     """Classify pages using rule-based classifier with duplicate detection."""
     try:
         async with async_session_maker() as session:
             pipeline = PageAnalysisPipeline(session)
             signals_objs = [PageSignals(**s) for s in page_signals]
-            classifications = await pipeline.classify_pages(document_id=UUID(document_id), page_signals=signals_objs)
+            classifications = await pipeline.classify_pages(
+                document_id=UUID(document_id),
+                page_signals=signals_objs,
+                workflow_id=UUID(workflow_id) if workflow_id else None,
+            )
             await session.commit()
             return [c.model_dump(mode='json') for c in classifications]
     except Exception as e:
@@ -1,5 +1,6 @@
 """Mixin for shared document processing logic."""
 
+import asyncio
 from datetime import timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
@@ -125,17 +126,7 @@ class DocumentProcessingMixin:
         )
 
         # OCR Extraction
-        ocr_data = await workflow.execute_activity(
-            "extract_ocr",
-            args=[workflow_id, document_id],
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=RetryPolicy(
-                maximum_attempts=5,
-                initial_interval=timedelta(seconds=5),
-                maximum_interval=timedelta(seconds=60),
-                backoff_coefficient=2.0,
-            ),
-        )
+        ocr_data = await self._execute_ocr(workflow_id, document_id)
 
         await workflow.execute_activity(
             "update_stage_status",
@@ -176,7 +167,7 @@ class DocumentProcessingMixin:
         
         classifications = await workflow.execute_activity(
             "classify_pages",
-            args=[document_id, page_signals],
+            args=[document_id, page_signals, workflow_id],
             start_to_close_timeout=timedelta(minutes=2),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
@@ -277,6 +268,79 @@ class DocumentProcessingMixin:
             "classified": True,
         }
 
+    async def _execute_ocr(self, workflow_id: str, document_id: str) -> Dict[str, Any]:
+        """Run OCR as a single activity, or as parallel page-range shards for large PDFs.
+
+        Histories recorded before sharding was introduced replay the single
+        extract_ocr activity (patch "ocr-shards").
+        """
+        ocr_retry_policy = RetryPolicy(
+            maximum_attempts=5,
+            initial_interval=timedelta(seconds=5),
+            maximum_interval=timedelta(seconds=60),
+            backoff_coefficient=2.0,
+        )
+
+        if workflow.patched("ocr-shards"):
+            return await self._execute_sharded_ocr(workflow_id, document_id, ocr_retry_policy)
+        else:
+            return await workflow.execute_activity(
+                "extract_ocr",
+                args=[workflow_id, document_id],
+                start_to_close_timeout=timedelta(minutes=10),
+                retry_policy=ocr_retry_policy,
+            )
+
+    async def _execute_sharded_ocr(
+        self, workflow_id: str, document_id: str, ocr_retry_policy: RetryPolicy
+    ) -> Dict[str, Any]:
+        """Plan OCR shards and run them in parallel, or a single extract_ocr for small PDFs."""
+        plan = await workflow.execute_activity(
+            "plan_ocr_shards",
+            args=[workflow_id, document_id],
+            start_to_close_timeout=timedelta(minutes=2),
+            retry_policy=RetryPolicy(
+                maximum_attempts=3,
+                initial_interval=timedelta(seconds=5),
+                maximum_interval=timedelta(seconds=30),
+                backoff_coefficient=2.0,
+            ),
+        )
+        shards = plan.get("shards") or []
+
+        if len(shards) <= 1:
+            return await workflow.execute_activity(
+                "extract_ocr",
+                args=[workflow_id, document_id],
+                start_to_close_timeout=timedelta(minutes=10),
+                retry_policy=ocr_retry_policy,
+            )
+
+        workflow.logger.info(
+            f"Sharding OCR for {document_id}: {plan['page_count']} pages in {len(shards)} shards"
+        )
+
+        # Each shard persists its own pages; a failed shard is retried on its own
+        await asyncio.gather(*[
+            workflow.execute_activity(
+                "extract_ocr_shard",
+                args=[workflow_id, document_id, first_page, last_page],
+                start_to_close_timeout=timedelta(minutes=10),
+                retry_policy=ocr_retry_policy,
+            )
+            for first_page, last_page in shards
+        ])
+
+        return await workflow.execute_activity(
+            "finalize_ocr_shards",
+            args=[workflow_id, document_id, plan["page_count"]],
+            start_to_close_timeout=timedelta(minutes=1),
+            retry_policy=RetryPolicy(
+                maximum_attempts=3,
+                initial_interval=timedelta(seconds=5),
+            ),
+        )
+
     async def _execute_extraction_stage(
         self,
         workflow_id: str,
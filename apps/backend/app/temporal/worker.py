@@ -17,6 +17,9 @@ from fastapi import FastAPI
 import uvicorn
 import httpx
 
+# Workers size their database pool separately from the API process
+os.environ.setdefault("DATABASE_PROCESS_ROLE", "worker")
+
 from app.core.config import settings
 
 
@@ -36,7 +39,15 @@ app = FastAPI(title="Temporal Worker Health Check")
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "service": "temporal-worker"}
+    from app.core.database import engine, get_pool_metrics
+    from app.services.processed.services.ocr.ocr_executor import get_ocr_executor_stats
+
+    return {
+        "status": "ok",
+        "service": "temporal-worker",
+        "database": {"pool": get_pool_metrics(engine)},
+        "ocr": get_ocr_executor_stats(),
+    }
 
 @app.get("/")
 async def root():
@@ -132,11 +143,22 @@ async def main():
     
     # Run health check server, workers, and keep-alive ping concurrently
     # The health check server binds to the port immediately, satisfying Render's requirements
-    await asyncio.gather(
-        run_health_check_server(), 
-        run_workers()
+    from app.core.http_client import close_http_clients
+    from app.services.processed.services.ocr.ocr_executor import shutdown_ocr_executor
+    from app.services.processed.services.ocr.coordinate_extraction_service import (
+        shutdown_coordinate_pool,
     )
 
+    try:
+        await asyncio.gather(
+            run_health_check_server(), 
+            run_workers()
+        )
+    finally:
+        shutdown_ocr_executor()
+        shutdown_coordinate_pool()
+        await close_http_clients()
+
 
 if __name__ == "__main__":
     try:
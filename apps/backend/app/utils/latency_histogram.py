@@ -0,0 +1,92 @@
+"""Fixed-bucket latency histograms for pipeline stages.
+
+Each GraphRAG query reports per-stage latencies in its response metadata;
+these histograms aggregate them per process so tail latency (p95/p99) per
+stage can be read from the health endpoint without a metrics backend.
+"""
+
+import bisect
+import math
+import threading
+from typing import Dict, List, Sequence
+
+# Upper bucket bounds in milliseconds; the last bucket is unbounded
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.bounds: List[float] = sorted(buckets_ms)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        """Record one latency."""
+        index = bisect.bisect_left(self.bounds, value_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_ms += value_ms
+            self.max_ms = max(self.max_ms, value_ms)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket holding it.
+
+        Values in the overflow bucket report the maximum observed latency.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return float(self.bounds[index]) if index < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, object]:
+        """Summary suitable for JSON responses."""
+        with self._lock:
+            buckets = {
+                (f"le_{bound:g}" if index < len(self.bounds) else "le_inf"): count
+                for index, (bound, count) in enumerate(zip(self.bounds + [0], self.counts))
+            }
+            return {
+                "count": self.count,
+                "mean_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+                "max_ms": self.max_ms,
+                "p50_ms": self.quantile(0.50),
+                "p95_ms": self.quantile(0.95),
+                "p99_ms": self.quantile(0.99),
+                "buckets": buckets,
+            }
+
+
+_stage_histograms: Dict[str, LatencyHistogram] = {}
+_registry_lock = threading.Lock()
+
+
+def observe_stage_latencies(stage_latencies: Dict[str, float]) -> None:
+    """Record one query's per-stage latencies (milliseconds)."""
+    for stage, value_ms in stage_latencies.items():
+        histogram = _stage_histograms.get(stage)
+        if histogram is None:
+            with _registry_lock:
+                histogram = _stage_histograms.setdefault(stage, LatencyHistogram())
+        histogram.observe(value_ms)
+
+
+def stage_latency_snapshot() -> Dict[str, Dict[str, object]]:
+    """Snapshot of all stage histograms, keyed by stage name."""
+    return {stage: histogram.snapshot() for stage, histogram in sorted(_stage_histograms.items())}
+
+
+def reset_stage_latencies() -> None:
+    """Drop all recorded stage latencies."""
+    with _registry_lock:
+        _stage_histograms.clear()
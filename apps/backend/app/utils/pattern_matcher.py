@@ -0,0 +1,188 @@
+"""Precompiled multi-pattern matching for rule-based text classification.
+
+The page classifiers test every page against hundreds of keyword regexes.
+``PatternSet`` compiles a group of patterns once and pairs each with a
+literal that every match must contain (derived from the regex itself).
+A page is case-folded once, and only patterns whose literal occurs in it
+are searched. Typically only a handful of the patterns survive the
+literal check, so a page is a few substring scans instead of hundreds of
+regex searches. Results are identical to ``re.search`` with the same
+flags.
+"""
+
+import re
+from re import _parser as sre_parse
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple, Union
+
+# Characters that re.IGNORECASE treats as "i" but str.casefold() does not
+_FOLD_FIXES = str.maketrans({"İ": "i", "ı": "i"})
+
+# Shorter literals filter out too little to be worth checking
+_MIN_LITERAL_LENGTH = 3
+
+
+def fold_text(text: str) -> str:
+    """Case-fold text for literal prefiltering."""
+    return text.translate(_FOLD_FIXES).casefold()
+
+
+def required_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """Find the longest literal string every match of a regex must contain.
+
+    Only the top-level sequence of the pattern is inspected: literal
+    characters there are mandatory, while branches, classes and optional
+    repeats end the current run.
+
+    Args:
+        pattern: Regular expression
+        flags: Flags the pattern is compiled with
+
+    Returns:
+        Literal substring, or None when no useful literal exists
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except (re.error, TypeError):
+        return None
+
+    runs: List[str] = []
+    current: List[str] = []
+
+    def flush():
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            current.append(chr(av))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, sre_parse.POSSESSIVE_REPEAT):
+            low, _, body = av
+            # "x+" guarantees one "x" after the current run, then anything may follow
+            if low >= 1 and len(body) == 1 and body[0][0] is sre_parse.LITERAL:
+                current.append(chr(body[0][1]))
+            flush()
+        else:
+            flush()
+    flush()
+
+    best = max(runs, key=len, default="")
+    if len(best) < _MIN_LITERAL_LENGTH:
+        return None
+    return best
+
+
+class PatternSet:
+    """A group of regexes compiled once and matched with a literal prefilter.
+
+    Patterns can be grouped by key (e.g. page type) so a single call returns
+    per-group results for one text.
+
+    Attributes:
+        flags: Flags every pattern is compiled with
+    """
+
+    def __init__(
+        self,
+        patterns: Union[Mapping[Hashable, Sequence[str]], Sequence[str]],
+        flags: int = re.IGNORECASE,
+        prefix: str = "",
+    ):
+        """Compile all patterns.
+
+        Args:
+            patterns: Mapping of group key to patterns, or a flat list
+                (stored under the key None)
+            flags: Regex flags
+            prefix: Regex prepended to every pattern (e.g. a line anchor)
+        """
+        if not isinstance(patterns, Mapping):
+            patterns = {None: patterns}
+
+        self.flags = flags
+        self._fold = bool(flags & re.IGNORECASE)
+        self._groups: Dict[Hashable, List[Tuple[Pattern, Optional[str]]]] = {}
+
+        for key, group in patterns.items():
+            compiled = []
+            for pattern in group:
+                full = prefix + pattern
+                literal = required_literal(full, flags)
+                if literal is not None and self._fold:
+                    literal = fold_text(literal)
+                compiled.append((re.compile(full, flags), literal))
+            self._groups[key] = compiled
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self._groups.values())
+
+    def keys(self) -> Iterable[Hashable]:
+        """Group keys in insertion order."""
+        return self._groups.keys()
+
+    def _prepare(self, text: str) -> str:
+        return fold_text(text) if self._fold else text
+
+    @staticmethod
+    def _candidate(literal: Optional[str], folded: str) -> bool:
+        return literal is None or literal in folded
+
+    def count(self, text: str) -> Dict[Hashable, int]:
+        """Count matching patterns per group.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Mapping of group key to the number of its patterns that match;
+            groups without matches are omitted
+        """
+        folded = self._prepare(text)
+        counts: Dict[Hashable, int] = {}
+        for key, group in self._groups.items():
+            matches = sum(
+                1
+                for pattern, literal in group
+                if self._candidate(literal, folded) and pattern.search(text)
+            )
+            if matches:
+                counts[key] = matches
+        return counts
+
+    def matching_keys(self, text: str) -> List[Hashable]:
+        """Keys of all groups with at least one matching pattern, in order."""
+        folded = self._prepare(text)
+        return [key for key in self._groups if self._group_matches(key, text, folded)]
+
+    def first(self, text: str) -> Optional[Hashable]:
+        """Key of the first group (in insertion order) with a matching pattern."""
+        folded = self._prepare(text)
+        for key in self._groups:
+            if self._group_matches(key, text, folded):
+                return key
+        return None
+
+    def search(self, text: str, key: Hashable = None) -> bool:
+        """Whether any pattern in a group matches.
+
+        Args:
+            text: Text to search
+            key: Group key (None for flat pattern lists)
+        """
+        return self._group_matches(key, text, self._prepare(text))
+
+    def find(self, text: str, key: Hashable = None) -> Optional[re.Match]:
+        """First pattern (in list order) of a group that matches, as a match object."""
+        folded = self._prepare(text)
+        for pattern, literal in self._groups[key]:
+            if self._candidate(literal, folded):
+                match = pattern.search(text)
+                if match:
+                    return match
+        return None
+
+    def _group_matches(self, key: Hashable, text: str, folded: str) -> bool:
+        return any(
+            self._candidate(literal, folded) and pattern.search(text)
+            for pattern, literal in self._groups[key]
+        )
@@ -0,0 +1,121 @@
+"""Unit tests for database engine pooling configuration."""
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import InstrumentedAsyncQueuePool, PoolWaitStats, build_engine, get_pool_metrics
+
+
+@pytest.fixture
+def pool_mode(monkeypatch):
+    """Override the configured pool mode for a single test."""
+
+    def _set(mode: str):
+        monkeypatch.setattr(settings.db, "pool_mode", mode)
+
+    return _set
+
+
+class TestBuildEngine:
+    """Tests for build_engine pool selection."""
+
+    def test_queue_mode_uses_instrumented_pool(self, pool_mode):
+        pool_mode("queue")
+        engine = build_engine(role="api")
+
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+        assert engine.pool.size() == settings.db.pool_size
+
+    def test_worker_role_uses_worker_sizing(self, pool_mode):
+        pool_mode("queue")
+        engine = build_engine(role="worker")
+
+        assert engine.pool.size() == settings.db.worker_pool_size
+
+    def test_null_mode_disables_pooling(self, pool_mode):
+        pool_mode("null")
+        engine = build_engine(role="api")
+
+        assert isinstance(engine.pool, NullPool)
+        assert get_pool_metrics(engine) == {"mode": "null", "role": "api"}
+
+    def test_pgbouncer_mode_uses_unique_statement_names(self, pool_mode):
+        pool_mode("pgbouncer")
+        engine = build_engine(role="api")
+
+        assert get_pool_metrics(engine)["mode"] == "pgbouncer"
+        assert database._unique_statement_name() != database._unique_statement_name()
+
+
+def _db(url: str, **overrides):
+    return settings.db.model_copy(
+        update={"url": url, "use_local_db": True, "pool_mode": None, "statement_cache_size": None, **overrides}
+    )
+
+
+class TestStatementCache:
+    """Tests for pool mode detection and statement cache sizing."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "postgresql://u:p@aws-0-eu.pooler.supabase.com:5432/db",
+            "postgresql://u:p@db.example.com:6543/db",
+            "postgresql://u:p@db.example.com:5432/db?supa=base-pooler.x",
+        ],
+    )
+    def test_pooler_urls_default_to_pgbouncer_without_cache(self, url):
+        db = _db(url)
+
+        assert db.resolved_pool_mode == "pgbouncer"
+        assert db.resolved_statement_cache_size == 0
+        assert "supa=" not in db.connection_url
+
+    def test_pgbouncer_mode_ignores_configured_cache_size(self):
+        db = _db("postgresql://u:p@localhost:5432/db", pool_mode="pgbouncer", statement_cache_size=100)
+
+        assert db.resolved_statement_cache_size == 0
+
+    def test_direct_url_honours_statement_cache_size_parameter(self):
+        db = _db("postgresql://u:p@localhost:5432/db?statement_cache_size=0&sslmode=require")
+
+        assert db.resolved_pool_mode == "queue"
+        assert db.resolved_statement_cache_size == 0
+        assert db.connection_url == "postgresql+asyncpg://u:p@localhost:5432/db?ssl=require"
+        assert _db("postgresql://u:p@localhost:5432/db").resolved_statement_cache_size == 100
+
+
+class TestPoolMetrics:
+    """Tests for pool metrics reporting."""
+
+    def test_metrics_report_idle_pool(self, pool_mode):
+        pool_mode("queue")
+        engine = build_engine(role="api")
+
+        metrics = get_pool_metrics(engine)
+
+        assert metrics["checked_out"] == 0
+        assert metrics["overflow"] == 0
+        assert metrics["wait"]["checkouts"] == 0
+
+    def test_metrics_report_the_role_max_overflow(self, pool_mode, monkeypatch):
+        pool_mode("queue")
+        monkeypatch.setattr(settings.db, "worker_max_overflow", 7)
+
+        metrics = get_pool_metrics(build_engine(role="worker"))
+
+        assert metrics["max_overflow"] == 7
+
+    def test_wait_stats_snapshot(self):
+        stats = PoolWaitStats()
+        stats.record(0.002)
+        stats.record(0.004, timed_out=True)
+
+        snapshot = stats.snapshot()
+
+        assert snapshot["checkouts"] == 2
+        assert snapshot["avg_wait_ms"] == pytest.approx(3.0)
+        assert snapshot["max_wait_ms"] == pytest.approx(4.0)
+        assert snapshot["timeouts"] == 1
@@ -0,0 +1,57 @@
+"""Unit tests for shared outbound HTTP clients."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core import http_client
+from app.core.http_client import close_http_clients, get_http_client, retry_after_seconds
+from app.core.llm_client import BaseLLMClient
+
+
+@pytest.mark.asyncio
+async def test_one_client_per_origin(monkeypatch):
+    monkeypatch.setattr(http_client, "_clients", {})
+
+    first = get_http_client("https://openrouter.ai/api/v1/chat/completions")
+    assert get_http_client("https://OpenRouter.ai/other") is first
+    assert get_http_client("https://example.supabase.co/storage/v1") is not first
+
+    await close_http_clients()
+
+    assert first.is_closed
+    assert http_client._clients == {}
+    assert get_http_client("https://openrouter.ai/") is not first
+    await close_http_clients()
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ({"Retry-After": "7"}, 7.0),
+        ({"Retry-After": "100000"}, 60.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+        ({}, None),
+    ],
+)
+def test_retry_after_parsing(header, expected):
+    assert retry_after_seconds(httpx.Response(429, headers=header)) == expected
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_waits_for_retry_after(monkeypatch):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(200, json={"ok": True}),
+    ])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses)))
+    monkeypatch.setattr("app.core.llm_client.get_http_client", lambda url: client)
+
+    llm = BaseLLMClient(api_key="k", base_url="https://llm.test/v1", max_retries=3)
+    with patch("app.core.llm_client.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await llm.call_api(payload={"q": 1}) == {"ok": True}
+
+    sleep.assert_awaited_once_with(3.0)
+    await client.aclose()
@@ -0,0 +1,66 @@
+"""Unit tests for the process-wide LLM rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core import llm_rate_limiter
+from app.core.llm_rate_limiter import (
+    LLMRateLimiter,
+    TokenBucket,
+    get_llm_rate_limiter,
+    llm_rate_limiter_stats,
+)
+from app.core.unified_llm import UnifiedLLMClient
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped():
+    limiter = LLMRateLimiter("gemini", max_concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.limit():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.stats()["total_requests"] == 6
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    bucket = TokenBucket(per_minute=6000)  # 100 per second
+
+    assert await bucket.acquire(6000) == 0.0
+    waited = await bucket.acquire(5)
+
+    assert waited == pytest.approx(0.05, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_is_clamped_to_capacity():
+    bucket = TokenBucket(per_minute=60000)
+
+    # Larger than one minute of budget, still served from a full bucket
+    assert await bucket.acquire(10**7) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_clients_share_the_provider_limiter(monkeypatch):
+    monkeypatch.setattr(llm_rate_limiter, "_limiters", {})
+    with patch("app.core.unified_llm.GeminiClient"):
+        first = UnifiedLLMClient("gemini", api_key="k", model="m")
+        second = UnifiedLLMClient("gemini", api_key="k", model="m")
+    for client in (first, second):
+        client.client.generate_content = AsyncMock(return_value="ok")
+
+    await asyncio.gather(first.generate_content("a"), second.generate_content("b"))
+
+    assert get_llm_rate_limiter("gemini").stats()["total_requests"] == 2
+    assert get_llm_rate_limiter("openrouter").stats()["total_requests"] == 0
+    assert llm_rate_limiter_stats()["gemini"]["total_requests"] == 2
@@ -0,0 +1,102 @@
+"""Unit tests for the LLM response cache."""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core import llm_response_cache
+from app.core.config import settings
+from app.core.llm_response_cache import LLMResponseCache, llm_cache_key, llm_response_cache_stats
+from app.core.unified_llm import UnifiedLLMClient
+
+
+def test_key_covers_every_request_input():
+    base = llm_cache_key("gemini", "m", "text", "system", {"temperature": 0})
+
+    assert base == llm_cache_key("gemini", "m", "text", "system", {"temperature": 0})
+    assert base != llm_cache_key("openrouter", "m", "text", "system", {"temperature": 0})
+    assert base != llm_cache_key("gemini", "m2", "text", "system", {"temperature": 0})
+    assert base != llm_cache_key("gemini", "m", "text!", "system", {"temperature": 0})
+    assert base != llm_cache_key("gemini", "m", "text", "other", {"temperature": 0})
+    assert base != llm_cache_key("gemini", "m", "text", "system", {"temperature": 1})
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    cache.put("ab" * 32, "response")
+    assert cache.get("ab" * 32) == "response"
+
+    with patch("app.core.llm_response_cache.time.time", return_value=time.time() + 120):
+        assert cache.get("ab" * 32) is None
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "expired": 1, "evictions": 0, "hit_rate": 0.5}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), ttl_seconds=60, max_bytes=320)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for age, key in zip((30, 20, 10), keys):
+        cache.put(key, "x" * 50)
+        path = cache._entry_path(key)
+        os.utime(path, (time.time() - age, time.time() - age))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+
+    cache.put("ff" * 32, "x" * 50)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.stats()["evictions"] >= 1
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        llm_response_cache, "_llm_response_cache", LLMResponseCache(str(tmp_path), 60, 10**6)
+    )
+    monkeypatch.setattr(settings.llm_cache, "enabled", True)
+    with patch("app.core.unified_llm.GeminiClient"):
+        client = UnifiedLLMClient("gemini", api_key="k", model="m")
+    client.client.generate_content = AsyncMock(return_value='{"ok": true}')
+    return client
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_call_the_llm_once(client):
+    results = await asyncio.gather(*(client.generate_content("same prompt") for _ in range(3)))
+    await client.generate_content("same prompt")
+
+    assert results == ['{"ok": true}'] * 3
+    client.client.generate_content.assert_awaited_once()
+    assert llm_response_cache_stats()["hits"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_call_site_can_bypass_the_cache(client):
+    await client.generate_content("prompt")
+    await client.generate_content("prompt", use_cache=False)
+
+    assert client.client.generate_content.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fallback_responses_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        llm_response_cache, "_llm_response_cache", LLMResponseCache(str(tmp_path), 60, 10**6)
+    )
+    monkeypatch.setattr(settings.llm_cache, "enabled", True)
+    with patch("app.core.unified_llm.OpenRouterClient"), patch("app.core.unified_llm.GeminiClient"):
+        client = UnifiedLLMClient(
+            "openrouter", api_key="k", model="m", fallback_to_gemini=True, gemini_api_key="g"
+        )
+    client.client.generate_content = AsyncMock(side_effect=RuntimeError("primary down"))
+    client.fallback_client.generate_content = AsyncMock(return_value="from gemini")
+
+    assert await client.generate_content("prompt") == "from gemini"
+    assert await client.generate_content("prompt") == "from gemini"
+
+    # The second call missed the cache and tried the primary provider again
+    assert client.client.generate_content.await_count == 2
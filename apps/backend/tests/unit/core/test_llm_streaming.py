@@ -0,0 +1,106 @@
+"""Unit tests for streamed LLM responses."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core.exceptions import APIClientError
+from app.core.llm_client import OpenRouterClient
+from app.core.unified_llm import UnifiedLLMClient
+
+SSE_BODY = (
+    ": OPENROUTER PROCESSING\n\n"
+    'data: {"choices": [{"delta": {"role": "assistant", "content": ""}}]}\n\n'
+    'data: {"choices": [{"delta": {"content": "The limit "}}]}\n\n'
+    'data: {"choices": [{"delta": {"content": "is $1M [1]."}}]}\n\n'
+    'data: {"choices": [{"delta": {}, "finish_reason": "stop"}]}\n\n'
+    "data: [DONE]\n\n"
+)
+
+
+async def _collect(stream):
+    return [delta async for delta in stream]
+
+
+@pytest.mark.asyncio
+async def test_openrouter_stream_yields_content_deltas(monkeypatch):
+    payloads = []
+
+    def handler(request):
+        payloads.append(request.content)
+        return httpx.Response(200, text=SSE_BODY, headers={"Content-Type": "text/event-stream"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr("app.core.llm_client.get_http_client", lambda url: client)
+
+    llm = OpenRouterClient(api_key="k", model="m", base_url="https://llm.test/v1/chat")
+    deltas = await _collect(llm.generate_content_stream("What is the limit?"))
+
+    assert deltas == ["The limit ", "is $1M [1]."]
+    assert b'"stream":true' in payloads[0].replace(b" ", b"")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_openrouter_stream_retries_only_before_first_event(monkeypatch):
+    responses = iter([
+        httpx.Response(503),
+        httpx.Response(200, text=SSE_BODY),
+    ])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses)))
+    monkeypatch.setattr("app.core.llm_client.get_http_client", lambda url: client)
+
+    llm = OpenRouterClient(api_key="k", model="m", base_url="https://llm.test/v1/chat")
+    with patch("app.core.llm_client.asyncio.sleep", new=AsyncMock()):
+        deltas = await _collect(llm.generate_content_stream("prompt"))
+    assert "".join(deltas) == "The limit is $1M [1]."
+
+    error_body = 'data: {"choices": [{"delta": {"content": "The"}}]}\n\ndata: {"error": {"message": "overloaded"}}\n\n'
+    client_error = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=error_body)))
+    monkeypatch.setattr("app.core.llm_client.get_http_client", lambda url: client_error)
+    received = []
+    with pytest.raises(APIClientError):
+        async for delta in llm.generate_content_stream("prompt"):
+            received.append(delta)
+    assert received == ["The"]
+
+    await client.aclose()
+    await client_error.aclose()
+
+
+def _stream(*deltas, error=None):
+    async def generate(**kwargs):
+        for delta in deltas:
+            yield delta
+        if error:
+            raise error
+    return generate
+
+
+@pytest.fixture
+def unified():
+    with patch("app.core.unified_llm.OpenRouterClient"), patch("app.core.unified_llm.GeminiClient"):
+        return UnifiedLLMClient(
+            "openrouter", api_key="k", model="m", fallback_to_gemini=True, gemini_api_key="g"
+        )
+
+
+@pytest.mark.asyncio
+async def test_unified_stream_falls_back_before_first_delta(unified):
+    unified.client.generate_content_stream = _stream(error=APIClientError("down"))
+    unified.fallback_client.generate_content_stream = _stream("from ", "gemini")
+
+    assert await _collect(unified.generate_content_stream("prompt", use_cache=False)) == ["from ", "gemini"]
+
+
+@pytest.mark.asyncio
+async def test_unified_stream_does_not_fall_back_mid_answer(unified):
+    unified.client.generate_content_stream = _stream("partial", error=APIClientError("reset"))
+    unified.fallback_client.generate_content_stream = _stream("from gemini")
+
+    received = []
+    with pytest.raises(APIClientError):
+        async for delta in unified.generate_content_stream("prompt", use_cache=False):
+            received.append(delta)
+    assert received == ["partial"]
@@ -0,0 +1,64 @@
+"""Tests for concurrent section extraction."""
+
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.extracted.services.extraction.section.section_extraction_orchestrator import (
+    SectionExtractionOrchestrator,
+    SectionExtractionResult,
+)
+from app.services.processed.services.chunking.hybrid_models import (
+    HybridChunk,
+    HybridChunkMetadata,
+    SectionSuperChunk,
+    SectionType,
+)
+
+
+def _super_chunk(section_type, priority):
+    return SectionSuperChunk(
+        section_type=section_type,
+        section_name=section_type.value,
+        chunks=[HybridChunk(text=section_type.value, metadata=HybridChunkMetadata(token_count=10))],
+        processing_priority=priority,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sections_run_concurrently_and_keep_priority_order():
+    orchestrator = SectionExtractionOrchestrator(MagicMock(), "gemini")
+    running = 0
+    peak = 0
+    # Lower-priority sections finish first
+    delays = {SectionType.DECLARATIONS: 0.03, SectionType.COVERAGES: 0.02, SectionType.EXCLUSIONS: 0.01}
+
+    async def extract(super_chunk, document_id, workflow_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delays[super_chunk.section_type])
+        running -= 1
+        if super_chunk.section_type == SectionType.COVERAGES:
+            raise RuntimeError("llm error")
+        return SectionExtractionResult(section_type=super_chunk.section_type, confidence=0.9)
+
+    orchestrator.extract_section_compute = extract
+    super_chunks = [
+        _super_chunk(SectionType.EXCLUSIONS, 3),
+        _super_chunk(SectionType.DECLARATIONS, 1),
+        _super_chunk(SectionType.COVERAGES, 2),
+    ]
+
+    result = await orchestrator.extract_all_sections_compute(super_chunks, uuid4(), uuid4())
+
+    assert peak == 3
+    assert [r.section_type for r in result.section_results[:3]] == [
+        SectionType.DECLARATIONS,
+        SectionType.COVERAGES,
+        SectionType.EXCLUSIONS,
+    ]
+    # A failed section yields an empty result instead of failing the document
+    assert result.section_results[1].confidence == 0.0
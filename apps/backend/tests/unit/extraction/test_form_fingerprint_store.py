@@ -0,0 +1,155 @@
+"""Tests for cross-document reuse of standard form extractions."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.extracted.services.extraction.section.form_fingerprint_store import (
+    FormFingerprintKey,
+    extract_form_numbers,
+    fingerprint_form_text,
+)
+from app.services.extracted.services.extraction.section.section_extraction_orchestrator import (
+    SectionExtractionOrchestrator,
+)
+from app.services.processed.services.chunking.hybrid_models import (
+    HybridChunk,
+    HybridChunkMetadata,
+    SectionSuperChunk,
+    SectionType,
+)
+
+FORM_TEXT = "COMMERCIAL GENERAL LIABILITY CG D3 16 11 11\nThis insurance does not apply to ..."
+
+
+def _fingerprint(texts, section_type=SectionType.EXCLUSIONS, prompt="prompt", model="m"):
+    return fingerprint_form_text(texts, section_type, "ExclusionsExtractor", prompt, model)
+
+
+class TestFingerprint:
+    """Fingerprints identify identical form text only."""
+
+    def test_form_numbers_use_page_analyzer_patterns(self):
+        assert extract_form_numbers([FORM_TEXT, "Form IL T4 05 03 11", FORM_TEXT]) == [
+            "CG D3 16 11 11",
+            "IL T4 05 03 11",
+        ]
+
+    def test_formatting_and_package_page_numbers_are_ignored(self):
+        reformatted = FORM_TEXT.replace("\n", "   ").lower() + "\nPage 7 of 42"
+
+        assert _fingerprint([FORM_TEXT]) == _fingerprint([reformatted])
+
+    def test_content_prompt_and_model_change_the_fingerprint(self):
+        base = _fingerprint([FORM_TEXT])
+
+        assert _fingerprint([FORM_TEXT + " except bodily injury"]) != base
+        assert _fingerprint([FORM_TEXT], prompt="other prompt") != base
+        assert _fingerprint([FORM_TEXT], model="other") != base
+
+    def test_text_without_form_number_or_policy_specific_section_is_not_cached(self):
+        assert _fingerprint(["Manuscript endorsement for ACME Corp"]) is None
+        assert _fingerprint([FORM_TEXT], section_type=SectionType.DECLARATIONS) is None
+
+    def test_pages_repeated_across_documents_are_cached_without_form_number(self):
+        notice = "Notice of terrorism insurance coverage under the federal program"
+        key = fingerprint_form_text(
+            [notice], SectionType.EXCLUSIONS, "ExclusionsExtractor", "prompt", "m", repeated_pages=True
+        )
+
+        assert key is not None and key.form_number == "repeated page"
+        assert fingerprint_form_text(
+            [notice], SectionType.DECLARATIONS, "ExclusionsExtractor", "prompt", "m", repeated_pages=True
+        ) is None
+
+
+def _orchestrator(store):
+    orchestrator = SectionExtractionOrchestrator(MagicMock(), "gemini", gemini_model="m")
+    orchestrator.form_store = store
+    return orchestrator
+
+
+def _super_chunk(text):
+    return SectionSuperChunk(
+        section_type=SectionType.EXCLUSIONS,
+        section_name="Exclusions",
+        chunks=[HybridChunk(text=text, metadata=HybridChunkMetadata(token_count=50))],
+        document_id=uuid4(),
+    )
+
+
+def _extractor(response='{"exclusions": [], "confidence": 0.9}'):
+    extractor = MagicMock()
+    extractor.get_extraction_prompt.return_value = "prompt"
+    extractor.client.generate_content = AsyncMock(return_value=response)
+    return extractor
+
+
+@pytest.mark.asyncio
+async def test_known_form_skips_llm_call():
+    store = MagicMock(enabled=True)
+    store.lookup = AsyncMock(return_value={"exclusions": ["war"], "confidence": 0.95})
+    store.store = AsyncMock()
+    orchestrator = _orchestrator(store)
+    extractor = _extractor()
+
+    parsed = await orchestrator._run_extraction_call(extractor, _super_chunk(FORM_TEXT))
+
+    assert parsed == {"exclusions": ["war"], "confidence": 0.95}
+    extractor.client.generate_content.assert_not_awaited()
+    store.store.assert_not_awaited()
+    assert orchestrator.form_cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_new_form_is_extracted_and_stored():
+    store = MagicMock(enabled=True)
+    store.lookup = AsyncMock(return_value=None)
+    store.store = AsyncMock()
+    orchestrator = _orchestrator(store)
+    super_chunk = _super_chunk(FORM_TEXT)
+
+    parsed = await orchestrator._run_extraction_call(_extractor(), super_chunk)
+
+    assert parsed == {"exclusions": [], "confidence": 0.9}
+    key = store.store.await_args.args[0]
+    assert isinstance(key, FormFingerprintKey)
+    assert key.form_number == "CG D3 16 11 11"
+    assert store.store.await_args.kwargs["document_id"] == super_chunk.document_id
+
+
+@pytest.mark.asyncio
+async def test_repeated_pages_without_form_number_are_looked_up():
+    store = MagicMock(enabled=True)
+    store.lookup = AsyncMock(return_value={"exclusions": ["nuclear"], "confidence": 0.9})
+    store.store = AsyncMock()
+    orchestrator = _orchestrator(store)
+    super_chunk = _super_chunk("Nuclear energy liability exclusion applies to all coverages")
+    extractor = _extractor()
+
+    await orchestrator._run_extraction_call(extractor, super_chunk)
+    extractor.client.generate_content.assert_awaited_once()
+
+    # Page 1 repeats a page of another document in the workflow
+    orchestrator.repeated_pages = {1}
+    parsed = await orchestrator._run_extraction_call(extractor, super_chunk)
+
+    assert parsed == {"exclusions": ["nuclear"], "confidence": 0.9}
+    extractor.client.generate_content.assert_awaited_once()
+    store.lookup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_policy_specific_text_always_goes_to_llm():
+    store = MagicMock(enabled=True)
+    store.lookup = AsyncMock()
+    store.store = AsyncMock()
+    orchestrator = _orchestrator(store)
+    extractor = _extractor()
+
+    await orchestrator._run_extraction_call(extractor, _super_chunk("Named insured ACME Corp"))
+
+    extractor.client.generate_content.assert_awaited_once()
+    store.lookup.assert_not_awaited()
+    store.store.assert_not_awaited()
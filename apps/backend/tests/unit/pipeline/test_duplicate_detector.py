@@ -3,8 +3,13 @@
 Tests MinHash-based duplicate detection for insurance document pages.
 """
 
+from uuid import uuid4
+
 import pytest
-from app.services.page_analysis.duplicate_detector import DuplicateDetector
+from app.services.processed.services.analysis.duplicate_detector import (
+    DuplicateDetector,
+    WorkflowPageIndex,
+)
 from app.models.page_analysis_models import PageSignals
 
 
@@ -496,3 +501,95 @@ class TestDuplicateDetectorInsuranceScenarios:
 
 
 
+
+
+class TestDuplicateDetectorFullText:
+    """Test full-text shingling and the LSH index."""
+
+    BODY = (
+        "We will pay those sums that the insured becomes legally obligated to pay "
+        "as damages because of bodily injury or property damage to which this "
+        "insurance applies. We will have the right and duty to defend the insured "
+        "against any suit seeking those damages."
+    )
+
+    def _page(self, page_number, header, body):
+        return PageSignals(
+            page_number=page_number,
+            top_lines=[header],
+            all_lines=[header, body],
+            text_density=0.6,
+            has_tables=False,
+            page_hash=f"p{page_number}",
+        )
+
+    def test_same_header_different_body_not_duplicate(self):
+        """Pages of one form share headers but not bodies."""
+        detector = DuplicateDetector()
+        detector.is_duplicate(self._page(1, "COMMERCIAL GENERAL LIABILITY COVERAGE FORM", self.BODY))
+
+        is_dup, _ = detector.is_duplicate(
+            self._page(2, "COMMERCIAL GENERAL LIABILITY COVERAGE FORM",
+                       "Section IV conditions: bankruptcy of the insured will not relieve us "
+                       "of our obligations under this coverage part. Duties in the event of "
+                       "occurrence, offense, claim or suit apply to every insured.")
+        )
+
+        assert is_dup is False
+
+    def test_many_unique_pages_then_repeat(self):
+        """A repeated page is found among many indexed pages."""
+        detector = DuplicateDetector()
+        for n in range(1, 301):
+            body = " ".join(f"term{n}x{i}" for i in range(60))
+            assert detector.is_duplicate(self._page(n, f"Schedule page {n}", body)) == (False, None)
+
+        is_dup, dup_of = detector.is_duplicate(
+            self._page(301, "Schedule page 17", " ".join(f"term17x{i}" for i in range(60)))
+        )
+
+        assert is_dup is True
+        assert dup_of == 17
+
+
+class TestCrossDocumentMatching:
+    """Test workflow-scoped matching across documents."""
+
+    def _page(self, page_number, text):
+        return PageSignals(
+            page_number=page_number,
+            top_lines=text.split(". ")[:1],
+            all_lines=[text],
+            text_density=0.6,
+            has_tables=False,
+            page_hash=str(page_number),
+        )
+
+    def test_form_repeated_in_another_document_is_matched(self):
+        index = WorkflowPageIndex(similarity_threshold=0.9)
+        form = TestDuplicateDetectorFullText.BODY
+        first_doc, second_doc = uuid4(), uuid4()
+
+        detector = DuplicateDetector(workflow_index=index)
+        detector.is_duplicate(self._page(1, "Declarations. Named insured Acme Corp policy period 2024"))
+        detector.is_duplicate(self._page(2, form))
+        assert detector.match_across_documents(first_doc) == {}
+
+        detector.reset()
+        detector.is_duplicate(self._page(1, "Declarations. Named insured Beta LLC, locations in Ohio"))
+        detector.is_duplicate(self._page(5, form))
+        matches = detector.match_across_documents(second_doc)
+
+        assert list(matches) == [5]
+        assert matches[5][:2] == (first_doc, 2)
+
+    def test_reprocessing_a_document_does_not_match_itself(self):
+        index = WorkflowPageIndex(similarity_threshold=0.9)
+        document_id = uuid4()
+
+        for _ in range(2):
+            detector = DuplicateDetector(workflow_index=index)
+            detector.is_duplicate(self._page(1, TestDuplicateDetectorFullText.BODY))
+            assert detector.match_across_documents(document_id) == {}
+
+        assert len(index) == 1
@@ -0,0 +1,76 @@
+"""Unit tests for overlapping coordinate extraction with Docling OCR."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models.page_data import PageData
+from app.pipeline.ocr_extraction import OCRExtractionPipeline
+
+
+def _record(page_number):
+    return {
+        "page_number": page_number,
+        "width": 612.0,
+        "height": 792.0,
+        "rotation": 0,
+        "words": [{"t": f"p{page_number}", "x0": 1.0, "y0": 2.0, "x1": 3.0, "y1": 4.0}],
+    }
+
+
+def _pipeline(coordinate_service):
+    with patch("app.pipeline.ocr_extraction.OCRService"), patch(
+        "app.pipeline.ocr_extraction.get_coordinate_extraction_service",
+        return_value=coordinate_service,
+    ):
+        pipeline = OCRExtractionPipeline(MagicMock())
+    pipeline.doc_repo = MagicMock(store_pages=AsyncMock())
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_coordinates_run_while_docling_converts():
+    events = []
+
+    async def stream(pdf_source, page_range=None):
+        events.append("coordinates_started")
+        for page_number in (2, 1):  # chunks may finish out of order
+            yield _record(page_number)
+
+    async def extract_pages(**kwargs):
+        await asyncio.sleep(0)
+        events.append("docling_finished")
+        return [PageData(page_number=1, text="a"), PageData(page_number=2, text="b")]
+
+    pipeline = _pipeline(MagicMock(stream_page_coordinates=stream))
+    pipeline.ocr_service.extract_pages = extract_pages
+
+    pages = await pipeline.extract_and_store_pages(
+        document_id=uuid4(), document_url="/tmp/doc.pdf", pdf_path="/tmp/doc.pdf"
+    )
+
+    assert events == ["coordinates_started", "docling_finished"]
+    assert pages[0].width_points == 612.0
+    assert pages[1].word_coordinates[0]["t"] == "p2"
+
+
+@pytest.mark.asyncio
+async def test_coordinate_failure_keeps_ocr_pages():
+    async def stream(pdf_source, page_range=None):
+        raise ValueError("broken pdf")
+        yield  # pragma: no cover
+
+    pipeline = _pipeline(MagicMock(stream_page_coordinates=stream))
+    pipeline.ocr_service.extract_pages = AsyncMock(
+        return_value=[PageData(page_number=1, text="a")]
+    )
+
+    pages = await pipeline.extract_and_store_pages(
+        document_id=uuid4(), document_url="/tmp/doc.pdf", pdf_path="/tmp/doc.pdf"
+    )
+
+    assert pages[0].width_points is None
+    assert pages[0].word_coordinates is None
+    pipeline.doc_repo.store_pages.assert_awaited_once()
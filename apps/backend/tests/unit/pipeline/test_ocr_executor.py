@@ -0,0 +1,78 @@
+"""Unit tests for running Docling conversions off the event loop."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.services.processed.services.ocr.ocr_executor import OCRExecutor
+from app.services.processed.services.ocr.ocr_service import OCRService
+
+
+def _slow_converter(delay: float) -> MagicMock:
+    """Build a fake Docling converter whose convert() blocks for `delay` seconds."""
+    document = MagicMock()
+    document.export_to_markdown.return_value = "Page one<<PAGE_BREAK>>Page two"
+    document.texts = []
+    document.tables = []
+
+    result = MagicMock()
+    result.document = document
+
+    def convert(_url):
+        time.sleep(delay)
+        return result
+
+    converter = MagicMock()
+    converter.convert.side_effect = convert
+    return converter
+
+
+class TestOCRServiceOffLoop:
+    """OCRService must not block the event loop during conversion."""
+
+    @pytest.mark.asyncio
+    async def test_conversion_does_not_block_event_loop(self):
+        service = OCRService(use_process_pool=False)
+        service.converter = _slow_converter(0.3)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        pages = await service.extract_pages("file:///tmp/doc.pdf", uuid4())
+        tick_task.cancel()
+
+        assert [p.page_number for p in pages] == [1, 2]
+        assert ticks >= 5
+        assert service.last_job_metrics.conversion_seconds >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_missing_docling_raises_extraction_error(self):
+        from app.core.exceptions import OCRExtractionError
+
+        service = OCRService(use_process_pool=False)
+        service.converter = None
+
+        with pytest.raises(OCRExtractionError):
+            await service.extract_pages("file:///tmp/doc.pdf", uuid4())
+
+
+class TestOCRExecutorStats:
+    """Tests for executor metric aggregation."""
+
+    def test_stats_before_any_job(self):
+        executor = OCRExecutor(max_workers=2)
+
+        stats = executor.stats()
+
+        assert stats["started"] is False
+        assert stats["submitted"] == 0
+        assert stats["in_flight"] == 0
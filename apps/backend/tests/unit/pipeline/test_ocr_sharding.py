@@ -0,0 +1,23 @@
+"""Unit tests for page-range sharded OCR planning."""
+
+from app.temporal.shared.activities.ocr import build_page_shards
+
+
+class TestBuildPageShards:
+    """Tests for splitting documents into page-range shards."""
+
+    def test_shards_cover_every_page_in_order(self):
+        shards = build_page_shards(page_count=130, shard_size=50)
+
+        assert shards == [[1, 50], [51, 100], [101, 130]]
+
+    def test_exact_multiple_has_no_empty_shard(self):
+        shards = build_page_shards(page_count=100, shard_size=50)
+
+        assert shards == [[1, 50], [51, 100]]
+
+    def test_small_document_is_single_shard(self):
+        assert build_page_shards(page_count=7, shard_size=50) == [[1, 7]]
+
+    def test_empty_document_has_no_shards(self):
+        assert build_page_shards(page_count=0, shard_size=50) == []
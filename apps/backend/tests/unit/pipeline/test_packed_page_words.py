@@ -0,0 +1,57 @@
+"""Unit tests for columnar word-coordinate packing."""
+
+import pytest
+
+from app.services.processed.services.ocr.coordinate_extraction_service import (
+    PackedPageWords,
+)
+
+
+def _words():
+    return [
+        {"t": "Limit", "x0": 10.0, "y0": 700.5, "x1": 40.25, "y1": 712.0},
+        {"t": "of", "x0": 42.0, "y0": 700.5, "x1": 50.0, "y1": 712.0},
+        {"t": "Liabilité", "x0": 52.0, "y0": 700.5, "x1": 90.0, "y1": 712.0},
+    ]
+
+
+class TestPackedPageWords:
+    """Tests for packing and lazily decoding page word coordinates."""
+
+    def test_round_trip_through_stored_buffers(self):
+        packed = PackedPageWords.pack(3, _words())
+
+        stored = PackedPageWords(
+            page_number=3,
+            word_count=packed.word_count,
+            boxes=packed.boxes_buffer,
+            text_offsets=packed.offsets_buffer,
+            text=packed.packed_text,
+        )
+
+        assert stored.texts == ["Limit", "of", "Liabilité"]
+        assert stored.boxes.shape == (3, 4)
+        assert stored.boxes[0].tolist() == pytest.approx([10.0, 700.5, 40.25, 712.0])
+
+        words = stored.to_word_coordinates()
+        assert [w.text for w in words] == ["Limit", "of", "Liabilité"]
+        assert all(w.page_number == 3 for w in words)
+        assert words[2].x1 == pytest.approx(90.0)
+
+    def test_packing_is_compact(self):
+        packed = PackedPageWords.pack(1, _words())
+
+        assert len(packed.boxes_buffer) == 3 * 4 * 4
+        assert len(packed.offsets_buffer) == 4 * 4
+
+    def test_empty_page(self):
+        packed = PackedPageWords.pack(1, [])
+
+        assert packed.word_count == 0
+        assert packed.texts == []
+        assert packed.to_word_coordinates() == []
+
+    def test_nul_characters_are_dropped(self):
+        packed = PackedPageWords.pack(1, [{"t": "a\x00b", "x0": 0, "y0": 0, "x1": 1, "y1": 1}])
+
+        assert packed.texts == ["ab"]
@@ -81,7 +81,7 @@ class TestPageAnalysisPipelineMarkdown:
         )
         
         # Mock the repository
-        pipeline.repository.save_page_signals = AsyncMock()
+        pipeline.repository.save_page_signals_bulk = AsyncMock()
         
         document_id = uuid4()
         signals, doc_type, confidence = await pipeline.extract_signals_from_markdown(
@@ -97,7 +97,7 @@ class TestPageAnalysisPipelineMarkdown:
         # Verify calls
         pipeline.analyzer.analyze_markdown_batch.assert_called_once_with(sample_markdown_pages)
         pipeline.analyzer.markdown_analyzer.detect_document_type.assert_called_once()
-        assert pipeline.repository.save_page_signals.call_count == 3
+        pipeline.repository.save_page_signals_bulk.assert_awaited_once_with(document_id, signals)
 
     @pytest.mark.asyncio
     async def test_detect_document_type_integration(self, mock_session):
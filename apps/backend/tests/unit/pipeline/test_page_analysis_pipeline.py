@@ -74,7 +74,7 @@ class TestPageAnalysisPipelineExtractSignals:
             # Mock the repository
             with patch.object(
                 pipeline.repository,
-                'save_page_signals',
+                'save_page_signals_bulk',
                 new_callable=AsyncMock
             ):
                 document_id = uuid4()
@@ -98,14 +98,15 @@ class TestPageAnalysisPipelineExtractSignals:
             mock_save = AsyncMock()
             with patch.object(
                 pipeline.repository,
-                'save_page_signals',
+                'save_page_signals_bulk',
                 mock_save
             ):
                 document_id = uuid4()
                 await pipeline.extract_signals(document_id, "http://example.com/doc.pdf")
                 
-                # Should save each signal
-                assert mock_save.call_count == 3
+                # Should save all signals in one bulk write
+                mock_save.assert_awaited_once()
+                assert len(mock_save.call_args.args[1]) == 3
 
 
 class TestPageAnalysisPipelineClassifyPages:
@@ -157,7 +158,7 @@ class TestPageAnalysisPipelineClassifyPages:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -174,7 +175,7 @@ class TestPageAnalysisPipelineClassifyPages:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -192,7 +193,7 @@ class TestPageAnalysisPipelineClassifyPages:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -210,7 +211,7 @@ class TestPageAnalysisPipelineClassifyPages:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -248,7 +249,7 @@ class TestPageAnalysisPipelineClassifyPages:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -268,14 +269,57 @@ class TestPageAnalysisPipelineClassifyPages:
         mock_save = AsyncMock()
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             mock_save
         ):
             document_id = uuid4()
             await pipeline.classify_pages(document_id, sample_signals)
             
-            # Should save each classification
-            assert mock_save.call_count == 3
+            # Should save all classifications in one bulk write
+            mock_save.assert_awaited_once()
+            assert len(mock_save.call_args.args[1]) == 3
+
+
+    @pytest.mark.asyncio
+    async def test_cross_document_matches_use_stored_signatures(self, mock_session, monkeypatch):
+        """Pages repeated from another workflow document are matched via the database."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings.page_analysis, "cross_document_duplicates", True)
+        form = " ".join(f"the insurer will pay clause {i} of the standard form" for i in range(20))
+        workflow_id, first_doc, second_doc = uuid4(), uuid4(), uuid4()
+
+        def page(number, text):
+            return PageSignals(
+                page_number=number, top_lines=[text[:40]], all_lines=[text],
+                text_density=0.6, has_tables=False, page_hash=str(number),
+            )
+
+        first = PageAnalysisPipeline(mock_session)
+        first.repository.get_workflow_page_signatures = AsyncMock(return_value=[])
+        first.repository.save_page_classifications_bulk = AsyncMock()
+        await first.classify_pages(first_doc, [page(1, form)], workflow_id=workflow_id)
+        stored = first.repository.save_page_classifications_bulk.await_args.kwargs["signatures"]
+
+        # A different worker classifies the next document from the stored rows
+        second = PageAnalysisPipeline(mock_session)
+        second.repository.get_workflow_page_signatures = AsyncMock(
+            return_value=[(first_doc, number, data) for number, data in stored.items()]
+        )
+        second.repository.save_page_classifications_bulk = AsyncMock()
+        await second.classify_pages(
+            second_doc,
+            [page(1, "Declarations named insured Beta LLC located in Ohio"), page(4, form)],
+            workflow_id=workflow_id,
+        )
+
+        second.repository.get_workflow_page_signatures.assert_awaited_once_with(
+            workflow_id, exclude_document_id=second_doc
+        )
+        saved = second.repository.save_page_classifications_bulk.await_args.args[1]
+        assert saved[0].cross_document_match is None
+        assert saved[1].cross_document_match["document_id"] == str(first_doc)
+        assert saved[1].cross_document_match["page_number"] == 1
 
 
 class TestPageAnalysisPipelineCreateManifest:
@@ -509,7 +553,7 @@ class TestPageAnalysisPipelineV2Alignment:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             with patch.object(
@@ -592,7 +636,7 @@ class TestPageAnalysisPipelineV2Alignment:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
@@ -635,7 +679,7 @@ class TestPageAnalysisPipelineV2Alignment:
         
         with patch.object(
             pipeline.repository,
-            'save_page_classification',
+            'save_page_classifications_bulk',
             new_callable=AsyncMock
         ):
             document_id = uuid4()
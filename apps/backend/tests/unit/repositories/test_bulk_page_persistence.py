@@ -0,0 +1,66 @@
+"""Unit tests for bulk page persistence in DocumentRepository."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.sql.dml import Delete, Insert
+
+from app.models.page_data import PageData
+from app.repositories.document_repository import DocumentRepository
+
+
+def _session():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_store_pages_uses_one_statement_per_table():
+    session = _session()
+    repo = DocumentRepository(session)
+    pages = [
+        PageData(
+            page_number=n,
+            text=f"page {n}",
+            word_coordinates=[{"t": "w", "x0": 0, "y0": 0, "x1": 1, "y1": 1}] if n == 1 else None,
+        )
+        for n in range(1, 401)
+    ]
+
+    await repo.store_pages(uuid4(), pages)
+
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    assert [type(stmt) for stmt in statements] == [Delete, Delete, Insert, Insert]
+    # All page rows go to a single executemany INSERT
+    page_rows = session.execute.await_args_list[2].args[1]
+    assert len(page_rows) == 400
+    assert len(session.execute.await_args_list[3].args[1]) == 1
+    session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_pages_range_scopes_delete():
+    session = _session()
+    repo = DocumentRepository(session)
+
+    await repo.store_pages(uuid4(), [PageData(page_number=51, text="x")], page_range=(51, 100))
+
+    delete_sql = str(session.execute.await_args_list[0].args[0])
+    assert "page_number BETWEEN" in delete_sql
+
+
+@pytest.mark.asyncio
+async def test_delete_pages_after_drops_pages_and_coordinates():
+    session = _session()
+    session.execute.return_value = MagicMock(rowcount=3)
+    repo = DocumentRepository(session)
+
+    deleted = await repo.delete_pages_after(uuid4(), 10)
+
+    tables = [call.args[0].table.name for call in session.execute.await_args_list]
+    assert tables == ["document_pages", "document_page_coordinates"]
+    for call in session.execute.await_args_list:
+        assert "page_number >" in str(call.args[0])
+    assert deleted == 3
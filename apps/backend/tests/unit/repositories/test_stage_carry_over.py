@@ -0,0 +1,42 @@
+"""Unit tests for reusing document-scoped stages across workflows."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.stages_repository import StagesRepository
+
+
+@pytest.mark.asyncio
+async def test_latest_completed_document_stages_are_carried_over():
+    earlier, later = uuid4(), uuid4()
+    runs = [
+        # Ordered newest first, as the query returns them
+        SimpleNamespace(stage_name="processed", workflow_id=later, stage_metadata={"page_count": 12}),
+        SimpleNamespace(stage_name="processed", workflow_id=earlier, stage_metadata={"page_count": 11}),
+    ]
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = runs
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+    repo = StagesRepository(session)
+    repo.update_stage_status = AsyncMock(return_value=True)
+    document_id, workflow_id = uuid4(), uuid4()
+
+    carried = await repo.carry_over_document_stages(document_id, workflow_id)
+
+    assert carried == ["processed"]
+    repo.update_stage_status.assert_awaited_once_with(
+        document_id=document_id,
+        workflow_id=workflow_id,
+        stage_name="processed",
+        status="completed",
+        stage_metadata={"page_count": 12, "reused_from_workflow_id": str(later)},
+    )
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    # Workflow-scoped stages (extraction onwards) are never carried over
+    assert "workflow_document_stage_runs.stage_name IN (__[POSTCOMPILE_stage_name_1])" in sql
+    assert session.execute.await_args.args[0].compile().params["stage_name_1"] == ["processed", "classified"]
@@ -0,0 +1,163 @@
+"""Unit tests for single-statement multi-query vector search."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import TextClause
+
+from app.core.config import settings
+from app.repositories import vector_embedding_repository
+from app.repositories.vector_embedding_repository import VectorEmbeddingRepository
+
+
+@pytest.fixture(autouse=True)
+def _pgvector_0_8(monkeypatch):
+    monkeypatch.setattr(vector_embedding_repository, "_pgvector_version", (0, 8, 0))
+
+
+def _repo(rows=()):
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=list(rows))
+    return VectorEmbeddingRepository(session), session
+
+
+def _search_statements(session):
+    """Executed statements other than SET LOCAL planner settings."""
+    return [
+        call.args[0] for call in session.execute.await_args_list
+        if not isinstance(call.args[0], TextClause)
+    ]
+
+
+def _set_statements(session):
+    return [
+        call.args[0].text for call in session.execute.await_args_list
+        if isinstance(call.args[0], TextClause)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_all_query_vectors_run_in_one_statement():
+    repo, session = _repo()
+
+    await repo.semantic_search_multi_query(
+        [[0.1] * 384, [0.2] * 384, [0.3] * 384],
+        top_k=10,
+        workflow_id=uuid4(),
+        section_types=["coverages"],
+        exact=False,
+    )
+
+    searches = _search_statements(session)
+    assert len(searches) == 1
+    sql = str(searches[0].compile(dialect=postgresql.dialect()))
+    assert "JOIN LATERAL" in sql
+    assert "DISTINCT ON (nearest.document_id, nearest.entity_id)" in sql
+    # Distance is computed once per candidate row
+    assert sql.count("<=>") == 2  # select list + ORDER BY of the lateral scan
+    assert "nearest.distance <=" in sql
+
+
+@pytest.mark.asyncio
+async def test_rows_map_to_embedding_distance_pairs():
+    embedding = MagicMock()
+    repo, _ = _repo([SimpleNamespace(VectorEmbedding=embedding, distance=0.25)])
+
+    results = await repo.semantic_search_multi_query([[0.1] * 384], exact=True)
+
+    assert results == [(embedding, 0.25)]
+
+
+@pytest.mark.asyncio
+async def test_no_embeddings_skips_query():
+    repo, session = _repo()
+
+    assert await repo.semantic_search_multi_query([]) == []
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_hnsw_search_sets_ef_search_for_the_query_only(monkeypatch):
+    repo, session = _repo()
+    monkeypatch.setattr(settings.vector_search, "hnsw_iterative_scan", "strict_order")
+
+    await repo.semantic_search_multi_query([[0.1] * 384], workflow_id=uuid4(), exact=False, ef_search=200)
+
+    assert _set_statements(session) == [
+        "SET LOCAL hnsw.ef_search = 200",
+        "SET LOCAL hnsw.iterative_scan = strict_order",
+        "SET LOCAL hnsw.ef_search TO DEFAULT",
+        "SET LOCAL hnsw.iterative_scan TO DEFAULT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iterative_scan_is_skipped_before_pgvector_0_8(monkeypatch):
+    repo, session = _repo()
+    version_row = MagicMock()
+    version_row.scalar_one_or_none.return_value = "0.7.4"
+    session.execute = AsyncMock(side_effect=lambda *args, **kwargs: (
+        version_row if "pg_extension" in str(args[0]) else []
+    ))
+    monkeypatch.setattr(settings.vector_search, "hnsw_iterative_scan", "strict_order")
+    monkeypatch.setattr(vector_embedding_repository, "_pgvector_version", None)
+
+    await repo.semantic_search_multi_query([[0.1] * 384], workflow_id=uuid4(), exact=False)
+    await repo.semantic_search_multi_query([[0.1] * 384], workflow_id=uuid4(), exact=False)
+
+    assert not any("iterative_scan" in statement for statement in _set_statements(session))
+    # The version is looked up once per process
+    assert sum("pg_extension" in statement for statement in _set_statements(session)) == 1
+
+
+@pytest.mark.asyncio
+async def test_small_workflows_are_searched_exactly(monkeypatch):
+    repo, session = _repo()
+    monkeypatch.setattr(settings.vector_search, "exact_scan_max_vectors", 5000)
+    repo.count_scope_vectors = AsyncMock(return_value=1200)
+
+    await repo.semantic_search_multi_query([[0.1] * 384], workflow_id=uuid4())
+
+    assert repo.count_scope_vectors.await_args.kwargs["limit"] == 5001
+    assert _set_statements(session) == []
+    sql = str(_search_statements(session)[0].compile(dialect=postgresql.dialect()))
+    # The ORDER BY is not an indexable <=> expression, so the HNSW index is not used
+    assert "ORDER BY (vector_embeddings.embedding <=> CAST(queries.query_embedding AS VECTOR(384))) + " in sql
+
+
+@pytest.mark.asyncio
+async def test_large_workflows_use_the_hnsw_index(monkeypatch):
+    repo, session = _repo()
+    session.execute.return_value = MagicMock()
+    monkeypatch.setattr(settings.vector_search, "exact_scan_max_vectors", 5000)
+    repo.count_scope_vectors = AsyncMock(return_value=5001)
+
+    await repo.semantic_search([0.1] * 384, workflow_id=uuid4())
+
+    assert _set_statements(session)[0].startswith("SET LOCAL hnsw.ef_search")
+
+
+@pytest.mark.asyncio
+async def test_chunk_search_runs_all_texts_in_one_statement():
+    chunk_a, chunk_b = MagicMock(), MagicMock()
+    repo, session = _repo([
+        SimpleNamespace(ordinal=0, VectorEmbedding=chunk_a, distance=0.2),
+        SimpleNamespace(ordinal=2, VectorEmbedding=chunk_b, distance=0.4),
+    ])
+
+    results = await repo.search_chunk_embeddings_batch(
+        [[0.1] * 384, [0.2] * 384, [0.3] * 384], uuid4(), top_k=3, max_distance=0.65, exact=True
+    )
+
+    assert results == [[(chunk_a, 0.2)], [], [(chunk_b, 0.4)]]
+    searches = _search_statements(session)
+    assert len(searches) == 1
+    sql = str(searches[0].compile(dialect=postgresql.dialect()))
+    assert "JOIN LATERAL" in sql
+    # The lateral scan keeps its own FROM instead of correlating to the outer join
+    assert "FROM vector_embeddings \nWHERE vector_embeddings.document_id" in sql
+    assert "vector_embeddings.entity_type = " in sql
+    assert "nearest.distance <=" in sql
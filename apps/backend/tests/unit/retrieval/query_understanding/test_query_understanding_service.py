@@ -5,12 +5,22 @@ from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 from app.services.retrieval.query_understanding.service import QueryUnderstandingService
+from app.services.retrieval.query_understanding.workflow_context_cache import (
+    invalidate_workflow_context,
+)
 from app.schemas.query import QueryPlan
 
 
 class TestQueryUnderstandingService:
     """Test suite for QueryUnderstandingService."""
 
+    @pytest.fixture(autouse=True)
+    def clear_context_cache(self):
+        """Start each test with an empty workflow context cache."""
+        invalidate_workflow_context()
+        yield
+        invalidate_workflow_context()
+
     @pytest.fixture
     def mock_db_session(self):
         """Create mock database session."""
@@ -29,43 +39,37 @@ class TestQueryUnderstandingService:
         return [doc_1, doc_2]
 
     @pytest.fixture
-    def mock_sections(self):
-        """Create mock sections."""
+    def mock_sections(self, mock_workflow_docs):
+        """Create mock section inventory rows."""
         section_1 = Mock()
         section_1.id = uuid4()
-        section_1.document_id = uuid4()
+        section_1.document_id = mock_workflow_docs[0].document_id
         section_1.section_type = "declarations"
-        section_1.section_name = "Declarations Page"
-        section_1.content = "Policy information and declarations"
-        section_1.page_numbers = [1]
+        section_1.page_range = {"start": 1, "end": 1}
 
         section_2 = Mock()
         section_2.id = uuid4()
-        section_2.document_id = uuid4()
+        section_2.document_id = mock_workflow_docs[1].document_id
         section_2.section_type = "coverages"
-        section_2.section_name = "Coverage Limits"
-        section_2.content = "Coverage details and limits"
-        section_2.page_numbers = [2, 3]
+        section_2.page_range = {"start": 2, "end": 3}
 
         return [section_1, section_2]
 
     @pytest.fixture
-    def mock_entities(self):
-        """Create mock entities."""
+    def mock_entities(self, mock_workflow_docs):
+        """Create mock entity inventory rows."""
         entity_1 = Mock()
         entity_1.id = uuid4()
-        entity_1.document_id = uuid4()
+        entity_1.document_id = mock_workflow_docs[0].document_id
         entity_1.entity_type = "policy"
-        entity_1.entity_name = "Commercial General Liability Policy"
-        entity_1.attributes = {"policy_number": "POL-12345"}
+        entity_1.entity_label = "Commercial General Liability Policy"
         entity_1.confidence = 0.95
 
         entity_2 = Mock()
         entity_2.id = uuid4()
-        entity_2.document_id = uuid4()
+        entity_2.document_id = mock_workflow_docs[1].document_id
         entity_2.entity_type = "coverage"
-        entity_2.entity_name = "General Liability Coverage"
-        entity_2.attributes = {"limit": "$1,000,000"}
+        entity_2.entity_label = "General Liability Coverage"
         entity_2.confidence = 0.90
 
         return [entity_1, entity_2]
@@ -83,15 +87,18 @@ class TestQueryUnderstandingService:
 
             # Setup mock repositories
             mock_workflow_repo = Mock()
-            mock_workflow_repo.get_by_workflow_id = AsyncMock(return_value=mock_workflow_docs)
+            mock_workflow_repo.get_context_version = AsyncMock(return_value=(2, "v1"))
+            mock_workflow_repo.get_document_names = AsyncMock(
+                return_value=[(doc.document_id, f"Document {i}.pdf") for i, doc in enumerate(mock_workflow_docs)]
+            )
             mock_workflow_repo_class.return_value = mock_workflow_repo
 
             mock_section_repo = Mock()
-            mock_section_repo.get_by_document_and_workflow = AsyncMock(return_value=mock_sections)
+            mock_section_repo.get_inventory_by_workflow = AsyncMock(return_value=mock_sections)
             mock_section_repo_class.return_value = mock_section_repo
 
             mock_entity_repo = Mock()
-            mock_entity_repo.get_by_document_and_workflow = AsyncMock(return_value=mock_entities)
+            mock_entity_repo.get_inventory_by_workflow = AsyncMock(return_value=mock_entities)
             mock_entity_repo_class.return_value = mock_entity_repo
 
             # Create service
@@ -195,7 +202,7 @@ class TestQueryUnderstandingService:
         result = await service.understand_query(query, workflow_id)
 
         # Should have called workflow repository
-        service._mock_workflow_repo.get_by_workflow_id.assert_called_once_with(workflow_id)
+        service._mock_workflow_repo.get_document_names.assert_called_once_with(workflow_id)
 
         # Should have workflow context
         assert result.workflow_context is not None
@@ -218,7 +225,10 @@ class TestQueryUnderstandingService:
         assert result.target_document_ids == [target_doc_id]
 
         # Context should be filtered to target documents
-        assert result.workflow_context.document_count > 0
+        assert result.workflow_context.document_ids == [target_doc_id]
+        assert result.workflow_context.document_names == {target_doc_id: "Document 0.pdf"}
+        assert [s["section_type"] for s in result.workflow_context.sections] == ["declarations"]
+        assert [e["entity_type"] for e in result.workflow_context.entities] == ["policy"]
 
     @pytest.mark.asyncio
     async def test_understand_query_derives_section_filters(self, service):
@@ -264,7 +274,7 @@ class TestQueryUnderstandingService:
     async def test_understand_query_handles_no_documents(self, service):
         """Test query understanding when workflow has no documents."""
         # Mock empty workflow
-        service._mock_workflow_repo.get_by_workflow_id = AsyncMock(return_value=[])
+        service._mock_workflow_repo.get_document_names = AsyncMock(return_value=[])
 
         query = "What is the coverage?"
         workflow_id = uuid4()
@@ -361,30 +371,40 @@ class TestQueryUnderstandingService:
             assert mock_logger.info.call_count >= 5  # At least 5 log statements
 
     @pytest.mark.asyncio
-    async def test_understand_query_section_repo_calls(self, service, mock_workflow_docs):
-        """Test that section repository is called for each document."""
+    async def test_understand_query_loads_inventory_once_per_workflow(self, service):
+        """Test that sections and entities are loaded in one query each, not per document."""
         query = "What is the coverage?"
         workflow_id = uuid4()
 
         await service.understand_query(query, workflow_id)
 
-        # Should call section repo for each document
-        assert service._mock_section_repo.get_by_document_and_workflow.call_count == len(
-            mock_workflow_docs
-        )
+        service._mock_section_repo.get_inventory_by_workflow.assert_called_once_with(workflow_id)
+        service._mock_entity_repo.get_inventory_by_workflow.assert_called_once_with(workflow_id)
 
     @pytest.mark.asyncio
-    async def test_understand_query_entity_repo_calls(self, service, mock_workflow_docs):
-        """Test that entity repository is called for each document."""
-        query = "What is the coverage?"
+    async def test_understand_query_reuses_cached_context(self, service):
+        """Test that repeated queries only check the context version."""
         workflow_id = uuid4()
 
-        await service.understand_query(query, workflow_id)
+        first = await service.understand_query("What is the coverage?", workflow_id)
+        second = await service.understand_query("Who is the insured?", workflow_id)
 
-        # Should call entity repo for each document
-        assert service._mock_entity_repo.get_by_document_and_workflow.call_count == len(
-            mock_workflow_docs
-        )
+        assert second.workflow_context == first.workflow_context
+        assert service._mock_workflow_repo.get_context_version.call_count == 2
+        service._mock_workflow_repo.get_document_names.assert_called_once()
+        service._mock_section_repo.get_inventory_by_workflow.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_understand_query_reloads_context_when_version_changes(self, service):
+        """Test that a stage transition (e.g. indexing completing) invalidates the cache."""
+        workflow_id = uuid4()
+
+        await service.understand_query("What is the coverage?", workflow_id)
+        service._mock_workflow_repo.get_context_version = AsyncMock(return_value=(2, "v2"))
+        await service.understand_query("What is the coverage?", workflow_id)
+
+        assert service._mock_workflow_repo.get_document_names.call_count == 2
+        assert service._mock_entity_repo.get_inventory_by_workflow.call_count == 2
 
     @pytest.mark.asyncio
     async def test_understand_query_filter_validation(self, service):
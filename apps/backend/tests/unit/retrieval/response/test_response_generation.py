@@ -86,3 +86,43 @@ async def test_generate_response_error_graceful_handling(service, mock_llm_clien
     
     assert "error occurred" in response.answer
     assert response.provenance == {}
+
+def _stream(*deltas, error=None):
+    async def generate(**kwargs):
+        for delta in deltas:
+            yield delta
+        if error:
+            raise error
+    return generate
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_yields_deltas(service, mock_llm_client):
+    """Test that streamed answers are passed through as they arrive."""
+    mock_llm_client.generate_content_stream = _stream("\n", "The limit ", "is $1M [1].")
+    context = ContextPayload(
+        full_text_results=[MergedResult(source="vector", content="Limit: $1M", document_id=uuid4(), document_name="D", relevance_score=0.9)],
+        summary_results=[],
+        total_results=1,
+        token_count=10,
+        provenance_index={}
+    )
+
+    deltas = [delta async for delta in service.generate_response_stream("What is the limit?", context)]
+
+    assert deltas == ["The limit ", "is $1M [1]."]
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_error_before_first_token(service, mock_llm_client):
+    """Test that a failed stream yields the same fallback answer as generate_response."""
+    mock_llm_client.generate_content_stream = _stream(error=Exception("API Down"))
+    context = ContextPayload(
+        full_text_results=[MergedResult(source="graph", content="X", document_id=uuid4(), document_name="D", relevance_score=0.5)],
+        summary_results=[],
+        total_results=1,
+        token_count=10,
+        provenance_index={}
+    )
+
+    deltas = [delta async for delta in service.generate_response_stream("Query", context)]
+
+    assert len(deltas) == 1 and "error occurred" in deltas[0]
@@ -0,0 +1,129 @@
+"""Unit tests for GraphRAGService stage overlap and latency budgets."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.query import ContextPayload, GraphRAGRequest, QueryPlan
+from app.services.retrieval.graphrag_service import GENERATION_TIMEOUT_ANSWER, GraphRAGService
+from app.utils.latency_histogram import reset_stage_latencies, stage_latency_snapshot
+
+
+@pytest.fixture
+def service():
+    svc = GraphRAGService.__new__(GraphRAGService)
+    svc.query_understanding = MagicMock()
+    svc.query_understanding.understand_query = AsyncMock(
+        return_value=MagicMock(
+            spec=QueryPlan, intent="QA", traversal_depth=1, expanded_queries=["What is the limit?"]
+        )
+    )
+    svc.query_understanding.intent_classifier.classify.return_value = ("QA", 0.9, 1)
+    svc.query_understanding.query_expander.expand.return_value = ["What is the limit?"]
+    svc.vector_retrieval = MagicMock()
+    svc.vector_retrieval.embed_queries = AsyncMock(return_value=[[0.1]])
+    svc.vector_retrieval.search = AsyncMock(return_value=[])
+    svc.vector_retrieval.resolve = AsyncMock(return_value=[])
+    svc.graph_expansion = MagicMock()
+    svc.graph_expansion.traverse = AsyncMock(return_value=([], []))
+    svc.graph_expansion.score = AsyncMock(return_value=[])
+    svc.result_merger = MagicMock()
+    svc.result_merger.merge.return_value = []
+    svc.context_builder = MagicMock()
+    svc.context_builder.build_context.return_value = ContextPayload(
+        full_text_results=[], summary_results=[], total_results=0, token_count=0,
+        provenance_index={},
+    )
+
+    async def stream(query, context):
+        yield "The limit "
+        yield "is $1M [1]."
+
+    svc.response_generator = MagicMock()
+    svc.response_generator.generate_response_stream = stream
+    svc.response_generator.generate_response = AsyncMock(return_value=MagicMock(answer="The limit is $1M [1]."))
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_query_reuses_embeddings_computed_during_understanding(service):
+    await service.query(uuid4(), GraphRAGRequest(query="What is the limit?"))
+
+    service.vector_retrieval.embed_queries.assert_awaited_once_with(["What is the limit?"])
+    assert service.vector_retrieval.search.await_args.kwargs["query_embeddings"] == [[0.1]]
+
+
+@pytest.mark.asyncio
+async def test_graph_traversal_over_budget_falls_back_to_vector_only(service):
+    embedding = MagicMock(entity_id="e1", section_type="coverages")
+    service.vector_retrieval.search = AsyncMock(return_value=[(embedding, 0.9, 0.9)])
+
+    async def slow_traverse(*args):
+        await asyncio.sleep(10)
+
+    service.graph_expansion.traverse = slow_traverse
+
+    with patch("app.services.retrieval.graphrag_service.settings.graphrag.graph_timeout_seconds", 0.01):
+        response = await service.query(uuid4(), GraphRAGRequest(query="What is the limit?"))
+
+    assert response.answer == "The limit is $1M [1]."
+    assert response.metadata.graph_available is False
+    assert response.metadata.fallback_mode is True
+    service.graph_expansion.score.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_generation_over_budget_returns_timeout_answer(service):
+    async def slow_generate(**kwargs):
+        await asyncio.sleep(10)
+
+    service.response_generator.generate_response = slow_generate
+    reset_stage_latencies()
+
+    with patch("app.services.retrieval.graphrag_service.settings.graphrag.generation_timeout_seconds", 0.01):
+        response = await service.query(uuid4(), GraphRAGRequest(query="What is the limit?"))
+
+    assert response.answer == GENERATION_TIMEOUT_ANSWER
+    snapshot = stage_latency_snapshot()
+    assert snapshot["response_generation"]["count"] == 1
+    assert snapshot["total"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_without_text_in_budget_streams_timeout_answer(service):
+    async def stalled_stream(query, context):
+        await asyncio.sleep(10)
+        yield "never"
+
+    service.response_generator.generate_response_stream = stalled_stream
+
+    with patch("app.services.retrieval.graphrag_service.settings.graphrag.generation_timeout_seconds", 0.01):
+        events = [e async for e in service.query_stream(uuid4(), GraphRAGRequest(query="What is the limit?"))]
+
+    assert [e.event_type for e in events] == ["context_ready", "delta", "final"]
+    assert events[1].data["text"] == GENERATION_TIMEOUT_ANSWER
+    assert events[-1].data["answer"] == GENERATION_TIMEOUT_ANSWER
+
+
+@pytest.mark.asyncio
+async def test_stream_over_budget_ends_with_the_partial_answer(service):
+    closed = asyncio.Event()
+
+    async def slow_stream(query, context):
+        try:
+            yield "The limit "
+            await asyncio.sleep(10)
+            yield "is $1M [1]."
+        finally:
+            closed.set()
+
+    service.response_generator.generate_response_stream = slow_stream
+
+    with patch("app.services.retrieval.graphrag_service.settings.graphrag.generation_timeout_seconds", 0.05):
+        events = [e async for e in service.query_stream(uuid4(), GraphRAGRequest(query="What is the limit?"))]
+
+    assert [e.event_type for e in events] == ["context_ready", "delta", "final"]
+    assert events[-1].data["answer"] == "The limit"
+    assert closed.is_set()
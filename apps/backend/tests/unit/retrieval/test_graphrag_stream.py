@@ -0,0 +1,88 @@
+"""Unit tests for the streamed GraphRAG query path."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.query import ContextPayload, GraphRAGRequest, ProvenanceEntry, QueryPlan
+from app.services.retrieval.graphrag_service import GraphRAGService, build_source_citations
+
+
+def _provenance():
+    return {
+        "[1]": ProvenanceEntry(document_name="Policy.pdf", document_id=uuid4(), page_numbers=[3], section_type="coverages"),
+        "[2]": ProvenanceEntry(
+            document_name="Endorsement.pdf",
+            document_id=uuid4(),
+            relationship_path=["HAS_COVERAGE", "MODIFIED_BY"],
+        ),
+        "[3]": ProvenanceEntry(document_name="Unused.pdf", document_id=uuid4()),
+    }
+
+
+def test_citations_cover_markers_used_in_answer():
+    sources = build_source_citations("Limit is $1M [2]. See also [1, 2] and [9].", _provenance())
+
+    assert [s.citation_id for s in sources] == ["2", "1"]
+    assert sources[0].relationship_context == "Related via: HAS_COVERAGE → MODIFIED_BY"
+    assert sources[1].section_type == "coverages"
+
+
+@pytest.fixture
+def service():
+    svc = GraphRAGService.__new__(GraphRAGService)
+    svc.query_understanding = MagicMock()
+    svc.query_understanding.understand_query = AsyncMock(
+        return_value=MagicMock(
+            spec=QueryPlan, intent="QA", traversal_depth=1, expanded_queries=["What is the limit?"]
+        )
+    )
+    svc.query_understanding.intent_classifier.classify.return_value = ("QA", 0.9, 1)
+    svc.query_understanding.query_expander.expand.return_value = ["What is the limit?"]
+    svc.vector_retrieval = MagicMock()
+    svc.vector_retrieval.embed_queries = AsyncMock(return_value=[[0.1]])
+    svc.vector_retrieval.search = AsyncMock(return_value=[])
+    svc.vector_retrieval.resolve = AsyncMock(return_value=[])
+    svc.graph_expansion = MagicMock()
+    svc.graph_expansion.traverse = AsyncMock(return_value=([], []))
+    svc.graph_expansion.score = AsyncMock(return_value=[])
+    svc.result_merger = MagicMock()
+    svc.result_merger.merge.return_value = []
+    svc.context_builder = MagicMock()
+    svc.context_builder.build_context.return_value = ContextPayload(
+        full_text_results=[], summary_results=[], total_results=0, token_count=0,
+        provenance_index=_provenance(),
+    )
+
+    async def stream(query, context):
+        yield "The limit "
+        yield "is $1M [1]."
+
+    svc.response_generator = MagicMock()
+    svc.response_generator.generate_response_stream = stream
+    svc.response_generator.generate_response = AsyncMock(return_value=MagicMock(answer="The limit is $1M [1]."))
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_query_stream_emits_context_deltas_and_final(service):
+    events = [e async for e in service.query_stream(uuid4(), GraphRAGRequest(query="What is the limit?"))]
+
+    assert [e.event_type for e in events] == ["context_ready", "delta", "delta", "final"]
+    assert events[0].data["intent"] == "QA"
+    final = events[-1].data
+    assert final["answer"] == "The limit is $1M [1]."
+    assert [s["citation_id"] for s in final["sources"]] == ["1"]
+    assert "first_token" in final["metadata"]["stage_latencies"]
+
+
+@pytest.mark.asyncio
+async def test_query_returns_the_same_citations_as_the_stream(service):
+    request = GraphRAGRequest(query="What is the limit?")
+
+    response = await service.query(uuid4(), request)
+    final = [e async for e in service.query_stream(uuid4(), request)][-1].data
+
+    assert [s.citation_id for s in response.sources] == ["1"]
+    assert [s["citation_id"] for s in final["sources"]] == ["1"]
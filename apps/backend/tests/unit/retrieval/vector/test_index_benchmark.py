@@ -0,0 +1,17 @@
+"""Unit tests for the vector index benchmark metrics."""
+
+from app.services.retrieval.vector.index_benchmark import percentile, recall_at_k
+
+
+def test_recall_at_k_counts_true_neighbours_found():
+    assert recall_at_k(["a", "b", "c", "d"], ["a", "x", "c", "b"], k=3) == 2 / 3
+    assert recall_at_k(["a", "b"], ["b", "a"], k=2) == 1.0
+    assert recall_at_k([], ["a"], k=5) == 1.0
+
+
+def test_percentile_uses_nearest_rank():
+    latencies = [float(ms) for ms in range(1, 101)]
+
+    assert percentile(latencies, 50) == 50.0
+    assert percentile(latencies, 95) == 95.0
+    assert percentile([], 95) == 0.0
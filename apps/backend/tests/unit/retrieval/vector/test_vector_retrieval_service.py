@@ -22,6 +22,7 @@ from app.schemas.query import (
     VectorSearchResult,
     WorkflowContext,
 )
+from app.services.embedding_service import EmbeddingService
 from app.services.retrieval.vector.vector_retrieval_service import (
     VectorRetrievalService,
 )
@@ -135,7 +136,7 @@ def service(mock_session):
 
 
 # ---------------------------------------------------------------------------
-# Tests: _embed_queries
+# Tests: embed_queries
 # ---------------------------------------------------------------------------
 
 
@@ -152,22 +153,28 @@ class TestEmbedQueries:
             [[0.1] * 384, [0.2] * 384]
         )
 
+        embedder = EmbeddingService("all-MiniLM-L6-v2", batch_window_ms=0)
+        embedder._model = mock_model
+
         with patch(
-            "app.services.retrieval.vector.vector_retrieval_service._get_embedding_model",
-            return_value=mock_model,
+            "app.services.retrieval.vector.vector_retrieval_service.get_embedding_service",
+            return_value=embedder,
         ):
-            result = await service._embed_queries(
+            result = await service.embed_queries(
                 ["query 1", "query 2"]
             )
+            cached = await service.embed_queries(["query 2"])
 
         assert len(result) == 2
         assert len(result[0]) == 384
-        mock_model.encode.assert_called_once_with(["query 1", "query 2"])
+        assert cached == [result[1]]
+        mock_model.encode.assert_called_once()
+        assert mock_model.encode.call_args.args[0] == ["query 1", "query 2"]
 
     @pytest.mark.asyncio
     async def test_embed_queries_empty_returns_empty(self, service):
         """Empty query list should return empty embeddings."""
-        result = await service._embed_queries([])
+        result = await service.embed_queries([])
         assert result == []
 
 
@@ -443,7 +450,7 @@ class TestRetrievePipeline:
     async def test_retrieve_empty_when_no_embeddings(self):
         """Should return empty list when embed returns nothing."""
         with patch.object(
-            self.service, "_embed_queries", return_value=[]
+            self.service, "embed_queries", return_value=[]
         ):
             results = await self.service.retrieve(self.query_plan)
         assert results == []
@@ -453,7 +460,7 @@ class TestRetrievePipeline:
         """Should return empty list when vector search finds nothing."""
         with patch.object(
             self.service,
-            "_embed_queries",
+            "embed_queries",
             return_value=[[0.1] * 384],
         ):
             self.service.vector_repo.semantic_search_multi_query.return_value = []
@@ -482,7 +489,7 @@ class TestRetrievePipeline:
         # Mock embed
         with patch.object(
             self.service,
-            "_embed_queries",
+            "embed_queries",
             return_value=[[0.1] * 384, [0.2] * 384],
         ):
             # Mock vector search
@@ -544,7 +551,7 @@ class TestRetrievePipeline:
 
         with patch.object(
             self.service,
-            "_embed_queries",
+            "embed_queries",
             return_value=[[0.1] * 384],
         ):
             self.service.vector_repo.semantic_search_multi_query.return_value = []
@@ -566,7 +573,7 @@ class TestRetrievePipeline:
 
         with patch.object(
             self.service,
-            "_embed_queries",
+            "embed_queries",
             return_value=[[0.1] * 384],
         ):
             self.service.vector_repo.semantic_search_multi_query.return_value = []
@@ -584,7 +591,7 @@ class TestRetrievePipeline:
 
         with patch.object(
             self.service,
-            "_embed_queries",
+            "embed_queries",
             return_value=[[0.1] * 384],
         ):
             self.service.vector_repo.semantic_search_multi_query.return_value = [
@@ -0,0 +1,85 @@
+"""Unit tests for indexed text-to-coordinate matching in CitationMapper."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from app.services.citation.citation_mapper import CitationMapper
+from app.services.processed.services.ocr.coordinate_extraction_service import (
+    PageMetadata,
+    WordCoordinate,
+)
+
+VOCABULARY = (
+    "the company will pay those sums that insured becomes legally obligated to as damages "
+    "because of bodily injury or property damage which this insurance applies coverage "
+    "exclusion endorsement limit each occurrence aggregate premises operations"
+).split()
+
+
+def _page(page_number, words):
+    return [
+        WordCoordinate(
+            text=word, page_number=page_number,
+            x0=10.0 * (i % 12), y0=800.0 - 12 * (i // 12), x1=10.0 * (i % 12) + 9, y1=810.0 - 12 * (i // 12),
+        )
+        for i, word in enumerate(words)
+    ]
+
+
+def _mapper(pages):
+    word_index = {page: _page(page, words) for page, words in pages.items()}
+    metadata = [PageMetadata(page_number=page, width=612, height=792) for page in pages]
+    return CitationMapper(word_index, metadata)
+
+
+def _brute_force_start(mapper, search_words, page_num, threshold):
+    """Sliding-window reference: first start whose word similarity reaches the threshold."""
+    page_texts = [mapper._normalize_text(w.text) for w in mapper.word_index[page_num]]
+    window = search_words[:mapper.config.anchor_size]
+
+    def word_match(a, b):
+        return a == b or (a and b and SequenceMatcher(None, a, b).ratio() >= mapper.config.word_similarity_threshold)
+
+    for i in range(len(page_texts) - len(window) + 1):
+        matches = sum(1 for a, b in zip(window, page_texts[i:i + len(window)]) if word_match(a, b))
+        if matches / len(window) >= threshold:
+            return i
+    return None
+
+
+def test_finds_text_with_ocr_noise_on_expected_page():
+    mapper = _mapper({
+        1: "declarations named insured policy period".split(),
+        2: "we will pay those sums that the insured becomes legaly obligated to pay as damages".split(),
+    })
+
+    match = mapper.find_text_location(
+        "We will pay those sums that the insured becomes legally obligated to pay", expected_page=2
+    )
+
+    assert match.page_number == 2
+    assert match.spans[0].text_content.startswith("we will pay those sums")
+    assert mapper.find_text_location("completely unrelated wording here") is None
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_index_agrees_with_sliding_window(seed):
+    rng = random.Random(seed)
+    pages = {page: [rng.choice(VOCABULARY) for _ in range(150)] for page in (1, 2, 3)}
+    mapper = _mapper(pages)
+
+    for _ in range(15):
+        page = rng.choice(list(pages))
+        start = rng.randrange(0, 130)
+        length = rng.choice([3, 8, 15, 25])
+        search_words = list(pages[page][start:start + length])
+        # Drop a character from some words (OCR noise)
+        search_words = [w[:-1] if len(w) > 6 and rng.random() < 0.3 else w for w in search_words]
+
+        for page_num in pages:
+            expected = _brute_force_start(mapper, search_words, page_num, 0.85)
+            assert mapper._first_matching_window(
+                search_words[:mapper.config.anchor_size], page_num, 0.85
+            ) == expected
@@ -0,0 +1,179 @@
+"""Unit tests for batched citation resolution and persistence."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.citation import BoundingBox, CitationSpan
+from app.services.citation import citation_resolution_service
+from app.services.citation.citation_creation_service import CitationCreationService
+from app.services.citation.citation_resolution_service import (
+    CitationResolutionService,
+    ResolutionRequest,
+    ResolutionResult,
+)
+
+DIRECT_TEXT = "we will pay those sums that the insured becomes legally obligated to pay"
+
+
+def _span(page_number):
+    return CitationSpan(
+        page_number=page_number,
+        bounding_boxes=[BoundingBox(x0=1.0, y0=2.0, x1=3.0, y1=4.0)],
+        text_content="matched",
+    )
+
+
+@pytest.fixture
+def resolver(monkeypatch):
+    mapper = MagicMock()
+    mapper.find_text_location.side_effect = lambda search_text, expected_page, fuzzy_threshold: (
+        SimpleNamespace(spans=[_span(expected_page)], confidence=0.9)
+        if search_text == DIRECT_TEXT else None
+    )
+    embedding_service = MagicMock()
+    embedding_service.embed = AsyncMock(side_effect=lambda texts: [[0.1] * 384 for _ in texts])
+    monkeypatch.setattr(citation_resolution_service, "get_embedding_service", lambda: embedding_service)
+
+    service = CitationResolutionService(MagicMock(), citation_mapper=mapper)
+    service.vector_repo = MagicMock()
+    chunk = SimpleNamespace(id=uuid4(), page_number=7)
+    service.vector_repo.search_chunk_embeddings_batch = AsyncMock(
+        return_value=[[(SimpleNamespace(source_chunk_id=chunk.id), 0.3)], []]
+    )
+    service._load_chunks = AsyncMock(return_value={chunk.id: chunk})
+    return service, embedding_service
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_and_searches_unresolved_items_once(resolver):
+    resolver, embedding_service = resolver
+    requests = [
+        ResolutionRequest(DIRECT_TEXT, expected_page=2, page_numbers=[2]),
+        ResolutionRequest("paraphrased coverage grant for bodily injury", page_numbers=[3]),
+        ResolutionRequest("another paraphrased exclusion wording", page_numbers=[4, 5]),
+        ResolutionRequest("too short", page_numbers=[6]),
+    ]
+
+    results = await resolver.resolve_batch(requests, uuid4())
+
+    assert [result.method for result in results] == [
+        "direct_text_match", "semantic_chunk_match", "placeholder", "placeholder"
+    ]
+    assert results[1].spans[0].page_number == 7
+    assert results[1].confidence == pytest.approx(0.7)
+    assert [span.page_number for span in results[2].spans] == [4, 5]
+
+    embedding_service.embed.assert_awaited_once_with([
+        "paraphrased coverage grant for bodily injury",
+        "another paraphrased exclusion wording",
+    ])
+    resolver.vector_repo.search_chunk_embeddings_batch.assert_awaited_once()
+    resolver._load_chunks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_semantic_failure_falls_back_to_placeholders(resolver):
+    resolver, _ = resolver
+    resolver.vector_repo.search_chunk_embeddings_batch.side_effect = RuntimeError("db down")
+
+    results = await resolver.resolve_batch(
+        [ResolutionRequest("paraphrased coverage grant for bodily injury", page_numbers=[3])], uuid4()
+    )
+
+    assert results[0].method == "placeholder"
+    assert results[0].spans[0].page_number == 3
+
+
+@pytest.mark.asyncio
+async def test_citations_are_resolved_and_written_in_one_batch():
+    session = MagicMock()
+    session.commit = AsyncMock()
+    service = CitationCreationService(session)
+    resolution_service = MagicMock()
+    resolution_service.resolve_batch = AsyncMock(side_effect=lambda requests, document_id: [
+        ResolutionResult(spans=[_span(request.primary_page)], method="direct_text_match", confidence=0.9)
+        for request in requests
+    ])
+    service._ensure_resolution_service = AsyncMock(return_value=resolution_service)
+    service._resolution_service = resolution_service
+    service.citation_service.citation_repo.upsert_bulk = AsyncMock(return_value=2)
+
+    result = await service.create_citations_from_synthesis(
+        uuid4(),
+        effective_coverages=[
+            {"canonical_id": "cov-1", "page_numbers": [2, 3], "source_text": "coverage text", "confidence": 0.8},
+            {"canonical_id": None, "page_numbers": [1], "source_text": "no id"},
+        ],
+        effective_exclusions=[
+            {"canonical_id": "exc-1", "page_number": 5, "description": "exclusion text"},
+        ],
+    )
+
+    assert result["created_count"] == 2
+    assert result["skipped_count"] == 1
+    assert result["resolution_stats"]["direct_text_match"] == 2
+    resolution_service.resolve_batch.assert_awaited_once()
+
+    rows = service.citation_service.citation_repo.upsert_bulk.await_args.args[0]
+    assert [(row["source_type"], row["source_id"]) for row in rows] == [
+        ("effective_coverage", "cov-1"), ("effective_exclusion", "exc-1")
+    ]
+    assert rows[0]["page_range"] == {"start": 2, "end": 3}
+    assert rows[1]["primary_page"] == 5
+    assert rows[1]["spans"][0]["bounding_boxes"] == [{"x0": 1.0, "y0": 2.0, "x1": 3.0, "y1": 4.0}]
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_mapper_errors_only_affect_their_item(resolver):
+    resolver, _ = resolver
+    failing_text = "paraphrased coverage grant for bodily injury"
+    match = resolver.citation_mapper.find_text_location.side_effect
+
+    def find_text_location(search_text, expected_page, fuzzy_threshold):
+        if search_text.startswith(failing_text[:10]):
+            raise ValueError("bad coordinates")
+        return match(search_text, expected_page, fuzzy_threshold)
+
+    resolver.citation_mapper.find_text_location.side_effect = find_text_location
+
+    results = await resolver.resolve_batch(
+        [
+            ResolutionRequest(DIRECT_TEXT, expected_page=2, page_numbers=[2]),
+            ResolutionRequest(failing_text, page_numbers=[3]),
+        ],
+        uuid4(),
+    )
+
+    assert results[0].method == "direct_text_match" and results[0].error is None
+    # Tier 1 and the chunk-page match both failed; the chunk's page is still used
+    assert results[1].method == "semantic_chunk_match"
+    assert results[1].spans[0].page_number == 7
+    assert "bad coordinates" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_failed_resolution_batch_falls_back_to_placeholders():
+    session = MagicMock()
+    session.commit = AsyncMock()
+    service = CitationCreationService(session)
+    resolution_service = CitationResolutionService(session)
+    resolution_service.resolve_batch = AsyncMock(side_effect=RuntimeError("embedding model missing"))
+    service._ensure_resolution_service = AsyncMock(return_value=resolution_service)
+    service._resolution_service = resolution_service
+    service.citation_service.citation_repo.upsert_bulk = AsyncMock(return_value=1)
+
+    result = await service.create_citations_from_synthesis(
+        uuid4(),
+        effective_coverages=[{"canonical_id": "cov-1", "page_numbers": [4], "source_text": "coverage text"}],
+        effective_exclusions=[],
+    )
+
+    assert result["created_count"] == 1
+    assert result["resolution_stats"]["placeholder"] == 1
+    assert any("embedding model missing" in error for error in result["errors"])
+    rows = service.citation_service.citation_repo.upsert_bulk.await_args.args[0]
+    assert rows[0]["primary_page"] == 4
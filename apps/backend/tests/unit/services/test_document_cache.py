@@ -0,0 +1,118 @@
+"""Tests for the local document cache."""
+
+import asyncio
+import hashlib
+import os
+import time
+
+import pytest
+
+from app.services.document_cache import DocumentCache
+
+
+def _chunks(*parts: bytes):
+    calls = {"count": 0}
+
+    def factory():
+        calls["count"] += 1
+
+        async def gen():
+            for part in parts:
+                yield part
+
+        return gen()
+
+    return factory, calls
+
+
+@pytest.mark.asyncio
+async def test_fetches_once_then_hits(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=1024 * 1024)
+    factory, calls = _chunks(b"%PDF-1.4 ", b"body")
+
+    async with cache.lease("docs/a.pdf", factory) as first:
+        pass
+    async with cache.lease("docs/a.pdf", factory) as second:
+        with second.open_mmap() as mapped:
+            content = mapped.read()
+
+    assert calls["count"] == 1
+    assert first.path == second.path
+    assert first.sha256 == hashlib.sha256(b"%PDF-1.4 body").hexdigest()
+    assert content == b"%PDF-1.4 body"
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_checksum_mismatch_is_a_miss(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=1024 * 1024)
+    factory, calls = _chunks(b"v1")
+    async with cache.lease("docs/a.pdf", factory):
+        pass
+
+    assert cache.lookup("docs/a.pdf", checksum="0" * 64) is None
+    assert cache.lookup("docs/a.pdf") is not None
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=10)
+    old_factory, _ = _chunks(b"a" * 6)
+    new_factory, _ = _chunks(b"b" * 6)
+
+    async with cache.lease("docs/old.pdf", old_factory) as old:
+        pass
+    os.utime(old.path, (0, 0))
+    async with cache.lease("docs/new.pdf", new_factory) as new:
+        pass
+
+    assert not os.path.exists(old.path)
+    assert os.path.exists(new.path)
+    assert cache.lookup("docs/old.pdf") is None
+
+
+@pytest.mark.asyncio
+async def test_leased_blobs_are_not_evicted(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=10)
+    old_factory, _ = _chunks(b"a" * 6)
+    new_factory, _ = _chunks(b"b" * 6)
+
+    async with cache.lease("docs/old.pdf", old_factory) as old:
+        os.utime(old.path, (0, 0))
+        # Another reader fetches while the old blob is still in use
+        async with cache.lease("docs/new.pdf", new_factory):
+            pass
+        assert os.path.exists(old.path)
+
+    assert cache.evict() == 1
+    assert not os.path.exists(old.path)
+
+
+def test_stale_leases_are_dropped(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=10, lease_ttl_seconds=60)
+    lease = cache._pin("abc")
+
+    assert cache.is_pinned("abc")
+
+    stale = time.time() - 120
+    os.utime(lease, (stale, stale))
+    assert not cache.is_pinned("abc")
+    assert not lease.exists()
+
+
+@pytest.mark.asyncio
+async def test_fetch_locks_are_released(tmp_path):
+    cache = DocumentCache(str(tmp_path), max_bytes=1024 * 1024)
+    factory, calls = _chunks(b"shared")
+
+    async def read():
+        async with cache.lease("docs/a.pdf", factory) as cached:
+            return cached.sha256
+
+    results = await asyncio.gather(*(read() for _ in range(5)))
+
+    assert calls["count"] == 1
+    assert len(set(results)) == 1
+    assert cache._fetch_locks == {}
+    assert cache._fetch_lock_users == {}
+    assert list((tmp_path / "leases").iterdir()) == []
@@ -0,0 +1,161 @@
+"""Unit tests for parallel, content-deduplicated document uploads."""
+
+import asyncio
+import hashlib
+from datetime import datetime, timezone
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.core.exceptions import ValidationError
+from app.repositories.document_repository import DocumentRepository
+from app.services.document_service import DocumentService
+
+
+def _document(name, checksum):
+    return SimpleNamespace(
+        id=uuid4(), status="uploaded", file_path=f"user/uploads/{name}", document_name=name,
+        page_count=0, uploaded_at=datetime.now(timezone.utc), checksum=checksum,
+    )
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings.supabase, "upload_concurrency", 2)
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    service = DocumentService(session)
+
+    in_flight = {"now": 0, "max": 0}
+
+    async def upload_file(file, bucket, path):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        content = await file.read()
+        if content == b"broken":
+            raise RuntimeError("storage unavailable")
+        return {"Key": path, "sha256": hashlib.sha256(content).hexdigest(), "size_bytes": len(content)}
+
+    service.storage_service = MagicMock()
+    service.storage_service.upload_file = AsyncMock(side_effect=upload_file)
+    service.storage_service.delete_file = AsyncMock()
+    service.storage_service.in_flight = in_flight
+
+    service.doc_repo = MagicMock()
+    service.doc_repo.create_document = AsyncMock(
+        side_effect=lambda **kwargs: _document(kwargs["document_name"], kwargs["checksum"])
+    )
+    service.wf_doc_repo = MagicMock()
+    service.wf_doc_repo.create_workflow_document = AsyncMock(return_value=MagicMock())
+    service.wf_doc_repo.get_by_workflow_and_document_id = AsyncMock(return_value=[])
+    service.stage_repo = MagicMock()
+    service.stage_repo.carry_over_document_stages = AsyncMock(return_value=["processed", "classified"])
+    return service
+
+
+def _file(name, content):
+    return UploadFile(file=BytesIO(content), filename=name, size=len(content))
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_linked_not_reprocessed(service):
+    existing = _document("earlier.pdf", hashlib.sha256(b"old policy").hexdigest())
+    service.doc_repo.get_by_checksum = AsyncMock(
+        side_effect=lambda user_id, checksum: existing if checksum == existing.checksum else None
+    )
+    workflow_id = uuid4()
+
+    response = await service._upload_documents_logic(
+        [
+            _file("new.pdf", b"new policy"),
+            _file("again.pdf", b"old policy"),
+            _file("copy.pdf", b"new policy"),
+            _file("broken.pdf", b"broken"),
+        ],
+        user_id=uuid4(),
+        workflow_id=workflow_id,
+    )
+
+    assert response.total_uploaded == 3
+    new_doc, linked, copy = response.documents
+    assert not new_doc.deduplicated
+    assert linked.id == existing.id and linked.deduplicated
+    # The same content twice in one request also maps to one document
+    assert copy.id == new_doc.id and copy.deduplicated
+    assert response.failed_uploads[0].filename == "broken.pdf"
+
+    service.doc_repo.create_document.assert_awaited_once()
+    assert service.doc_repo.create_document.await_args.kwargs["checksum"] == hashlib.sha256(b"new policy").hexdigest()
+    assert service.storage_service.delete_file.await_count == 2
+    service.wf_doc_repo.create_workflow_document.assert_any_await(document_id=existing.id, workflow_id=workflow_id)
+    # OCR and page analysis outputs of the earlier upload are reused
+    service.stage_repo.carry_over_document_stages.assert_any_await(existing.id, workflow_id)
+
+
+@pytest.mark.asyncio
+async def test_uploads_run_concurrently_up_to_the_limit(service):
+    service.doc_repo.get_by_checksum = AsyncMock(return_value=None)
+
+    response = await service._upload_documents_logic(
+        [_file(f"doc{i}.pdf", f"content {i}".encode()) for i in range(5)],
+        user_id=uuid4(),
+        workflow_id=uuid4(),
+    )
+
+    assert response.total_uploaded == 5
+    assert service.storage_service.in_flight["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_shared_document_unlinks_it_first(service):
+    user_id = uuid4()
+    document = SimpleNamespace(id=uuid4(), user_id=user_id)
+    service.doc_repo.get_by_id = AsyncMock(return_value=document)
+    service.doc_repo.delete = AsyncMock()
+    service.wf_doc_repo.unlink_document = AsyncMock(return_value=True)
+    service.wf_doc_repo.count_document_links = AsyncMock(side_effect=[1, 0])
+
+    # Still used by another workflow: only the link goes
+    assert await service.delete_document(document.id, user_id, workflow_id=uuid4())
+    service.doc_repo.delete.assert_not_awaited()
+
+    # Last link removed: the document goes too
+    assert await service.delete_document(document.id, user_id, workflow_id=uuid4())
+    service.doc_repo.delete.assert_awaited_once_with(document.id)
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_shared_document_requires_a_workflow(service):
+    user_id = uuid4()
+    document = SimpleNamespace(id=uuid4(), user_id=user_id)
+    service.doc_repo.get_by_id = AsyncMock(return_value=document)
+    service.doc_repo.delete = AsyncMock()
+    service.wf_doc_repo.count_document_links = AsyncMock(return_value=2)
+
+    with pytest.raises(ValidationError):
+        await service.delete_document(document.id, user_id)
+    service.doc_repo.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_checksum_lookup_only_matches_processed_documents():
+    session = MagicMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    session.execute = AsyncMock(return_value=result)
+
+    assert await DocumentRepository(session).get_by_checksum(uuid4(), "abc") is None
+
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "EXISTS" in sql
+    assert "workflow_document_stage_runs.stage_name" in sql
+    assert "workflow_document_stage_runs.status" in sql
@@ -0,0 +1,83 @@
+"""Tests for the process-wide embedding service."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.embedding_service import EmbeddingService
+
+
+def _service(**kwargs):
+    service = EmbeddingService("all-MiniLM-L6-v2", **kwargs)
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: np.array(
+        [[float(len(text)), 1.0] for text in texts]
+    )
+    service._model = model
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_forward_pass():
+    service = _service(batch_window_ms=20)
+
+    results = await asyncio.gather(
+        service.embed(["a", "bb"]),
+        service.embed(["bb", "ccc"]),
+        service.embed(["dddd"]),
+    )
+
+    service._model.encode.assert_called_once()
+    # Duplicate texts across callers are encoded once
+    assert service._model.encode.call_args.args[0] == ["a", "bb", "ccc", "dddd"]
+    assert results == [
+        [[1.0, 1.0], [2.0, 1.0]],
+        [[2.0, 1.0], [3.0, 1.0]],
+        [[4.0, 1.0]],
+    ]
+    assert service.stats()["coalesced_calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_query_cache_hits_and_evicts():
+    service = _service(batch_window_ms=0, query_cache_size=2)
+
+    await service.embed_queries(["q1", "q2"])
+    await service.embed_query("q1")
+    assert service._model.encode.call_count == 1
+    assert service.cache_hits == 1
+
+    # q2 is least recently used and gets evicted
+    await service.embed_query("q3")
+    await service.embed_query("q2")
+    assert service._model.encode.call_count == 3
+    assert service.stats()["query_cache_size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates_to_all_callers():
+    service = _service(batch_window_ms=10)
+    service._model.encode.side_effect = RuntimeError("boom")
+
+    results = await asyncio.gather(
+        service.embed(["a"]), service.embed(["b"]), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_model_with_wrong_dimension_fails_at_load(monkeypatch):
+    model = MagicMock()
+    model.get_sentence_embedding_dimension.return_value = 768
+    monkeypatch.setitem(
+        sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=lambda *a, **k: model)
+    )
+    service = EmbeddingService("all-mpnet-base-v2")
+
+    with pytest.raises(ValueError, match="768-dim"):
+        service.encode(["text"])
+    assert service._model is None
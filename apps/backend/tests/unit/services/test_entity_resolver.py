@@ -0,0 +1,105 @@
+"""Unit tests for set-based canonical entity resolution."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.entity_repository import EntityRepository
+from app.services.enriched.services.entity.resolver import EntityResolver, _merge_attributes
+
+
+@pytest.fixture
+def resolver():
+    resolver = EntityResolver(MagicMock())
+    resolver.entity_repo = MagicMock()
+    resolver.entity_repo.add_batch_to_workflow_scope = AsyncMock()
+    resolver.mention_repo = MagicMock()
+    resolver.mention_repo.create_batch = AsyncMock(
+        side_effect=lambda rows: [SimpleNamespace(id=uuid4(), **row) for row in rows]
+    )
+    resolver.evidence_repo = MagicMock()
+    resolver.evidence_repo.create_batch = AsyncMock()
+    return resolver
+
+
+@pytest.mark.asyncio
+async def test_batch_resolves_with_one_lookup_and_one_upsert(resolver):
+    existing_id, new_id = uuid4(), uuid4()
+    policy_key = ("Policy", resolver._generate_canonical_key("Policy", "POL123"))
+    coverage_key = ("Coverage", resolver._generate_canonical_key("Coverage", "cov_gl"))
+    resolver.entity_repo.get_by_keys = AsyncMock(
+        return_value={policy_key: (existing_id, {"normalized_value": "POL123", "description": "Policy"})}
+    )
+    resolver.entity_repo.upsert_canonical_entities = AsyncMock(return_value={coverage_key: new_id})
+    workflow_id = uuid4()
+
+    ids = await resolver.resolve_entities_batch(
+        [
+            {"entity_type": "Policy", "normalized_value": "POL123", "description": "Policy"},
+            {"entity_type": "Coverage", "id": "cov_gl", "coverage_name": "General Liability",
+             "description": "GL"},
+            {"entity_type": "Coverage", "id": "cov_gl", "description": "General liability coverage"},
+            {"entity_type": "Coverage"},  # no value: skipped
+        ],
+        chunk_id=None,
+        document_id=uuid4(),
+        workflow_id=workflow_id,
+    )
+
+    assert ids == [existing_id, new_id, new_id]
+    resolver.entity_repo.get_by_keys.assert_awaited_once()
+    # The unchanged existing entity is not rewritten; repeated mentions merge in memory
+    upserts = resolver.entity_repo.upsert_canonical_entities.await_args.args[0]
+    assert upserts == [{
+        "entity_type": "Coverage",
+        "canonical_key": coverage_key[1],
+        "attributes": {
+            "normalized_value": "cov_gl",
+            "raw_value": "cov_gl",
+            "description": "General liability coverage",
+        },
+    }]
+
+    mentions = resolver.mention_repo.create_batch.await_args.args[0]
+    assert [m["mention_text"] for m in mentions] == ["POL123", "General Liability", "cov_gl"]
+    evidence = resolver.evidence_repo.create_batch.await_args.args[0]
+    assert [e["canonical_entity_id"] for e in evidence] == ids
+    resolver.entity_repo.add_batch_to_workflow_scope.assert_awaited_once_with(workflow_id, ids)
+
+
+@pytest.mark.asyncio
+async def test_resolve_entity_rejects_mentions_without_value(resolver):
+    with pytest.raises(ValueError):
+        await resolver.resolve_entity({"entity_type": "Policy"}, None, uuid4())
+
+
+def test_merge_keeps_existing_values_and_prefers_longer_text():
+    merged = _merge_attributes(
+        {"limit": "1M", "description": "short", "carrier": None},
+        {"limit": "2M", "description": "a longer description", "carrier": "ACME", "form": None},
+    )
+
+    assert merged == {"limit": "1M", "description": "a longer description", "carrier": "ACME"}
+
+
+@pytest.mark.asyncio
+async def test_upsert_merges_attributes_in_sql():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=[])
+
+    await EntityRepository(session).upsert_canonical_entities([
+        {"entity_type": "Policy", "canonical_key": "b", "attributes": {}},
+        {"entity_type": "Coverage", "canonical_key": "a", "attributes": {}},
+    ])
+
+    session.execute.assert_awaited_once()
+    statement = session.execute.await_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT ON CONSTRAINT uq_entity_type_canonical_key DO UPDATE" in sql
+    assert "jsonb_strip_nulls(excluded.attributes) || jsonb_strip_nulls(coalesce(canonical_entities.attributes" in sql
+    assert "RETURNING canonical_entities.id" in sql
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert [params["entity_type_m0"], params["entity_type_m1"]] == ["Coverage", "Policy"]
@@ -0,0 +1,133 @@
+"""Tests for incremental, batched embedding generation."""
+
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.services.embedding_service import EmbeddingService
+from app.services.summarized.services.indexing.vector.generate_embeddings import (
+    GenerateEmbeddingsService,
+)
+
+
+NO_METADATA = {
+    "canonical_entity_id": None,
+    "effective_date": None,
+    "expiration_date": None,
+    "location_id": None,
+}
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _service(existing, reusable=None, canonical=None):
+    service = GenerateEmbeddingsService(MagicMock(commit=AsyncMock()))
+    section = SimpleNamespace(
+        section_type="coverages",
+        extracted_fields={"coverages": [{"name": "General Liability"}, {"name": "Auto Liability"}]},
+    )
+    service._fetch_sections = AsyncMock(return_value=[section])
+    service.template_service.run = AsyncMock(side_effect=lambda _, data: f"Coverage: {data['name']}")
+    service.entity_repo = MagicMock()
+    service.entity_repo.get_by_keys = AsyncMock(return_value=canonical or {})
+
+    repo = MagicMock()
+    repo.get_entity_embedding_states = AsyncMock(return_value=existing)
+    repo.get_vectors_by_content_hash = AsyncMock(return_value=reusable or {})
+    repo.delete_by_ids = AsyncMock(side_effect=lambda ids: len(ids))
+    repo.update_metadata_by_ids = AsyncMock(side_effect=lambda updates: len(updates))
+    repo.bulk_create = AsyncMock(side_effect=lambda rows: len(rows))
+    service.vector_repo = repo
+
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: np.zeros((len(texts), 384))
+    service.embedder = EmbeddingService(service.model_name)
+    service.embedder._model = model
+    return service
+
+
+@pytest.mark.asyncio
+async def test_unchanged_document_encodes_nothing():
+    existing = [
+        (uuid4(), "coverages_cov_0", _hash("Coverage: General Liability"), NO_METADATA),
+        (uuid4(), "coverages_cov_1", _hash("Coverage: Auto Liability"), NO_METADATA),
+    ]
+    service = _service(existing)
+
+    result = await service.run(uuid4(), uuid4())
+
+    service.embedder._model.encode.assert_not_called()
+    service.vector_repo.delete_by_ids.assert_awaited_once_with([])
+    service.vector_repo.bulk_create.assert_awaited_once_with([])
+    assert result.chunks_embedded == 2
+    assert result.storage_details["unchanged"] == 2
+
+
+@pytest.mark.asyncio
+async def test_only_changed_rows_are_replaced_in_one_batch():
+    stale_id = uuid4()
+    existing = [
+        (uuid4(), "coverages_cov_0", _hash("Coverage: General Liability"), NO_METADATA),
+        (stale_id, "coverages_cov_1", _hash("Coverage: Old Text"), NO_METADATA),
+    ]
+    service = _service(existing)
+
+    result = await service.run(uuid4(), uuid4())
+
+    service.embedder._model.encode.assert_called_once()
+    assert service.embedder._model.encode.call_args.args[0] == ["Coverage: Auto Liability"]
+    service.vector_repo.delete_by_ids.assert_awaited_once_with([stale_id])
+    rows = service.vector_repo.bulk_create.await_args.args[0]
+    assert [row["entity_id"] for row in rows] == ["coverages_cov_1"]
+    assert result.storage_details == {
+        "status": "success",
+        "model": service.model_name,
+        "written": 1,
+        "unchanged": 1,
+        "updated": 0,
+        "removed": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_vectors_for_identical_content_are_reused():
+    reusable = {
+        _hash("Coverage: General Liability"): [0.1] * 384,
+        _hash("Coverage: Auto Liability"): [0.2] * 384,
+    }
+    service = _service(existing=[], reusable=reusable)
+
+    await service.run(uuid4(), uuid4())
+
+    service.embedder._model.encode.assert_not_called()
+    rows = service.vector_repo.bulk_create.await_args.args[0]
+    assert len(rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_changed_canonical_entity_is_updated_in_place():
+    row_id, canonical_id = uuid4(), uuid4()
+    existing = [
+        (row_id, "coverages_cov_0", _hash("Coverage: General Liability"), NO_METADATA),
+        (uuid4(), "coverages_cov_1", _hash("Coverage: Auto Liability"), NO_METADATA),
+    ]
+    service = _service(existing)
+    key = service._canonical_entity_key("coverage", {"name": "General Liability"})
+    service.entity_repo.get_by_keys.return_value = {key: (canonical_id, {})}
+
+    result = await service.run(uuid4(), uuid4())
+
+    # Both entities are resolved with a single lookup
+    service.entity_repo.get_by_keys.assert_awaited_once()
+    service.embedder._model.encode.assert_not_called()
+    service.vector_repo.update_metadata_by_ids.assert_awaited_once_with(
+        [{"id": row_id, **NO_METADATA, "canonical_entity_id": canonical_id}]
+    )
+    assert result.storage_details["updated"] == 1
+    assert result.storage_details["written"] == 0
@@ -1,6 +1,8 @@
+import hashlib
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import UploadFile
+from starlette.datastructures import Headers
 from io import BytesIO
 from app.services.storage_service import StorageService
 from app.core.exceptions import AppError
@@ -12,19 +14,36 @@ def storage_service():
 @pytest.fixture
 def mock_upload_file():
     content = b"test content"
-    file = BytesIO(content)
-    return MagicMock(spec=UploadFile, filename="test.pdf", content_type="application/pdf", read=MagicMock(return_value=content), seek=MagicMock())
+    return UploadFile(
+        file=BytesIO(content),
+        size=len(content),
+        filename="test.pdf",
+        headers=Headers({"content-type": "application/pdf"}),
+    )
 
 @pytest.mark.asyncio
 async def test_upload_file_success(storage_service, mock_upload_file):
-    with patch("httpx.AsyncClient.post") as mock_post:
-        mock_post.return_value = MagicMock(status_code=200, json=lambda: {"Key": "documents/test.pdf"})
-        
-        result = await storage_service.upload_file(mock_upload_file, "documents", "test.pdf")
+    sent = {}
+
+    async def drain(url, headers, content, timeout):
+        sent["headers"] = headers
+        sent["body"] = b"".join([chunk async for chunk in content])
+        return MagicMock(status_code=200, json=lambda: {"Key": "documents/test.pdf"})
+
+    with patch("httpx.AsyncClient.post", new=AsyncMock(side_effect=drain)) as mock_post:
+        result = await storage_service.upload_file(mock_upload_file, "documents", "test.pdf", chunk_size=4)
         
-        assert result == {"Key": "documents/test.pdf"}
+        assert result == {
+            "Key": "documents/test.pdf",
+            "sha256": hashlib.sha256(b"test content").hexdigest(),
+            "size_bytes": 12,
+        }
         mock_post.assert_called_once()
-        mock_upload_file.read.assert_called_once()
+        assert sent["body"] == b"test content"
+        assert sent["headers"]["Content-Length"] == "12"
+        assert sent["headers"]["Content-Type"] == "application/pdf"
+        # Rewound for later readers
+        assert await mock_upload_file.read() == b"test content"
 
 @pytest.mark.asyncio
 async def test_upload_file_failure(storage_service, mock_upload_file):
@@ -0,0 +1,127 @@
+"""Unit tests for the single-query, keyset-paginated workflow listing."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import ValidationError
+from app.repositories.workflow_repository import WorkflowRepository
+from app.services.workflow_service import (
+    WorkflowService,
+    decode_workflow_cursor,
+    encode_workflow_cursor,
+)
+
+CREATED = datetime(2026, 10, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+def _row(index, total=3, **overrides):
+    row = {
+        "id": uuid4(),
+        "temporal_workflow_id": f"workflow-{index}",
+        "workflow_name": f"Workflow {index}",
+        "workflow_definition_id": uuid4(),
+        "status": "completed",
+        "created_at": CREATED - timedelta(hours=index),
+        "updated_at": CREATED - timedelta(hours=index),
+        "definition_name": "Policy Comparison",
+        "workflow_type": "policy_comparison",
+        "documents_total": 2,
+        "documents_completed": 1,
+        "documents_failed": 1,
+        "last_stage_at": CREATED - timedelta(hours=index) + timedelta(minutes=5),
+        "last_event_at": None,
+        "total": total,
+        "documents": None,
+        "stages": None,
+        "recent_events": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def _service(rows):
+    service = WorkflowService(MagicMock())
+    service.wf_repo = MagicMock()
+    service.wf_repo.list_workflow_summaries = AsyncMock(return_value=rows)
+    service.wf_repo.count = AsyncMock(return_value=7)
+    return service
+
+
+def test_cursor_round_trip_keeps_microseconds():
+    workflow_id = uuid4()
+
+    cursor = encode_workflow_cursor(CREATED, workflow_id)
+
+    assert decode_workflow_cursor(cursor) == (CREATED, workflow_id)
+    with pytest.raises(ValidationError):
+        decode_workflow_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_list_workflows_pages_by_cursor():
+    rows = [_row(i) for i in range(3)]
+    service = _service(rows)
+
+    page = await service.list_workflows(uuid4(), limit=2)
+
+    # One extra row is fetched to detect the next page
+    assert service.wf_repo.list_workflow_summaries.await_args.kwargs["limit"] == 3
+    assert [item["id"] for item in page["workflows"]] == [rows[0]["id"], rows[1]["id"]]
+    assert page["total"] == 3
+    assert decode_workflow_cursor(page["next_cursor"]) == (rows[1]["created_at"], rows[1]["id"])
+    service.wf_repo.count.assert_not_awaited()
+
+    service.wf_repo.list_workflow_summaries.return_value = rows[2:]
+    last = await service.list_workflows(uuid4(), limit=2, cursor=page["next_cursor"])
+
+    assert service.wf_repo.list_workflow_summaries.await_args.kwargs["after"] == (
+        rows[1]["created_at"], rows[1]["id"]
+    )
+    assert last["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_item_metrics_and_duration_come_from_the_row():
+    row = _row(0, stages=[{"stage_name": "ocr", "status": "completed", "duration_seconds": 12.5}])
+    service = _service([row])
+
+    item = (await service.list_workflows(uuid4()))["workflows"][0]
+
+    assert item["metrics"]["documents_processing"] == 0
+    assert item["metrics"]["progress_percent"] == 50
+    # Terminal workflows end at their latest stage activity
+    assert item["duration_seconds"] == 300
+    assert item["stages"][0]["stage_name"] == "ocr"
+    assert item["documents"] == [] and item["recent_events"] == []
+
+
+@pytest.mark.asyncio
+async def test_empty_page_past_the_end_still_reports_total():
+    service = _service([])
+
+    first = await service.list_workflows(uuid4())
+    past_end = await service.list_workflows(uuid4(), cursor=encode_workflow_cursor(CREATED, uuid4()))
+
+    assert first["total"] == 0
+    assert past_end["total"] == 7
+
+
+@pytest.mark.asyncio
+async def test_summaries_are_one_keyset_statement():
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    repo = WorkflowRepository(session)
+
+    await repo.list_workflow_summaries(uuid4(), limit=21, after=(CREATED, uuid4()), events_limit=5)
+
+    assert session.execute.await_count == 1
+    sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "(workflows.created_at, workflows.id) <" in sql
+    assert "OFFSET" not in sql
+    assert "row_number() OVER (PARTITION BY workflow_run_events.workflow_id" in sql
+    assert "FILTER (WHERE ranked_events.event_rank <=" in sql
+    assert "count(*) FILTER (WHERE documents.status =" in sql
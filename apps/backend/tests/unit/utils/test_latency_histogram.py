@@ -0,0 +1,35 @@
+"""Unit tests for stage latency histograms."""
+
+from app.utils.latency_histogram import (
+    LatencyHistogram,
+    observe_stage_latencies,
+    reset_stage_latencies,
+    stage_latency_snapshot,
+)
+
+
+def test_quantiles_report_bucket_upper_bounds():
+    histogram = LatencyHistogram(buckets_ms=(10, 100, 1000))
+    for value in [5] * 90 + [50] * 9 + [5000]:
+        histogram.observe(value)
+
+    assert histogram.quantile(0.50) == 10
+    assert histogram.quantile(0.95) == 100
+    # Overflow bucket reports the largest observed value
+    assert histogram.quantile(1.0) == 5000
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["buckets"] == {"le_10": 90, "le_100": 9, "le_1000": 0, "le_inf": 1}
+
+
+def test_stage_registry_aggregates_queries():
+    reset_stage_latencies()
+    observe_stage_latencies({"vector_retrieval": 40, "graph_expansion": 300})
+    observe_stage_latencies({"vector_retrieval": 60})
+
+    snapshot = stage_latency_snapshot()
+    assert list(snapshot) == ["graph_expansion", "vector_retrieval"]
+    assert snapshot["vector_retrieval"]["count"] == 2
+    assert snapshot["vector_retrieval"]["mean_ms"] == 50.0
+    reset_stage_latencies()
@@ -0,0 +1,93 @@
+import re
+
+import pytest
+
+from app.services.processed.services.analysis.page_classifier import PageClassifier
+from app.utils.pattern_matcher import PatternSet, required_literal
+
+
+class TestRequiredLiteral:
+    """Test suite for prefilter literal extraction."""
+
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            (r"policy\s+declarations?", "declaration"),
+            (r"^#?\s*DECLARATIONS?", "DECLARATION"),
+            (r"this\s+endorsement\s+(changes|modifies)", "endorsement"),
+            (r"acord\s+2[45]", "acord"),
+            (r"sec+tions", "tions"),
+            (r"a|b", None),
+            (r"[a-z]+", None),
+            (r"ab", None),
+        ],
+    )
+    def test_literals(self, pattern, expected):
+        assert required_literal(pattern, re.IGNORECASE) == expected
+
+
+class TestPatternSet:
+    """Test suite for precompiled pattern groups."""
+
+    def test_count_matches_re_search(self):
+        groups = {
+            "declarations": [r"policy\s+number\s*[:\-]", r"policy\s+number\s*[:\-]?\s*[A-Z0-9\-]+"],
+            "exclusions": [r"^##?\s*EXCLUSIONS?\s*$", r"does\s+not\s+apply"],
+        }
+        matcher = PatternSet(groups)
+        text = "Policy Number: CA-1234 issued"
+
+        expected = {
+            key: sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+            for key, patterns in groups.items()
+        }
+        assert matcher.count(text) == {k: v for k, v in expected.items() if v}
+
+    def test_prefilter_is_case_insensitive(self):
+        matcher = PatternSet([r"certificate\s+of\s+liability\s+insurance"])
+
+        assert matcher.search("CERTIFICATE OF LIABILITY INSURANCE")
+        # Dotted capital I is matched by re.IGNORECASE, so it must pass the prefilter
+        assert matcher.search("certİficate of lİability insurance") == bool(
+            re.search(r"certificate\s+of\s+liability\s+insurance", "certİficate of lİability insurance", re.I)
+        )
+
+    def test_first_respects_group_order_and_prefix(self):
+        matcher = PatternSet(
+            {"a": [r"coverage\s+form"], "b": [r"coverage"]},
+            prefix=r"^\s*#*\s*(?:[a-z\d]{1,2}[\.\)]\s+)*",
+        )
+
+        assert matcher.first("## c. coverage form") == "a"
+        assert matcher.first("11. coverage") == "b"
+        assert matcher.first("the coverage form") is None
+
+    def test_find_returns_first_pattern_in_list_order(self):
+        matcher = PatternSet([r"Policy\s*#[:\s]*([A-Z0-9\-]+)", r"(AB\d+)"])
+
+        assert matcher.find("ref AB123 policy # XY-9").group(1) == "XY-9"
+
+
+class TestPageClassifierMatching:
+    """PageClassifier results are unchanged by the compiled matchers."""
+
+    def _reference_counts(self, classifier, text):
+        return {
+            page_type: sum(1 for p in patterns if re.search(p, text, re.IGNORECASE))
+            for page_type, patterns in classifier.SECTION_PATTERNS.items()
+        }
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "common policy declarations policy number: ab-1234 named insured: acme",
+            "section ii - exclusions this insurance does not apply to",
+            "this endorsement changes the policy. please read it carefully.",
+            "schedule of values building value contents value",
+        ],
+    )
+    def test_section_counts_equal_per_pattern_search(self, text):
+        classifier = PageClassifier()
+        reference = {k: v for k, v in self._reference_counts(classifier, text).items() if v}
+
+        assert classifier._section_matcher.count(text) == reference
@@ -96,11 +96,13 @@ export class DefaultService {
     /**
      * Delete document
      * @param documentId
+     * @param workflowId Remove the document from this workflow; it is deleted once no workflow uses it
      * @returns any Document deleted
      * @throws ApiError
      */
     public static deleteDocument(
         documentId: string,
+        workflowId?: string,
     ): CancelablePromise<(ApiResponse & {
         data?: Record<string, any> | null;
     })> {
@@ -110,9 +112,13 @@ export class DefaultService {
             path: {
                 'document_id': documentId,
             },
+            query: {
+                'workflow_id': workflowId,
+            },
             errors: {
                 401: `Unauthorized`,
                 404: `Document not found`,
+                409: `Document is shared by several workflows and no workflow_id was given`,
                 500: `Internal server error`,
             },
         });
@@ -6,5 +6,9 @@ import type { WorkflowListItem } from './WorkflowListItem';
 export type WorkflowListResponse = {
     total?: number;
     workflows?: Array<WorkflowListItem>;
+    /**
+     * Cursor for the next page; null on the last page
+     */
+    next_cursor?: string | null;
 };
 
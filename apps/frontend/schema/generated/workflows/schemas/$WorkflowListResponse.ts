@@ -13,5 +13,10 @@ export const $WorkflowListResponse = {
                 type: 'WorkflowListItem',
             },
         },
+        next_cursor: {
+            type: 'string',
+            description: `Cursor for the next page; null on the last page`,
+            isNullable: true,
+        },
     },
 } as const;
@@ -45,13 +45,15 @@ export class DefaultService {
     /**
      * List workflows
      * @param limit
-     * @param offset
+     * @param offset Ignored when cursor is given
+     * @param cursor next_cursor from the previous page
      * @returns any List of workflows
      * @throws ApiError
      */
     public static listWorkflows(
         limit: number = 50,
         offset?: number,
+        cursor?: string,
     ): CancelablePromise<(ApiResponse & {
         data?: WorkflowListResponse;
     })> {
@@ -61,6 +63,7 @@ export class DefaultService {
             query: {
                 'limit': limit,
                 'offset': offset,
+                'cursor': cursor,
             },
             errors: {
                 401: `Unauthorized`,